@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""Check import time of each entry point against a budget.
+
+Imports every entry point in a fresh interpreter with ``-X importtime``
+and reads the cumulative time of the entry point module from the
+report. The median of ``--runs`` imports is compared with the budget
+below. Entry points must not import handler modules with routers; those
+are loaded by build_dispatcher or, in the webhook app, after startup.
+
+Budgets are the median on a development machine plus about 10%, in
+milliseconds; ``--budget-scale`` stretches them on slower ones. The
+check is run by hand (``make bench-import BUDGET_SCALE=2``), not in CI.
+Exits with status 1 when a budget is exceeded or a handler module is
+imported.
+
+Example:
+    python scripts/benchmark_import_time.py --runs 5
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+from ugc_bot.app import ROUTER_MODULES
+
+BUDGETS_MS: dict[str, float] = {
+    "ugc_bot.telegram_webhook_app": 7800,
+    "ugc_bot.instagram_webhook_app": 1800,
+    "ugc_bot.outbox_processor": 1300,
+    "ugc_bot.kafka_consumer": 7000,
+    "ugc_bot.feedback_scheduler": 8200,
+    "ugc_bot.role_reminder_scheduler": 7700,
+}
+
+_HANDLER_MODULES = frozenset(
+    f"ugc_bot.bot.handlers.{m}" for m in ROUTER_MODULES
+)
+
+
+def _import_once(module: str) -> tuple[float, set[str]]:
+    """Import ``module`` in a new interpreter.
+
+    Returns its cumulative import time in ms and the imported modules.
+    """
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    cumulative_ms = 0.0
+    imported: set[str] = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|")
+        name = name.strip()
+        if not cumulative.strip().isdigit():
+            continue  # header line
+        imported.add(name)
+        if name == module:
+            cumulative_ms = int(cumulative) / 1000
+    return cumulative_ms, imported
+
+
+def run_benchmark(runs: int, budget_scale: float) -> bool:
+    """Import every entry point; return True when all are within budget."""
+
+    ok = True
+    for module, budget in BUDGETS_MS.items():
+        timings = []
+        handlers: set[str] = set()
+        for _ in range(runs):
+            elapsed, imported = _import_once(module)
+            timings.append(elapsed)
+            handlers |= imported & _HANDLER_MODULES
+        median = statistics.median(timings)
+        limit = budget * budget_scale
+        status = "ok" if median <= limit and not handlers else "FAIL"
+        ok = ok and status == "ok"
+        print(
+            f"{module:<33} {median:>8.0f} ms  budget {limit:>6.0f} ms  {status}"
+        )
+        for name in sorted(handlers):
+            print(f"    imports handler module {name}")
+    return ok
+
+
+def main() -> None:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description="Check entry point import time against budgets"
+    )
+    parser.add_argument(
+        "--runs",
+        type=int,
+        default=3,
+        help="Imports per entry point; the median is used (default: 3)",
+    )
+    parser.add_argument(
+        "--budget-scale",
+        type=float,
+        default=1.0,
+        help="Multiply every budget, e.g. 2 on a slow laptop (default: 1)",
+    )
+    args = parser.parse_args()
+    if not run_benchmark(args.runs, args.budget_scale):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""Load test Instagram webhook posts: per-request versus shared container.
+
+Posts N verification-code messages to the Instagram webhook app in
+process (httpx ASGI transport) against a temp SQLite database, in
+batches. "per-request" drops the services before every post and never
+disposes them, reproducing the previous Container(config) per request;
+"shared" reuses the container built once. After each batch it prints
+the median latency and the DB connections currently open, which should
+stay flat for "shared" and grow with traffic for "per-request".
+
+Example:
+    python scripts/benchmark_instagram_webhook.py --requests 500
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import Pool
+
+from ugc_bot.infrastructure.db.base import Base
+from ugc_bot.instagram_webhook_app import app
+
+_PAYLOAD = {
+    "object": "instagram",
+    "entry": [
+        {
+            "id": "page1",
+            "time": 1234567890,
+            "messaging": [
+                {
+                    "sender": {"id": "17841400000000000"},
+                    "recipient": {"id": "page1"},
+                    "timestamp": 1234567890,
+                    "message": {"mid": "m1", "text": "ABC123XY"},
+                }
+            ],
+        }
+    ],
+}
+
+_open_connections = 0
+
+
+def _count_connections() -> None:
+    """Track DB-API connections opened and closed by every pool."""
+
+    def _opened(*_args: object) -> None:
+        global _open_connections
+        _open_connections += 1
+
+    def _closed(*_args: object) -> None:
+        global _open_connections
+        _open_connections -= 1
+
+    event.listen(Pool, "connect", _opened)
+    event.listen(Pool, "close", _closed)
+
+
+async def _create_schema(database_url: str) -> None:
+    engine = create_async_engine(database_url)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    await engine.dispose()
+
+
+async def _run(name: str, requests: int, batch: int, shared: bool) -> None:
+    """Post ``requests`` events; print latency and connections per batch."""
+
+    app.state.config_state.clear()
+    app.state.services = None
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+        latencies: list[float] = []
+        for sent in range(1, requests + 1):
+            if not shared:
+                app.state.services = None
+            started = time.perf_counter()
+            response = await client.post("/webhook/instagram", json=_PAYLOAD)
+            latencies.append(time.perf_counter() - started)
+            response.raise_for_status()
+            if sent % batch == 0:
+                print(
+                    f"{name:<12} {sent:>6} posts  "
+                    f"p50 {statistics.median(latencies) * 1000:7.2f} ms  "
+                    f"open connections {_open_connections:>5}"
+                )
+                latencies = []
+    services = app.state.services
+    if services is not None:
+        await services.container.close()
+    app.state.services = None
+
+
+async def run_benchmark(requests: int, batch: int) -> None:
+    """Run both modes against a fresh SQLite database."""
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database_url = f"sqlite:///{Path(tmp) / 'bench.db'}"
+        os.environ["DATABASE_URL"] = database_url
+        await _create_schema(
+            database_url.replace("sqlite:", "sqlite+aiosqlite:")
+        )
+        _count_connections()
+        await _run("shared", requests, batch, shared=True)
+        await _run("per-request", requests, batch, shared=False)
+
+
+def main() -> None:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description="Compare per-request and shared containers on the webhook"
+    )
+    parser.add_argument(
+        "--requests",
+        type=int,
+        default=500,
+        help="Posts per mode (default: 500)",
+    )
+    parser.add_argument(
+        "--batch",
+        type=int,
+        default=100,
+        help="Posts between reports (default: 100)",
+    )
+    args = parser.parse_args()
+
+    os.environ.setdefault("BOT_TOKEN", "benchmark")
+    os.environ["INSTAGRAM_APP_SECRET"] = ""
+    asyncio.run(run_benchmark(args.requests, args.batch))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""Benchmark JSON encoding on the FSM storage and webhook hot paths.
+
+Times FSM state round trips (dumps + loads of a draft with UUIDs and
+datetimes, as RedisStorage does per update) and webhook update parsing
+(body bytes to a validated aiogram Update). Each path runs with the
+previous stdlib code, the codec's stdlib fallback and orjson, when it is
+installed. Reports operations/second.
+
+Example:
+    python scripts/benchmark_json_codec.py --iterations 20000
+"""
+
+import argparse
+import json
+import time
+from collections.abc import Callable
+from datetime import datetime, timezone
+from typing import Any
+from uuid import UUID, uuid4
+
+from aiogram.types import Update
+
+from ugc_bot import json_codec
+
+_FSM_STATE = {
+    "user_id": uuid4(),
+    "order_id": uuid4(),
+    "product_link": "https://example.com/product/123",
+    "offer_text": "Нужен обзор продукта " * 10,
+    "price": 15000.0,
+    "bloggers_needed": 5,
+    "barter": False,
+    "created_at": datetime.now(timezone.utc),
+    "selected": [str(uuid4()) for _ in range(5)],
+}
+
+_UPDATE_BODY = json.dumps(
+    {
+        "update_id": 123456789,
+        "message": {
+            "message_id": 1,
+            "date": 1609459200,
+            "chat": {"id": 123, "type": "private", "username": "user"},
+            "from": {
+                "id": 123,
+                "is_bot": False,
+                "first_name": "Test",
+                "username": "user",
+                "language_code": "ru",
+            },
+            "text": "Хочу откликнуться на заказ",
+        },
+    }
+).encode("utf-8")
+
+
+def _previous_dumps(obj: dict) -> str:
+    """The encoder app.py used before: a JSONEncoder class per call."""
+
+    class UUIDEncoder(json.JSONEncoder):
+        def default(self, o: Any) -> Any:
+            if isinstance(o, UUID):
+                return str(o)
+            if isinstance(o, datetime):
+                return o.isoformat()
+            return super().default(o)
+
+    return json.dumps(obj, cls=UUIDEncoder)
+
+
+def _best_of(rounds: int, iterations: int, call: Callable[[], Any]) -> float:
+    """Return the best operations/second over ``rounds``."""
+
+    best = float("inf")
+    for _ in range(rounds):
+        started = time.perf_counter()
+        for _ in range(iterations):
+            call()
+        best = min(best, time.perf_counter() - started)
+    return iterations / best
+
+
+def _codec_backends() -> list[tuple[str, Any]]:
+    backends: list[tuple[str, Any]] = [("codec-json", None)]
+    if json_codec.orjson is not None:
+        backends.append(("codec-orjson", json_codec.orjson))
+    return backends
+
+
+def run_benchmark(iterations: int, rounds: int) -> None:
+    """Time both paths with every available implementation."""
+
+    installed = json_codec.orjson
+    results = [
+        (
+            "fsm round trip",
+            "previous",
+            _best_of(
+                rounds,
+                iterations,
+                lambda: json.loads(_previous_dumps(_FSM_STATE)),
+            ),
+        ),
+        (
+            "webhook parse",
+            "previous",
+            _best_of(
+                rounds,
+                iterations,
+                lambda: Update.model_validate(json.loads(_UPDATE_BODY)),
+            ),
+        ),
+    ]
+    try:
+        for name, backend in _codec_backends():
+            json_codec.orjson = backend
+            results.append(
+                (
+                    "fsm round trip",
+                    name,
+                    _best_of(
+                        rounds,
+                        iterations,
+                        lambda: json_codec.loads(json_codec.dumps(_FSM_STATE)),
+                    ),
+                )
+            )
+            results.append(
+                (
+                    "webhook parse",
+                    name,
+                    _best_of(
+                        rounds,
+                        iterations,
+                        lambda: Update.model_validate(
+                            json_codec.loads(_UPDATE_BODY)
+                        ),
+                    ),
+                )
+            )
+    finally:
+        json_codec.orjson = installed
+    for path, name, rate in sorted(results, key=lambda r: r[0]):
+        print(f"{path:<15} {name:<13} {rate:>12,.0f} ops/s")
+
+
+def main() -> None:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description="Compare stdlib and orjson on FSM and webhook JSON"
+    )
+    parser.add_argument(
+        "--iterations",
+        type=int,
+        default=20_000,
+        help="Operations per round (default: 20000)",
+    )
+    parser.add_argument(
+        "--rounds",
+        type=int,
+        default=3,
+        help="Repetitions per implementation; best is reported (default: 3)",
+    )
+    args = parser.parse_args()
+    run_benchmark(args.iterations, args.rounds)
+
+
+if __name__ == "__main__":
+    main()
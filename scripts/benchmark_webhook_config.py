@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""Benchmark webhook requests with per-request versus cached config.
+
+Sends N verification requests to the Instagram webhook app in process
+(httpx ASGI transport, no network). "per-request" forgets the config
+before each request, reproducing the previous load_config() call per
+request; "cached" reuses the config loaded once. Reports requests/second
+for each.
+
+Example:
+    python scripts/benchmark_webhook_config.py --requests 2000
+"""
+
+import argparse
+import asyncio
+import os
+import time
+
+import httpx
+
+from ugc_bot.instagram_webhook_app import app
+
+_TOKEN = "benchmark-token"
+_PARAMS = {
+    "hub.mode": "subscribe",
+    "hub.challenge": "42",
+    "hub.verify_token": _TOKEN,
+}
+
+
+async def _run(requests: int, reset_config: bool) -> float:
+    """Send ``requests`` verifications; return the elapsed seconds."""
+
+    config_state = app.state.config_state
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+        config_state.clear()
+        started = time.perf_counter()
+        for _ in range(requests):
+            if reset_config:
+                config_state.clear()
+            response = await client.get("/webhook/instagram", params=_PARAMS)
+            response.raise_for_status()
+        return time.perf_counter() - started
+
+
+async def run_benchmark(requests: int, rounds: int) -> None:
+    """Time both modes and print the best round of each."""
+
+    for name, reset_config in (("per-request", True), ("cached", False)):
+        best = min([await _run(requests, reset_config) for _ in range(rounds)])
+        print(
+            f"{name:<12} {requests} requests in {best * 1000:.1f} ms "
+            f"({requests / best:,.0f} req/s)"
+        )
+
+
+def main() -> None:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description="Compare per-request and cached config on the webhook"
+    )
+    parser.add_argument(
+        "--requests",
+        type=int,
+        default=2000,
+        help="Requests per round (default: 2000)",
+    )
+    parser.add_argument(
+        "--rounds",
+        type=int,
+        default=3,
+        help="Repetitions per mode; the best is reported (default: 3)",
+    )
+    args = parser.parse_args()
+
+    os.environ.setdefault("BOT_TOKEN", "benchmark")
+    os.environ["INSTAGRAM_WEBHOOK_VERIFY_TOKEN"] = _TOKEN
+    asyncio.run(run_benchmark(args.requests, args.rounds))
+
+
+if __name__ == "__main__":
+    main()
@@ -7,9 +7,10 @@ from typing import Any, TypeVar
 from uuid import UUID
 
 from fastapi import FastAPI
-from sqladmin import Admin, ModelView
+from sqladmin import Admin, BaseView, ModelView, expose
 from sqlalchemy import text
 from starlette.requests import Request
+from starlette.responses import JSONResponse
 
 from ugc_bot.admin.auth import AdminAuth
 from ugc_bot.application.ports import OrderRepository
@@ -39,6 +40,7 @@ from ugc_bot.infrastructure.db.models import (
     OrderResponseModel,
     UserModel,
 )
+from ugc_bot.infrastructure.user_cache import UserCache
 from ugc_bot.logging_setup import configure_logging
 from ugc_bot.startup_logging import log_startup_info
 
@@ -109,6 +111,7 @@ class UserAdmin(ModelView, model=UserModel):
         old_status = obj.status if obj else None
 
         result = await super().update_model(request, pk, data)
+        await self._invalidate_user_cache(pk_uuid)
 
         obj = await _get_obj_by_pk(self, UserModel, pk_uuid)
         new_status = obj.status if obj else None
@@ -139,6 +142,20 @@ class UserAdmin(ModelView, model=UserModel):
 
         return result
 
+    async def delete_model(self, request: Request, pk: Any) -> None:
+        """Delete user and drop it from the user cache."""
+
+        await super().delete_model(request, pk)
+        await self._invalidate_user_cache(UUID(str(pk)))
+
+    async def _invalidate_user_cache(self, user_id: UUID) -> None:
+        """Drop an edited user from the bot's user cache (all replicas)."""
+
+        container = getattr(self, "_container", None)
+        user_cache = getattr(container, "user_cache", None)
+        if isinstance(user_cache, UserCache):
+            await user_cache.invalidate([user_id])
+
 
 class BloggerProfileAdmin(ModelView, model=BloggerProfileModel):
     """Admin view for blogger profiles."""
@@ -521,6 +538,31 @@ class EnumAwareAdmin(Admin):
         return RedirectResponse(url=url, status_code=302)
 
 
+class SlowQueryAdmin(BaseView):
+    """Top slow statement fingerprints of every process, as JSON."""
+
+    name = "Slow queries"
+    icon = "fa-solid fa-gauge-high"
+
+    @expose("/slow-queries", methods=["GET"])
+    async def slow_queries(self, request: Request) -> JSONResponse:
+        """Return fingerprints per process; ``?limit=N`` caps each list."""
+
+        container = getattr(self, "_container", None)
+        recorder = container.slow_query_recorder if container else None
+        if recorder is None:
+            return JSONResponse({"enabled": False, "instances": {}})
+        limit_param = request.query_params.get("limit", "")
+        limit = int(limit_param) if limit_param.isdigit() else None
+        return JSONResponse(
+            {
+                "enabled": True,
+                "threshold_ms": recorder.threshold_seconds * 1000,
+                "instances": await recorder.collect(limit),
+            }
+        )
+
+
 def create_admin_app() -> FastAPI:
     """Create a FastAPI app with SQLAdmin."""
 
@@ -576,6 +618,9 @@ def create_admin_app() -> FastAPI:
     admin.add_view(InstagramVerificationAdmin)
     admin.add_view(ComplaintAdmin)
     admin.add_view(ContactPricingAdmin)
+    if container.slow_query_recorder is not None:
+        SlowQueryAdmin._container = container  # type: ignore[attr-defined]
+        admin.add_base_view(SlowQueryAdmin)
     return app
 
 
@@ -5,60 +5,66 @@ telegram_webhook_app for webhook-based deployment. The bot runs via:
   uvicorn ugc_bot.telegram_webhook_app:app --host 0.0.0.0 --port 9999
 """
 
+import asyncio
+import importlib
 import logging
 
-from aiogram import Dispatcher
+from aiogram import Dispatcher, Router
 from aiogram.fsm.storage.memory import MemoryStorage
 
-from ugc_bot.bot.handlers.admin_moderation import (
-    router as admin_moderation_router,
-)
-from ugc_bot.bot.handlers.advertiser_registration import (
-    router as advertiser_router,
-)
-from ugc_bot.bot.handlers.blogger_registration import router as blogger_router
-from ugc_bot.bot.handlers.complaints import router as complaints_router
-from ugc_bot.bot.handlers.feedback import router as feedback_router
-from ugc_bot.bot.handlers.instagram_verification import (
-    router as instagram_router,
-)
-from ugc_bot.bot.handlers.my_orders import router as my_orders_router
-from ugc_bot.bot.handlers.offer_responses import router as offer_response_router
-from ugc_bot.bot.handlers.order_creation import router as order_router
-from ugc_bot.bot.handlers.payments import router as payments_router
-from ugc_bot.bot.handlers.profile import router as profile_router
-
-# Services are built via Container.build_bot_services()
-from ugc_bot.bot.handlers.start import router as start_router
+from ugc_bot import json_codec
 from ugc_bot.bot.middleware.error_handler import ErrorHandlerMiddleware
+from ugc_bot.bot.middleware.unit_of_work import UnitOfWorkMiddleware
 from ugc_bot.config import AppConfig
 from ugc_bot.container import Container
 
+# Handler modules under ugc_bot.bot.handlers, in registration order. They
+# are imported by build_dispatcher only, so importing this module (e.g.
+# for create_storage) does not load every handler.
+ROUTER_MODULES: tuple[str, ...] = (
+    "start",
+    "admin_moderation",
+    "blogger_registration",
+    "advertiser_registration",
+    "profile",
+    "instagram_verification",
+    "my_orders",
+    "order_creation",
+    "feedback",
+    "offer_responses",
+    "payments",
+    "complaints",
+)
 
-def _json_dumps(obj: dict) -> str:
-    """Custom JSON dumps that handles UUID and other non-serializable types."""
-    import json
-    from datetime import datetime
-    from uuid import UUID
 
-    class UUIDEncoder(json.JSONEncoder):
-        """JSON encoder that handles UUID and datetime objects."""
+def load_routers() -> list[Router]:
+    """Import the handler modules and return their routers."""
 
-        def default(self, obj):  # type: ignore[no-untyped-def]
-            if isinstance(obj, UUID):
-                return str(obj)
-            if isinstance(obj, datetime):
-                return obj.isoformat()
-            return super().default(obj)
+    return [
+        importlib.import_module(f"ugc_bot.bot.handlers.{name}").router
+        for name in ROUTER_MODULES
+    ]
 
-    return json.dumps(obj, cls=UUIDEncoder)
 
+async def include_routers(dispatcher: Dispatcher) -> None:
+    """Import the handler modules off the event loop and include them.
 
-def _json_loads(data: str) -> dict:
-    """Custom JSON loads for FSM data."""
-    import json
+    The webhook app runs this in the background, so it serves (and
+    queues updates) while the handlers load.
+    """
 
-    return json.loads(data)
+    routers = await asyncio.to_thread(load_routers)
+    dispatcher.include_routers(*routers)
+
+
+def _json_dumps(obj: dict) -> str:
+    """Encode FSM data; UUIDs and datetimes are stored as strings."""
+    return json_codec.dumps(obj)
+
+
+def _json_loads(data: str) -> dict:
+    """Decode FSM data."""
+    return json_codec.loads(data)
 
 
 async def create_storage(config: AppConfig):
@@ -109,6 +115,14 @@ def build_dispatcher(
     container = Container(config)
     services = container.build_bot_services()
 
+    # One DB session per update; registered first so it wraps error handling
+    dispatcher.update.outer_middleware(
+        UnitOfWorkMiddleware(
+            container.transaction_manager,
+            metrics_collector=services["metrics_collector"],
+        )
+    )
+
     # Register error handling middleware for all updates
     error_handler = ErrorHandlerMiddleware(
         metrics_collector=services["metrics_collector"]
@@ -118,17 +132,7 @@ def build_dispatcher(
     # Register all services in dispatcher
     for key, service in services.items():
         dispatcher[key] = service
+    dispatcher["user_cache"] = container.user_cache
     if include_routers:
-        dispatcher.include_router(start_router)
-        dispatcher.include_router(admin_moderation_router)
-        dispatcher.include_router(blogger_router)
-        dispatcher.include_router(advertiser_router)
-        dispatcher.include_router(profile_router)
-        dispatcher.include_router(instagram_router)
-        dispatcher.include_router(my_orders_router)
-        dispatcher.include_router(order_router)
-        dispatcher.include_router(feedback_router)
-        dispatcher.include_router(offer_response_router)
-        dispatcher.include_router(payments_router)
-        dispatcher.include_router(complaints_router)
+        dispatcher.include_routers(*load_routers())
     return dispatcher
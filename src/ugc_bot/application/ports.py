@@ -1,14 +1,19 @@
 """Repository ports for the application layer."""
 
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from datetime import datetime
 from typing import (
     TYPE_CHECKING,
+    Any,
     AsyncContextManager,
+    Generic,
     Iterable,
     List,
     Optional,
     Protocol,
+    Sequence,
+    TypeVar,
 )
 from uuid import UUID
 
@@ -31,6 +36,23 @@ from ugc_bot.domain.enums import MessengerType
 if TYPE_CHECKING:
     from ugc_bot.domain.enums import ComplaintStatus, InteractionStatus
 
+T = TypeVar("T")
+
+PageCursor = tuple[datetime, UUID]
+"""Keyset position: the row's sort timestamp and its id as tiebreaker."""
+
+
+@dataclass(frozen=True, slots=True)
+class Page(Generic[T]):
+    """One keyset page of a list, newest first.
+
+    ``total`` is the size of the whole list; it is 0 when the page is
+    empty.
+    """
+
+    items: list[T]
+    total: int
+
 
 class UserRepository(ABC):
     """Port for user persistence."""
@@ -54,11 +76,49 @@ class UserRepository(ABC):
     async def save(self, user: User, session: object | None = None) -> None:
         """Persist a user."""
 
+    async def save_many(
+        self, users: Sequence[User], session: object | None = None
+    ) -> None:
+        """Persist many users (one by one unless overridden)."""
+
+        for user in users:
+            await self.save(user, session=session)
+
+    async def list_by_ids(
+        self, user_ids: Sequence[UUID], session: object | None = None
+    ) -> list[User]:
+        """Fetch many users by ID (one by one unless overridden)."""
+
+        users = []
+        for user_id in user_ids:
+            user = await self.get_by_id(user_id, session=session)
+            if user is not None:
+                users.append(user)
+        return users
+
     @abstractmethod
     async def list_pending_role_reminders(
-        self, reminder_cutoff: datetime, session: object | None = None
+        self,
+        reminder_cutoff: datetime,
+        session: object | None = None,
+        *,
+        limit: int | None = None,
+        after_user_id: UUID | None = None,
     ) -> Iterable[User]:
-        """List users who have not chosen a role and are due for a reminder."""
+        """List users who have not chosen a role and are due for a reminder.
+
+        With limit, returns one page ordered by user_id, starting after
+        after_user_id (keyset pagination).
+        """
+
+    @abstractmethod
+    async def update_last_role_reminder_at_many(
+        self,
+        user_ids: Sequence[UUID],
+        reminded_at: datetime,
+        session: object | None = None,
+    ) -> None:
+        """Set last_role_reminder_at for many users in one statement."""
 
     async def iter_all(self) -> Iterable[User]:
         """Iterate all users (optional)."""
@@ -96,6 +156,20 @@ class BloggerProfileRepository(ABC):
     ) -> None:
         """Persist blogger profile."""
 
+    async def save_many(
+        self, profiles: Sequence[BloggerProfile], session: object | None = None
+    ) -> None:
+        """Persist many blogger profiles (one by one unless overridden)."""
+
+        for profile in profiles:
+            await self.save(profile, session=session)
+
+    @abstractmethod
+    async def update_fields(
+        self, user_id: UUID, session: object | None = None, **changes: Any
+    ) -> Optional[BloggerProfile]:
+        """Update only the given fields; return the profile or None."""
+
     @abstractmethod
     async def list_confirmed_user_ids(
         self, session: object | None = None
@@ -118,6 +192,16 @@ class AdvertiserProfileRepository(ABC):
     ) -> None:
         """Persist advertiser profile."""
 
+    async def save_many(
+        self,
+        profiles: Sequence[AdvertiserProfile],
+        session: object | None = None,
+    ) -> None:
+        """Persist many advertiser profiles (one by one unless overridden)."""
+
+        for profile in profiles:
+            await self.save(profile, session=session)
+
 
 class OrderRepository(ABC):
     """Port for order persistence."""
@@ -162,6 +246,47 @@ class OrderRepository(ABC):
     async def save(self, order: Order, session: object | None = None) -> None:
         """Persist order."""
 
+    async def save_many(
+        self, orders: Sequence[Order], session: object | None = None
+    ) -> None:
+        """Persist many orders (one by one unless overridden)."""
+
+        for order in orders:
+            await self.save(order, session=session)
+
+    @abstractmethod
+    async def update_fields(
+        self, order_id: UUID, session: object | None = None, **changes: Any
+    ) -> Optional[Order]:
+        """Update only the given fields; return the order or None."""
+
+    @abstractmethod
+    async def list_page_by_advertiser(
+        self,
+        advertiser_id: UUID,
+        limit: int,
+        before: PageCursor | None = None,
+        after: PageCursor | None = None,
+        session: object | None = None,
+    ) -> Page[Order]:
+        """List one page of an advertiser's orders, newest first.
+
+        ``before`` returns the orders after that (created_at, order_id)
+        cursor in newest-first order (next page), ``after`` those ahead
+        of it (previous page).
+        """
+
+    @abstractmethod
+    async def increment_responses_count(
+        self, order_id: UUID, now: datetime, session: object | None = None
+    ) -> Optional[Order]:
+        """Count one more response on an active order that has room.
+
+        Closes the order (status and completed_at) when the new count
+        reaches bloggers_needed. Returns None when the order is missing,
+        not active or already full.
+        """
+
 
 class OrderResponseRepository(ABC):
     """Port for order response persistence."""
@@ -172,6 +297,14 @@ class OrderResponseRepository(ABC):
     ) -> None:
         """Persist order response."""
 
+    async def save_many(
+        self, responses: Sequence[OrderResponse], session: object | None = None
+    ) -> None:
+        """Persist many order responses (one by one unless overridden)."""
+
+        for response in responses:
+            await self.save(response, session=session)
+
     @abstractmethod
     async def list_by_order(
         self, order_id: UUID, session: object | None = None
@@ -196,6 +329,42 @@ class OrderResponseRepository(ABC):
     ) -> int:
         """Count responses by order."""
 
+    async def count_by_orders(
+        self, order_ids: Sequence[UUID], session: object | None = None
+    ) -> dict[UUID, int]:
+        """Count responses per order (one by one unless overridden)."""
+
+        return {
+            order_id: await self.count_by_order(order_id, session=session)
+            for order_id in order_ids
+        }
+
+    @abstractmethod
+    async def list_page_by_blogger(
+        self,
+        blogger_id: UUID,
+        limit: int,
+        before: PageCursor | None = None,
+        after: PageCursor | None = None,
+        session: object | None = None,
+    ) -> Page[tuple[Order, OrderResponse]]:
+        """List one page of a blogger's responses with their orders.
+
+        Newest response first; ``before`` and ``after`` are keyset cursors
+        on (responded_at, response_id) as in
+        ``OrderRepository.list_page_by_advertiser``.
+        """
+
+    @abstractmethod
+    async def add_if_absent(
+        self, response: OrderResponse, session: object | None = None
+    ) -> bool:
+        """Insert response unless the blogger already responded.
+
+        Returns False when a response for the same order and blogger
+        exists.
+        """
+
 
 class OfferDispatchRepository(ABC):
     """Port for tracking offer dispatches (who received offers)."""
@@ -241,6 +410,22 @@ class InteractionRepository(ABC):
     ) -> Iterable[Interaction]:
         """List interactions for order."""
 
+    async def count_advertiser_feedback_by_orders(
+        self, order_ids: Sequence[UUID], session: object | None = None
+    ) -> dict[UUID, int]:
+        """Count interactions with advertiser feedback per order.
+
+        Loads each order's interactions unless overridden.
+        """
+
+        counts: dict[UUID, int] = {}
+        for order_id in order_ids:
+            interactions = await self.list_by_order(order_id, session=session)
+            counts[order_id] = sum(
+                1 for item in interactions if item.from_advertiser is not None
+            )
+        return counts
+
     @abstractmethod
     async def list_due_for_feedback(
         self, cutoff: datetime, session: object | None = None
@@ -259,6 +444,23 @@ class InteractionRepository(ABC):
     ) -> None:
         """Persist interaction."""
 
+    async def save_many(
+        self, interactions: Sequence[Interaction], session: object | None = None
+    ) -> None:
+        """Persist many interactions (one by one unless overridden)."""
+
+        for interaction in interactions:
+            await self.save(interaction, session=session)
+
+    @abstractmethod
+    async def update_fields(
+        self,
+        interaction_id: UUID,
+        session: object | None = None,
+        **changes: Any,
+    ) -> Optional[Interaction]:
+        """Update only the given fields; return the interaction or None."""
+
     @abstractmethod
     async def update_next_check_at(
         self,
@@ -331,6 +533,16 @@ class InstagramGraphApiClient(ABC):
             Username if found, None otherwise
         """
 
+    async def get_usernames_by_ids(
+        self, instagram_user_ids: Sequence[str]
+    ) -> dict[str, str | None]:
+        """Get usernames of many user IDs; one lookup each by default."""
+
+        return {
+            instagram_user_id: await self.get_username_by_id(instagram_user_id)
+            for instagram_user_id in dict.fromkeys(instagram_user_ids)
+        }
+
 
 class PaymentRepository(ABC):
     """Port for payment persistence."""
@@ -353,6 +565,14 @@ class PaymentRepository(ABC):
     ) -> None:
         """Persist payment."""
 
+    async def save_many(
+        self, payments: Sequence[Payment], session: object | None = None
+    ) -> None:
+        """Persist many payments (one by one unless overridden)."""
+
+        for payment in payments:
+            await self.save(payment, session=session)
+
 
 class ContactPricingRepository(ABC):
     """Port for contact pricing persistence."""
@@ -428,6 +648,14 @@ class ComplaintRepository(ABC):
     ) -> None:
         """Persist complaint."""
 
+    async def save_many(
+        self, complaints: Sequence[Complaint], session: object | None = None
+    ) -> None:
+        """Persist many complaints (one by one unless overridden)."""
+
+        for complaint in complaints:
+            await self.save(complaint, session=session)
+
     @abstractmethod
     async def get_by_id(
         self, complaint_id: UUID, session: object | None = None
@@ -501,8 +729,12 @@ class TransactionManager(Protocol):
     rolls back on exception.
     """
 
-    def transaction(self) -> AsyncContextManager[object]:
+    def transaction(
+        self, readonly: bool = False
+    ) -> AsyncContextManager[object]:
         """Return an async context manager yielding a session.
 
         Use: async with tm.transaction() as session: ...
+        Pass readonly=True for user-facing reads that may use a read
+        replica; scans whose results drive writes stay on the primary.
         """
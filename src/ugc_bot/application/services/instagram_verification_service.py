@@ -134,22 +134,12 @@ class InstagramVerificationService:
             await self.verification_repo.mark_used(
                 valid_code.code_id, session=session
             )
-            confirmed_profile = BloggerProfile(
-                user_id=profile.user_id,
-                instagram_url=profile.instagram_url,
+            await self.blogger_repo.update_fields(
+                profile.user_id,
+                session=session,
                 confirmed=True,
-                city=profile.city,
-                topics=profile.topics,
-                audience_gender=profile.audience_gender,
-                audience_age_min=profile.audience_age_min,
-                audience_age_max=profile.audience_age_max,
-                audience_geo=profile.audience_geo,
-                price=profile.price,
-                barter=profile.barter,
-                work_format=profile.work_format,
                 updated_at=datetime.now(timezone.utc),
             )
-            await self.blogger_repo.save(confirmed_profile, session=session)
             return True
 
         return await with_optional_tx(self.transaction_manager, _run)
@@ -234,22 +224,12 @@ class InstagramVerificationService:
             await self.verification_repo.mark_used(
                 valid_code.code_id, session=session
             )
-            confirmed_profile = BloggerProfile(
-                user_id=profile.user_id,
-                instagram_url=profile.instagram_url,
+            await self.blogger_repo.update_fields(
+                profile.user_id,
+                session=session,
                 confirmed=True,
-                city=profile.city,
-                topics=profile.topics,
-                audience_gender=profile.audience_gender,
-                audience_age_min=profile.audience_age_min,
-                audience_age_max=profile.audience_age_max,
-                audience_geo=profile.audience_geo,
-                price=profile.price,
-                barter=profile.barter,
-                work_format=profile.work_format,
                 updated_at=datetime.now(timezone.utc),
             )
-            await self.blogger_repo.save(confirmed_profile, session=session)
 
         await with_optional_tx(self.transaction_manager, _confirm)
         logger.info(
@@ -86,6 +86,20 @@ class InteractionService:
 
         return await with_optional_tx(self.transaction_manager, _run)
 
+    async def count_advertiser_feedback_by_orders(
+        self, order_ids: list[UUID]
+    ) -> dict[UUID, int]:
+        """Count interactions with advertiser feedback per order."""
+
+        async def _run(session: object | None):
+            return (
+                await self.interaction_repo.count_advertiser_feedback_by_orders(
+                    order_ids, session=session
+                )
+            )
+
+        return await with_optional_tx(self.transaction_manager, _run)
+
     async def create_for_contacts_sent(
         self, order_id: UUID, blogger_id: UUID, advertiser_id: UUID
     ) -> Interaction:
@@ -115,23 +129,15 @@ class InteractionService:
     ) -> None:
         """Set next_check_at (e.g. next 10:00 after feedback request)."""
 
-        interaction = await self._get_by_id(interaction_id)
-        if interaction is None:
-            return
-        updated = Interaction(
-            interaction_id=interaction.interaction_id,
-            order_id=interaction.order_id,
-            blogger_id=interaction.blogger_id,
-            advertiser_id=interaction.advertiser_id,
-            status=interaction.status,
-            from_advertiser=interaction.from_advertiser,
-            from_blogger=interaction.from_blogger,
-            postpone_count=interaction.postpone_count,
-            next_check_at=next_check_at,
-            created_at=interaction.created_at,
-            updated_at=datetime.now(timezone.utc),
-        )
-        await self._save(updated)
+        async def _run(session: object | None) -> None:
+            await self.interaction_repo.update_fields(
+                interaction_id,
+                session=session,
+                next_check_at=next_check_at,
+                updated_at=datetime.now(timezone.utc),
+            )
+
+        await with_optional_tx(self.transaction_manager, _run)
 
     async def get_or_create(
         self, order_id: UUID, blogger_id: UUID, advertiser_id: UUID
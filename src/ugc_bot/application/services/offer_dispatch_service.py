@@ -70,20 +70,23 @@ class OfferDispatchService:
                 order_id, session=session
             )
         )
-        already_sent_set = frozenset(already_sent)
+        excluded = frozenset(already_sent) | {order.advertiser_id}
+        candidate_ids = [
+            user_id for user_id in confirmed_ids if user_id not in excluded
+        ]
+        if not candidate_ids:
+            return []
 
+        # One IN query instead of a get_by_id per blogger
+        candidates = await self.user_repo.list_by_ids(
+            candidate_ids, session=session
+        )
+        by_id = {user.user_id: user for user in candidates}
         users: list[User] = []
-        for user_id in confirmed_ids:
-            if user_id == order.advertiser_id:
-                continue
-            if user_id in already_sent_set:
-                continue
-            user = await self.user_repo.get_by_id(user_id, session=session)
-            if user is None:
-                continue
-            if user.status != UserStatus.ACTIVE:
-                continue
-            users.append(user)
+        for user_id in candidate_ids:
+            user = by_id.get(user_id)
+            if user is not None and user.status == UserStatus.ACTIVE:
+                users.append(user)
         return users
 
     async def record_offer_sent(
@@ -9,6 +9,8 @@ from ugc_bot.application.errors import OrderCreationError
 from ugc_bot.application.ports import (
     OrderRepository,
     OrderResponseRepository,
+    Page,
+    PageCursor,
     TransactionManager,
 )
 from ugc_bot.domain.entities import Order, OrderResponse
@@ -66,6 +68,28 @@ class OfferResponseService:
 
         return await with_optional_tx(self.transaction_manager, _run)
 
+    async def list_page_by_blogger(
+        self,
+        blogger_id: UUID,
+        limit: int,
+        before: PageCursor | None = None,
+        after: PageCursor | None = None,
+    ) -> Page[tuple[Order, OrderResponse]]:
+        """List one keyset page of blogger responses with their orders."""
+
+        async def _run(session: object | None):
+            return await self.response_repo.list_page_by_blogger(
+                blogger_id,
+                limit,
+                before=before,
+                after=after,
+                session=session,
+            )
+
+        return await with_optional_tx(
+            self.transaction_manager, _run, readonly=True
+        )
+
     async def count_by_order(self, order_id: UUID) -> int:
         """Count responses for an order."""
 
@@ -76,10 +100,36 @@ class OfferResponseService:
 
         return await with_optional_tx(self.transaction_manager, _run)
 
+    async def count_by_orders(self, order_ids: list[UUID]) -> dict[UUID, int]:
+        """Count responses for several orders with one grouped query."""
+
+        async def _run(session: object | None):
+            return await self.response_repo.count_by_orders(
+                order_ids, session=session
+            )
+
+        return await with_optional_tx(self.transaction_manager, _run)
+
+    async def has_responded(self, order_id: UUID, blogger_id: UUID) -> bool:
+        """Check whether the blogger responded to the order."""
+
+        async def _run(session: object | None):
+            return await self.response_repo.exists(
+                order_id, blogger_id, session=session
+            )
+
+        return await with_optional_tx(self.transaction_manager, _run)
+
     async def respond_and_finalize(
         self, order_id: UUID, blogger_id: UUID
     ) -> OfferResponseResult:
-        """Create response and update order in a single atomic transaction."""
+        """Create response and update order in a single atomic transaction.
+
+        Two statements: one ``UPDATE ... RETURNING`` that bumps
+        ``responses_count`` (closing the order when it is full) and a
+        conditional insert of the response. No ``SELECT ... FOR UPDATE``
+        or response count is needed.
+        """
 
         if self.transaction_manager is None:
             raise ValueError(
@@ -87,38 +137,27 @@ class OfferResponseService:
             )
 
         now = datetime.now(timezone.utc)
+        response = OrderResponse(
+            response_id=uuid4(),
+            order_id=order_id,
+            blogger_id=blogger_id,
+            responded_at=now,
+        )
         async with self.transaction_manager.transaction() as session:
-            order = await self.order_repo.get_by_id_for_update(
-                order_id, session=session
+            updated = await self.order_repo.increment_responses_count(
+                order_id, now, session=session
             )
-            if order is None:
-                raise OrderCreationError("Order not found.")
-            if order.status != OrderStatus.ACTIVE:
-                raise OrderCreationError("Order is not active.")
-            if await self.response_repo.exists(
-                order_id, blogger_id, session=session
+            if updated is None:
+                order = await self.order_repo.get_by_id(
+                    order_id, session=session
+                )
+                raise OrderCreationError(_rejection_reason(order))
+            # A duplicate rolls the counter update back with the transaction.
+            if not await self.response_repo.add_if_absent(
+                response, session=session
             ):
                 raise OrderCreationError("You already responded to this order.")
 
-            response_count = await self.response_repo.count_by_order(
-                order_id, session=session
-            )
-            if response_count >= order.bloggers_needed:
-                raise OrderCreationError("Order response limit reached.")
-
-            response = OrderResponse(
-                response_id=uuid4(),
-                order_id=order_id,
-                blogger_id=blogger_id,
-                responded_at=now,
-            )
-            await self.response_repo.save(response, session=session)
-            response_count += 1
-            updated = _update_order_after_response(
-                order, response_count, now=now
-            )
-            await self.order_repo.save(updated, session=session)
-
         if self.metrics_collector:
             self.metrics_collector.record_blogger_response(
                 order_id=str(order_id),
@@ -129,38 +168,17 @@ class OfferResponseService:
         return OfferResponseResult(
             order=updated,
             response=response,
-            response_count=response_count,
+            response_count=updated.responses_count,
             order_closed=order_closed,
             completed_at=updated.completed_at,
         )
 
 
-def _update_order_after_response(
-    order: Order, response_count: int, now: datetime
-) -> Order:
-    """Return updated order after a response is accepted."""
-
-    new_status = (
-        OrderStatus.CLOSED
-        if response_count >= order.bloggers_needed
-        else order.status
-    )
-    completed_at = (
-        now if response_count >= order.bloggers_needed else order.completed_at
-    )
-    return Order(
-        order_id=order.order_id,
-        advertiser_id=order.advertiser_id,
-        order_type=order.order_type,
-        product_link=order.product_link,
-        offer_text=order.offer_text,
-        barter_description=order.barter_description,
-        price=order.price,
-        bloggers_needed=order.bloggers_needed,
-        status=new_status,
-        created_at=order.created_at,
-        completed_at=completed_at,
-        content_usage=order.content_usage,
-        deadlines=order.deadlines,
-        geography=order.geography,
-    )
+def _rejection_reason(order: Order | None) -> str:
+    """Explain why the counter update matched no order row."""
+
+    if order is None:
+        return "Order not found."
+    if order.status != OrderStatus.ACTIVE:
+        return "Order is not active."
+    return "Order response limit reached."
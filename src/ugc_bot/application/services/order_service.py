@@ -10,6 +10,8 @@ from ugc_bot.application.errors import OrderCreationError, UserNotFoundError
 from ugc_bot.application.ports import (
     AdvertiserProfileRepository,
     OrderRepository,
+    Page,
+    PageCursor,
     TransactionManager,
     UserRepository,
 )
@@ -90,7 +92,31 @@ class OrderService:
                 )
             )
 
-        return await with_optional_tx(self.transaction_manager, _run)
+        return await with_optional_tx(
+            self.transaction_manager, _run, readonly=True
+        )
+
+    async def list_page_by_advertiser(
+        self,
+        advertiser_id: UUID,
+        limit: int,
+        before: PageCursor | None = None,
+        after: PageCursor | None = None,
+    ) -> Page[Order]:
+        """List one keyset page of advertiser orders, newest first."""
+
+        async def _run(session: object | None):
+            return await self.order_repo.list_page_by_advertiser(
+                advertiser_id,
+                limit,
+                before=before,
+                after=after,
+                session=session,
+            )
+
+        return await with_optional_tx(
+            self.transaction_manager, _run, readonly=True
+        )
 
     async def get_order(self, order_id: UUID) -> Order | None:
         """Fetch order by id within a transaction boundary."""
@@ -158,27 +158,10 @@ class OutboxPublisher:
         """Process order activation event."""
 
         order_id = UUID(event.payload["order_id"])
-        order = await self.order_repo.get_by_id(order_id, session=session)
-        if order is None:
-            raise ValueError(f"Order {order_id} not found")
-
-        activated_order = Order(
-            order_id=order.order_id,
-            advertiser_id=order.advertiser_id,
-            order_type=order.order_type,
-            product_link=order.product_link,
-            offer_text=order.offer_text,
-            barter_description=order.barter_description,
-            price=order.price,
-            bloggers_needed=order.bloggers_needed,
-            status=OrderStatus.ACTIVE,
-            created_at=order.created_at,
-            completed_at=order.completed_at,
-            content_usage=order.content_usage,
-            deadlines=order.deadlines,
-            geography=order.geography,
-            product_photo_file_id=order.product_photo_file_id,
+        activated_order = await self.order_repo.update_fields(
+            order_id, session=session, status=OrderStatus.ACTIVE
         )
-        await self.order_repo.save(activated_order, session=session)
+        if activated_order is None:
+            raise ValueError(f"Order {order_id} not found")
 
         await kafka_publisher.publish(activated_order)
@@ -16,7 +16,11 @@ from ugc_bot.infrastructure.db.session import with_optional_tx
 
 @dataclass(slots=True)
 class ProfileService:
-    """Build user profile summaries from repositories."""
+    """Build user profile summaries from repositories.
+
+    Lookups are read-only and may be served by the read replica; services
+    that change a profile re-read it inside their own write transaction.
+    """
 
     user_repo: UserRepository
     blogger_repo: BloggerProfileRepository
@@ -33,7 +37,9 @@ class ProfileService:
                 external_id, messenger_type, session=session
             )
 
-        return await with_optional_tx(self.transaction_manager, _run)
+        return await with_optional_tx(
+            self.transaction_manager, _run, readonly=True
+        )
 
     async def get_blogger_profile(self, user_id: UUID) -> BloggerProfile | None:
         """Fetch blogger profile by user id."""
@@ -43,7 +49,9 @@ class ProfileService:
                 user_id, session=session
             )
 
-        return await with_optional_tx(self.transaction_manager, _run)
+        return await with_optional_tx(
+            self.transaction_manager, _run, readonly=True
+        )
 
     async def get_advertiser_profile(
         self, user_id: UUID
@@ -55,4 +63,6 @@ class ProfileService:
                 user_id, session=session
             )
 
-        return await with_optional_tx(self.transaction_manager, _run)
+        return await with_optional_tx(
+            self.transaction_manager, _run, readonly=True
+        )
@@ -1,8 +1,10 @@
 """Service for user creation and lookup."""
 
 import logging
+from collections.abc import AsyncIterator, Sequence
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import partial
 from typing import Any, Optional
 from uuid import UUID, uuid4
 
@@ -219,6 +221,41 @@ class UserRoleService:
 
         return await with_optional_tx(self.transaction_manager, _run)
 
+    async def iter_pending_role_reminders(
+        self, reminder_cutoff: datetime, page_size: int
+    ) -> AsyncIterator[list[User]]:
+        """Yield users due for a role reminder in pages of page_size.
+
+        Each page is read in its own short transaction using keyset
+        pagination on user_id, so the full list is never held in memory.
+        Pages come from the primary: reminders sent from a lagging replica
+        would repeat ones already recorded.
+        """
+
+        async def _run(
+            session: object | None, after_user_id: UUID | None
+        ) -> list[User]:
+            return list(
+                await self.user_repo.list_pending_role_reminders(
+                    reminder_cutoff,
+                    session=session,
+                    limit=page_size,
+                    after_user_id=after_user_id,
+                )
+            )
+
+        after: UUID | None = None
+        while True:
+            page = await with_optional_tx(
+                self.transaction_manager, partial(_run, after_user_id=after)
+            )
+            if not page:
+                return
+            yield page
+            if len(page) < page_size:
+                return
+            after = page[-1].user_id
+
     async def list_admins(
         self, messenger_type: MessengerType | None = None
     ) -> list[User]:
@@ -257,3 +294,19 @@ class UserRoleService:
             await self.user_repo.save(updated, session=session)
 
         await with_optional_tx(self.transaction_manager, _run)
+
+    async def update_last_role_reminder_at_many(
+        self, user_ids: Sequence[UUID]
+    ) -> None:
+        """Set last_role_reminder_at to now for many users at once."""
+
+        if not user_ids:
+            return
+        now = datetime.now(timezone.utc)
+
+        async def _run(session: object | None) -> None:
+            await self.user_repo.update_last_role_reminder_at_many(
+                user_ids, now, session=session
+            )
+
+        await with_optional_tx(self.transaction_manager, _run)
@@ -15,7 +15,15 @@ from ugc_bot.application.services.advertiser_registration_service import (
 from ugc_bot.application.services.fsm_draft_service import FsmDraftService
 from ugc_bot.application.services.profile_service import ProfileService
 from ugc_bot.application.services.user_role_service import UserRoleService
-from ugc_bot.bot.handlers.keyboards import (
+from ugc_bot.bot.handlers.utils import (
+    format_agreements_message,
+    get_user_and_ensure_allowed,
+    handle_draft_choice,
+    handle_role_choice,
+    parse_user_id_from_state,
+)
+from ugc_bot.bot.keyboards import (
+    ADVERTISER_LABEL,
     ADVERTISER_START_BUTTON_TEXT,
     CONFIRM_AGREEMENT_BUTTON_TEXT,
     DRAFT_QUESTION_TEXT,
@@ -24,14 +32,6 @@ from ugc_bot.bot.handlers.keyboards import (
     draft_choice_keyboard,
     flow_keyboard_remove,
 )
-from ugc_bot.bot.handlers.start import ADVERTISER_LABEL
-from ugc_bot.bot.handlers.utils import (
-    format_agreements_message,
-    get_user_and_ensure_allowed,
-    handle_draft_choice,
-    handle_role_choice,
-    parse_user_id_from_state,
-)
 from ugc_bot.bot.validators import (
     normalize_url,
     validate_brand,
@@ -17,9 +17,17 @@ from ugc_bot.application.services.fsm_draft_service import FsmDraftService
 from ugc_bot.application.services.order_service import MAX_ORDER_PRICE
 from ugc_bot.application.services.profile_service import ProfileService
 from ugc_bot.application.services.user_role_service import UserRoleService
-from ugc_bot.bot.handlers.keyboards import (
+from ugc_bot.bot.handlers.utils import (
+    format_agreements_message,
+    get_user_and_ensure_allowed,
+    handle_draft_choice,
+    handle_role_choice,
+    parse_user_id_from_state,
+)
+from ugc_bot.bot.keyboards import (
     CONFIRM_AGREEMENT_BUTTON_TEXT,
     CREATE_PROFILE_BUTTON_TEXT,
+    CREATOR_LABEL,
     DRAFT_QUESTION_TEXT,
     WORK_FORMAT_ADS_BUTTON_TEXT,
     WORK_FORMAT_UGC_ONLY_BUTTON_TEXT,
@@ -30,14 +38,6 @@ from ugc_bot.bot.handlers.keyboards import (
     flow_keyboard,
     flow_keyboard_remove,
 )
-from ugc_bot.bot.handlers.start import CREATOR_LABEL
-from ugc_bot.bot.handlers.utils import (
-    format_agreements_message,
-    get_user_and_ensure_allowed,
-    handle_draft_choice,
-    handle_role_choice,
-    parse_user_id_from_state,
-)
 from ugc_bot.bot.validators import (
     validate_audience_geo,
     validate_city,
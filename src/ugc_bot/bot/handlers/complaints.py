@@ -120,9 +120,8 @@ async def select_complaint_target(
         )
     else:
         # Blogger: complain about advertiser
-        responses = await offer_response_service.list_by_order(order_id)
-        if not any(
-            response.blogger_id == user.user_id for response in responses
+        if not await offer_response_service.has_responded(
+            order_id, user.user_id
         ):
             await callback.answer("У вас нет доступа к этому заказу.")
             return
@@ -198,24 +197,25 @@ async def start_complaint(
         await callback.answer("Заказ не найден.")
         return
 
-    # Verify user has access to this order
-    if order.advertiser_id != user.user_id:
-        # Check if user is a blogger who responded to this order
-        responses = await offer_response_service.list_by_order(order_id)
-        if not any(
-            response.blogger_id == user.user_id for response in responses
-        ):
-            await callback.answer("У вас нет доступа к этому заказу.")
-            return
+    # Verify user has access: the advertiser or a blogger who responded
+    if (
+        order.advertiser_id != user.user_id
+        and not await offer_response_service.has_responded(
+            order_id, user.user_id
+        )
+    ):
+        await callback.answer("У вас нет доступа к этому заказу.")
+        return
 
     # Verify reported_id is valid (either advertiser or blogger from this order)
-    if reported_id != order.advertiser_id:
-        responses = await offer_response_service.list_by_order(order_id)
-        if not any(
-            response.blogger_id == reported_id for response in responses
-        ):
-            await callback.answer("Неверный идентификатор пользователя.")
-            return
+    if (
+        reported_id != order.advertiser_id
+        and not await offer_response_service.has_responded(
+            order_id, reported_id
+        )
+    ):
+        await callback.answer("Неверный идентификатор пользователя.")
+        return
 
     # Store complaint data in state
     await state.update_data(
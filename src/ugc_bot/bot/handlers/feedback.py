@@ -235,13 +235,10 @@ async def _advertiser_has_feedback_for_bloggers_needed(
     order = await order_service.get_order(interaction.order_id)
     if order is None:
         return False
-    interactions = await interaction_service.list_interactions_by_order(
-        interaction.order_id
+    counts = await interaction_service.count_advertiser_feedback_by_orders(
+        [interaction.order_id]
     )
-    count_with_feedback = sum(
-        1 for i in interactions if i.from_advertiser is not None
-    )
-    return count_with_feedback >= order.bloggers_needed
+    return counts.get(interaction.order_id, 0) >= order.bloggers_needed
 
 
 def _can_access_interaction(
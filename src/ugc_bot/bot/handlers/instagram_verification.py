@@ -14,11 +14,11 @@ from ugc_bot.application.services.instagram_verification_service import (
 )
 from ugc_bot.application.services.profile_service import ProfileService
 from ugc_bot.application.services.user_role_service import UserRoleService
-from ugc_bot.bot.handlers.keyboards import (
+from ugc_bot.bot.handlers.utils import get_user_and_ensure_allowed
+from ugc_bot.bot.keyboards import (
     CONFIRM_INSTAGRAM_BUTTON_TEXT,
     blogger_verification_sent_keyboard,
 )
-from ugc_bot.bot.handlers.utils import get_user_and_ensure_allowed
 from ugc_bot.config import AppConfig
 
 router = Router()
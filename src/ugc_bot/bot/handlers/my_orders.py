@@ -1,8 +1,11 @@
 """Handlers for advertiser and blogger orders."""
 
-from datetime import datetime
+import binascii
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import datetime, timedelta, timezone
 from math import ceil
 from typing import Optional
+from uuid import UUID
 
 from aiogram import Router
 from aiogram.filters import Command
@@ -13,17 +16,18 @@ from aiogram.types import (
     Message,
 )
 
+from ugc_bot.application.ports import Page, PageCursor
 from ugc_bot.application.services.offer_response_service import (
     OfferResponseService,
 )
 from ugc_bot.application.services.order_service import OrderService
 from ugc_bot.application.services.profile_service import ProfileService
 from ugc_bot.application.services.user_role_service import UserRoleService
-from ugc_bot.bot.handlers.keyboards import MY_ORDERS_BUTTON_TEXT
 from ugc_bot.bot.handlers.utils import (
     get_user_and_ensure_allowed,
     get_user_and_ensure_allowed_callback,
 )
+from ugc_bot.bot.keyboards import MY_ORDERS_BUTTON_TEXT
 from ugc_bot.domain.entities import Order, OrderResponse
 from ugc_bot.domain.enums import OrderStatus, OrderType
 
@@ -68,6 +72,45 @@ def _format_price_and_barter(order: Order) -> list[str]:
 _PAGE_SIZE = 5
 _MY_ORDERS_CALLBACK_PREFIX = "my_orders:"
 _MY_ORDERS_BLOGGER_CALLBACK_PREFIX = "my_orders_blogger:"
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _cursor(direction: str, position: PageCursor) -> str:
+    """Encode a keyset cursor ("b"efore/"a"fter) as "<µs>.<id>".
+
+    The id is base64 so the callback data stays within Telegram's 64
+    bytes.
+    """
+
+    moment, row_id = position
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    micros = (moment - _EPOCH) // timedelta(microseconds=1)
+    encoded_id = urlsafe_b64encode(row_id.bytes).rstrip(b"=").decode()
+    return f"{direction}{micros}.{encoded_id}"
+
+
+def _parse_page_data(
+    raw: str,
+) -> tuple[int, Optional[PageCursor], Optional[PageCursor]]:
+    """Parse "<page>[:<cursor>]" into page number, before and after.
+
+    Callbacks without a cursor (or with a broken one) open the first page.
+    """
+
+    page_raw, _, cursor = raw.partition(":")
+    micros, _, encoded_id = cursor[1:].partition(".")
+    try:
+        page = int(page_raw)
+        moment = _EPOCH + timedelta(microseconds=int(micros))
+        row_id = UUID(bytes=urlsafe_b64decode(encoded_id + "=="))
+    except (ValueError, binascii.Error):
+        return 1, None, None
+    if cursor[:1] == "b":
+        return page, (moment, row_id), None
+    if cursor[:1] == "a":
+        return page, None, (moment, row_id)
+    return 1, None, None
 
 
 @router.message(Command("my_orders"))
@@ -102,29 +145,20 @@ async def show_my_orders(
         return
 
     if advertiser is not None:
-        orders = sorted(
-            await order_service.list_by_advertiser(user.user_id),
-            key=lambda item: item.created_at,
-            reverse=True,
+        orders = await order_service.list_page_by_advertiser(
+            user.user_id, _PAGE_SIZE
         )
-        if orders:
-            text, keyboard = await _render_page(
-                orders, page=1, offer_response_service=offer_response_service
-            )
+        if orders.items:
+            text, keyboard = _render_page(orders, page=1)
             await message.answer(text, reply_markup=keyboard)
         else:
             await message.answer("У вас пока нет заказов. /create_order")
 
     if blogger is not None:
-        responses = await offer_response_service.list_by_blogger(user.user_id)
-        order_responses = []
-        for resp in sorted(
-            responses, key=lambda r: r.responded_at, reverse=True
-        ):
-            order = await order_service.get_order(resp.order_id)
-            if order is not None:
-                order_responses.append((order, resp))
-        if order_responses:
+        order_responses = await offer_response_service.list_page_by_blogger(
+            user.user_id, _PAGE_SIZE
+        )
+        if order_responses.items:
             text, keyboard = _render_blogger_orders_page(
                 order_responses, page=1
             )
@@ -168,18 +202,15 @@ async def paginate_orders(
         if blogger is None:
             await callback.answer("Профиль блогера не заполнен.")
             return
-        try:
-            page = int(raw)
-        except ValueError:
+        page, before, after = _parse_page_data(raw)
+        order_responses = await offer_response_service.list_page_by_blogger(
+            user.user_id, _PAGE_SIZE, before=before, after=after
+        )
+        if not order_responses.items and (before or after):
             page = 1
-        responses = await offer_response_service.list_by_blogger(user.user_id)
-        order_responses = []
-        for resp in sorted(
-            responses, key=lambda r: r.responded_at, reverse=True
-        ):
-            order = await order_service.get_order(resp.order_id)
-            if order is not None:
-                order_responses.append((order, resp))
+            order_responses = await offer_response_service.list_page_by_blogger(
+                user.user_id, _PAGE_SIZE
+            )
         text, keyboard = _render_blogger_orders_page(order_responses, page=page)
     else:
         raw = data.split(_MY_ORDERS_CALLBACK_PREFIX, 1)[-1]
@@ -187,18 +218,16 @@ async def paginate_orders(
         if advertiser is None:
             await callback.answer("Профиль рекламодателя не заполнен.")
             return
-        try:
-            page = int(raw)
-        except ValueError:
-            page = 1
-        orders = sorted(
-            await order_service.list_by_advertiser(user.user_id),
-            key=lambda item: item.created_at,
-            reverse=True,
-        )
-        text, keyboard = await _render_page(
-            orders, page=page, offer_response_service=offer_response_service
+        page, before, after = _parse_page_data(raw)
+        orders = await order_service.list_page_by_advertiser(
+            user.user_id, _PAGE_SIZE, before=before, after=after
         )
+        if not orders.items and (before or after):
+            page = 1
+            orders = await order_service.list_page_by_advertiser(
+                user.user_id, _PAGE_SIZE
+            )
+        text, keyboard = _render_page(orders, page=page)
 
     message = callback.message
     if message and hasattr(message, "edit_text"):
@@ -206,32 +235,54 @@ async def paginate_orders(
     await callback.answer()
 
 
-async def _render_page(
-    orders, page: int, offer_response_service: OfferResponseService
+def _nav_buttons(
+    prefix: str,
+    page: int,
+    total_pages: int,
+    newest: PageCursor,
+    oldest: PageCursor,
+) -> list[InlineKeyboardButton]:
+    """Back/forward buttons carrying the page number and keyset cursor."""
+
+    buttons: list[InlineKeyboardButton] = []
+    if page > 1:
+        buttons.append(
+            InlineKeyboardButton(
+                text="⬅️ Назад",
+                callback_data=f"{prefix}{page - 1}:{_cursor('a', newest)}",
+            )
+        )
+    if page < total_pages:
+        buttons.append(
+            InlineKeyboardButton(
+                text="Вперед ➡️",
+                callback_data=f"{prefix}{page + 1}:{_cursor('b', oldest)}",
+            )
+        )
+    return buttons
+
+
+def _render_page(
+    orders: Page[Order], page: int
 ) -> tuple[str, InlineKeyboardMarkup]:
-    """Render paginated orders list."""
+    """Render one page of advertiser orders."""
 
-    total_pages = max(1, ceil(len(orders) / _PAGE_SIZE))
+    total_pages = max(1, ceil(orders.total / _PAGE_SIZE))
     page = max(1, min(page, total_pages))
     start = (page - 1) * _PAGE_SIZE
-    end = start + _PAGE_SIZE
-    slice_orders = orders[start:end]
 
     lines = [f"Ваши заказы (страница {page}/{total_pages}):"]
     buttons_rows: list[list[InlineKeyboardButton]] = []
 
-    for idx, order in enumerate(slice_orders):
+    for idx, order in enumerate(orders.items):
         # Нумерация по дате создания: 1 = первый созданный (самый старый)
-        creation_number = len(orders) - start - idx
-        matched_count = await offer_response_service.count_by_order(
-            order.order_id
-        )
+        creation_number = orders.total - start - idx
         status_label = ORDER_STATUS_LABELS.get(order.status, order.status.value)
         order_lines = [
             f"№ {creation_number}",
             f"Статус: {status_label}",
             f"Креаторов: {order.bloggers_needed}",
-            f"Подобрано: {matched_count} / {order.bloggers_needed}",
+            f"Подобрано: {order.responses_count} / {order.bloggers_needed}",
             *_format_price_and_barter(order),
             f"Дата создания: {_format_date(order.created_at)}",
             f"Дата завершения: {_format_date(order.completed_at)}",
@@ -239,60 +290,46 @@ async def _render_page(
         ]
         lines.append("\n".join(order_lines))
 
-    # Pagination buttons
-    nav_buttons: list[InlineKeyboardButton] = []
-    if page > 1:
-        nav_buttons.append(
-            InlineKeyboardButton(
-                text="⬅️ Назад",
-                callback_data=f"{_MY_ORDERS_CALLBACK_PREFIX}{page - 1}",
-            )
+    if orders.items:
+        nav_buttons = _nav_buttons(
+            _MY_ORDERS_CALLBACK_PREFIX,
+            page,
+            total_pages,
+            newest=(orders.items[0].created_at, orders.items[0].order_id),
+            oldest=(orders.items[-1].created_at, orders.items[-1].order_id),
         )
-    if page < total_pages:
-        nav_buttons.append(
-            InlineKeyboardButton(
-                text="Вперед ➡️",
-                callback_data=f"{_MY_ORDERS_CALLBACK_PREFIX}{page + 1}",
-            )
-        )
-    if nav_buttons:
-        buttons_rows.append(nav_buttons)
+        if nav_buttons:
+            buttons_rows.append(nav_buttons)
 
     keyboard = InlineKeyboardMarkup(inline_keyboard=buttons_rows)
     return "\n\n".join(lines), keyboard
 
 
+def _response_cursor(response: OrderResponse) -> PageCursor:
+    return response.responded_at, response.response_id
+
+
 def _render_blogger_orders_page(
-    order_responses: list[tuple[Order, OrderResponse]],
+    order_responses: Page[tuple[Order, OrderResponse]],
     page: int = 1,
 ) -> tuple[str, InlineKeyboardMarkup]:
-    """Render paginated list of orders the blogger responded to."""
+    """Render one page of orders the blogger responded to."""
 
-    total_pages = max(1, ceil(len(order_responses) / _PAGE_SIZE))
+    total_pages = max(1, ceil(order_responses.total / _PAGE_SIZE))
     page = max(1, min(page, total_pages))
     start = (page - 1) * _PAGE_SIZE
-    end = start + _PAGE_SIZE
-    slice_pairs = order_responses[start:end]
-
-    # Нумерация по дате создания заказа: 1 = первый созданный
-    orders_sorted_by_created = sorted(
-        order_responses, key=lambda pair: pair[0].created_at
-    )
-    order_id_to_number = {
-        order.order_id: idx + 1
-        for idx, (order, _) in enumerate(orders_sorted_by_created)
-    }
 
     lines = [
         f"Заказы, на которые вы откликнулись (страница {page}/{total_pages}):"
     ]
     buttons_rows: list[list[InlineKeyboardButton]] = []
 
-    for order, _response in slice_pairs:
-        creation_number = order_id_to_number.get(order.order_id, 0)
+    for idx, (order, _response) in enumerate(order_responses.items):
+        # Нумерация по дате отклика: 1 = первый отклик
+        response_number = order_responses.total - start - idx
         status_label = ORDER_STATUS_LABELS.get(order.status, order.status.value)
         order_lines = [
-            f"№ {creation_number}",
+            f"№ {response_number}",
             f"Статус: {status_label}",
             f"Формат: {_format_order_type(order)}",
             *_format_price_and_barter(order),
@@ -300,23 +337,16 @@ def _render_blogger_orders_page(
         ]
         lines.append("\n".join(order_lines))
 
-    nav_buttons: list[InlineKeyboardButton] = []
-    if page > 1:
-        nav_buttons.append(
-            InlineKeyboardButton(
-                text="⬅️ Назад",
-                callback_data=f"{_MY_ORDERS_BLOGGER_CALLBACK_PREFIX}{page - 1}",
-            )
-        )
-    if page < total_pages:
-        nav_buttons.append(
-            InlineKeyboardButton(
-                text="Вперед ➡️",
-                callback_data=f"{_MY_ORDERS_BLOGGER_CALLBACK_PREFIX}{page + 1}",
-            )
+    if order_responses.items:
+        nav_buttons = _nav_buttons(
+            _MY_ORDERS_BLOGGER_CALLBACK_PREFIX,
+            page,
+            total_pages,
+            newest=_response_cursor(order_responses.items[0][1]),
+            oldest=_response_cursor(order_responses.items[-1][1]),
         )
-    if nav_buttons:
-        buttons_rows.append(nav_buttons)
+        if nav_buttons:
+            buttons_rows.append(nav_buttons)
 
     keyboard = InlineKeyboardMarkup(inline_keyboard=buttons_rows)
     return "\n\n".join(lines), keyboard
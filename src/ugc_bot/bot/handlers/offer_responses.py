@@ -25,8 +25,8 @@ from ugc_bot.bot.handlers.security_warnings import (
 from ugc_bot.bot.handlers.utils import (
     RateLimiter,
     get_user_and_ensure_allowed_callback,
-    send_with_retry,
 )
+from ugc_bot.bot.sending import send_with_retry
 from ugc_bot.domain.entities import Order
 
 router = Router()
@@ -24,13 +24,6 @@ from ugc_bot.application.services.order_service import (
 )
 from ugc_bot.application.services.profile_service import ProfileService
 from ugc_bot.application.services.user_role_service import UserRoleService
-from ugc_bot.bot.handlers.keyboards import (
-    CREATE_ORDER_BUTTON_TEXT,
-    DRAFT_QUESTION_TEXT,
-    draft_choice_keyboard,
-    flow_keyboard,
-    flow_keyboard_remove,
-)
 from ugc_bot.bot.handlers.payments import send_order_invoice
 from ugc_bot.bot.handlers.security_warnings import ORDER_CREATED_MESSAGE
 from ugc_bot.bot.handlers.utils import (
@@ -38,6 +31,13 @@ from ugc_bot.bot.handlers.utils import (
     handle_draft_choice,
     parse_user_id_from_state,
 )
+from ugc_bot.bot.keyboards import (
+    CREATE_ORDER_BUTTON_TEXT,
+    DRAFT_QUESTION_TEXT,
+    draft_choice_keyboard,
+    flow_keyboard,
+    flow_keyboard_remove,
+)
 from ugc_bot.bot.validators import (
     normalize_url,
     validate_barter_description,
@@ -24,13 +24,13 @@ from ugc_bot.application.services.content_moderation_service import (
 from ugc_bot.application.services.payment_service import PaymentService
 from ugc_bot.application.services.profile_service import ProfileService
 from ugc_bot.application.services.user_role_service import UserRoleService
-from ugc_bot.bot.handlers.keyboards import advertiser_after_payment_keyboard
 from ugc_bot.bot.handlers.security_warnings import (
     ADVERTISER_AFTER_PAYMENT_IMPORTANT,
     ADVERTISER_AFTER_PAYMENT_SUCCESS,
     ADVERTISER_AFTER_PAYMENT_WHAT_NEXT,
 )
 from ugc_bot.bot.handlers.utils import get_user_and_ensure_allowed
+from ugc_bot.bot.keyboards import advertiser_after_payment_keyboard
 from ugc_bot.config import AppConfig
 from ugc_bot.domain.enums import OrderStatus
 
@@ -20,7 +20,11 @@ from ugc_bot.application.services.fsm_draft_service import FsmDraftService
 from ugc_bot.application.services.order_service import MAX_ORDER_PRICE
 from ugc_bot.application.services.profile_service import ProfileService
 from ugc_bot.application.services.user_role_service import UserRoleService
-from ugc_bot.bot.handlers.keyboards import (
+from ugc_bot.bot.handlers.utils import (
+    handle_draft_choice,
+    parse_user_id_from_state,
+)
+from ugc_bot.bot.keyboards import (
     DRAFT_QUESTION_TEXT,
     EDIT_PROFILE_BUTTON_TEXT,
     MY_PROFILE_BUTTON_TEXT,
@@ -32,10 +36,6 @@ from ugc_bot.bot.handlers.keyboards import (
     flow_keyboard,
     flow_keyboard_remove,
 )
-from ugc_bot.bot.handlers.utils import (
-    handle_draft_choice,
-    parse_user_id_from_state,
-)
 from ugc_bot.bot.validators import (
     validate_audience_geo,
     validate_brand,
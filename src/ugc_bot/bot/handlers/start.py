@@ -3,32 +3,27 @@
 from aiogram import Router
 from aiogram.filters import Command, CommandStart
 from aiogram.fsm.context import FSMContext
-from aiogram.types import KeyboardButton, Message, ReplyKeyboardMarkup
+from aiogram.types import Message
 
 from ugc_bot.application.services.fsm_draft_service import FsmDraftService
 from ugc_bot.application.services.profile_service import ProfileService
 from ugc_bot.application.services.user_role_service import UserRoleService
-from ugc_bot.bot.handlers.keyboards import (
+from ugc_bot.bot.keyboards import (
     CHANGE_ROLE_BUTTON_TEXT,
+    START_TEXT,
     SUPPORT_BUTTON_TEXT,
     advertiser_menu_keyboard,
     main_menu_keyboard,
+    role_keyboard,
 )
 from ugc_bot.domain.enums import MessengerType
 
 router = Router()
 
-START_TEXT = (
-    "UMC — сервис для UGC.\n" "Бизнесу — подбор креаторов, креаторам — заказы."
-)
-
 SUPPORT_RESPONSE_TEXT = (
     "Служба поддержки: @usemycontent\n" "Обращайтесь по любым вопросам!"
 )
 
-CREATOR_LABEL = "Я креатор"
-ADVERTISER_LABEL = "Мне нужны UGC‑креаторы"
-
 
 @router.message(CommandStart())
 async def start_command(
@@ -53,7 +48,7 @@ async def start_command(
         role_chosen=False,
         telegram_username=message.from_user.username,
     )
-    await message.answer(START_TEXT, reply_markup=_role_keyboard())
+    await message.answer(START_TEXT, reply_markup=role_keyboard())
 
 
 @router.message(Command("role"))
@@ -61,7 +56,7 @@ async def start_command(
 async def change_role_button(message: Message, state: FSMContext) -> None:
     """Handle /role and 'Смена роли' — show start screen again."""
     await state.clear()
-    await message.answer(START_TEXT, reply_markup=_role_keyboard())
+    await message.answer(START_TEXT, reply_markup=role_keyboard())
 
 
 _STATE_TO_FLOW: dict[str, str] = {
@@ -141,17 +136,3 @@ async def support_button(
         SUPPORT_RESPONSE_TEXT,
         reply_markup=reply_markup,
     )
-
-
-def _role_keyboard() -> ReplyKeyboardMarkup:
-    """Build a reply keyboard for role selection."""
-
-    return ReplyKeyboardMarkup(
-        keyboard=[
-            [KeyboardButton(text=CREATOR_LABEL)],
-            [KeyboardButton(text=ADVERTISER_LABEL)],
-            [KeyboardButton(text=SUPPORT_BUTTON_TEXT)],
-        ],
-        resize_keyboard=True,
-        one_time_keyboard=True,
-    )
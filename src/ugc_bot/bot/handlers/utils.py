@@ -2,8 +2,6 @@
 
 from __future__ import annotations
 
-import asyncio
-import logging
 from collections.abc import Awaitable
 from dataclasses import dataclass, field
 from time import monotonic
@@ -21,7 +19,7 @@ from aiogram.types import (
 
 from ugc_bot.application.services.fsm_draft_service import FsmDraftService
 from ugc_bot.bot.handlers.draft_prompts import get_draft_prompt
-from ugc_bot.bot.handlers.keyboards import (
+from ugc_bot.bot.keyboards import (
     DRAFT_RESTORED_TEXT,
     RESUME_DRAFT_BUTTON_TEXT,
     START_OVER_BUTTON_TEXT,
@@ -54,39 +52,6 @@ class RateLimiter:
         return True
 
 
-async def send_with_retry(
-    bot,
-    chat_id: int,
-    text: str,
-    *,
-    retries: int,
-    delay_seconds: float,
-    logger: logging.Logger,
-    extra: dict[str, Any] | None = None,
-    **kwargs: Any,
-) -> bool:
-    """Send a message with retry on failures."""
-
-    for attempt in range(1, retries + 1):
-        try:
-            await bot.send_message(chat_id=chat_id, text=text, **kwargs)
-            return True
-        except Exception as exc:  # pragma: no cover - depends on network errors
-            logger.warning(
-                "Send message failed",
-                extra={
-                    "attempt": attempt,
-                    "retries": retries,
-                    "chat_id": chat_id,
-                    "error": str(exc),
-                    **(extra or {}),
-                },
-            )
-            if attempt < retries:
-                await asyncio.sleep(delay_seconds)
-    return False
-
-
 def format_agreements_message(
     config: AppConfig,
     intro: str = "Профиль создан. Ознакомьтесь с документами и подтвердите.",
@@ -0,0 +1,98 @@
+"""One Bot API HTTP session per process, shared by every Bot.
+
+aiogram gives each ``Bot`` its own aiohttp session by default, so every
+new ``Bot`` pays DNS, TCP and TLS setup again. Entry points pass
+``shared_bot_session(config.bot)`` instead. Connections are then kept
+alive and reused across all senders in the process, within the
+configured pool limit and request timeout.
+
+New and reused connections are counted through aiohttp request tracing.
+"""
+
+import time
+from types import SimpleNamespace
+from typing import Any, Optional
+
+from aiogram.client.session.aiohttp import AiohttpSession
+from aiohttp import ClientSession, TraceConfig
+
+from ugc_bot.config import BotConfig
+from ugc_bot.metrics.collector import MetricsCollector
+
+
+class PooledAiohttpSession(AiohttpSession):
+    """AiohttpSession that records connection reuse metrics."""
+
+    def __init__(
+        self,
+        *,
+        limit: int = 100,
+        timeout: float = 60.0,
+        metrics_collector: Optional[MetricsCollector] = None,
+    ) -> None:
+        super().__init__(limit=limit, timeout=timeout)
+        self.metrics_collector = metrics_collector
+        self._trace_config = self._build_trace_config()
+
+    async def create_session(self) -> ClientSession:
+        session = await super().create_session()
+        if self._trace_config not in session.trace_configs:
+            session.trace_configs.append(self._trace_config)
+        return session
+
+    def _build_trace_config(self) -> TraceConfig:
+        trace_config = TraceConfig()
+        trace_config.on_connection_create_start.append(self._on_create_start)
+        trace_config.on_connection_create_end.append(self._on_create_end)
+        trace_config.on_connection_reuseconn.append(self._on_reuse)
+        trace_config.freeze()
+        return trace_config
+
+    async def _on_create_start(
+        self, session: ClientSession, ctx: SimpleNamespace, params: Any
+    ) -> None:
+        ctx.connect_started = time.perf_counter()
+
+    async def _on_create_end(
+        self, session: ClientSession, ctx: SimpleNamespace, params: Any
+    ) -> None:
+        if self.metrics_collector is not None:
+            self.metrics_collector.record_bot_api_connection_created(
+                time.perf_counter() - ctx.connect_started
+            )
+
+    async def _on_reuse(
+        self, session: ClientSession, ctx: SimpleNamespace, params: Any
+    ) -> None:
+        if self.metrics_collector is not None:
+            self.metrics_collector.record_bot_api_connection_reused()
+
+
+# One session per distinct pool setting, so a different config is honoured.
+_shared_sessions: dict[tuple[int, float], PooledAiohttpSession] = {}
+
+
+def shared_bot_session(config: BotConfig) -> PooledAiohttpSession:
+    """Return the process-wide Bot API session for ``config``.
+
+    Callers with the same pool limit and timeout share one session.
+    Closing it (``bot.session.close()``) is safe: the next request opens
+    a new connection pool.
+    """
+
+    key = (config.bot_http_pool_limit, config.bot_http_timeout_seconds)
+    session = _shared_sessions.get(key)
+    if session is None:
+        session = _shared_sessions[key] = PooledAiohttpSession(
+            limit=config.bot_http_pool_limit,
+            timeout=config.bot_http_timeout_seconds,
+            metrics_collector=MetricsCollector(),
+        )
+    return session
+
+
+async def close_shared_bot_session() -> None:
+    """Close the connections of every process-wide session created."""
+
+    for session in _shared_sessions.values():
+        await session.close()
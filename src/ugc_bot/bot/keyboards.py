@@ -1,4 +1,4 @@
-"""Keyboard helpers for bot handlers."""
+"""Reply keyboards and texts shared by handlers and workers."""
 
 from aiogram.types import (
     KeyboardButton,
@@ -24,6 +24,26 @@ START_OVER_BUTTON_TEXT = "Начать заново"
 DRAFT_QUESTION_TEXT = "У вас есть черновик. Продолжить?"
 DRAFT_RESTORED_TEXT = "Черновик восстановлен."
 
+START_TEXT = (
+    "UMC — сервис для UGC.\n" "Бизнесу — подбор креаторов, креаторам — заказы."
+)
+CREATOR_LABEL = "Я креатор"
+ADVERTISER_LABEL = "Мне нужны UGC‑креаторы"
+
+
+def role_keyboard() -> ReplyKeyboardMarkup:
+    """Build a reply keyboard for role selection."""
+
+    return ReplyKeyboardMarkup(
+        keyboard=[
+            [KeyboardButton(text=CREATOR_LABEL)],
+            [KeyboardButton(text=ADVERTISER_LABEL)],
+            [KeyboardButton(text=SUPPORT_BUTTON_TEXT)],
+        ],
+        resize_keyboard=True,
+        one_time_keyboard=True,
+    )
+
 
 def draft_choice_keyboard() -> ReplyKeyboardMarkup:
     """Keyboard for draft restore: Continue or Start over."""
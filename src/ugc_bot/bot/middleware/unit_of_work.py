@@ -0,0 +1,53 @@
+"""Request-scoped unit of work middleware for aiogram updates.
+
+Each update is handled with one database session on one pooled
+connection: service calls that go through ``with_optional_tx`` reuse it
+instead of checking out their own. Each service call still commits when
+it returns, so no transaction or row lock is held while the handler
+talks to the Bot API, but the connection is returned to the pool only
+once the update is done. SQL statements
+issued while handling the update are counted as one ``telegram_update``
+operation.
+"""
+
+from typing import Any, Awaitable, Callable
+
+from aiogram import BaseMiddleware
+from aiogram.types import TelegramObject
+
+from ugc_bot.infrastructure.db.session import SessionTransactionManager
+from ugc_bot.infrastructure.db.statement_stats import track_statements
+from ugc_bot.metrics.collector import MetricsCollector
+
+
+class UnitOfWorkMiddleware(BaseMiddleware):
+    """Open one request-scoped session per update."""
+
+    def __init__(
+        self,
+        transaction_manager: SessionTransactionManager | None,
+        metrics_collector: MetricsCollector | None = None,
+    ) -> None:
+        """Initialize unit of work middleware.
+
+        Args:
+            transaction_manager: Manager providing the request scope. When
+                None, updates are passed through unchanged.
+            metrics_collector: Optional collector for per-update statement
+                counts and DB time.
+        """
+        self.transaction_manager = transaction_manager
+        self.metrics_collector = metrics_collector
+
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: dict[str, Any],
+    ) -> Any:
+        """Run the handler inside a request scope."""
+        if self.transaction_manager is None:
+            return await handler(event, data)
+        with track_statements("telegram_update", self.metrics_collector):
+            async with self.transaction_manager.request_scope():
+                return await handler(event, data)
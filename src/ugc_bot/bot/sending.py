@@ -0,0 +1,92 @@
+"""Outbound Bot API helpers shared by handlers and workers.
+
+Kept outside ``bot.handlers`` so schedulers can send messages without
+importing handler modules and their routers.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from time import monotonic
+from typing import Any
+
+
+@dataclass(slots=True)
+class SendRateLimiter:
+    """Async limiter for outbound Bot API calls.
+
+    Spaces calls to at most ``rate_per_second`` and caps the number of
+    in-flight requests at ``max_concurrency``. One instance is meant to be
+    shared by every sender in a process.
+    """
+
+    rate_per_second: float
+    max_concurrency: int
+    _semaphore: asyncio.Semaphore = field(init=False)
+    _lock: asyncio.Lock = field(init=False)
+    _next_slot: float = field(init=False, default=0.0)
+
+    def __post_init__(self) -> None:
+        self._semaphore = asyncio.Semaphore(max(1, self.max_concurrency))
+        self._lock = asyncio.Lock()
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Wait for a free rate/concurrency slot and hold it."""
+
+        async with self._semaphore:
+            if self.rate_per_second > 0:
+                async with self._lock:
+                    now = monotonic()
+                    wait = max(0.0, self._next_slot - now)
+                    self._next_slot = (
+                        max(now, self._next_slot) + 1.0 / self.rate_per_second
+                    )
+                if wait:
+                    await asyncio.sleep(wait)
+            yield
+
+
+async def send_with_retry(
+    bot,
+    chat_id: int,
+    text: str,
+    *,
+    retries: int,
+    delay_seconds: float,
+    logger: logging.Logger,
+    extra: dict[str, Any] | None = None,
+    limiter: SendRateLimiter | None = None,
+    **kwargs: Any,
+) -> bool:
+    """Send a message with retry on failures.
+
+    When a limiter is given, every attempt waits for a limiter slot.
+    """
+
+    for attempt in range(1, retries + 1):
+        try:
+            if limiter is None:
+                await bot.send_message(chat_id=chat_id, text=text, **kwargs)
+            else:
+                async with limiter.slot():
+                    await bot.send_message(chat_id=chat_id, text=text, **kwargs)
+            return True
+        except Exception as exc:  # pragma: no cover - depends on network errors
+            logger.warning(
+                "Send message failed",
+                extra={
+                    "attempt": attempt,
+                    "retries": retries,
+                    "chat_id": chat_id,
+                    "error": str(exc),
+                    **(extra or {}),
+                },
+            )
+            if attempt < retries:
+                await asyncio.sleep(delay_seconds)
+    return False
@@ -0,0 +1,253 @@
+"""Bounded queue feeding webhook updates to the dispatcher.
+
+The webhook endpoint only enqueues; a fixed number of workers run the
+handlers, so a burst of updates cannot open more concurrent DB sessions
+than there are workers. A full queue is reported to the caller, which
+answers Telegram with an error so the update is delivered again later.
+
+Updates are chained per user (or chat) id. A chain is taken by one
+worker at a time, so updates of one user are handled in arrival order,
+while any idle worker picks up the next waiting chain: a slow user only
+holds back their own updates. ``max_size`` bounds the queued updates
+across all chains, and a chain is dropped as soon as it runs empty.
+
+With a deduplicator, a worker claims the update id right before
+handling it and skips updates another delivery already took. Updates
+refused with a full queue are never claimed, so their retry still runs.
+
+An update submitted with a ``reply`` future is handled with its
+callback answer deferrable (see ``webhook_reply``). If the handler made
+exactly one call and it can travel in the webhook response, its payload
+resolves the future; otherwise the calls are sent here. A held answer is
+sent as soon as the caller stops waiting. Methods returned by handlers
+are always executed.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any, Optional
+
+from aiogram import Bot, Dispatcher
+from aiogram.methods import TelegramMethod
+from aiogram.types import Update
+from aiogram.types.update import UpdateTypeLookupError
+
+from ugc_bot.bot.webhook_reply import (
+    ReplyCapture,
+    capture_replies,
+    webhook_reply_payload,
+)
+from ugc_bot.infrastructure.update_dedup import UpdateDeduplicator
+from ugc_bot.metrics.collector import MetricsCollector
+
+logger = logging.getLogger(__name__)
+
+WebhookReply = asyncio.Future[dict[str, Any] | None]
+_Item = tuple[Update, float, WebhookReply | None]
+
+
+class UpdateQueueFull(Exception):
+    """Raised when an update cannot be queued."""
+
+
+def update_lane_key(update: Update) -> int:
+    """Return the id updates are serialized by: user, else chat."""
+
+    try:
+        event = update.event
+    except UpdateTypeLookupError:
+        return update.update_id
+    user = getattr(event, "from_user", None)
+    if user is not None:
+        return user.id
+    chat = getattr(event, "chat", None)
+    if chat is not None:
+        return chat.id
+    return update.update_id
+
+
+class UpdateQueue:
+    """Process dispatcher updates with ``workers`` concurrent tasks.
+
+    At most ``max_size`` updates wait in the queue, whatever their users.
+    """
+
+    def __init__(
+        self,
+        dispatcher: Dispatcher,
+        bot: Bot,
+        *,
+        workers: int = 16,
+        max_size: int = 1000,
+        metrics_collector: Optional[MetricsCollector] = None,
+        deduplicator: Optional[UpdateDeduplicator] = None,
+    ) -> None:
+        self.dispatcher = dispatcher
+        self.bot = bot
+        self.workers = workers
+        self.metrics_collector = metrics_collector
+        self.deduplicator = deduplicator
+        self.max_size = max_size
+        # Pending updates per key; a key stays while a worker holds it.
+        self._chains: dict[int, deque[_Item]] = {}
+        # Keys with pending updates that no worker holds, in FIFO order.
+        self._ready: asyncio.Queue[int] = asyncio.Queue()
+        self._size = 0
+        self._tasks: list[asyncio.Task] = []
+        self._accepting = False
+
+    def start(self, ready: "asyncio.Future[Any] | None" = None) -> None:
+        """Start accepting updates and the workers.
+
+        With ``ready`` (e.g. the handler routers loading), updates are
+        queued at once and handled once it completes. If it fails, the
+        queue stops accepting so Telegram redelivers to another replica.
+        """
+
+        if self._tasks:
+            return
+        self._accepting = True
+        self._tasks = [
+            asyncio.create_task(self._worker(ready))
+            for _ in range(self.workers)
+        ]
+
+    def submit(self, update: Update, reply: WebhookReply | None = None) -> None:
+        """Queue ``update``; raise UpdateQueueFull when there is no room.
+
+        ``reply`` receives the webhook response payload, or None.
+        """
+
+        if not self._accepting:
+            raise UpdateQueueFull("Update queue is not accepting updates")
+        if self._size >= self.max_size:
+            if self.metrics_collector is not None:
+                self.metrics_collector.record_update_queue_rejected()
+            raise UpdateQueueFull("Update queue is full")
+        key = update_lane_key(update)
+        chain = self._chains.get(key)
+        if chain is None:
+            chain = self._chains[key] = deque()
+            self._ready.put_nowait(key)
+        chain.append((update, time.perf_counter(), reply))
+        self._size += 1
+        self._record_depth()
+
+    def depth(self) -> int:
+        """Return the number of queued updates across all chains."""
+
+        return self._size
+
+    async def drain(self, timeout: float | None = None) -> None:
+        """Stop accepting updates, finish queued ones and stop workers.
+
+        Updates still queued after ``timeout`` seconds are dropped;
+        Telegram does not resend them since they were acknowledged.
+        """
+
+        self._accepting = False
+        try:
+            await asyncio.wait_for(self._ready.join(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                "Update queue drain timed out",
+                extra={"dropped": self.depth()},
+            )
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        for chain in self._chains.values():
+            for _update, _enqueued_at, reply in chain:
+                if reply is not None and not reply.done():
+                    reply.set_result(None)
+        self._chains.clear()
+        self._size = 0
+
+    async def _worker(self, ready: "asyncio.Future[Any] | None") -> None:
+        if ready is not None:
+            try:
+                # Shielded: a cancelled worker must not cancel the others'.
+                await asyncio.shield(ready)
+            except Exception:
+                if self._accepting:
+                    self._accepting = False
+                    logger.exception("Update queue failed to start workers")
+                return
+        while True:
+            key = await self._ready.get()
+            chain = self._chains[key]
+            update, enqueued_at, reply = chain.popleft()
+            self._size -= 1
+            try:
+                if self.metrics_collector is not None:
+                    self.metrics_collector.record_update_queue_wait(
+                        time.perf_counter() - enqueued_at
+                    )
+                self._record_depth()
+                if await self._claim(update):
+                    await self._handle(update, reply)
+            except Exception:
+                logger.exception(
+                    "Update processing failed",
+                    extra={"update_id": update.update_id},
+                )
+            finally:
+                if reply is not None and not reply.done():
+                    reply.set_result(None)
+                if chain:
+                    self._ready.put_nowait(key)
+                else:
+                    del self._chains[key]
+                self._ready.task_done()
+
+    async def _handle(self, update: Update, reply: WebhookReply | None) -> None:
+        if reply is None:
+            result = await self.dispatcher.feed_update(self.bot, update)
+            if isinstance(result, TelegramMethod):
+                await self._send([result])
+            return
+        capture = ReplyCapture(self._send_one)
+        # A timed-out or abandoned response sends the held answer at once.
+        reply.add_done_callback(lambda _reply: capture.close())
+        try:
+            with capture_replies(capture):
+                result = await self.dispatcher.feed_update(self.bot, update)
+        except Exception:
+            await capture.flush()
+            raise
+        # Inline only the handler's sole call; one sent earlier would
+        # otherwise run after it.
+        sole_call = capture.open
+        deferred = capture.take()
+        await capture.flush()
+        methods: list[TelegramMethod[Any]] = []
+        if deferred is not None:
+            methods.append(deferred)
+            sole_call = True
+        if isinstance(result, TelegramMethod):
+            methods.append(result)
+        if not reply.done() and sole_call and len(methods) == 1:
+            payload = webhook_reply_payload(self.bot, methods[0])
+            if payload is not None:
+                reply.set_result(payload)
+                return
+        await self._send(methods)
+
+    async def _send_one(self, method: TelegramMethod[Any]) -> None:
+        await self.dispatcher.silent_call_request(self.bot, method)
+
+    async def _send(self, methods: list[TelegramMethod[Any]]) -> None:
+        for method in methods:
+            await self.dispatcher.silent_call_request(self.bot, method)
+
+    async def _claim(self, update: Update) -> bool:
+        if self.deduplicator is None:
+            return True
+        return await self.deduplicator.claim(update.update_id)
+
+    def _record_depth(self) -> None:
+        if self.metrics_collector is not None:
+            self.metrics_collector.record_update_queue_depth(self.depth())
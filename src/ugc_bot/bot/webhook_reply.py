@@ -0,0 +1,152 @@
+"""Return a handler's single Bot API call as the webhook response.
+
+Telegram executes a method sent back as the webhook HTTP response, which
+saves the outbound request for handlers that end with one answer. Two
+kinds of calls qualify:
+
+- a ``TelegramMethod`` returned by the handler (``return message.answer(...)``),
+  aiogram's own convention;
+- ``callback.answer()``: its result is only ``True``, so while replies are
+  captured the call is deferred and answered locally.
+
+A deferred answer is only kept while it is the handler's sole call. The
+next outbound call, or the webhook response no longer being awaited,
+sends it right away, so the user sees the calls in the order the handler
+made them and the spinner stops without waiting for the handler.
+
+Methods uploading files cannot travel in the response and are sent as
+usual.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+from aiogram import Bot
+from aiogram.client.session.middlewares.base import (
+    BaseRequestMiddleware,
+    NextRequestMiddlewareType,
+)
+from aiogram.methods import AnswerCallbackQuery, TelegramMethod
+from aiogram.methods.base import Response, TelegramType
+
+
+class ReplyCapture:
+    """Callback answer held back while one update is handled.
+
+    ``send`` delivers a held answer that cannot travel in the response.
+    """
+
+    def __init__(
+        self, send: Callable[[TelegramMethod[Any]], Awaitable[Any]]
+    ) -> None:
+        self._send = send
+        self._deferred: AnswerCallbackQuery | None = None
+        self._open = True
+        self._sending: asyncio.Task[None] | None = None
+
+    @property
+    def open(self) -> bool:
+        """True while no call went out and the response is awaited."""
+
+        return self._open
+
+    def defer(self, method: TelegramMethod[Any]) -> bool:
+        """Hold ``method`` back if it is the first call, a callback answer."""
+
+        if not self._open or not isinstance(method, AnswerCallbackQuery):
+            return False
+        self._open = False
+        self._deferred = method
+        return True
+
+    def take(self) -> AnswerCallbackQuery | None:
+        """Hand the held answer to the caller; nothing is deferred after."""
+
+        self._open = False
+        method, self._deferred = self._deferred, None
+        return method
+
+    def close(self) -> None:
+        """Stop deferring and send a held answer in the background."""
+
+        self._open = False
+        if self._deferred is not None and self._sending is None:
+            self._sending = asyncio.get_running_loop().create_task(
+                self._send_deferred()
+            )
+
+    async def flush(self) -> None:
+        """Stop deferring and send a held answer before returning."""
+
+        self._open = False
+        if self._sending is not None:
+            await self._sending
+        else:
+            await self._send_deferred()
+
+    async def _send_deferred(self) -> None:
+        method = self.take()
+        if method is None:
+            return
+        token = _captured.set(None)
+        try:
+            await self._send(method)
+        finally:
+            _captured.reset(token)
+
+
+_captured: ContextVar[ReplyCapture | None] = ContextVar(
+    "ugc_webhook_reply_captured", default=None
+)
+
+
+@contextmanager
+def capture_replies(capture: ReplyCapture) -> Iterator[ReplyCapture]:
+    """Let ``capture`` hold back the first callback answer in this context."""
+
+    token = _captured.set(capture)
+    try:
+        yield capture
+    finally:
+        _captured.reset(token)
+
+
+class DeferCallbackAnswer(BaseRequestMiddleware):
+    """Bot session middleware deferring a handler's lone callback answer.
+
+    Outside ``capture_replies`` requests pass through untouched. Any other
+    request first sends the answer held back for the same update.
+    """
+
+    async def __call__(
+        self,
+        make_request: NextRequestMiddlewareType[TelegramType],
+        bot: Bot,
+        method: TelegramMethod[TelegramType],
+    ) -> Response[TelegramType]:
+        capture = _captured.get()
+        if capture is None:
+            return await make_request(bot, method)
+        if capture.defer(method):
+            return Response[TelegramType](ok=True, result=True)  # type: ignore[arg-type]
+        await capture.flush()
+        return await make_request(bot, method)
+
+
+def webhook_reply_payload(
+    bot: Bot, method: TelegramMethod[Any]
+) -> dict[str, Any] | None:
+    """Return the JSON body executing ``method``, None if it has files."""
+
+    files: dict[str, Any] = {}
+    payload: dict[str, Any] = {"method": method.__api_method__}
+    for key, value in method.model_dump(warnings=False).items():
+        prepared = bot.session.prepare_value(
+            value, bot=bot, files=files, _dumps_json=False
+        )
+        if prepared is not None:
+            payload[key] = prepared
+    return None if files else payload
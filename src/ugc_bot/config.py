@@ -16,13 +16,32 @@ _ENV = SettingsConfigDict(
 )
 
 _FLAT_KEYS = {
-    "bot": ["BOT_TOKEN", "TELEGRAM_PROVIDER_TOKEN"],
+    "bot": [
+        "BOT_TOKEN",
+        "TELEGRAM_PROVIDER_TOKEN",
+        "BOT_SEND_RATE_PER_SECOND",
+        "BOT_HTTP_POOL_LIMIT",
+        "BOT_HTTP_TIMEOUT_SECONDS",
+    ],
     "log": ["LOG_LEVEL", "LOG_FORMAT"],
+    "metrics": ["METRICS_PORT", "METRICS_PUSHGATEWAY_URL"],
     "db": [
         "DATABASE_URL",
         "DB_POOL_SIZE",
         "DB_MAX_OVERFLOW",
         "DB_POOL_TIMEOUT",
+        "DATABASE_REPLICA_URL",
+        "DB_REPLICA_MAX_LAG_SECONDS",
+        "DB_REPLICA_CHECK_INTERVAL_SECONDS",
+        "DB_DRIVER",
+        "DB_STATEMENT_CACHE_SIZE",
+        "DB_PGBOUNCER",
+        "DB_POOL_PRE_PING",
+        "DB_POOL_RECYCLE_SECONDS",
+        "DB_POOL_VALIDATION_INTERVAL_SECONDS",
+        "DB_SLOW_QUERY_THRESHOLD_MS",
+        "DB_SLOW_QUERY_TOP_N",
+        "DB_SLOW_QUERY_LOG_INTERVAL_SECONDS",
     ],
     "admin": [
         "ADMIN_USERNAME",
@@ -53,21 +72,41 @@ _FLAT_KEYS = {
         "ROLE_REMINDER_HOUR",
         "ROLE_REMINDER_MINUTE",
         "ROLE_REMINDER_TIMEZONE",
+        "ROLE_REMINDER_BATCH_SIZE",
+        "ROLE_REMINDER_CONCURRENCY",
+    ],
+    "redis": [
+        "REDIS_URL",
+        "USE_REDIS_STORAGE",
+        "USER_CACHE_ENABLED",
+        "USER_CACHE_LOCAL_TTL_SECONDS",
+        "USER_CACHE_REDIS_TTL_SECONDS",
+        "USER_CACHE_MAX_SIZE",
     ],
-    "redis": ["REDIS_URL", "USE_REDIS_STORAGE"],
     "instagram": [
         "INSTAGRAM_WEBHOOK_VERIFY_TOKEN",
         "INSTAGRAM_APP_SECRET",
         "ADMIN_INSTAGRAM_USERNAME",
         "INSTAGRAM_ACCESS_TOKEN",
         "INSTAGRAM_API_BASE_URL",
+        "INSTAGRAM_USERNAME_CACHE_TTL_SECONDS",
+        "INSTAGRAM_USERNAME_NEGATIVE_TTL_SECONDS",
     ],
     "docs": [
         "DOCS_OFFER_URL",
         "DOCS_PRIVACY_URL",
         "DOCS_CONSENT_URL",
     ],
-    "webhook": ["WEBHOOK_BASE_URL", "WEBHOOK_SECRET"],
+    "webhook": [
+        "WEBHOOK_BASE_URL",
+        "WEBHOOK_SECRET",
+        "WEBHOOK_WORKERS",
+        "WEBHOOK_QUEUE_SIZE",
+        "WEBHOOK_DRAIN_TIMEOUT_SECONDS",
+        "WEBHOOK_DEDUP_TTL_SECONDS",
+        "WEBHOOK_INLINE_REPLY",
+        "WEBHOOK_INLINE_REPLY_TIMEOUT_SECONDS",
+    ],
 }
 
 
@@ -96,6 +135,15 @@ class BotConfig(BaseSettings):
     telegram_provider_token: str = Field(
         default="", alias="TELEGRAM_PROVIDER_TOKEN"
     )
+    # Bot API allows ~30 messages/second across chats; keep headroom.
+    bot_send_rate_per_second: float = Field(
+        default=25.0, alias="BOT_SEND_RATE_PER_SECOND"
+    )
+    # One Bot API connection pool per process, shared by every Bot.
+    bot_http_pool_limit: int = Field(default=100, alias="BOT_HTTP_POOL_LIMIT")
+    bot_http_timeout_seconds: float = Field(
+        default=60.0, alias="BOT_HTTP_TIMEOUT_SECONDS"
+    )
 
     @field_validator("bot_token")
     @classmethod
@@ -117,6 +165,17 @@ class LogConfig(BaseSettings):
         return v.strip().upper()
 
 
+class MetricsConfig(BaseSettings):
+    model_config = _ENV
+
+    # Workers without an HTTP app serve /metrics on this port (0 = off).
+    metrics_port: int = Field(default=0, alias="METRICS_PORT")
+    # One-shot jobs (role reminder) push their metrics here before exiting.
+    metrics_pushgateway_url: str = Field(
+        default="", alias="METRICS_PUSHGATEWAY_URL"
+    )
+
+
 class DbConfig(BaseSettings):
     model_config = _ENV
 
@@ -124,6 +183,48 @@ class DbConfig(BaseSettings):
     pool_size: int = Field(default=5, alias="DB_POOL_SIZE")
     max_overflow: int = Field(default=10, alias="DB_MAX_OVERFLOW")
     pool_timeout: int = Field(default=30, alias="DB_POOL_TIMEOUT")
+    # Optional hot standby for read-only transactions.
+    database_replica_url: str = Field(default="", alias="DATABASE_REPLICA_URL")
+    replica_max_lag_seconds: float = Field(
+        default=5.0, alias="DB_REPLICA_MAX_LAG_SECONDS"
+    )
+    replica_check_interval_seconds: float = Field(
+        default=5.0, alias="DB_REPLICA_CHECK_INTERVAL_SECONDS"
+    )
+    # Async Postgres driver used when DATABASE_URL names none.
+    db_driver: str = Field(default="psycopg", alias="DB_DRIVER")
+    # Prepared statements kept per connection (asyncpg).
+    statement_cache_size: int = Field(
+        default=100, alias="DB_STATEMENT_CACHE_SIZE"
+    )
+    # Transaction-pooling PgBouncer in front of Postgres.
+    pgbouncer: bool = Field(default=False, alias="DB_PGBOUNCER")
+    # Ping on every checkout; when off, idle connections are validated
+    # every DB_POOL_VALIDATION_INTERVAL_SECONDS in the background.
+    pool_pre_ping: bool = Field(default=True, alias="DB_POOL_PRE_PING")
+    # Replace connections older than this (-1 keeps them forever).
+    pool_recycle_seconds: int = Field(
+        default=-1, alias="DB_POOL_RECYCLE_SECONDS"
+    )
+    pool_validation_interval_seconds: float = Field(
+        default=30.0, alias="DB_POOL_VALIDATION_INTERVAL_SECONDS"
+    )
+    # Slow query recorder; off unless a threshold is set.
+    slow_query_threshold_ms: float | None = Field(
+        default=None, alias="DB_SLOW_QUERY_THRESHOLD_MS"
+    )
+    slow_query_top_n: int = Field(default=20, alias="DB_SLOW_QUERY_TOP_N")
+    slow_query_log_interval_seconds: float = Field(
+        default=300.0, alias="DB_SLOW_QUERY_LOG_INTERVAL_SECONDS"
+    )
+
+    @field_validator("db_driver")
+    @classmethod
+    def validate_db_driver(cls, v: str) -> str:
+        driver = v.strip().lower()
+        if driver not in {"psycopg", "asyncpg"}:
+            raise ValueError("DB_DRIVER must be 'psycopg' or 'asyncpg'.")
+        return driver
 
 
 class AdminConfig(BaseSettings):
@@ -188,6 +289,12 @@ class RoleReminderConfig(BaseSettings):
     role_reminder_timezone: str = Field(
         default="Europe/Moscow", alias="ROLE_REMINDER_TIMEZONE"
     )
+    role_reminder_batch_size: int = Field(
+        default=500, alias="ROLE_REMINDER_BATCH_SIZE"
+    )
+    role_reminder_concurrency: int = Field(
+        default=10, alias="ROLE_REMINDER_CONCURRENCY"
+    )
 
 
 class RedisConfig(BaseSettings):
@@ -195,6 +302,17 @@ class RedisConfig(BaseSettings):
 
     redis_url: str = Field(default="redis://redis:6379/0", alias="REDIS_URL")
     use_redis_storage: bool = Field(default=True, alias="USE_REDIS_STORAGE")
+    # Read-through cache for user lookups (in-process tier + Redis tier)
+    user_cache_enabled: bool = Field(default=True, alias="USER_CACHE_ENABLED")
+    user_cache_local_ttl_seconds: float = Field(
+        default=30.0, alias="USER_CACHE_LOCAL_TTL_SECONDS"
+    )
+    user_cache_redis_ttl_seconds: int = Field(
+        default=300, alias="USER_CACHE_REDIS_TTL_SECONDS"
+    )
+    user_cache_max_size: int = Field(
+        default=10_000, alias="USER_CACHE_MAX_SIZE"
+    )
 
 
 class InstagramConfig(BaseSettings):
@@ -213,6 +331,13 @@ class InstagramConfig(BaseSettings):
     instagram_api_base_url: str = Field(
         default="https://graph.instagram.com", alias="INSTAGRAM_API_BASE_URL"
     )
+    # Resolved sender usernames are cached; unknown ids for less time.
+    instagram_username_cache_ttl_seconds: float = Field(
+        default=3600.0, alias="INSTAGRAM_USERNAME_CACHE_TTL_SECONDS"
+    )
+    instagram_username_negative_ttl_seconds: float = Field(
+        default=300.0, alias="INSTAGRAM_USERNAME_NEGATIVE_TTL_SECONDS"
+    )
 
 
 class DocsConfig(BaseSettings):
@@ -234,6 +359,26 @@ class WebhookConfig(BaseSettings):
         default="", alias="WEBHOOK_BASE_URL"
     )  # e.g. https://bot.usemycontent.ru
     webhook_secret: str = Field(default="", alias="WEBHOOK_SECRET")
+    # Updates are queued in one lane per worker, sharded by user so each
+    # user's updates run in order; a full lane answers 503 so Telegram
+    # retries later.
+    webhook_workers: int = Field(default=16, alias="WEBHOOK_WORKERS")
+    webhook_queue_size: int = Field(default=1000, alias="WEBHOOK_QUEUE_SIZE")
+    webhook_drain_timeout_seconds: float = Field(
+        default=30.0, alias="WEBHOOK_DRAIN_TIMEOUT_SECONDS"
+    )
+    # Redelivered update ids are dropped for this long (Redis SET NX).
+    webhook_dedup_ttl_seconds: int = Field(
+        default=600, alias="WEBHOOK_DEDUP_TTL_SECONDS"
+    )
+    # Wait this long for the handler and return its single Bot API call
+    # as the webhook response instead of a separate request.
+    webhook_inline_reply: bool = Field(
+        default=False, alias="WEBHOOK_INLINE_REPLY"
+    )
+    webhook_inline_reply_timeout_seconds: float = Field(
+        default=1.0, alias="WEBHOOK_INLINE_REPLY_TIMEOUT_SECONDS"
+    )
 
     @field_validator("webhook_base_url")
     @classmethod
@@ -251,6 +396,7 @@ class AppConfig(BaseModel):
 
     bot: BotConfig
     log: LogConfig
+    metrics: MetricsConfig
     db: DbConfig
     admin: AdminConfig
     kafka: KafkaConfig
@@ -270,6 +416,7 @@ class AppConfig(BaseModel):
         return {
             "bot": BotConfig.model_validate(nested["bot"]),
             "log": LogConfig.model_validate(nested["log"]),
+            "metrics": MetricsConfig.model_validate(nested["metrics"]),
             "db": DbConfig.model_validate(nested["db"]),
             "admin": AdminConfig.model_validate(nested["admin"]),
             "kafka": KafkaConfig.model_validate(nested["kafka"]),
@@ -0,0 +1,98 @@
+"""Config loaded once per process and reloaded on SIGHUP.
+
+``load_config()`` re-reads ``.env`` and validates every settings section,
+too much work for each webhook request. ``ConfigState`` keeps the values
+an app reads per request, derived once from the config, and rebuilds
+them on ``reload()``. Components built at startup keep the config they
+were built with.
+"""
+
+import asyncio
+import contextlib
+import logging
+import signal
+from collections.abc import Callable, Coroutine
+from typing import Any, Generic, TypeVar
+
+from pydantic import ValidationError
+
+from ugc_bot.config import AppConfig
+
+logger = logging.getLogger(__name__)
+
+S = TypeVar("S")
+
+
+class ConfigState(Generic[S]):
+    """Settings derived from AppConfig, loaded lazily and reloadable."""
+
+    def __init__(
+        self,
+        derive: Callable[[AppConfig], S],
+        loader: Callable[[], AppConfig],
+    ) -> None:
+        self._derive = derive
+        self._loader = loader
+        self._settings: S | None = None
+        self._on_reload_task: asyncio.Task[None] | None = None
+
+    def get(self) -> S:
+        """Return the current settings, loading them on first use."""
+
+        if self._settings is None:
+            self._settings = self._derive(self._loader())
+        return self._settings
+
+    def reload(self) -> S:
+        """Load the config again; keep the current one if it is invalid."""
+
+        try:
+            self._settings = self._derive(self._loader())
+        except ValidationError as exc:
+            if self._settings is None:
+                raise
+            logger.error(
+                "Config reload failed, keeping current config",
+                extra={"error": str(exc)},
+            )
+        else:
+            logger.info("Config loaded")
+        return self._settings
+
+    def clear(self) -> None:
+        """Forget the settings; the next ``get()`` loads them."""
+
+        self._settings = None
+
+    def install_reload_signal(
+        self, on_reload: Callable[[S], Coroutine[Any, Any, None]] | None = None
+    ) -> bool:
+        """Reload on SIGHUP, then run ``on_reload`` with the new settings.
+
+        Returns False where signals are unsupported.
+        """
+
+        sighup = getattr(signal, "SIGHUP", None)
+        if sighup is None:
+            return False
+
+        def _handle() -> None:
+            settings = self.reload()
+            if on_reload is not None:
+                self._on_reload_task = asyncio.create_task(on_reload(settings))
+
+        try:
+            asyncio.get_running_loop().add_signal_handler(sighup, _handle)
+        except (NotImplementedError, RuntimeError, ValueError):
+            # No signals on this platform or outside the main thread.
+            return False
+        return True
+
+    def remove_reload_signal(self) -> None:
+        """Undo ``install_reload_signal``."""
+
+        sighup = getattr(signal, "SIGHUP", None)
+        if sighup is None:
+            return
+        with contextlib.suppress(NotImplementedError, RuntimeError, ValueError):
+            asyncio.get_running_loop().remove_signal_handler(sighup)
@@ -21,8 +21,16 @@ from ugc_bot.container import (
     repository_factory,
     service_factory,
 )
-from ugc_bot.infrastructure.db.session import SessionTransactionManager
+from ugc_bot.infrastructure.db.session import (
+    SessionTransactionManager,
+    dispose_engine,
+)
+from ugc_bot.infrastructure.db.slow_queries import SlowQueryRecorder
+from ugc_bot.infrastructure.instagram.graph_api_client import (
+    HttpInstagramGraphApiClient,
+)
 from ugc_bot.infrastructure.kafka.publisher import KafkaOrderActivationPublisher
+from ugc_bot.infrastructure.user_cache import UserCache
 
 
 class Container:
@@ -34,15 +42,27 @@ class Container:
 
     def __init__(self, config: AppConfig) -> None:
         self._config = config
+        self._slow_query_recorder = (
+            infrastructure_factory.build_slow_query_recorder(config)
+        )
         self._session_factory = (
-            infrastructure_factory.create_session_factory_from_config(config)
+            infrastructure_factory.create_session_factory_from_config(
+                config, self._slow_query_recorder
+            )
+        )
+        self._replica_session_factory = (
+            infrastructure_factory.create_replica_session_factory_from_config(
+                config, self._slow_query_recorder
+            )
         )
         self._transaction_manager = (
             infrastructure_factory.create_transaction_manager(
-                self._session_factory
+                self._session_factory, self._replica_session_factory, config
             )
         )
+        self._user_cache = infrastructure_factory.build_user_cache(config)
         self._repos: dict | None = None
+        self._instagram_api_client: HttpInstagramGraphApiClient | None = None
 
     @property
     def session_factory(self):
@@ -52,9 +72,31 @@ class Container:
     def transaction_manager(self) -> SessionTransactionManager | None:
         return self._transaction_manager
 
+    @property
+    def user_cache(self) -> UserCache | None:
+        return self._user_cache
+
+    @property
+    def slow_query_recorder(self) -> SlowQueryRecorder | None:
+        return self._slow_query_recorder
+
+    async def close(self) -> None:
+        """Dispose the database engines and close caches and API clients."""
+        for factory in (self._session_factory, self._replica_session_factory):
+            if factory is not None:
+                await dispose_engine(factory.kw["bind"])
+        if self._user_cache is not None:
+            await self._user_cache.close()
+        if self._instagram_api_client is not None:
+            await self._instagram_api_client.close()
+        if self._slow_query_recorder is not None:
+            await self._slow_query_recorder.close()
+
     def get_admin_engine(self) -> Engine:
         """Engine for SQLAdmin (pool_pre_ping)."""
-        return infrastructure_factory.build_admin_engine(self._config)
+        return infrastructure_factory.build_admin_engine(
+            self._config, self._slow_query_recorder
+        )
 
     def build_repos(self) -> dict:
         """All repos for the main bot dispatcher. Cached after first call."""
@@ -62,7 +104,9 @@ class Container:
             raise ValueError("DATABASE_URL is required for repositories.")
         if self._repos is not None:
             return self._repos
-        self._repos = repository_factory.build_repos(self._session_factory)
+        self._repos = repository_factory.build_repos(
+            self._session_factory, self._user_cache
+        )
         return self._repos
 
     def build_offer_dispatch_service(self) -> OfferDispatchService:
@@ -106,9 +150,15 @@ class Container:
         """Create lock manager for issue description (Redis or in-memory)."""
         return infrastructure_factory.build_issue_lock_manager(self._config)
 
-    def build_instagram_api_client(self):
-        """Create Instagram Graph API client if configured."""
-        return infrastructure_factory.build_instagram_api_client(self._config)
+    def build_instagram_api_client(
+        self,
+    ) -> HttpInstagramGraphApiClient | None:
+        """Instagram Graph API client if configured. Cached after first call."""
+        if self._instagram_api_client is None:
+            self._instagram_api_client = (
+                infrastructure_factory.build_instagram_api_client(self._config)
+            )
+        return self._instagram_api_client
 
     def build_bot_services(self) -> dict:
         """Build all services and repos for the bot dispatcher."""
@@ -1,5 +1,7 @@
 """Factory for creating infrastructure components."""
 
+from typing import Any
+
 from sqlalchemy.engine import Engine
 from sqlalchemy.ext.asyncio import async_sessionmaker
 
@@ -9,33 +11,106 @@ from ugc_bot.infrastructure.db.session import (
     create_db_engine,
     create_session_factory,
 )
+from ugc_bot.infrastructure.db.slow_queries import SlowQueryRecorder
 from ugc_bot.infrastructure.redis_lock import IssueDescriptionLockManager
+from ugc_bot.infrastructure.update_dedup import UpdateDeduplicator
+from ugc_bot.infrastructure.user_cache import UserCache
 from ugc_bot.metrics.collector import MetricsCollector
 
 
-def create_session_factory_from_config(config: AppConfig):
+def db_engine_options(
+    config: AppConfig, slow_query_recorder: SlowQueryRecorder | None = None
+) -> dict[str, Any]:
+    """Pool and driver keyword arguments for create_session_factory."""
+    return {
+        "pool_size": config.db.pool_size,
+        "max_overflow": config.db.max_overflow,
+        "pool_timeout": config.db.pool_timeout,
+        "driver": config.db.db_driver,
+        "statement_cache_size": config.db.statement_cache_size,
+        "pgbouncer": config.db.pgbouncer,
+        "pool_pre_ping": config.db.pool_pre_ping,
+        "pool_recycle": config.db.pool_recycle_seconds,
+        "pool_validation_interval": (
+            config.db.pool_validation_interval_seconds
+        ),
+        "slow_query_recorder": slow_query_recorder,
+        "metrics_collector": build_metrics_collector(),
+    }
+
+
+def build_slow_query_recorder(config: AppConfig) -> SlowQueryRecorder | None:
+    """Create the slow query recorder, or None when it is disabled.
+
+    Disabled unless DB_SLOW_QUERY_THRESHOLD_MS is set. Aggregates are
+    shared through Redis when Redis storage is enabled. Build it once
+    per process and pass it to every engine.
+    """
+    threshold_ms = config.db.slow_query_threshold_ms
+    if threshold_ms is None:
+        return None
+    redis_url = None
+    if config.redis.use_redis_storage and config.redis.redis_url:
+        redis_url = config.redis.redis_url
+    return SlowQueryRecorder(
+        threshold_ms / 1000,
+        top_n=config.db.slow_query_top_n,
+        log_interval_seconds=config.db.slow_query_log_interval_seconds,
+        redis_url=redis_url,
+    )
+
+
+def create_session_factory_from_config(
+    config: AppConfig, slow_query_recorder: SlowQueryRecorder | None = None
+):
     """Create async session factory from app config."""
     if not config.db.database_url:
         return None
     return create_session_factory(
         config.db.database_url,
-        pool_size=config.db.pool_size,
-        max_overflow=config.db.max_overflow,
-        pool_timeout=config.db.pool_timeout,
+        **db_engine_options(config, slow_query_recorder),
+    )
+
+
+def create_replica_session_factory_from_config(
+    config: AppConfig, slow_query_recorder: SlowQueryRecorder | None = None
+):
+    """Create async session factory for the read replica, if configured."""
+    if not config.db.database_url or not config.db.database_replica_url:
+        return None
+    return create_session_factory(
+        config.db.database_replica_url,
+        **{
+            **db_engine_options(config, slow_query_recorder),
+            "pool_name": "replica",
+        },
     )
 
 
 def create_transaction_manager(
     session_factory: async_sessionmaker | None,
+    replica_session_factory: async_sessionmaker | None = None,
+    config: AppConfig | None = None,
 ) -> SessionTransactionManager | None:
     """Create transaction manager from session factory."""
     if session_factory is None:
         return None
-    return SessionTransactionManager(session_factory)
+    if replica_session_factory is None or config is None:
+        return SessionTransactionManager(session_factory)
+    return SessionTransactionManager(
+        session_factory,
+        replica_session_factory,
+        replica_max_lag_seconds=config.db.replica_max_lag_seconds,
+        replica_check_interval_seconds=(
+            config.db.replica_check_interval_seconds
+        ),
+    )
 
 
-def build_admin_engine(config: AppConfig) -> Engine:
-    """Create sync engine for SQLAdmin (pool_pre_ping)."""
+def build_admin_engine(
+    config: AppConfig, slow_query_recorder: SlowQueryRecorder | None = None
+) -> Engine:
+    """Create sync engine for SQLAdmin (always pre-pings)."""
     if not config.db.database_url:
         raise ValueError("DATABASE_URL is required for admin.")
     return create_db_engine(
@@ -43,6 +118,9 @@ def build_admin_engine(config: AppConfig) -> Engine:
         pool_size=config.db.pool_size,
         max_overflow=config.db.max_overflow,
         pool_timeout=config.db.pool_timeout,
+        pool_recycle=config.db.pool_recycle_seconds,
+        slow_query_recorder=slow_query_recorder,
+        metrics_collector=build_metrics_collector(),
     )
 
 
@@ -59,6 +137,34 @@ def build_issue_lock_manager(config: AppConfig) -> IssueDescriptionLockManager:
     return IssueDescriptionLockManager(redis_url=redis_url)
 
 
+def build_update_deduplicator(config: AppConfig) -> UpdateDeduplicator:
+    """Create the webhook update deduplicator (Redis or in-process)."""
+    redis_url = None
+    if config.redis.use_redis_storage and config.redis.redis_url:
+        redis_url = config.redis.redis_url
+    return UpdateDeduplicator(
+        redis_url,
+        ttl_seconds=config.webhook.webhook_dedup_ttl_seconds,
+        metrics_collector=build_metrics_collector(),
+    )
+
+
+def build_user_cache(config: AppConfig) -> UserCache | None:
+    """Create the user lookup cache (Redis tier only with Redis storage)."""
+    if not config.redis.user_cache_enabled:
+        return None
+    redis_url = None
+    if config.redis.use_redis_storage and config.redis.redis_url:
+        redis_url = config.redis.redis_url
+    return UserCache(
+        redis_url,
+        local_ttl_seconds=config.redis.user_cache_local_ttl_seconds,
+        redis_ttl_seconds=config.redis.user_cache_redis_ttl_seconds,
+        max_size=config.redis.user_cache_max_size,
+        metrics_collector=build_metrics_collector(),
+    )
+
+
 def build_instagram_api_client(config: AppConfig):
     """Create Instagram Graph API client if configured."""
     if (
@@ -73,4 +179,8 @@ def build_instagram_api_client(config: AppConfig):
     return HttpInstagramGraphApiClient(
         access_token=config.instagram.instagram_access_token,
         base_url=config.instagram.instagram_api_base_url,
+        cache_ttl_seconds=config.instagram.instagram_username_cache_ttl_seconds,
+        negative_cache_ttl_seconds=(
+            config.instagram.instagram_username_negative_ttl_seconds
+        ),
     )
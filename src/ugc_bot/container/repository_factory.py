@@ -16,19 +16,26 @@ from ugc_bot.infrastructure.db.repositories import (
     SqlAlchemyPaymentRepository,
     SqlAlchemyUserRepository,
 )
+from ugc_bot.infrastructure.user_cache import CachedUserRepository, UserCache
 
 
-def build_repos(session_factory):
+def build_repos(session_factory, user_cache: UserCache | None = None):
     """Build all SQLAlchemy repositories for the application.
 
     Args:
         session_factory: Async session factory from create_session_factory.
+        user_cache: Optional cache wrapped around the user repository.
 
     Returns:
         Dict of repository name to repository instance.
     """
+    user_repo = SqlAlchemyUserRepository(session_factory=session_factory)
     return {
-        "user_repo": SqlAlchemyUserRepository(session_factory=session_factory),
+        "user_repo": (
+            CachedUserRepository(inner=user_repo, cache=user_cache)
+            if user_cache is not None
+            else user_repo
+        ),
         "blogger_repo": SqlAlchemyBloggerProfileRepository(
             session_factory=session_factory
         ),
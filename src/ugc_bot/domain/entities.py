@@ -19,7 +19,7 @@ from ugc_bot.domain.enums import (
 )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class User:
     """Core user entity."""
 
@@ -36,7 +36,7 @@ class User:
     admin: bool = False
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BloggerProfile:
     """Blogger profile entity."""
 
@@ -56,7 +56,7 @@ class BloggerProfile:
     wanted_to_change_terms_count: int = 0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AdvertiserProfile:
     """Advertiser profile entity."""
 
@@ -68,7 +68,7 @@ class AdvertiserProfile:
     company_activity: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Order:
     """Order entity posted by an advertiser."""
 
@@ -87,9 +87,10 @@ class Order:
     deadlines: Optional[str] = None
     geography: Optional[str] = None
     product_photo_file_id: Optional[str] = None
+    responses_count: int = 0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OrderResponse:
     """Order response entity linking bloggers to orders."""
 
@@ -99,7 +100,7 @@ class OrderResponse:
     responded_at: datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Interaction:
     """Feedback interaction entity after contacts are shared."""
 
@@ -116,7 +117,7 @@ class Interaction:
     updated_at: datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InstagramVerificationCode:
     """Instagram verification code entity."""
 
@@ -128,7 +129,7 @@ class InstagramVerificationCode:
     created_at: datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Complaint:
     """Complaint entity for reporting issues."""
 
@@ -143,7 +144,7 @@ class Complaint:
     file_ids: Optional[list[str]] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Payment:
     """Payment entity."""
 
@@ -158,7 +159,7 @@ class Payment:
     paid_at: Optional[datetime]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FsmDraft:
     """FSM draft entity for partial form data saved when user clicks Support."""
 
@@ -169,7 +170,7 @@ class FsmDraft:
     updated_at: datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ContactPricing:
     """Contact pricing entity."""
 
@@ -178,7 +179,7 @@ class ContactPricing:
     updated_at: datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OutboxEvent:
     """Outbox event entity for reliable event publishing."""
 
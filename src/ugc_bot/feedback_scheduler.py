@@ -16,8 +16,16 @@ from ugc_bot.application.feedback_utils import (
 from ugc_bot.application.services.interaction_service import InteractionService
 from ugc_bot.application.services.profile_service import ProfileService
 from ugc_bot.application.services.user_role_service import UserRoleService
-from ugc_bot.bot.handlers.utils import send_with_retry
+from ugc_bot.bot.http_session import shared_bot_session
+from ugc_bot.bot.sending import send_with_retry
 from ugc_bot.config import FeedbackConfig, load_config
+from ugc_bot.container.infrastructure_factory import (
+    build_metrics_collector,
+    build_slow_query_recorder,
+    create_replica_session_factory_from_config,
+    create_transaction_manager,
+    db_engine_options,
+)
 from ugc_bot.domain.entities import Interaction, Order
 from ugc_bot.infrastructure.db.repositories import (
     SqlAlchemyAdvertiserProfileRepository,
@@ -27,11 +35,13 @@ from ugc_bot.infrastructure.db.repositories import (
     SqlAlchemyUserRepository,
 )
 from ugc_bot.infrastructure.db.session import (
-    SessionTransactionManager,
     create_session_factory,
     with_optional_tx,
 )
+from ugc_bot.infrastructure.db.statement_stats import track_statements
 from ugc_bot.logging_setup import configure_logging
+from ugc_bot.metrics.collector import MetricsCollector
+from ugc_bot.metrics.exporter import start_metrics_server
 from ugc_bot.startup_logging import log_startup_info
 
 logger = logging.getLogger(__name__)
@@ -77,7 +87,11 @@ async def _iter_due_interactions(
     cutoff: datetime,
     transaction_manager,
 ) -> Iterable[Interaction]:
-    """List interactions due for feedback within a transaction."""
+    """List interactions due for feedback within a transaction.
+
+    The scan decides which feedback is sent and updated, so it reads the
+    primary: a lagging replica would return interactions already handled.
+    """
 
     async def _run(session: object | None):
         return await interaction_repo.list_due_for_feedback(
@@ -288,6 +302,7 @@ async def run_loop(
     interval_seconds: int,
     transaction_manager,
     max_iterations: int | None = None,
+    metrics_collector: MetricsCollector | None = None,
 ) -> None:
     """Run periodic feedback dispatch."""
 
@@ -300,17 +315,18 @@ async def run_loop(
             logger.debug(
                 "Feedback loop iteration", extra={"iteration": iterations}
             )
-            await run_once(
-                bot,
-                interaction_repo,
-                interaction_service,
-                user_role_service,
-                profile_service,
-                order_repo,
-                feedback_config,
-                cutoff,
-                transaction_manager,
-            )
+            with track_statements("feedback_cycle", metrics_collector):
+                await run_once(
+                    bot,
+                    interaction_repo,
+                    interaction_service,
+                    user_role_service,
+                    profile_service,
+                    order_repo,
+                    feedback_config,
+                    cutoff,
+                    transaction_manager,
+                )
             if max_iterations is not None and iterations >= max_iterations:
                 return
             await asyncio.sleep(interval_seconds)
@@ -349,13 +365,16 @@ def main() -> None:
             ),
         },
     )
+    slow_query_recorder = build_slow_query_recorder(config)
     session_factory = create_session_factory(
         config.db.database_url,
-        pool_size=config.db.pool_size,
-        max_overflow=config.db.max_overflow,
-        pool_timeout=config.db.pool_timeout,
+        **db_engine_options(config, slow_query_recorder),
+    )
+    transaction_manager = create_transaction_manager(
+        session_factory,
+        create_replica_session_factory_from_config(config, slow_query_recorder),
+        config,
     )
-    transaction_manager = SessionTransactionManager(session_factory)
     user_repo = SqlAlchemyUserRepository(session_factory=session_factory)
     interaction_repo = SqlAlchemyInteractionRepository(
         session_factory=session_factory
@@ -384,7 +403,10 @@ def main() -> None:
         transaction_manager=transaction_manager,
     )
 
-    bot = Bot(token=config.bot.bot_token)
+    bot = Bot(
+        token=config.bot.bot_token, session=shared_bot_session(config.bot)
+    )
+    start_metrics_server(config.metrics)
     asyncio.run(
         run_loop(
             bot,
@@ -396,6 +418,7 @@ def main() -> None:
             config.feedback,
             interval_seconds=config.feedback.feedback_poll_interval_seconds,
             transaction_manager=transaction_manager,
+            metrics_collector=build_metrics_collector(),
         )
     )
 
@@ -8,6 +8,7 @@ from sqlalchemy import engine_from_config, pool
 
 from ugc_bot.infrastructure.db import models  # noqa: F401
 from ugc_bot.infrastructure.db.base import Base
+from ugc_bot.infrastructure.db.session import to_sync_url
 
 config = context.config
 if config.config_file_name is not None:
@@ -21,7 +22,7 @@ def _get_database_url() -> str:
 
     env_url = os.getenv("DATABASE_URL")
     if env_url:
-        return env_url
+        return to_sync_url(env_url)
     config_url = config.get_main_option("sqlalchemy.url")
     if not config_url:
         raise ValueError("DATABASE_URL is required for migrations.")
@@ -0,0 +1,138 @@
+"""Index audit: cover hot repository predicates, drop redundant indexes.
+
+Composite and partial indexes match the WHERE clauses of repository
+queries. Indexes that duplicate the leading columns of a unique or
+primary key constraint are dropped to save write amplification.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0029_index_audit"
+down_revision = "0028_drop_ugc_requirements"
+branch_labels = None
+depends_on = None
+
+# (name, table, columns, partial predicate or None)
+_NEW_INDEXES: list[tuple[str, str, list[str], str | None]] = [
+    (
+        "ix_users_pending_role_choice",
+        "users",
+        ["user_id"],
+        "role_chosen_at IS NULL",
+    ),
+    ("ix_users_admin", "users", ["user_id"], "admin IS TRUE"),
+    (
+        "ix_blogger_profiles_confirmed",
+        "blogger_profiles",
+        ["user_id"],
+        "confirmed IS TRUE",
+    ),
+    (
+        "ix_orders_completed_at",
+        "orders",
+        ["completed_at"],
+        "completed_at IS NOT NULL",
+    ),
+    (
+        "ix_interactions_participants",
+        "interactions",
+        ["order_id", "blogger_id", "advertiser_id"],
+        None,
+    ),
+    (
+        "ix_interactions_due_pending",
+        "interactions",
+        ["next_check_at"],
+        "status = 'pending'",
+    ),
+    ("ix_interactions_status", "interactions", ["status"], None),
+    (
+        "ix_complaints_order_reporter",
+        "complaints",
+        ["order_id", "reporter_id"],
+        None,
+    ),
+    ("ix_complaints_reporter_id", "complaints", ["reporter_id"], None),
+    ("ix_complaints_status", "complaints", ["status"], None),
+    (
+        "ix_instagram_verification_codes_code_unused",
+        "instagram_verification_codes",
+        ["code"],
+        "used IS FALSE",
+    ),
+    (
+        "ix_instagram_verification_codes_user_id",
+        "instagram_verification_codes",
+        ["user_id"],
+        None,
+    ),
+    ("ix_payments_external_id", "payments", ["external_id"], None),
+    (
+        "ix_outbox_events_pending_created_at",
+        "outbox_events",
+        ["created_at"],
+        "status = 'pending'",
+    ),
+]
+
+# Covered by UNIQUE (external_id, messenger_type), UNIQUE (order_id,
+# blogger_id), ix_interactions_participants and the offer_dispatches PK.
+_REDUNDANT_INDEXES: list[tuple[str, str, list[str]]] = [
+    (
+        "ix_users_external_messenger_status",
+        "users",
+        ["external_id", "messenger_type", "status"],
+    ),
+    ("ix_order_responses_order_id", "order_responses", ["order_id"]),
+    ("ix_interactions_order_id", "interactions", ["order_id"]),
+    ("ix_offer_dispatches_order_id", "offer_dispatches", ["order_id"]),
+]
+
+
+def upgrade() -> None:
+    """Create hot-path indexes and drop redundant ones.
+
+    Indexes are built and dropped CONCURRENTLY so the tables stay
+    writable during deploy. That cannot run in a transaction, hence the
+    autocommit block; IF [NOT] EXISTS lets a rerun skip finished steps.
+    A build that failed leaves an INVALID index that must be dropped
+    before rerunning.
+    """
+    with op.get_context().autocommit_block():
+        for name, table, columns, where in _NEW_INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                postgresql_where=sa.text(where) if where else None,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+        for name, table, _columns in _REDUNDANT_INDEXES:
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Restore the previous index set."""
+    with op.get_context().autocommit_block():
+        for name, table, columns in reversed(_REDUNDANT_INDEXES):
+            op.create_index(
+                name,
+                table,
+                columns,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+        for name, table, _columns, _where in reversed(_NEW_INDEXES):
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
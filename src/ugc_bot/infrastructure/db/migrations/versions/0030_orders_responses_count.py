@@ -0,0 +1,46 @@
+"""Add denormalized responses_count to orders.
+
+Accepting a response increments the counter with one conditional UPDATE
+instead of locking the order row and counting order_responses.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0030_orders_responses_count"
+down_revision = "0029_index_audit"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add responses_count and backfill it from order_responses."""
+    op.add_column(
+        "orders",
+        sa.Column(
+            "responses_count",
+            sa.Integer(),
+            nullable=False,
+            server_default=sa.text("0"),
+        ),
+    )
+    op.execute(
+        """
+        UPDATE orders
+        SET responses_count = (
+            SELECT count(*)
+            FROM order_responses
+            WHERE order_responses.order_id = orders.order_id
+        )
+        WHERE EXISTS (
+            SELECT 1
+            FROM order_responses
+            WHERE order_responses.order_id = orders.order_id
+        )
+        """
+    )
+
+
+def downgrade() -> None:
+    """Remove responses_count from orders."""
+    op.drop_column("orders", "responses_count")
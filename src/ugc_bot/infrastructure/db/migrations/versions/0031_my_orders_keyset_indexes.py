@@ -0,0 +1,64 @@
+"""Index the keyset pages of my_orders.
+
+Advertiser pages seek on (advertiser_id, created_at) and blogger pages on
+(blogger_id, responded_at); the latter replaces the blogger_id index.
+"""
+
+from alembic import op
+
+revision = "0031_my_orders_keyset_indexes"
+down_revision = "0030_orders_responses_count"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create keyset indexes and drop the superseded blogger_id index.
+
+    Built CONCURRENTLY, outside a transaction, so the tables stay writable.
+    """
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_orders_advertiser_created_at",
+            "orders",
+            ["advertiser_id", "created_at"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_order_responses_blogger_responded_at",
+            "order_responses",
+            ["blogger_id", "responded_at"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_order_responses_blogger_id",
+            table_name="order_responses",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Restore the blogger_id index and drop keyset indexes."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_order_responses_blogger_id",
+            "order_responses",
+            ["blogger_id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_order_responses_blogger_responded_at",
+            table_name="order_responses",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_orders_advertiser_created_at",
+            table_name="orders",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -15,6 +15,7 @@ from sqlalchemy import (
     Numeric,
     String,
     Text,
+    UniqueConstraint,
     text,
 )
 from sqlalchemy.dialects.postgresql import JSONB
@@ -204,6 +205,9 @@ class OrderModel(Base):
     product_photo_file_id: Mapped[Optional[str]] = mapped_column(
         String, nullable=True
     )
+    responses_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default=text("0")
+    )
 
 
 class ContactPricingModel(Base):
@@ -244,6 +248,7 @@ class OrderResponseModel(Base):
     """Order response ORM model."""
 
     __tablename__ = "order_responses"
+    __table_args__ = (UniqueConstraint("order_id", "blogger_id"),)
 
     response_id: Mapped[UUID] = mapped_column(
         PG_UUID(as_uuid=True),
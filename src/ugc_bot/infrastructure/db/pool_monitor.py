@@ -0,0 +1,189 @@
+"""Connection pool metrics and background validation.
+
+``instrument_pool`` exports pool state through the metrics collector:
+connections checked out, overflow connections in use, time spent
+waiting for a connection and invalidations. Occupancy and waits come
+from the ``Monitored*QueuePool`` classes the engine factories use for
+Postgres.
+
+``PoolValidator`` replaces ``pool_pre_ping``: instead of a round trip on
+every checkout, idle connections are pinged every ``interval_seconds``
+in the background. A failed ping goes through SQLAlchemy's disconnect
+handling, which invalidates the whole pool, so connections broken by a
+database restart are replaced before a request picks them up.
+"""
+
+import asyncio
+import contextlib
+import logging
+import time
+import weakref
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+if TYPE_CHECKING:
+    from ugc_bot.metrics.collector import MetricsCollector
+
+logger = logging.getLogger(__name__)
+
+_validators: "weakref.WeakKeyDictionary[Engine, PoolValidator]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+class _MonitoredPool:
+    """QueuePool mixin reporting checkout waits and pool occupancy.
+
+    Occupancy is read after the pool updated its counters, which the
+    ``checkin`` event fires too early for.
+    """
+
+    on_checkout_wait: Callable[[float], None] | None = None
+    on_state_change: Callable[[Any], None] | None = None
+
+    def _do_get(self) -> Any:
+        started = time.perf_counter()
+        try:
+            return super()._do_get()  # type: ignore[misc]
+        finally:
+            if self.on_checkout_wait is not None:
+                self.on_checkout_wait(time.perf_counter() - started)
+            if self.on_state_change is not None:
+                self.on_state_change(self)
+
+    def _do_return_conn(self, record: Any) -> None:
+        super()._do_return_conn(record)  # type: ignore[misc]
+        if self.on_state_change is not None:
+            self.on_state_change(self)
+
+    def recreate(self) -> Any:
+        # Engine.dispose() swaps in a recreated pool; keep observing it.
+        pool = super().recreate()  # type: ignore[misc]
+        pool.on_checkout_wait = self.on_checkout_wait
+        pool.on_state_change = self.on_state_change
+        return pool
+
+
+class MonitoredQueuePool(_MonitoredPool, QueuePool):
+    """QueuePool exporting checkout waits and occupancy."""
+
+
+class MonitoredAsyncAdaptedQueuePool(_MonitoredPool, AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool exporting checkout waits and occupancy."""
+
+
+def instrument_pool(
+    engine: Engine | AsyncEngine,
+    name: str,
+    metrics_collector: "MetricsCollector",
+) -> None:
+    """Export pool metrics of ``engine`` labelled ``pool=name``.
+
+    Invalidations are counted for any pool; occupancy and checkout waits
+    need one of the ``Monitored*QueuePool`` classes.
+    """
+
+    pool = (
+        engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+    ).pool
+
+    def _on_invalidate(*_args: Any) -> None:
+        metrics_collector.record_db_pool_invalidation(name, soft=False)
+
+    def _on_soft_invalidate(*_args: Any) -> None:
+        metrics_collector.record_db_pool_invalidation(name, soft=True)
+
+    event.listen(pool, "invalidate", _on_invalidate)
+    event.listen(pool, "soft_invalidate", _on_soft_invalidate)
+    if not isinstance(pool, _MonitoredPool):
+        return
+
+    def _on_state_change(current: QueuePool) -> None:
+        metrics_collector.record_db_pool_state(
+            name, current.checkedout(), max(0, current.overflow())
+        )
+
+    def _on_checkout_wait(seconds: float) -> None:
+        metrics_collector.record_db_pool_checkout_wait(name, seconds)
+
+    pool.on_checkout_wait = _on_checkout_wait
+    pool.on_state_change = _on_state_change
+
+
+class PoolValidator:
+    """Ping idle pooled connections periodically instead of on checkout.
+
+    The loop starts with the first checkout made on a running event loop
+    (``attach``) and stops with ``stop()`` or when the loop shuts down.
+    An attached validator is found again with ``get_pool_validator``.
+    Idle connections are checked out one at a time; the queue pool hands
+    them out in FIFO order, so one pass visits each of them once.
+    """
+
+    def __init__(self, engine: AsyncEngine, interval_seconds: float) -> None:
+        self._engine = engine
+        self._interval = interval_seconds
+        self._task: asyncio.Task[None] | None = None
+
+    def attach(self) -> None:
+        """Start the loop on the first checkout (idempotent)."""
+
+        pool = self._engine.sync_engine.pool
+        if not event.contains(pool, "checkout", self._on_checkout):
+            event.listen(pool, "checkout", self._on_checkout)
+        _validators[self._engine.sync_engine] = self
+
+    def _on_checkout(self, *_args: Any) -> None:
+        if self._task is not None and not self._task.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._task = loop.create_task(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._interval)
+            await self.validate_once()
+
+    async def validate_once(self) -> int:
+        """Ping the connections idle in the pool; return how many passed."""
+
+        idle = getattr(self._engine.sync_engine.pool, "checkedin", None)
+        passed = 0
+        for _ in range(idle() if idle is not None else 0):
+            try:
+                async with self._engine.connect() as conn:
+                    await conn.exec_driver_sql("SELECT 1")
+            except DBAPIError as exc:
+                # The pool is invalidated; the rest reconnect on checkout.
+                logger.warning(
+                    "Pooled connection failed validation",
+                    extra={"error": str(exc)},
+                )
+                break
+            passed += 1
+        return passed
+
+    async def stop(self) -> None:
+        """Cancel the validation loop."""
+
+        if self._task is None:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+
+def get_pool_validator(engine: AsyncEngine) -> PoolValidator | None:
+    """Return the validator attached to ``engine``, if any."""
+
+    return _validators.get(engine.sync_engine)
@@ -2,10 +2,22 @@
 
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Callable, Iterable, List, Optional
+from typing import Any, Callable, Iterable, List, Optional, Sequence
 from uuid import UUID
 
-from sqlalchemy import func, select, update
+from sqlalchemy import (
+    Row,
+    Select,
+    case,
+    exists,
+    func,
+    inspect,
+    literal,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from ugc_bot.application.ports import (
@@ -21,6 +33,8 @@ from ugc_bot.application.ports import (
     OrderRepository,
     OrderResponseRepository,
     OutboxRepository,
+    Page,
+    PageCursor,
     PaymentRepository,
     UserRepository,
 )
@@ -47,6 +61,7 @@ from ugc_bot.domain.enums import (
     OutboxEventStatus,
     WorkFormat,
 )
+from ugc_bot.infrastructure.db.base import Base
 from ugc_bot.infrastructure.db.models import (
     AdvertiserProfileModel,
     BloggerProfileModel,
@@ -99,6 +114,168 @@ def _get_async_session(session: object | None) -> AsyncSession:
     return session  # type: ignore[return-value]
 
 
+_UPSERT_INSERTS: dict[str, Callable[..., Any]] = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+
+def _model_values(model: Base) -> dict:
+    """Return column values explicitly set on an ORM instance.
+
+    Unset attributes are left out so that, like ``merge``, an update never
+    overwrites columns the caller did not provide.
+    """
+
+    mapper = inspect(type(model))
+    return {
+        attr.key: getattr(model, attr.key)
+        for attr in mapper.column_attrs
+        if attr.key in model.__dict__
+    }
+
+
+async def _upsert(db_session: AsyncSession, models: Sequence[Base]) -> None:
+    """Insert or update models with one ``INSERT ... ON CONFLICT`` statement.
+
+    Conflicts are resolved on the primary key. Dialects without native
+    upsert support (and test doubles without a bound engine) fall back to
+    ``session.merge``.
+    """
+
+    if not models:
+        return
+    model_cls = type(models[0])
+    bind = getattr(db_session, "bind", None)
+    dialect_name = getattr(getattr(bind, "dialect", None), "name", None)
+    insert = _UPSERT_INSERTS.get(dialect_name or "")
+    if insert is None:
+        for model in models:
+            await db_session.merge(model)
+        return
+
+    mapper = inspect(model_cls)
+    pk_keys = [mapper.get_property_by_column(c).key for c in mapper.primary_key]
+    rows = [_model_values(model) for model in models]
+    stmt = insert(model_cls).values(rows)
+    changed = {
+        key: stmt.excluded[mapper.columns[key].name]
+        for key in rows[0]
+        if key not in pk_keys
+    }
+    if changed:
+        stmt = stmt.on_conflict_do_update(index_elements=pk_keys, set_=changed)
+    else:
+        stmt = stmt.on_conflict_do_nothing(index_elements=pk_keys)
+    await db_session.execute(stmt)
+    _expire_cached(
+        db_session, model_cls, [tuple(r[k] for k in pk_keys) for r in rows]
+    )
+
+
+def _expire_cached(
+    db_session: AsyncSession, model_cls: type[Base], primary_keys: list[tuple]
+) -> None:
+    """Expire identity-map copies of rows written with Core statements.
+
+    Later ORM reads in the same session then reload the row instead of
+    returning the stale instance.
+    """
+
+    sync_session = getattr(db_session, "sync_session", None)
+    if sync_session is None:
+        return
+    mapper = inspect(model_cls)
+    for pk in primary_keys:
+        cached = sync_session.identity_map.get(
+            mapper.identity_key_from_primary_key(pk)
+        )
+        if cached is not None:
+            sync_session.expire(cached)
+
+
+async def _update_returning(
+    db_session: AsyncSession,
+    model_cls: type[Base],
+    where: Any,
+    changes: dict[str, Any],
+) -> Any:
+    """Write only ``changes`` with ``UPDATE ... RETURNING``.
+
+    Returns the updated ORM row (or None when nothing matched) without a
+    read before the write.
+    """
+
+    if not changes:
+        stmt: Any = select(model_cls).where(where)
+    else:
+        stmt = (
+            update(model_cls)
+            .where(where)
+            .values(**changes)
+            .returning(model_cls)
+            .execution_options(populate_existing=True)
+        )
+    result = await db_session.execute(stmt)
+    return result.scalar_one_or_none()
+
+
+def _columns(model_cls: type[Base]) -> Select:
+    """Select a model's table columns as plain rows.
+
+    Hot reads map rows straight to entities: no ORM instance, identity map
+    entry or attribute instrumentation is created per row. Column names
+    match attribute names, so the ``_to_*_entity`` helpers accept either.
+    ``Session.execute`` still autoflushes before the read, so rows left
+    pending by the ``add``/``merge`` fallbacks of ``add_if_absent`` and
+    ``_upsert`` are visible in the same unit.
+    """
+
+    return select(*model_cls.__table__.columns)
+
+
+def _keyset(
+    stmt: Select,
+    column: Any,
+    id_column: Any,
+    limit: int,
+    before: PageCursor | None,
+    after: PageCursor | None,
+) -> Select:
+    """Apply a newest-first keyset page on ``(column, id_column)``.
+
+    The id breaks ties between rows with the same timestamp, so no row is
+    skipped or repeated at a page boundary. ``after`` (previous page)
+    reads upwards from the cursor, so its rows come back oldest first;
+    ``_page`` restores the order.
+    """
+
+    key = tuple_(column, id_column)
+    if after is not None:
+        return (
+            stmt.where(key > tuple_(*after))
+            .order_by(column.asc(), id_column.asc())
+            .limit(limit)
+        )
+    if before is not None:
+        stmt = stmt.where(key < tuple_(*before))
+    return stmt.order_by(column.desc(), id_column.desc()).limit(limit)
+
+
+def _page(
+    rows: Sequence[Row],
+    to_item: Callable[[Row], Any],
+    after: PageCursor | None,
+) -> Page:
+    """Map keyset rows (with a ``total`` column) to a newest-first page."""
+
+    ordered = reversed(rows) if after is not None else rows
+    return Page(
+        items=[to_item(row) for row in ordered],
+        total=int(rows[0].total) if rows else 0,
+    )
+
+
 @dataclass(slots=True)
 class SqlAlchemyUserRepository(UserRepository):
     """SQLAlchemy-backed user repository."""
@@ -112,9 +289,9 @@ class SqlAlchemyUserRepository(UserRepository):
 
         db_session = _get_async_session(session)
         exec_result = await db_session.execute(
-            select(UserModel).where(UserModel.user_id == user_id)
+            _columns(UserModel).where(UserModel.user_id == user_id)
         )
-        result = exec_result.scalar_one_or_none()
+        result = exec_result.one_or_none()
         return _to_user_entity(result) if result else None
 
     async def get_by_external(
@@ -127,12 +304,12 @@ class SqlAlchemyUserRepository(UserRepository):
 
         db_session = _get_async_session(session)
         exec_result = await db_session.execute(
-            select(UserModel).where(
+            _columns(UserModel).where(
                 UserModel.external_id == external_id,
                 UserModel.messenger_type == messenger_type.value,
             )
         )
-        result = exec_result.scalar_one_or_none()
+        result = exec_result.one_or_none()
         return _to_user_entity(result) if result else None
 
     async def save(self, user: User, session: object | None = None) -> None:
@@ -140,24 +317,70 @@ class SqlAlchemyUserRepository(UserRepository):
 
         db_session = _get_async_session(session)
         model = _to_user_model(user)
-        await db_session.merge(model)
+        await _upsert(db_session, [model])
+
+    async def save_many(
+        self, users: Sequence[User], session: object | None = None
+    ) -> None:
+        """Persist many users with one statement."""
+
+        db_session = _get_async_session(session)
+        await _upsert(db_session, [_to_user_model(item) for item in users])
+
+    async def list_by_ids(
+        self, user_ids: Sequence[UUID], session: object | None = None
+    ) -> list[User]:
+        """Fetch many users by ID with one IN query."""
+
+        if not user_ids:
+            return []
+        db_session = _get_async_session(session)
+        exec_result = await db_session.execute(
+            _columns(UserModel).where(UserModel.user_id.in_(user_ids))
+        )
+        return [_to_user_entity(row) for row in exec_result.all()]
 
     async def list_pending_role_reminders(
-        self, reminder_cutoff: datetime, session: object | None = None
+        self,
+        reminder_cutoff: datetime,
+        session: object | None = None,
+        *,
+        limit: int | None = None,
+        after_user_id: UUID | None = None,
     ) -> Iterable[User]:
         """List users who have not chosen a role and are due for a reminder."""
 
         db_session = _get_async_session(session)
-        exec_result = await db_session.execute(
-            select(UserModel).where(
-                UserModel.role_chosen_at.is_(None),
-                (UserModel.last_role_reminder_at.is_(None))
-                | (UserModel.last_role_reminder_at < reminder_cutoff),
-            )
+        query = _columns(UserModel).where(
+            UserModel.role_chosen_at.is_(None),
+            (UserModel.last_role_reminder_at.is_(None))
+            | (UserModel.last_role_reminder_at < reminder_cutoff),
         )
-        results = exec_result.scalars().all()
+        if after_user_id is not None:
+            query = query.where(UserModel.user_id > after_user_id)
+        if limit is not None:
+            query = query.order_by(UserModel.user_id).limit(limit)
+        exec_result = await db_session.execute(query)
+        results = exec_result.all()
         return [_to_user_entity(row) for row in results]
 
+    async def update_last_role_reminder_at_many(
+        self,
+        user_ids: Sequence[UUID],
+        reminded_at: datetime,
+        session: object | None = None,
+    ) -> None:
+        """Set last_role_reminder_at for many users in one statement."""
+
+        if not user_ids:
+            return
+        db_session = _get_async_session(session)
+        await db_session.execute(
+            update(UserModel)
+            .where(UserModel.user_id.in_(list(user_ids)))
+            .values(last_role_reminder_at=reminded_at)
+        )
+
     async def list_admins(
         self,
         messenger_type: MessengerType | None = None,
@@ -166,13 +389,13 @@ class SqlAlchemyUserRepository(UserRepository):
         """List users with admin=True. Optionally filter by messenger_type."""
 
         db_session = _get_async_session(session)
-        query = select(UserModel).where(UserModel.admin.is_(True))
+        query = _columns(UserModel).where(UserModel.admin.is_(True))
         if messenger_type is not None:
             query = query.where(
                 UserModel.messenger_type == messenger_type.value
             )
         exec_result = await db_session.execute(query)
-        results = exec_result.scalars().all()
+        results = exec_result.all()
         return [_to_user_entity(row) for row in results]
 
 
@@ -189,11 +412,11 @@ class SqlAlchemyBloggerProfileRepository(BloggerProfileRepository):
 
         db_session = _get_async_session(session)
         exec_result = await db_session.execute(
-            select(BloggerProfileModel).where(
+            _columns(BloggerProfileModel).where(
                 BloggerProfileModel.user_id == user_id
             )
         )
-        result = exec_result.scalar_one_or_none()
+        result = exec_result.one_or_none()
         return _to_blogger_profile_entity(result) if result else None
 
     async def get_by_instagram_url(
@@ -203,11 +426,11 @@ class SqlAlchemyBloggerProfileRepository(BloggerProfileRepository):
 
         db_session = _get_async_session(session)
         exec_result = await db_session.execute(
-            select(BloggerProfileModel).where(
+            _columns(BloggerProfileModel).where(
                 BloggerProfileModel.instagram_url == instagram_url
             )
         )
-        result = exec_result.scalar_one_or_none()
+        result = exec_result.one_or_none()
         return _to_blogger_profile_entity(result) if result else None
 
     async def save(
@@ -217,7 +440,31 @@ class SqlAlchemyBloggerProfileRepository(BloggerProfileRepository):
 
         db_session = _get_async_session(session)
         model = _to_blogger_profile_model(profile)
-        await db_session.merge(model)
+        await _upsert(db_session, [model])
+
+    async def save_many(
+        self, profiles: Sequence[BloggerProfile], session: object | None = None
+    ) -> None:
+        """Persist many blogger profiles with one statement."""
+
+        db_session = _get_async_session(session)
+        await _upsert(
+            db_session, [_to_blogger_profile_model(item) for item in profiles]
+        )
+
+    async def update_fields(
+        self, user_id: UUID, session: object | None = None, **changes: Any
+    ) -> Optional[BloggerProfile]:
+        """Update only the given profile columns."""
+
+        db_session = _get_async_session(session)
+        result = await _update_returning(
+            db_session,
+            BloggerProfileModel,
+            BloggerProfileModel.user_id == user_id,
+            changes,
+        )
+        return _to_blogger_profile_entity(result) if result else None
 
     async def list_confirmed_user_ids(
         self, session: object | None = None
@@ -249,11 +496,11 @@ class SqlAlchemyAdvertiserProfileRepository(AdvertiserProfileRepository):
 
         db_session = _get_async_session(session)
         exec_result = await db_session.execute(
-            select(AdvertiserProfileModel).where(
+            _columns(AdvertiserProfileModel).where(
                 AdvertiserProfileModel.user_id == user_id
             )
         )
-        result = exec_result.scalar_one_or_none()
+        result = exec_result.one_or_none()
         return _to_advertiser_profile_entity(result) if result else None
 
     async def save(
@@ -263,7 +510,20 @@ class SqlAlchemyAdvertiserProfileRepository(AdvertiserProfileRepository):
 
         db_session = _get_async_session(session)
         model = _to_advertiser_profile_model(profile)
-        await db_session.merge(model)
+        await _upsert(db_session, [model])
+
+    async def save_many(
+        self,
+        profiles: Sequence[AdvertiserProfile],
+        session: object | None = None,
+    ) -> None:
+        """Persist many advertiser profiles with one statement."""
+
+        db_session = _get_async_session(session)
+        await _upsert(
+            db_session,
+            [_to_advertiser_profile_model(item) for item in profiles],
+        )
 
 
 @dataclass(slots=True)
@@ -281,7 +541,7 @@ class SqlAlchemyInstagramVerificationRepository(
 
         db_session = _get_async_session(session)
         model = _to_verification_model(code)
-        await db_session.merge(model)
+        await _upsert(db_session, [model])
 
     async def get_valid_code(
         self, user_id: UUID, code: str, session: object | None = None
@@ -353,9 +613,9 @@ class SqlAlchemyOrderRepository(OrderRepository):
 
         db_session = _get_async_session(session)
         exec_result = await db_session.execute(
-            select(OrderModel).where(OrderModel.order_id == order_id)
+            _columns(OrderModel).where(OrderModel.order_id == order_id)
         )
-        result = exec_result.scalar_one_or_none()
+        result = exec_result.one_or_none()
         return _to_order_entity(result) if result else None
 
     async def get_by_id_for_update(
@@ -364,13 +624,13 @@ class SqlAlchemyOrderRepository(OrderRepository):
         """Fetch order by ID with row lock."""
 
         stmt = (
-            select(OrderModel)
+            _columns(OrderModel)
             .where(OrderModel.order_id == order_id)
             .with_for_update()
         )
         db_session = _get_async_session(session)
         exec_result = await db_session.execute(stmt)
-        result = exec_result.scalar_one_or_none()
+        result = exec_result.one_or_none()
         return _to_order_entity(result) if result else None
 
     async def list_active(
@@ -380,9 +640,9 @@ class SqlAlchemyOrderRepository(OrderRepository):
 
         db_session = _get_async_session(session)
         exec_result = await db_session.execute(
-            select(OrderModel).where(OrderModel.status == OrderStatus.ACTIVE)
+            _columns(OrderModel).where(OrderModel.status == OrderStatus.ACTIVE)
         )
-        result = exec_result.scalars()
+        result = exec_result.all()
         return [_to_order_entity(item) for item in result]
 
     async def list_by_advertiser(
@@ -392,9 +652,11 @@ class SqlAlchemyOrderRepository(OrderRepository):
 
         db_session = _get_async_session(session)
         exec_result = await db_session.execute(
-            select(OrderModel).where(OrderModel.advertiser_id == advertiser_id)
+            _columns(OrderModel).where(
+                OrderModel.advertiser_id == advertiser_id
+            )
         )
-        result = exec_result.scalars()
+        result = exec_result.all()
         return [_to_order_entity(item) for item in result]
 
     async def list_completed_before(
@@ -404,12 +666,12 @@ class SqlAlchemyOrderRepository(OrderRepository):
 
         db_session = _get_async_session(session)
         exec_result = await db_session.execute(
-            select(OrderModel).where(
+            _columns(OrderModel).where(
                 OrderModel.completed_at.is_not(None),
                 OrderModel.completed_at <= cutoff,
             )
         )
-        result = exec_result.scalars()
+        result = exec_result.all()
         return [_to_order_entity(item) for item in result]
 
     async def count_by_advertiser(
@@ -431,7 +693,101 @@ class SqlAlchemyOrderRepository(OrderRepository):
 
         model = _to_order_model(order)
         db_session = _get_async_session(session)
-        await db_session.merge(model)
+        await _upsert(db_session, [model])
+
+    async def save_many(
+        self, orders: Sequence[Order], session: object | None = None
+    ) -> None:
+        """Persist many orders with one statement."""
+
+        db_session = _get_async_session(session)
+        await _upsert(db_session, [_to_order_model(item) for item in orders])
+
+    async def update_fields(
+        self, order_id: UUID, session: object | None = None, **changes: Any
+    ) -> Optional[Order]:
+        """Update only the given order columns."""
+
+        db_session = _get_async_session(session)
+        result = await _update_returning(
+            db_session, OrderModel, OrderModel.order_id == order_id, changes
+        )
+        return _to_order_entity(result) if result else None
+
+    async def list_page_by_advertiser(
+        self,
+        advertiser_id: UUID,
+        limit: int,
+        before: PageCursor | None = None,
+        after: PageCursor | None = None,
+        session: object | None = None,
+    ) -> Page[Order]:
+        """List one page of orders with one keyset query.
+
+        Response counts come from the denormalized ``responses_count``
+        column and the list total from a scalar subquery, so a page is a
+        single statement regardless of the advertiser's history.
+        """
+
+        total = (
+            select(func.count())
+            .select_from(OrderModel)
+            .where(OrderModel.advertiser_id == advertiser_id)
+            .scalar_subquery()
+        )
+        stmt = _keyset(
+            select(*OrderModel.__table__.columns, total.label("total")).where(
+                OrderModel.advertiser_id == advertiser_id
+            ),
+            OrderModel.created_at,
+            OrderModel.order_id,
+            limit,
+            before,
+            after,
+        )
+        db_session = _get_async_session(session)
+        exec_result = await db_session.execute(stmt)
+        return _page(exec_result.all(), _to_order_entity, after)
+
+    async def increment_responses_count(
+        self, order_id: UUID, now: datetime, session: object | None = None
+    ) -> Optional[Order]:
+        """Count one more response with a single conditional UPDATE.
+
+        The row lock is held only for this statement; the WHERE clause
+        re-checks status and capacity against the locked row, so
+        concurrent responders can never overfill an order.
+        """
+
+        count = OrderModel.responses_count + 1
+        full = count >= OrderModel.bloggers_needed
+        stmt = (
+            update(OrderModel)
+            .where(
+                OrderModel.order_id == order_id,
+                OrderModel.status == OrderStatus.ACTIVE,
+                OrderModel.responses_count < OrderModel.bloggers_needed,
+            )
+            .values(
+                responses_count=count,
+                status=case(
+                    (full, literal(OrderStatus.CLOSED, OrderModel.status.type)),
+                    else_=OrderModel.status,
+                ),
+                completed_at=case(
+                    (full, literal(now, OrderModel.completed_at.type)),
+                    else_=OrderModel.completed_at,
+                ),
+            )
+            .returning(*OrderModel.__table__.columns)
+        )
+        db_session = _get_async_session(session)
+        exec_result = await db_session.execute(stmt)
+        result = exec_result.one_or_none()
+        if result is None:
+            return None
+        _expire_cached(db_session, OrderModel, [(order_id,)])
+        return _to_order_entity(result)
 
 
 @dataclass(slots=True)
@@ -447,9 +803,9 @@ class SqlAlchemyPaymentRepository(PaymentRepository):
 
         db_session = _get_async_session(session)
         exec_result = await db_session.execute(
-            select(PaymentModel).where(PaymentModel.order_id == order_id)
+            _columns(PaymentModel).where(PaymentModel.order_id == order_id)
         )
-        result = exec_result.scalar_one_or_none()
+        result = exec_result.one_or_none()
         return _to_payment_entity(result) if result else None
 
     async def get_by_external_id(
@@ -459,9 +815,11 @@ class SqlAlchemyPaymentRepository(PaymentRepository):
 
         db_session = _get_async_session(session)
         exec_result = await db_session.execute(
-            select(PaymentModel).where(PaymentModel.external_id == external_id)
+            _columns(PaymentModel).where(
+                PaymentModel.external_id == external_id
+            )
         )
-        result = exec_result.scalar_one_or_none()
+        result = exec_result.one_or_none()
         return _to_payment_entity(result) if result else None
 
     async def save(
@@ -471,7 +829,17 @@ class SqlAlchemyPaymentRepository(PaymentRepository):
 
         model = _to_payment_model(payment)
         db_session = _get_async_session(session)
-        await db_session.merge(model)
+        await _upsert(db_session, [model])
+
+    async def save_many(
+        self, payments: Sequence[Payment], session: object | None = None
+    ) -> None:
+        """Persist many payments with one statement."""
+
+        db_session = _get_async_session(session)
+        await _upsert(
+            db_session, [_to_payment_model(item) for item in payments]
+        )
 
 
 @dataclass(slots=True)
@@ -487,11 +855,11 @@ class SqlAlchemyContactPricingRepository(ContactPricingRepository):
 
         db_session = _get_async_session(session)
         exec_result = await db_session.execute(
-            select(ContactPricingModel).where(
+            _columns(ContactPricingModel).where(
                 ContactPricingModel.bloggers_count == bloggers_count
             )
         )
-        result = exec_result.scalar_one_or_none()
+        result = exec_result.one_or_none()
         return _to_contact_pricing_entity(result) if result else None
 
 
@@ -508,7 +876,17 @@ class SqlAlchemyOrderResponseRepository(OrderResponseRepository):
 
         model = _to_order_response_model(response)
         db_session = _get_async_session(session)
-        await db_session.merge(model)
+        await _upsert(db_session, [model])
+
+    async def save_many(
+        self, responses: Sequence[OrderResponse], session: object | None = None
+    ) -> None:
+        """Persist many order responses with one statement."""
+
+        db_session = _get_async_session(session)
+        await _upsert(
+            db_session, [_to_order_response_model(item) for item in responses]
+        )
 
     async def list_by_order(
         self, order_id: UUID, session: object | None = None
@@ -517,11 +895,11 @@ class SqlAlchemyOrderResponseRepository(OrderResponseRepository):
 
         db_session = _get_async_session(session)
         exec_result = await db_session.execute(
-            select(OrderResponseModel).where(
+            _columns(OrderResponseModel).where(
                 OrderResponseModel.order_id == order_id
             )
         )
-        results = exec_result.scalars()
+        results = exec_result.all()
         return [_to_order_response_entity(item) for item in results]
 
     async def list_by_blogger(
@@ -531,11 +909,11 @@ class SqlAlchemyOrderResponseRepository(OrderResponseRepository):
 
         db_session = _get_async_session(session)
         exec_result = await db_session.execute(
-            select(OrderResponseModel).where(
+            _columns(OrderResponseModel).where(
                 OrderResponseModel.blogger_id == blogger_id
             )
         )
-        results = exec_result.scalars()
+        results = exec_result.all()
         return [_to_order_response_entity(item) for item in results]
 
     async def exists(
@@ -545,15 +923,14 @@ class SqlAlchemyOrderResponseRepository(OrderResponseRepository):
 
         db_session = _get_async_session(session)
         exec_result = await db_session.execute(
-            select(func.count())
-            .select_from(OrderResponseModel)
-            .where(
-                OrderResponseModel.order_id == order_id,
-                OrderResponseModel.blogger_id == blogger_id,
+            select(
+                exists().where(
+                    OrderResponseModel.order_id == order_id,
+                    OrderResponseModel.blogger_id == blogger_id,
+                )
             )
         )
-        result = exec_result.scalar_one()
-        return int(result) > 0
+        return bool(exec_result.scalar_one())
 
     async def count_by_order(
         self, order_id: UUID, session: object | None = None
@@ -569,6 +946,106 @@ class SqlAlchemyOrderResponseRepository(OrderResponseRepository):
         result = exec_result.scalar_one()
         return int(result)
 
+    async def count_by_orders(
+        self, order_ids: Sequence[UUID], session: object | None = None
+    ) -> dict[UUID, int]:
+        """Count responses per order with one GROUP BY."""
+
+        counts = dict.fromkeys(order_ids, 0)
+        if not counts:
+            return counts
+        db_session = _get_async_session(session)
+        exec_result = await db_session.execute(
+            select(OrderResponseModel.order_id, func.count())
+            .where(OrderResponseModel.order_id.in_(counts))
+            .group_by(OrderResponseModel.order_id)
+        )
+        counts.update((order_id, int(n)) for order_id, n in exec_result.all())
+        return counts
+
+    async def list_page_by_blogger(
+        self,
+        blogger_id: UUID,
+        limit: int,
+        before: PageCursor | None = None,
+        after: PageCursor | None = None,
+        session: object | None = None,
+    ) -> Page[tuple[Order, OrderResponse]]:
+        """List one page of responses joined with their orders."""
+
+        total = (
+            select(func.count())
+            .select_from(OrderResponseModel)
+            .where(OrderResponseModel.blogger_id == blogger_id)
+            .scalar_subquery()
+        )
+        stmt = _keyset(
+            select(
+                *OrderModel.__table__.columns,
+                OrderResponseModel.response_id,
+                OrderResponseModel.blogger_id,
+                OrderResponseModel.responded_at,
+                total.label("total"),
+            )
+            .join(
+                OrderModel,
+                OrderModel.order_id == OrderResponseModel.order_id,
+            )
+            .where(OrderResponseModel.blogger_id == blogger_id),
+            OrderResponseModel.responded_at,
+            OrderResponseModel.response_id,
+            limit,
+            before,
+            after,
+        )
+        db_session = _get_async_session(session)
+        exec_result = await db_session.execute(stmt)
+        return _page(
+            exec_result.all(),
+            lambda row: (
+                _to_order_entity(row),
+                _to_order_response_entity(row),
+            ),
+            after,
+        )
+
+    async def add_if_absent(
+        self, response: OrderResponse, session: object | None = None
+    ) -> bool:
+        """Insert with ``ON CONFLICT (order_id, blogger_id) DO NOTHING``.
+
+        Dialects without native upsert support (and test doubles without
+        a bound engine) fall back to an existence check and ``add``.
+        """
+
+        db_session = _get_async_session(session)
+        bind = getattr(db_session, "bind", None)
+        dialect_name = getattr(getattr(bind, "dialect", None), "name", None)
+        insert = _UPSERT_INSERTS.get(dialect_name or "")
+        if insert is None:
+            if await self.exists(
+                response.order_id, response.blogger_id, session=session
+            ):
+                return False
+            db_session.add(_to_order_response_model(response))
+            return True
+
+        stmt = (
+            insert(OrderResponseModel)
+            .values(
+                _model_values(_to_order_response_model(response)),
+            )
+            .on_conflict_do_nothing(
+                index_elements=[
+                    OrderResponseModel.order_id,
+                    OrderResponseModel.blogger_id,
+                ]
+            )
+            .returning(OrderResponseModel.response_id)
+        )
+        exec_result = await db_session.execute(stmt)
+        return exec_result.scalar_one_or_none() is not None
+
 
 @dataclass(slots=True)
 class SqlAlchemyOfferDispatchRepository(OfferDispatchRepository):
@@ -588,7 +1065,7 @@ class SqlAlchemyOfferDispatchRepository(OfferDispatchRepository):
             order_id=order_id,
             blogger_id=blogger_id,
         )
-        await db_session.merge(model)
+        await _upsert(db_session, [model])
 
     async def list_blogger_ids_sent_for_order(
         self, order_id: UUID, session: object | None = None
@@ -616,11 +1093,11 @@ class SqlAlchemyInteractionRepository(InteractionRepository):
 
         db_session = _get_async_session(session)
         exec_result = await db_session.execute(
-            select(InteractionModel).where(
+            _columns(InteractionModel).where(
                 InteractionModel.interaction_id == interaction_id
             )
         )
-        result = exec_result.scalar_one_or_none()
+        result = exec_result.one_or_none()
         return _to_interaction_entity(result) if result else None
 
     async def get_by_participants(
@@ -634,13 +1111,13 @@ class SqlAlchemyInteractionRepository(InteractionRepository):
 
         db_session = _get_async_session(session)
         exec_result = await db_session.execute(
-            select(InteractionModel).where(
+            _columns(InteractionModel).where(
                 InteractionModel.order_id == order_id,
                 InteractionModel.blogger_id == blogger_id,
                 InteractionModel.advertiser_id == advertiser_id,
             )
         )
-        result = exec_result.scalar_one_or_none()
+        result = exec_result.one_or_none()
         return _to_interaction_entity(result) if result else None
 
     async def list_by_order(
@@ -650,13 +1127,33 @@ class SqlAlchemyInteractionRepository(InteractionRepository):
 
         db_session = _get_async_session(session)
         exec_result = await db_session.execute(
-            select(InteractionModel).where(
+            _columns(InteractionModel).where(
                 InteractionModel.order_id == order_id
             )
         )
-        results = exec_result.scalars()
+        results = exec_result.all()
         return [_to_interaction_entity(item) for item in results]
 
+    async def count_advertiser_feedback_by_orders(
+        self, order_ids: Sequence[UUID], session: object | None = None
+    ) -> dict[UUID, int]:
+        """Count interactions with advertiser feedback with one GROUP BY."""
+
+        counts = dict.fromkeys(order_ids, 0)
+        if not counts:
+            return counts
+        db_session = _get_async_session(session)
+        exec_result = await db_session.execute(
+            select(InteractionModel.order_id, func.count())
+            .where(
+                InteractionModel.order_id.in_(counts),
+                InteractionModel.from_advertiser.is_not(None),
+            )
+            .group_by(InteractionModel.order_id)
+        )
+        counts.update((order_id, int(n)) for order_id, n in exec_result.all())
+        return counts
+
     async def list_due_for_feedback(
         self, cutoff: datetime, session: object | None = None
     ) -> Iterable[Interaction]:
@@ -664,12 +1161,12 @@ class SqlAlchemyInteractionRepository(InteractionRepository):
 
         db_session = _get_async_session(session)
         exec_result = await db_session.execute(
-            select(InteractionModel).where(
+            _columns(InteractionModel).where(
                 InteractionModel.next_check_at <= cutoff,
                 InteractionModel.status == InteractionStatus.PENDING,
             )
         )
-        results = exec_result.scalars()
+        results = exec_result.all()
         return [_to_interaction_entity(item) for item in results]
 
     async def list_by_status(
@@ -679,9 +1176,9 @@ class SqlAlchemyInteractionRepository(InteractionRepository):
 
         db_session = _get_async_session(session)
         exec_result = await db_session.execute(
-            select(InteractionModel).where(InteractionModel.status == status)
+            _columns(InteractionModel).where(InteractionModel.status == status)
         )
-        results = exec_result.scalars()
+        results = exec_result.all()
         return [_to_interaction_entity(item) for item in results]
 
     async def save(
@@ -691,7 +1188,34 @@ class SqlAlchemyInteractionRepository(InteractionRepository):
 
         db_session = _get_async_session(session)
         model = _to_interaction_model(interaction)
-        await db_session.merge(model)
+        await _upsert(db_session, [model])
+
+    async def save_many(
+        self, interactions: Sequence[Interaction], session: object | None = None
+    ) -> None:
+        """Persist many interactions with one statement."""
+
+        db_session = _get_async_session(session)
+        await _upsert(
+            db_session, [_to_interaction_model(item) for item in interactions]
+        )
+
+    async def update_fields(
+        self,
+        interaction_id: UUID,
+        session: object | None = None,
+        **changes: Any,
+    ) -> Optional[Interaction]:
+        """Update only the given interaction columns."""
+
+        db_session = _get_async_session(session)
+        result = await _update_returning(
+            db_session,
+            InteractionModel,
+            InteractionModel.interaction_id == interaction_id,
+            changes,
+        )
+        return _to_interaction_entity(result) if result else None
 
     async def update_next_check_at(
         self,
@@ -739,16 +1263,13 @@ class SqlAlchemyNpsRepository(NpsRepository):
 
         db_session = _get_async_session(session)
         exec_result = await db_session.execute(
-            select(func.count())
-            .select_from(NpsResponseModel)
-            .where(NpsResponseModel.user_id == user_id)
+            select(exists().where(NpsResponseModel.user_id == user_id))
         )
-        count = exec_result.scalar_one()
-        return int(count) > 0
+        return bool(exec_result.scalar_one())
 
 
-def _to_user_entity(model: UserModel) -> User:
-    """Map user ORM model to domain entity."""
+def _to_user_entity(model: UserModel | Row) -> User:
+    """Map user ORM model or row to domain entity."""
 
     return User(
         user_id=model.user_id,
@@ -784,9 +1305,9 @@ def _to_user_model(user: User) -> UserModel:
 
 
 def _to_blogger_profile_entity(
-    model: BloggerProfileModel,
+    model: BloggerProfileModel | Row,
 ) -> BloggerProfile:
-    """Map blogger profile ORM model to domain entity."""
+    """Map blogger profile ORM model or row to domain entity."""
 
     work_format = model.work_format
     if isinstance(work_format, str):
@@ -834,8 +1355,8 @@ def _to_blogger_profile_model(
     )
 
 
-def _to_interaction_entity(model: InteractionModel) -> Interaction:
-    """Map interaction ORM model to domain entity."""
+def _to_interaction_entity(model: InteractionModel | Row) -> Interaction:
+    """Map interaction ORM model or row to domain entity."""
 
     return Interaction(
         interaction_id=model.interaction_id,
@@ -871,9 +1392,9 @@ def _to_interaction_model(interaction: Interaction) -> InteractionModel:
 
 
 def _to_advertiser_profile_entity(
-    model: AdvertiserProfileModel,
+    model: AdvertiserProfileModel | Row,
 ) -> AdvertiserProfile:
-    """Map advertiser profile ORM model to domain entity."""
+    """Map advertiser profile ORM model or row to domain entity."""
 
     return AdvertiserProfile(
         user_id=model.user_id,
@@ -930,8 +1451,8 @@ def _to_verification_model(
     )
 
 
-def _to_order_entity(model: OrderModel) -> Order:
-    """Map order ORM model to domain entity."""
+def _to_order_entity(model: OrderModel | Row) -> Order:
+    """Map order ORM model or row to domain entity."""
 
     return Order(
         order_id=model.order_id,
@@ -949,13 +1470,14 @@ def _to_order_entity(model: OrderModel) -> Order:
         deadlines=getattr(model, "deadlines", None),
         geography=getattr(model, "geography", None),
         product_photo_file_id=getattr(model, "product_photo_file_id", None),
+        responses_count=model.responses_count,
     )
 
 
 def _to_order_response_entity(
-    model: OrderResponseModel,
+    model: OrderResponseModel | Row,
 ) -> OrderResponse:
-    """Map order response ORM model to domain entity."""
+    """Map order response ORM model or row to domain entity."""
 
     return OrderResponse(
         response_id=model.response_id,
@@ -966,7 +1488,11 @@ def _to_order_response_entity(
 
 
 def _to_order_model(order: Order) -> OrderModel:
-    """Map domain order entity to ORM model."""
+    """Map domain order entity to ORM model.
+
+    ``responses_count`` is left unset so saving an order never overwrites
+    the counter maintained by ``increment_responses_count``.
+    """
 
     return OrderModel(
         order_id=order.order_id,
@@ -987,8 +1513,8 @@ def _to_order_model(order: Order) -> OrderModel:
     )
 
 
-def _to_payment_entity(model: PaymentModel) -> Payment:
-    """Map payment ORM model to domain entity."""
+def _to_payment_entity(model: PaymentModel | Row) -> Payment:
+    """Map payment ORM model or row to domain entity."""
 
     return Payment(
         payment_id=model.payment_id,
@@ -1019,8 +1545,10 @@ def _to_payment_model(payment: Payment) -> PaymentModel:
     )
 
 
-def _to_contact_pricing_entity(model: ContactPricingModel) -> ContactPricing:
-    """Map contact pricing ORM model to entity."""
+def _to_contact_pricing_entity(
+    model: ContactPricingModel | Row,
+) -> ContactPricing:
+    """Map contact pricing ORM model or row to entity."""
 
     return ContactPricing(
         bloggers_count=model.bloggers_count,
@@ -1183,7 +1711,17 @@ class SqlAlchemyComplaintRepository(ComplaintRepository):
 
         db_session = _get_async_session(session)
         model = _to_complaint_model(complaint)
-        await db_session.merge(model)
+        await _upsert(db_session, [model])
+
+    async def save_many(
+        self, complaints: Sequence[Complaint], session: object | None = None
+    ) -> None:
+        """Persist many complaints with one statement."""
+
+        db_session = _get_async_session(session)
+        await _upsert(
+            db_session, [_to_complaint_model(item) for item in complaints]
+        )
 
     async def get_by_id(
         self, complaint_id: UUID, session: object | None = None
@@ -1192,11 +1730,11 @@ class SqlAlchemyComplaintRepository(ComplaintRepository):
 
         db_session = _get_async_session(session)
         exec_result = await db_session.execute(
-            select(ComplaintModel).where(
+            _columns(ComplaintModel).where(
                 ComplaintModel.complaint_id == complaint_id
             )
         )
-        result = exec_result.scalar_one_or_none()
+        result = exec_result.one_or_none()
         return _to_complaint_entity(result) if result else None
 
     async def list_by_order(
@@ -1206,9 +1744,9 @@ class SqlAlchemyComplaintRepository(ComplaintRepository):
 
         db_session = _get_async_session(session)
         exec_result = await db_session.execute(
-            select(ComplaintModel).where(ComplaintModel.order_id == order_id)
+            _columns(ComplaintModel).where(ComplaintModel.order_id == order_id)
         )
-        results = exec_result.scalars()
+        results = exec_result.all()
         return [_to_complaint_entity(item) for item in results]
 
     async def list_by_reporter(
@@ -1218,11 +1756,11 @@ class SqlAlchemyComplaintRepository(ComplaintRepository):
 
         db_session = _get_async_session(session)
         exec_result = await db_session.execute(
-            select(ComplaintModel).where(
+            _columns(ComplaintModel).where(
                 ComplaintModel.reporter_id == reporter_id
             )
         )
-        results = exec_result.scalars()
+        results = exec_result.all()
         return [_to_complaint_entity(item) for item in results]
 
     async def exists(
@@ -1232,13 +1770,14 @@ class SqlAlchemyComplaintRepository(ComplaintRepository):
 
         db_session = _get_async_session(session)
         exec_result = await db_session.execute(
-            select(func.count(ComplaintModel.complaint_id)).where(
-                ComplaintModel.order_id == order_id,
-                ComplaintModel.reporter_id == reporter_id,
+            select(
+                exists().where(
+                    ComplaintModel.order_id == order_id,
+                    ComplaintModel.reporter_id == reporter_id,
+                )
             )
         )
-        count = exec_result.scalar()
-        return (count or 0) > 0
+        return bool(exec_result.scalar_one())
 
     async def list_by_status(
         self, status: ComplaintStatus, session: object | None = None
@@ -1247,14 +1786,14 @@ class SqlAlchemyComplaintRepository(ComplaintRepository):
 
         db_session = _get_async_session(session)
         exec_result = await db_session.execute(
-            select(ComplaintModel).where(ComplaintModel.status == status)
+            _columns(ComplaintModel).where(ComplaintModel.status == status)
         )
-        results = exec_result.scalars()
+        results = exec_result.all()
         return [_to_complaint_entity(item) for item in results]
 
 
-def _to_complaint_entity(model: ComplaintModel) -> Complaint:
-    """Map complaint ORM model to domain entity."""
+def _to_complaint_entity(model: ComplaintModel | Row) -> Complaint:
+    """Map complaint ORM model or row to domain entity."""
 
     return Complaint(
         complaint_id=model.complaint_id,
@@ -1309,7 +1848,7 @@ class SqlAlchemyFsmDraftRepository(FsmDraftRepository):
             state_key=state_key,
             data=serialized,
         )
-        await db_session.merge(model)
+        await _upsert(db_session, [model])
 
     async def get(
         self,
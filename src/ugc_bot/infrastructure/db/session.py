@@ -1,18 +1,58 @@
 """Database session factory and transaction helpers."""
 
-from collections.abc import Awaitable, Callable
+import asyncio
+import logging
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
 from contextlib import asynccontextmanager
-from typing import Any, Protocol, TypeVar
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Protocol, TypeVar
+from uuid import uuid4
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.engine import Engine
 from sqlalchemy.engine.url import URL, make_url
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
     AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.orm import ORMExecuteState
+
+from ugc_bot.infrastructure.db.pool_monitor import (
+    MonitoredAsyncAdaptedQueuePool,
+    MonitoredQueuePool,
+    PoolValidator,
+    get_pool_validator,
+    instrument_pool,
+)
+from ugc_bot.infrastructure.db.slow_queries import SlowQueryRecorder
+from ugc_bot.infrastructure.db.statement_stats import instrument_engine
+
+if TYPE_CHECKING:
+    from ugc_bot.metrics.collector import MetricsCollector
+
+logger = logging.getLogger(__name__)
+
+
+ASYNC_POSTGRES_DRIVERS = ("psycopg", "asyncpg")
+
+
+def to_sync_url(database_url: str) -> str:
+    """Return a URL usable by sync engines (admin, Alembic).
+
+    asyncpg has no sync mode, so such URLs are served by psycopg.
+    """
+
+    url = make_url(database_url)
+    if url.drivername != "postgresql+asyncpg":
+        return database_url
+    url = url.set(drivername="postgresql+psycopg")
+    return url.render_as_string(hide_password=False)
 
 
 def create_db_engine(
@@ -21,22 +61,39 @@ def create_db_engine(
     pool_size: int = 5,
     max_overflow: int = 10,
     pool_timeout: int = 30,
+    pool_recycle: int = -1,
+    slow_query_recorder: SlowQueryRecorder | None = None,
+    pool_name: str = "admin",
+    metrics_collector: "MetricsCollector | None" = None,
 ) -> Engine:
-    """Create a SQLAlchemy engine."""
+    """Create a SQLAlchemy engine.
+
+    Sync engines always pre-ping: they serve low-traffic admin pages and
+    have no event loop to run a background validator on.
+    """
 
     url = make_url(database_url)
     if url.drivername.startswith("sqlite"):
-        return create_engine(database_url, pool_pre_ping=True)
-    return create_engine(
-        database_url,
-        pool_pre_ping=True,
-        pool_size=pool_size,
-        max_overflow=max_overflow,
-        pool_timeout=pool_timeout,
-    )
+        engine = create_engine(database_url, pool_pre_ping=True)
+    else:
+        engine = create_engine(
+            to_sync_url(database_url),
+            poolclass=MonitoredQueuePool,
+            pool_pre_ping=True,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_timeout=pool_timeout,
+            pool_recycle=pool_recycle,
+        )
+    instrument_engine(engine)
+    if metrics_collector is not None:
+        instrument_pool(engine, pool_name, metrics_collector)
+    if slow_query_recorder is not None:
+        slow_query_recorder.instrument(engine)
+    return engine
 
 
-def _ensure_async_url(url: URL) -> URL:
+def _ensure_async_url(url: URL, driver: str = "psycopg") -> URL:
     if url.drivername.startswith("sqlite"):
         if "+aiosqlite" in url.drivername:
             return url
@@ -44,29 +101,99 @@ def _ensure_async_url(url: URL) -> URL:
     if "+psycopg" in url.drivername or "+asyncpg" in url.drivername:
         return url
     if url.drivername.startswith("postgresql"):
-        return url.set(drivername="postgresql+psycopg")
+        if driver not in ASYNC_POSTGRES_DRIVERS:
+            raise ValueError(f"Unsupported Postgres driver: {driver}")
+        return url.set(drivername=f"postgresql+{driver}")
     return url  # pragma: no cover
 
 
+def _driver_options(
+    url: URL, *, statement_cache_size: int, pgbouncer: bool
+) -> tuple[URL, dict[str, Any]]:
+    """Return URL and connect_args tuning prepared statements per driver.
+
+    asyncpg prepares every statement; SQLAlchemy keeps an LRU of them per
+    connection (``prepared_statement_cache_size``). psycopg prepares a
+    query after it ran ``prepare_threshold`` times on a connection.
+
+    Behind PgBouncer in transaction mode a server connection is not tied
+    to ours, so named prepared statements must be disabled (psycopg) or
+    made unique and uncached (asyncpg).
+    """
+
+    if url.drivername == "postgresql+asyncpg":
+        cache_size = 0 if pgbouncer else statement_cache_size
+        url = url.update_query_dict(
+            {"prepared_statement_cache_size": str(cache_size)}
+        )
+        if not pgbouncer:
+            return url, {}
+        return url, {
+            "statement_cache_size": 0,
+            "prepared_statement_name_func": _unique_statement_name,
+        }
+    if url.drivername == "postgresql+psycopg" and pgbouncer:
+        return url, {"prepare_threshold": None}
+    return url, {}
+
+
+def _unique_statement_name() -> str:
+    return f"__asyncpg_{uuid4()}__"
+
+
 def create_async_db_engine(
     database_url: str,
     *,
     pool_size: int = 5,
     max_overflow: int = 10,
     pool_timeout: int = 30,
+    driver: str = "psycopg",
+    statement_cache_size: int = 100,
+    pgbouncer: bool = False,
+    pool_pre_ping: bool = True,
+    pool_recycle: int = -1,
+    pool_validation_interval: float = 30.0,
+    slow_query_recorder: SlowQueryRecorder | None = None,
+    pool_name: str = "primary",
+    metrics_collector: "MetricsCollector | None" = None,
 ) -> AsyncEngine:
-    """Create a configured session factory."""
+    """Create an async engine.
 
-    url = _ensure_async_url(make_url(database_url))
+    ``driver`` picks the Postgres DBAPI when the URL does not name one.
+    ``slow_query_recorder`` aggregates statements above its threshold.
+    Without ``pool_pre_ping`` idle connections are validated every
+    ``pool_validation_interval`` seconds in the background instead of on
+    each checkout; pair it with ``pool_recycle`` below the server's idle
+    timeout. Pool metrics are labelled ``pool_name``.
+    """
+
+    url = _ensure_async_url(make_url(database_url), driver)
     if url.drivername.startswith("sqlite"):
-        return create_async_engine(url, pool_pre_ping=True)
-    return create_async_engine(
-        url,
-        pool_pre_ping=True,
-        pool_size=pool_size,
-        max_overflow=max_overflow,
-        pool_timeout=pool_timeout,
-    )
+        engine = create_async_engine(url, pool_pre_ping=True)
+    else:
+        url, connect_args = _driver_options(
+            url,
+            statement_cache_size=statement_cache_size,
+            pgbouncer=pgbouncer,
+        )
+        engine = create_async_engine(
+            url,
+            poolclass=MonitoredAsyncAdaptedQueuePool,
+            pool_pre_ping=pool_pre_ping,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_timeout=pool_timeout,
+            pool_recycle=pool_recycle,
+            connect_args=connect_args,
+        )
+        if not pool_pre_ping:
+            PoolValidator(engine, pool_validation_interval).attach()
+    instrument_engine(engine)
+    if metrics_collector is not None:
+        instrument_pool(engine, pool_name, metrics_collector)
+    if slow_query_recorder is not None:
+        slow_query_recorder.instrument(engine)
+    return engine
 
 
 def create_session_factory(
@@ -75,6 +202,15 @@ def create_session_factory(
     pool_size: int = 5,
     max_overflow: int = 10,
     pool_timeout: int = 30,
+    driver: str = "psycopg",
+    statement_cache_size: int = 100,
+    pgbouncer: bool = False,
+    pool_pre_ping: bool = True,
+    pool_recycle: int = -1,
+    pool_validation_interval: float = 30.0,
+    slow_query_recorder: SlowQueryRecorder | None = None,
+    pool_name: str = "primary",
+    metrics_collector: "MetricsCollector | None" = None,
 ) -> async_sessionmaker[AsyncSession]:
     """Create a configured async session factory."""
 
@@ -83,23 +219,47 @@ def create_session_factory(
         pool_size=pool_size,
         max_overflow=max_overflow,
         pool_timeout=pool_timeout,
+        driver=driver,
+        statement_cache_size=statement_cache_size,
+        pgbouncer=pgbouncer,
+        pool_pre_ping=pool_pre_ping,
+        pool_recycle=pool_recycle,
+        pool_validation_interval=pool_validation_interval,
+        slow_query_recorder=slow_query_recorder,
+        pool_name=pool_name,
+        metrics_collector=metrics_collector,
     )
     return async_sessionmaker(bind=engine, expire_on_commit=False)
 
 
+async def dispose_engine(engine: AsyncEngine) -> None:
+    """Stop the engine's pool validator and close its pooled connections."""
+
+    validator = get_pool_validator(engine)
+    if validator is not None:
+        await validator.stop()
+    await engine.dispose()
+
+
 T = TypeVar("T")
 
 
 class TransactionManagerProtocol(Protocol):
     """Protocol for transaction manager with .transaction() context manager."""
 
-    def transaction(self) -> Any:
+    def transaction(self, readonly: bool = False) -> Any:
         """Return async context manager yielding session."""
 
 
+class ReplicaUnavailableError(Exception):
+    """Raised when a read-only transaction failed on the replica."""
+
+
 async def with_optional_tx(
     transaction_manager: TransactionManagerProtocol | None,
     fn: Callable[[object | None], Awaitable[T]],
+    *,
+    readonly: bool = False,
 ) -> T:
     """Run an async function with optional transaction/session.
 
@@ -109,27 +269,273 @@ async def with_optional_tx(
     Args:
         transaction_manager: SessionTransactionManager or None.
         fn: Async callable(session|None) -> result.
+        readonly: fn only reads; it may run on the read replica and is
+            retried on the primary if the replica fails.
 
     Returns:
         The result of fn(session) or fn(None).
     """
     if transaction_manager is None:
         return await fn(None)
+    if readonly:
+        try:
+            async with transaction_manager.transaction(
+                readonly=True
+            ) as session:
+                return await fn(session)
+        except ReplicaUnavailableError:
+            pass
     async with transaction_manager.transaction() as session:
         return await fn(session)
 
 
+@dataclass(slots=True)
+class _RequestScope:
+    """Session shared by all transactions of one request (e.g. an update).
+
+    The session is opened on first use and bound to one pooled
+    connection, which it keeps across commits until the scope exits.
+    """
+
+    session_factory: async_sessionmaker[AsyncSession]
+    task: asyncio.Task | None
+    track_writes: bool = False
+    session: AsyncSession | None = None
+    connection: AsyncConnection | None = None
+    active: bool = True
+    depth: int = 0
+
+    @property
+    def has_writes(self) -> bool:
+        """Whether the shared session wrote anything reads must observe."""
+
+        session = self.session
+        return session is not None and bool(
+            session.info.get(_WRITES_KEY)
+            or session.new
+            or session.dirty
+            or session.deleted
+        )
+
+    def claim(self) -> bool:
+        """Enter the shared session from the task that opened the scope.
+
+        Other tasks, including ones the request spawned, get their own
+        session: the scope may commit or close while they still run.
+        """
+
+        if not self.active or asyncio.current_task() is not self.task:
+            return False
+        self.depth += 1
+        return True
+
+    def release(self) -> None:
+        self.depth -= 1
+
+    async def open(self) -> AsyncSession:
+        """Return the shared session, checking out its connection once."""
+
+        if self.session is None:
+            engine = self.session_factory.kw["bind"]
+            self.connection = await engine.connect()
+            self.session = self.session_factory(bind=self.connection)
+            if self.track_writes:
+                _track_writes(self.session)
+        return self.session
+
+    async def close(self, commit: bool) -> None:
+        """Commit or roll back pending work and return the connection."""
+
+        try:
+            if self.session is not None:
+                try:
+                    if commit:
+                        await self.session.commit()
+                    else:
+                        await self.session.rollback()
+                finally:
+                    await self.session.close()
+        finally:
+            if self.connection is not None:
+                await self.connection.close()
+
+
+_WRITES_KEY = "ugc_has_writes"
+_REPLICA_KEY = "ugc_replica"
+
+
+def is_replica_session(session: object | None) -> bool:
+    """Whether ``session`` reads from the read replica."""
+
+    info = getattr(session, "info", None)
+    return isinstance(info, dict) and bool(info.get(_REPLICA_KEY))
+
+
+def _track_writes(session: AsyncSession) -> None:
+    """Flag the session once it executes INSERT, UPDATE or DELETE."""
+
+    def _on_execute(state: ORMExecuteState) -> None:
+        if state.is_insert or state.is_update or state.is_delete:
+            state.session.info[_WRITES_KEY] = True
+
+    event.listen(session.sync_session, "do_orm_execute", _on_execute)
+
+
+async def _replica_lag_seconds(session: AsyncSession) -> float | None:
+    """Return replay lag of a Postgres standby, None when not applicable."""
+
+    if session.get_bind().dialect.name != "postgresql":
+        return None
+    result = await session.execute(
+        text(
+            "SELECT CASE WHEN pg_last_wal_receive_lsn() = "
+            "pg_last_wal_replay_lsn() THEN 0 ELSE EXTRACT(EPOCH FROM "
+            "now() - pg_last_xact_replay_timestamp()) END"
+        )
+    )
+    lag = result.scalar()
+    return float(lag) if lag is not None else None
+
+
+_request_scope: ContextVar[_RequestScope | None] = ContextVar(
+    "ugc_request_scope", default=None
+)
+
+
 class SessionTransactionManager:
     """Transaction manager for Async SQLAlchemy sessions."""
 
     def __init__(
-        self, session_factory: async_sessionmaker[AsyncSession]
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        replica_session_factory: async_sessionmaker[AsyncSession] | None = None,
+        *,
+        replica_max_lag_seconds: float | None = None,
+        replica_check_interval_seconds: float = 5.0,
     ) -> None:
         self._session_factory = session_factory
+        self._replica_session_factory = replica_session_factory
+        self._replica_max_lag_seconds = replica_max_lag_seconds
+        self._replica_check_interval = replica_check_interval_seconds
+        self._replica_checked_at: float | None = None
+        self._replica_down_until = 0.0
+
+    def _mark_replica_down(self) -> None:
+        self._replica_down_until = (
+            time.monotonic() + self._replica_check_interval
+        )
+
+    async def _open_replica_session(self) -> AsyncSession | None:
+        """Return a replica session, or None to fall back to the primary.
+
+        The replica is skipped for ``replica_check_interval_seconds`` after
+        a connection error or when its replay lag exceeds the limit.
+        """
+
+        factory = self._replica_session_factory
+        now = time.monotonic()
+        if factory is None or now < self._replica_down_until:
+            return None
+        session = factory()
+        session.info[_REPLICA_KEY] = True
+        try:
+            await session.connection()
+            check_lag = self._replica_max_lag_seconds is not None and (
+                self._replica_checked_at is None
+                or now - self._replica_checked_at
+                >= self._replica_check_interval
+            )
+            if check_lag:
+                lag = await _replica_lag_seconds(session)
+                self._replica_checked_at = now
+                limit = self._replica_max_lag_seconds
+                if lag is not None and limit is not None and lag > limit:
+                    logger.warning(
+                        "Read replica lagging, using primary",
+                        extra={"lag_seconds": lag},
+                    )
+                    self._mark_replica_down()
+                    await session.close()
+                    return None
+        except (DBAPIError, OSError):
+            logger.warning("Read replica unavailable, using primary")
+            self._mark_replica_down()
+            await session.close()
+            return None
+        return session
 
     @asynccontextmanager
-    async def transaction(self):
-        """Provide a transactional session scope."""
+    async def request_scope(self) -> AsyncIterator[None]:
+        """Share one session and connection across the current task.
+
+        The first ``transaction()`` inside the scope checks out a pooled
+        connection; later ones reuse it, so a request costs one checkout
+        (and at most one pre-ping). A top-level ``transaction()`` commits
+        when its block exits, so locks are released before the request
+        goes on to network calls, but the connection stays with the scope.
+        Nested ones are savepoints. Anything left uncommitted is committed
+        when the scope exits cleanly.
+        """
+
+        scope = _RequestScope(
+            self._session_factory,
+            asyncio.current_task(),
+            track_writes=self._replica_session_factory is not None,
+        )
+        token = _request_scope.set(scope)
+        completed = False
+        try:
+            yield
+            completed = True
+        finally:
+            scope.active = False
+            _request_scope.reset(token)
+            await scope.close(commit=completed)
+
+    @asynccontextmanager
+    async def transaction(self, readonly: bool = False):
+        """Provide a transactional session scope.
+
+        Inside ``request_scope()`` this runs on the shared session: the
+        outermost block commits on exit, nested blocks are savepoints and a
+        failure rolls back only the work done in that block. Other tasks
+        get their own session, as outside a scope.
+
+        With ``readonly=True`` and a replica configured, the block runs on
+        the replica unless the request already wrote to the primary. A
+        database error there is raised as ``ReplicaUnavailableError`` so
+        the caller can repeat the read on the primary.
+        """
+        scope = _request_scope.get()
+        use_replica = readonly and self._replica_session_factory is not None
+        if use_replica and not (scope is not None and scope.has_writes):
+            replica = await self._open_replica_session()
+            if replica is not None:
+                try:
+                    yield replica
+                except DBAPIError as exc:
+                    self._mark_replica_down()
+                    raise ReplicaUnavailableError(str(exc)) from exc
+                finally:
+                    await replica.close()
+                return
+        if scope is not None and scope.claim():
+            try:
+                shared = await scope.open()
+                if scope.depth > 1:
+                    async with shared.begin_nested():
+                        yield shared
+                else:
+                    try:
+                        yield shared
+                        await shared.commit()
+                    except Exception:
+                        await shared.rollback()
+                        raise
+            finally:
+                scope.release()
+            return
+
         session = self._session_factory()
         try:
             yield session
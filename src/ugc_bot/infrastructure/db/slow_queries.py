@@ -0,0 +1,271 @@
+"""Opt-in slow query recorder with statement fingerprinting.
+
+Statements slower than a threshold are reduced to a fingerprint (literals
+and bind parameters replaced by ``?``, IN lists and VALUES rows folded)
+and aggregated per fingerprint: count, total time and p50/p99 over the
+most recent samples. Parameters are never stored.
+
+Every ``log_interval_seconds`` the top fingerprints are written as
+structured log lines and, when Redis is configured, published under
+``ugc:slow_queries:<instance>`` so the admin app can show every process.
+"""
+
+import asyncio
+import logging
+import os
+import re
+import socket
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from ugc_bot import json_codec
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+logger = logging.getLogger(__name__)
+
+_KEY_PREFIX = "ugc:slow_queries:"
+_STARTED_KEY = "ugc_slow_query_started"
+
+_COMMENT = re.compile(r"--[^\n]*|/\*.*?\*/", re.S)
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_PARAM = re.compile(r"%\(\w+\)s|%s|\$\d+|(?<![:\w]):\w+|\?")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_SPACE = re.compile(r"\s+")
+_IN_LIST = re.compile(r"(?<=\bIN )\(\?(?:, \?)+\)", re.I)
+_VALUES_ROWS = re.compile(r"(\([?, ]+\))(?:, \1)+")
+
+
+def fingerprint_statement(statement: str) -> str:
+    """Normalize SQL so executions differing only in values group together."""
+
+    sql = _COMMENT.sub(" ", statement)
+    sql = _STRING.sub("?", sql)
+    sql = _PARAM.sub("?", sql)
+    sql = _NUMBER.sub("?", sql)
+    sql = _SPACE.sub(" ", sql).strip()
+    sql = _VALUES_ROWS.sub(r"\1, ...", sql)
+    return _IN_LIST.sub("(?, ...)", sql)
+
+
+@dataclass(frozen=True, slots=True)
+class SlowQueryStat:
+    """Aggregate for one statement fingerprint."""
+
+    fingerprint: str
+    count: int
+    total_seconds: float
+    p50_seconds: float
+    p99_seconds: float
+
+
+@dataclass(slots=True)
+class _Aggregate:
+    count: int = 0
+    total_seconds: float = 0.0
+    samples: deque[float] = field(default_factory=deque)
+
+
+def _percentile(ordered: list[float], fraction: float) -> float:
+    index = min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+class SlowQueryRecorder:
+    """Aggregate statements slower than ``threshold_seconds`` by fingerprint.
+
+    Safe to share between engines and threads (the admin sync engine runs
+    in a thread pool). At most ``max_fingerprints`` distinct statements
+    are tracked; later ones are ignored until ``reset()``.
+    """
+
+    def __init__(
+        self,
+        threshold_seconds: float,
+        *,
+        top_n: int = 20,
+        log_interval_seconds: float = 300.0,
+        max_fingerprints: int = 500,
+        samples_per_fingerprint: int = 500,
+        redis_url: str | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.threshold_seconds = threshold_seconds
+        self.top_n = top_n
+        self.instance = f"{socket.gethostname()}:{os.getpid()}"
+        self._log_interval = log_interval_seconds
+        self._max_fingerprints = max_fingerprints
+        self._samples = samples_per_fingerprint
+        self._redis_url = redis_url
+        self._redis: "Redis | None" = None
+        self._publish_task: asyncio.Task[None] | None = None
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._stats: dict[str, _Aggregate] = {}
+        self._last_report = clock()
+
+    def instrument(self, engine: Engine | AsyncEngine) -> None:
+        """Time every statement executed on ``engine`` (idempotent)."""
+
+        sync_engine = (
+            engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+        )
+        if event.contains(sync_engine, "after_cursor_execute", self._after):
+            return
+        event.listen(sync_engine, "before_cursor_execute", self._before)
+        event.listen(sync_engine, "after_cursor_execute", self._after)
+        event.listen(sync_engine, "handle_error", self._on_error)
+
+    def _before(self, conn: Any, *_args: Any) -> None:
+        conn.info.setdefault(_STARTED_KEY, []).append(time.perf_counter())
+
+    def _after(self, conn: Any, _cursor: Any, statement: str, *_: Any) -> None:
+        started = conn.info.get(_STARTED_KEY)
+        if started:
+            self.record(statement, time.perf_counter() - started.pop())
+
+    def _on_error(self, context: Any) -> None:
+        conn = context.connection
+        started = conn.info.get(_STARTED_KEY) if conn is not None else None
+        if started:
+            started.pop()
+
+    def record(self, statement: str, duration_seconds: float) -> None:
+        """Aggregate one execution if it crossed the threshold."""
+
+        if duration_seconds < self.threshold_seconds:
+            return
+        fingerprint = fingerprint_statement(statement)
+        with self._lock:
+            aggregate = self._stats.get(fingerprint)
+            if aggregate is None:
+                if len(self._stats) >= self._max_fingerprints:
+                    return
+                aggregate = _Aggregate(samples=deque(maxlen=self._samples))
+                self._stats[fingerprint] = aggregate
+            aggregate.count += 1
+            aggregate.total_seconds += duration_seconds
+            aggregate.samples.append(duration_seconds)
+            now = self._clock()
+            report = now - self._last_report >= self._log_interval
+            if report:
+                self._last_report = now
+        if report:
+            self.report()
+
+    def top(self, limit: int | None = None) -> list[SlowQueryStat]:
+        """Return fingerprints ordered by total time spent, slowest first."""
+
+        with self._lock:
+            items = [
+                (fingerprint, agg.count, agg.total_seconds, sorted(agg.samples))
+                for fingerprint, agg in self._stats.items()
+            ]
+        stats = [
+            SlowQueryStat(
+                fingerprint=fingerprint,
+                count=count,
+                total_seconds=total,
+                p50_seconds=_percentile(samples, 0.5),
+                p99_seconds=_percentile(samples, 0.99),
+            )
+            for fingerprint, count, total, samples in items
+        ]
+        stats.sort(key=lambda stat: stat.total_seconds, reverse=True)
+        return stats[: limit or self.top_n]
+
+    def reset(self) -> None:
+        """Drop all aggregates."""
+
+        with self._lock:
+            self._stats.clear()
+
+    def report(self) -> None:
+        """Log the top fingerprints and publish them to Redis if possible."""
+
+        for rank, stat in enumerate(self.top(), start=1):
+            logger.warning(
+                "Slow query",
+                extra={"rank": rank, "instance": self.instance, **asdict(stat)},
+            )
+        if self._redis_url is None:
+            return
+        if self._publish_task is not None and not self._publish_task.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._publish_task = loop.create_task(self.publish())
+
+    def _get_redis(self) -> "Redis | None":
+        """Lazy-init Redis client."""
+        if self._redis is not None:
+            return self._redis
+        if not self._redis_url:
+            return None
+        try:
+            from redis.asyncio import Redis
+
+            self._redis = Redis.from_url(self._redis_url, decode_responses=True)
+            return self._redis
+        except ImportError:
+            logger.debug("Redis not installed, slow queries stay local")
+            return None
+
+    async def publish(self) -> None:
+        """Store this process's top fingerprints in Redis."""
+
+        redis = self._get_redis()
+        if redis is None:
+            return
+        payload = json_codec.dumps([asdict(stat) for stat in self.top()])
+        ttl = max(60, int(self._log_interval * 3))
+        try:
+            await redis.set(f"{_KEY_PREFIX}{self.instance}", payload, ex=ttl)
+        except Exception as exc:
+            logger.warning(
+                "Slow query publish failed", extra={"error": str(exc)}
+            )
+
+    async def collect(self, limit: int | None = None) -> dict[str, list[dict]]:
+        """Top fingerprints per process: this one plus those in Redis."""
+
+        result = {
+            self.instance: [asdict(stat) for stat in self.top(limit)],
+        }
+        redis = self._get_redis()
+        if redis is None:
+            return result
+        try:
+            async for key in redis.scan_iter(match=f"{_KEY_PREFIX}*"):
+                instance = key.removeprefix(_KEY_PREFIX)
+                if instance == self.instance:
+                    continue
+                raw = await redis.get(key)
+                if raw:
+                    stats = json_codec.loads(raw)
+                    result[instance] = stats[: limit or self.top_n]
+        except Exception as exc:
+            logger.warning(
+                "Slow query collection failed", extra={"error": str(exc)}
+            )
+        return result
+
+    async def close(self) -> None:
+        """Wait for a pending publish, then close the Redis client."""
+        if self._publish_task is not None:
+            await self._publish_task
+            self._publish_task = None
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
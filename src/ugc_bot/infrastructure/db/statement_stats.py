@@ -0,0 +1,103 @@
+"""Per-operation SQL statement counting.
+
+Engines created in ``session.py`` are instrumented with cursor events that
+add each statement and its duration to the ``StatementStats`` active in
+the current context. An operation (a Telegram update, an outbox batch, a
+scheduler cycle) opens one with ``track_statements`` and, on exit, the
+totals are exported as Prometheus histograms.
+"""
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+if TYPE_CHECKING:
+    from ugc_bot.metrics.collector import MetricsCollector
+
+_STARTED_KEY = "ugc_statement_started"
+
+
+@dataclass(slots=True)
+class StatementStats:
+    """Statements issued and time spent in the database by one operation."""
+
+    operation: str
+    statements: int = 0
+    duration_seconds: float = 0.0
+    parent: "StatementStats | None" = None
+
+
+_current_stats: ContextVar[StatementStats | None] = ContextVar(
+    "ugc_statement_stats", default=None
+)
+
+
+def _before_cursor_execute(conn: Any, *_args: Any) -> None:
+    if _current_stats.get() is None:
+        return
+    conn.info.setdefault(_STARTED_KEY, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn: Any, *_args: Any) -> None:
+    started = conn.info.get(_STARTED_KEY)
+    if not started:
+        return
+    elapsed = time.perf_counter() - started.pop()
+    stats = _current_stats.get()
+    while stats is not None:
+        stats.statements += 1
+        stats.duration_seconds += elapsed
+        stats = stats.parent
+
+
+def _handle_error(context: Any) -> None:
+    conn = context.connection
+    started = conn.info.get(_STARTED_KEY) if conn is not None else None
+    if started:
+        started.pop()
+
+
+def instrument_engine(engine: Engine | AsyncEngine) -> None:
+    """Count statements executed on ``engine`` (idempotent)."""
+
+    sync_engine = (
+        engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+    )
+    if event.contains(
+        sync_engine, "before_cursor_execute", _before_cursor_execute
+    ):
+        return
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(sync_engine, "handle_error", _handle_error)
+
+
+@contextmanager
+def track_statements(
+    operation: str,
+    metrics_collector: "MetricsCollector | None" = None,
+) -> Iterator[StatementStats]:
+    """Count statements of one logical operation in the current context.
+
+    Scopes nest: statements also count towards every enclosing scope.
+    Tasks spawned inside the block inherit it. When a metrics collector
+    is given, the totals are recorded on exit, also on failure.
+    """
+
+    stats = StatementStats(operation, parent=_current_stats.get())
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+        if metrics_collector is not None:
+            metrics_collector.record_db_operation(
+                operation, stats.statements, stats.duration_seconds
+            )
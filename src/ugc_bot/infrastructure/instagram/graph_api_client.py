@@ -1,13 +1,47 @@
-"""Instagram Graph API client implementation."""
+"""Instagram Graph API client implementation.
 
+One ``httpx.AsyncClient`` is kept for the client's lifetime, so requests
+reuse kept-alive connections (HTTP/2 when ``h2`` is installed:
+``pip install ugc-bot[http2]``). Resolved usernames are cached with a
+TTL and LRU eviction; ids the API reports as unknown are cached for a
+shorter time. Network, auth, permission, rate-limit and server errors
+are not cached.
+
+``get_usernames_by_ids`` resolves many ids with Graph API batch
+requests (up to 50 per request).
+"""
+
+import importlib.util
 import logging
+from collections.abc import Sequence
+from typing import Any
 
 import httpx
 
+from ugc_bot import json_codec
 from ugc_bot.application.ports import InstagramGraphApiClient
+from ugc_bot.infrastructure.ttl_cache import TTLCache
+
+_HTTP2 = importlib.util.find_spec("h2") is not None
 
 logger = logging.getLogger(__name__)
 
+# Graph API limit on requests in one batch call.
+_BATCH_SIZE = 50
+# Graph API answers 404, or 400 with error code 100 and subcode 33
+# ("object does not exist"), for ids it cannot resolve. Other 400s are
+# OAuth (190), permission (10, 200) or throttling (4, 17, 32) errors.
+_UNKNOWN_ID_ERROR = (100, 33)
+
+
+class _Unavailable(Exception):
+    """The API could not answer now (auth, rate limit, server error)."""
+
+    def __init__(self, status_code: int, body: str) -> None:
+        super().__init__(status_code)
+        self.status_code = status_code
+        self.body = body
+
 
 class HttpInstagramGraphApiClient(InstagramGraphApiClient):
     """HTTP client for Instagram Graph API."""
@@ -18,6 +52,10 @@ class HttpInstagramGraphApiClient(InstagramGraphApiClient):
         base_url: str = "https://graph.instagram.com",
         api_version: str = "v24.0",
         timeout: float = 10.0,
+        cache_ttl_seconds: float = 3600.0,
+        negative_cache_ttl_seconds: float = 300.0,
+        cache_size: int = 10_000,
+        transport: httpx.AsyncBaseTransport | None = None,
     ) -> None:
         """Initialize Instagram Graph API client.
 
@@ -26,11 +64,54 @@ class HttpInstagramGraphApiClient(InstagramGraphApiClient):
             base_url: Base URL for Instagram Graph API
             api_version: API version (default: v24.0)
             timeout: Request timeout in seconds
+            cache_ttl_seconds: How long resolved usernames are cached
+            negative_cache_ttl_seconds: How long unknown ids are cached
+            cache_size: Maximum cached ids of each kind
+            transport: Optional httpx transport (tests)
         """
         self.access_token = access_token
         self.base_url = base_url.rstrip("/")
         self.api_version = api_version
         self.timeout = timeout
+        self._transport = transport
+        self._client: httpx.AsyncClient | None = None
+        self._usernames: TTLCache[str, str] = TTLCache(
+            cache_size, cache_ttl_seconds
+        )
+        self._unknown: TTLCache[str, bool] = TTLCache(
+            cache_size, negative_cache_ttl_seconds
+        )
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Lazy-init the long-lived HTTP client."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=self.timeout,
+                http2=_HTTP2 and self._transport is None,
+                transport=self._transport,
+            )
+        return self._client
+
+    async def close(self) -> None:
+        """Close the HTTP client and its connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _cached(self, instagram_user_id: str) -> tuple[bool, str | None]:
+        username = self._usernames.get(instagram_user_id)
+        if username is not None:
+            return True, username
+        if self._unknown.get(instagram_user_id):
+            return True, None
+        return False, None
+
+    def _remember(self, instagram_user_id: str, username: str | None) -> None:
+        if username is None:
+            self._unknown.set(instagram_user_id, True)
+        else:
+            self._usernames.set(instagram_user_id, username)
 
     async def get_username_by_id(self, instagram_user_id: str) -> str | None:
         """Get Instagram username by user ID.
@@ -48,44 +129,28 @@ class HttpInstagramGraphApiClient(InstagramGraphApiClient):
             logger.warning("Instagram access token not configured")
             return None
 
-        url = f"{self.base_url}/{self.api_version}/{instagram_user_id}"
+        hit, username = self._cached(instagram_user_id)
+        if hit:
+            return username
+
         params = {
             "fields": "username",
             "access_token": self.access_token,
         }
-
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(url, params=params)
-                response.raise_for_status()
-                data = response.json()
-
-                username = data.get("username")
-                if username:
-                    logger.info(
-                        "Retrieved Instagram username",
-                        extra={
-                            "instagram_user_id": instagram_user_id,
-                            "username": username,
-                        },
-                    )
-                    return username
-                logger.warning(
-                    "Username not found in API response",
-                    extra={
-                        "instagram_user_id": instagram_user_id,
-                        "response": data,
-                    },
-                )
-                return None
-
-        except httpx.HTTPStatusError as exc:
+            response = await self._get_client().get(
+                f"/{self.api_version}/{instagram_user_id}", params=params
+            )
+            username = self._parse_username(
+                instagram_user_id, response.status_code, response.text
+            )
+        except _Unavailable as exc:
             logger.warning(
                 "Instagram API request failed",
                 extra={
                     "instagram_user_id": instagram_user_id,
-                    "status_code": exc.response.status_code,
-                    "response": exc.response.text[:200],
+                    "status_code": exc.status_code,
+                    "response": exc.body[:200],
                 },
             )
             return None
@@ -105,3 +170,139 @@ class HttpInstagramGraphApiClient(InstagramGraphApiClient):
                 exc_info=exc,
             )
             return None
+
+        self._remember(instagram_user_id, username)
+        if username is not None:
+            logger.info(
+                "Retrieved Instagram username",
+                extra={
+                    "instagram_user_id": instagram_user_id,
+                    "username": username,
+                },
+            )
+        return username
+
+    async def get_usernames_by_ids(
+        self, instagram_user_ids: Sequence[str]
+    ) -> dict[str, str | None]:
+        """Resolve many user IDs with Graph API batch requests.
+
+        Cached ids are answered locally. Ids whose lookup failed map to
+        None and are not cached.
+        """
+        if not self.access_token:
+            logger.warning("Instagram access token not configured")
+            return dict.fromkeys(instagram_user_ids)
+
+        result: dict[str, str | None] = {}
+        missing: list[str] = []
+        for instagram_user_id in dict.fromkeys(instagram_user_ids):
+            hit, username = self._cached(instagram_user_id)
+            if hit:
+                result[instagram_user_id] = username
+            else:
+                missing.append(instagram_user_id)
+
+        for start in range(0, len(missing), _BATCH_SIZE):
+            chunk = missing[start : start + _BATCH_SIZE]
+            result.update(await self._fetch_batch(chunk))
+        return result
+
+    async def _fetch_batch(self, ids: list[str]) -> dict[str, str | None]:
+        batch = [
+            {
+                "method": "GET",
+                "relative_url": f"{self.api_version}/{i}?fields=username",
+            }
+            for i in ids
+        ]
+        try:
+            response = await self._get_client().post(
+                "/",
+                data={
+                    "access_token": self.access_token,
+                    "batch": json_codec.dumps(batch),
+                },
+            )
+            response.raise_for_status()
+            answers: list[dict[str, Any] | None] = json_codec.loads(
+                response.content
+            )
+        except (httpx.HTTPError, ValueError) as exc:
+            logger.warning(
+                "Instagram API batch request failed",
+                extra={"ids": len(ids), "error": str(exc)},
+            )
+            return dict.fromkeys(ids)
+
+        result: dict[str, str | None] = {}
+        for instagram_user_id, answer in zip(ids, answers, strict=False):
+            result[instagram_user_id] = None
+            if answer is None:
+                # Not executed (batch timed out); retry on the next call.
+                continue
+            try:
+                username = self._parse_username(
+                    instagram_user_id,
+                    int(answer.get("code", 0)),
+                    answer.get("body") or "",
+                )
+            except _Unavailable as exc:
+                logger.warning(
+                    "Instagram API request failed",
+                    extra={
+                        "instagram_user_id": instagram_user_id,
+                        "status_code": exc.status_code,
+                        "response": exc.body[:200],
+                    },
+                )
+                continue
+            self._remember(instagram_user_id, username)
+            result[instagram_user_id] = username
+        return result
+
+    def _parse_username(
+        self, instagram_user_id: str, status_code: int, body: str
+    ) -> str | None:
+        """Return the username from an API answer, None if it has none.
+
+        Raises _Unavailable when the answer says nothing about the id.
+        """
+        if status_code == 404 or (
+            status_code >= 400 and _error_code(body) == _UNKNOWN_ID_ERROR
+        ):
+            logger.warning(
+                "Instagram user not found",
+                extra={
+                    "instagram_user_id": instagram_user_id,
+                    "status_code": status_code,
+                    "response": body[:200],
+                },
+            )
+            return None
+        if status_code >= 400:
+            raise _Unavailable(status_code, body)
+        data = json_codec.loads(body)
+        username = data.get("username") if isinstance(data, dict) else None
+        if not username:
+            logger.warning(
+                "Username not found in API response",
+                extra={
+                    "instagram_user_id": instagram_user_id,
+                    "response": data,
+                },
+            )
+            return None
+        return username
+
+
+def _error_code(body: str) -> tuple[int | None, int | None]:
+    """Return ``error.code`` and ``error.error_subcode`` of an error body."""
+    try:
+        data = json_codec.loads(body)
+    except ValueError:
+        return None, None
+    error = data.get("error") if isinstance(data, dict) else None
+    if not isinstance(error, dict):
+        return None, None
+    return error.get("code"), error.get("error_subcode")
@@ -1,11 +1,11 @@
 """Kafka publisher for order activation events."""
 
 import asyncio
-import json
 import logging
 
 from aiokafka import AIOKafkaProducer  # type: ignore[import-untyped]
 
+from ugc_bot import json_codec
 from ugc_bot.application.ports import OrderActivationPublisher
 from ugc_bot.domain.entities import Order
 
@@ -19,7 +19,7 @@ class KafkaOrderActivationPublisher(OrderActivationPublisher):
         self._topic = topic
         self._producer = AIOKafkaProducer(
             bootstrap_servers=bootstrap_servers,
-            value_serializer=lambda value: json.dumps(value).encode("utf-8"),
+            value_serializer=json_codec.dumps_bytes,
         )
         self._started = False
         self._start_lock = asyncio.Lock()
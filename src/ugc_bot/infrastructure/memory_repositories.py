@@ -1,8 +1,18 @@
 """In-memory repository implementations."""
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timezone
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
 from uuid import UUID
 
 from ugc_bot.application.ports import (
@@ -18,6 +28,8 @@ from ugc_bot.application.ports import (
     OrderRepository,
     OrderResponseRepository,
     OutboxRepository,
+    Page,
+    PageCursor,
     PaymentRepository,
     UserRepository,
 )
@@ -42,6 +54,27 @@ from ugc_bot.domain.enums import (
     OutboxEventStatus,
 )
 
+T = TypeVar("T")
+
+
+def _keyset_page(
+    items: Iterable[T],
+    key: Callable[[T], PageCursor],
+    limit: int,
+    before: PageCursor | None,
+    after: PageCursor | None,
+) -> Page[T]:
+    """Slice items like the SQL keyset queries: newest first."""
+
+    ordered = sorted(items, key=key, reverse=True)
+    if before is not None:
+        page = [item for item in ordered if key(item) < before][:limit]
+    elif after is not None:
+        page = [item for item in ordered if key(item) > after][-limit:]
+    else:
+        page = ordered[:limit]
+    return Page(items=page, total=len(ordered) if page else 0)
+
 
 @dataclass
 class InMemoryUserRepository(UserRepository):
@@ -80,19 +113,44 @@ class InMemoryUserRepository(UserRepository):
         )
 
     async def list_pending_role_reminders(
-        self, reminder_cutoff: datetime, session: object | None = None
+        self,
+        reminder_cutoff: datetime,
+        session: object | None = None,
+        *,
+        limit: int | None = None,
+        after_user_id: UUID | None = None,
     ) -> Iterable[User]:
         """List users who have not chosen a role and are due for a reminder."""
 
-        return [
-            u
-            for u in self.users.values()
-            if u.role_chosen_at is None
-            and (
-                u.last_role_reminder_at is None
-                or u.last_role_reminder_at < reminder_cutoff
-            )
-        ]
+        pending = sorted(
+            (
+                u
+                for u in self.users.values()
+                if u.role_chosen_at is None
+                and (
+                    u.last_role_reminder_at is None
+                    or u.last_role_reminder_at < reminder_cutoff
+                )
+                and (after_user_id is None or u.user_id > after_user_id)
+            ),
+            key=lambda u: u.user_id,
+        )
+        return pending if limit is None else pending[:limit]
+
+    async def update_last_role_reminder_at_many(
+        self,
+        user_ids: Sequence[UUID],
+        reminded_at: datetime,
+        session: object | None = None,
+    ) -> None:
+        """Set last_role_reminder_at for many users."""
+
+        for user_id in user_ids:
+            user = self.users.get(user_id)
+            if user is not None:
+                self.users[user_id] = replace(
+                    user, last_role_reminder_at=reminded_at
+                )
 
     async def iter_all(self) -> Iterable[User]:
         """Iterate all users."""
@@ -142,6 +200,18 @@ class InMemoryBloggerProfileRepository(BloggerProfileRepository):
 
         self.profiles[profile.user_id] = profile
 
+    async def update_fields(
+        self, user_id: UUID, session: object | None = None, **changes: Any
+    ) -> Optional[BloggerProfile]:
+        """Update only the given profile fields in memory."""
+
+        profile = self.profiles.get(user_id)
+        if profile is None:
+            return None
+        updated = replace(profile, **changes)
+        self.profiles[user_id] = updated
+        return updated
+
     async def list_confirmed_user_ids(
         self, session: object | None = None
     ) -> list[UUID]:
@@ -315,12 +385,68 @@ class InMemoryOrderRepository(OrderRepository):
 
         self.orders[order.order_id] = order
 
+    async def update_fields(
+        self, order_id: UUID, session: object | None = None, **changes: Any
+    ) -> Optional[Order]:
+        """Update only the given order fields in memory."""
+
+        order = self.orders.get(order_id)
+        if order is None:
+            return None
+        updated = replace(order, **changes)
+        self.orders[order_id] = updated
+        return updated
+
+    async def list_page_by_advertiser(
+        self,
+        advertiser_id: UUID,
+        limit: int,
+        before: PageCursor | None = None,
+        after: PageCursor | None = None,
+        session: object | None = None,
+    ) -> Page[Order]:
+        """List one page of an advertiser's orders, newest first."""
+
+        return _keyset_page(
+            await self.list_by_advertiser(advertiser_id),
+            lambda order: (order.created_at, order.order_id),
+            limit,
+            before,
+            after,
+        )
+
+    async def increment_responses_count(
+        self, order_id: UUID, now: datetime, session: object | None = None
+    ) -> Optional[Order]:
+        """Count one more response on an active order with room."""
+
+        order = self.orders.get(order_id)
+        if (
+            order is None
+            or order.status != OrderStatus.ACTIVE
+            or order.responses_count >= order.bloggers_needed
+        ):
+            return None
+        count = order.responses_count + 1
+        if count >= order.bloggers_needed:
+            updated = replace(
+                order,
+                responses_count=count,
+                status=OrderStatus.CLOSED,
+                completed_at=now,
+            )
+        else:
+            updated = replace(order, responses_count=count)
+        self.orders[order_id] = updated
+        return updated
+
 
 @dataclass
 class InMemoryOrderResponseRepository(OrderResponseRepository):
     """In-memory implementation of order response repository."""
 
     responses: list[OrderResponse] = field(default_factory=list)
+    order_repo: Optional[InMemoryOrderRepository] = None
 
     async def save(
         self, response: OrderResponse, session: object | None = None
@@ -364,6 +490,40 @@ class InMemoryOrderResponseRepository(OrderResponseRepository):
             [resp for resp in self.responses if resp.order_id == order_id]
         )
 
+    async def list_page_by_blogger(
+        self,
+        blogger_id: UUID,
+        limit: int,
+        before: PageCursor | None = None,
+        after: PageCursor | None = None,
+        session: object | None = None,
+    ) -> Page[tuple[Order, OrderResponse]]:
+        """List a page of responses joined with orders from ``order_repo``."""
+
+        orders = self.order_repo.orders if self.order_repo else {}
+        pairs = [
+            (orders[resp.order_id], resp)
+            for resp in await self.list_by_blogger(blogger_id)
+            if resp.order_id in orders
+        ]
+        return _keyset_page(
+            pairs,
+            lambda pair: (pair[1].responded_at, pair[1].response_id),
+            limit,
+            before,
+            after,
+        )
+
+    async def add_if_absent(
+        self, response: OrderResponse, session: object | None = None
+    ) -> bool:
+        """Insert response unless the blogger already responded."""
+
+        if await self.exists(response.order_id, response.blogger_id):
+            return False
+        self.responses.append(response)
+        return True
+
 
 @dataclass
 class InMemoryOfferDispatchRepository(OfferDispatchRepository):
@@ -463,6 +623,21 @@ class InMemoryInteractionRepository(InteractionRepository):
 
         self.interactions[interaction.interaction_id] = interaction
 
+    async def update_fields(
+        self,
+        interaction_id: UUID,
+        session: object | None = None,
+        **changes: Any,
+    ) -> Optional[Interaction]:
+        """Update only the given interaction fields in memory."""
+
+        interaction = self.interactions.get(interaction_id)
+        if interaction is None:
+            return None
+        updated = replace(interaction, **changes)
+        self.interactions[interaction_id] = updated
+        return updated
+
     async def update_next_check_at(
         self,
         interaction_id: UUID,
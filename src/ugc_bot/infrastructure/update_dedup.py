@@ -0,0 +1,91 @@
+"""Drop Telegram updates that were already taken by any replica.
+
+Telegram redelivers an update when the webhook answer is slow, and the
+retry may reach another replica. Before an update is handled its
+``update_id`` is claimed with ``SET NX`` and a short TTL in Redis; only
+the claimer handles it. Without Redis, or when Redis fails, claims are
+kept in-process, which still catches retries reaching this replica.
+"""
+
+import logging
+from typing import TYPE_CHECKING, Optional
+
+from ugc_bot.infrastructure.ttl_cache import TTLCache
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+    from ugc_bot.metrics.collector import MetricsCollector
+
+logger = logging.getLogger(__name__)
+
+_KEY_PREFIX = "ugc:update:"
+
+
+class UpdateDeduplicator:
+    """Claim update ids so each update is handled once across replicas."""
+
+    def __init__(
+        self,
+        redis_url: str | None,
+        ttl_seconds: int = 600,
+        local_max_size: int = 100_000,
+        metrics_collector: Optional["MetricsCollector"] = None,
+    ) -> None:
+        self._redis_url = redis_url
+        self._redis: "Redis | None" = None
+        self._ttl = ttl_seconds
+        self._local: TTLCache[int, bool] = TTLCache(local_max_size, ttl_seconds)
+        self.metrics_collector = metrics_collector
+
+    def _get_redis(self) -> "Redis | None":
+        """Lazy-init Redis client."""
+        if self._redis is not None:
+            return self._redis
+        if not self._redis_url:
+            return None
+        try:
+            from redis.asyncio import Redis
+
+            self._redis = Redis.from_url(self._redis_url, decode_responses=True)
+            return self._redis
+        except ImportError:
+            logger.debug("Redis not installed, deduplicating in-process")
+            return None
+
+    async def claim(self, update_id: int) -> bool:
+        """Return True if this process should handle ``update_id``."""
+
+        claimed = await self._claim(update_id)
+        if not claimed:
+            logger.info(
+                "Duplicate update dropped", extra={"update_id": update_id}
+            )
+            if self.metrics_collector is not None:
+                self.metrics_collector.record_duplicate_update()
+        return claimed
+
+    async def _claim(self, update_id: int) -> bool:
+        redis = self._get_redis()
+        if redis is not None:
+            try:
+                return bool(
+                    await redis.set(
+                        f"{_KEY_PREFIX}{update_id}", "1", nx=True, ex=self._ttl
+                    )
+                )
+            except Exception as exc:
+                logger.warning(
+                    "Redis update claim failed, using in-process",
+                    extra={"update_id": update_id, "error": str(exc)},
+                )
+        if self._local.get(update_id):
+            return False
+        self._local.set(update_id, True)
+        return True
+
+    async def close(self) -> None:
+        """Close the Redis client."""
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
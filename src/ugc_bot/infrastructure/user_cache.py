@@ -0,0 +1,461 @@
+"""Two-tier read-through cache for user lookups.
+
+Users are cached in-process (TTL + LRU) and, when configured, in Redis.
+Writes invalidate both tiers and publish the user id on a Redis channel so
+other replicas drop their in-process copies. Only reads from the primary
+populate the cache: a lagging replica could otherwise put back a user
+that was just invalidated.
+"""
+
+import asyncio
+import contextlib
+import logging
+import time
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Optional
+from uuid import UUID
+
+from sqlalchemy import event
+
+from ugc_bot import json_codec
+from ugc_bot.application.ports import UserRepository
+from ugc_bot.domain.entities import User
+from ugc_bot.domain.enums import MessengerType, UserStatus
+from ugc_bot.infrastructure.db.session import is_replica_session
+from ugc_bot.infrastructure.ttl_cache import TTLCache
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+    from ugc_bot.metrics.collector import MetricsCollector
+
+logger = logging.getLogger(__name__)
+
+_KEY_PREFIX = "ugc:user:"
+_INVALIDATION_CHANNEL = "ugc:user_cache:invalidate"
+_DIRTY_KEY = "ugc_user_cache_dirty"
+_HOOKED_KEY = "ugc_user_cache_hooked"
+
+
+def _user_to_json(user: User) -> str:
+    """Serialize a user for the Redis tier."""
+
+    def _dt(value: datetime | None) -> str | None:
+        return value.isoformat() if value is not None else None
+
+    return json_codec.dumps(
+        {
+            "user_id": str(user.user_id),
+            "external_id": user.external_id,
+            "messenger_type": user.messenger_type.value,
+            "username": user.username,
+            "status": user.status.value,
+            "issue_count": user.issue_count,
+            "created_at": _dt(user.created_at),
+            "role_chosen_at": _dt(user.role_chosen_at),
+            "last_role_reminder_at": _dt(user.last_role_reminder_at),
+            "telegram": user.telegram,
+            "admin": user.admin,
+        }
+    )
+
+
+def _user_from_json(raw: str) -> User:
+    """Deserialize a user stored by ``_user_to_json``."""
+
+    data = json_codec.loads(raw)
+
+    def _dt(value: str | None) -> datetime | None:
+        return datetime.fromisoformat(value) if value is not None else None
+
+    created_at = _dt(data["created_at"])
+    assert created_at is not None
+    return User(
+        user_id=UUID(data["user_id"]),
+        external_id=data["external_id"],
+        messenger_type=MessengerType(data["messenger_type"]),
+        username=data["username"],
+        status=UserStatus(data["status"]),
+        issue_count=data["issue_count"],
+        created_at=created_at,
+        role_chosen_at=_dt(data["role_chosen_at"]),
+        last_role_reminder_at=_dt(data["last_role_reminder_at"]),
+        telegram=data["telegram"],
+        admin=data["admin"],
+    )
+
+
+class UserCache:
+    """User cache keyed by user_id and by (external_id, messenger_type).
+
+    The external key only maps to a user_id (that pairing never changes),
+    so invalidating a user means dropping its user_id entry. Redis errors
+    are logged and treated as misses. Call ``start()`` in long-running
+    processes to enable the in-process tier alongside Redis.
+    """
+
+    def __init__(
+        self,
+        redis_url: str | None,
+        *,
+        local_ttl_seconds: float = 30.0,
+        redis_ttl_seconds: int = 300,
+        max_size: int = 10_000,
+        metrics_collector: "MetricsCollector | None" = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._redis_url = redis_url
+        self._redis: "Redis | None" = None
+        self._redis_ttl = redis_ttl_seconds
+        self._by_id: TTLCache[UUID, User] = TTLCache(
+            max_size, local_ttl_seconds, clock
+        )
+        self._by_external: TTLCache[tuple[str, str], UUID] = TTLCache(
+            max_size, local_ttl_seconds, clock
+        )
+        self._metrics = metrics_collector
+        self._listener: asyncio.Task | None = None
+        self._pending: set[asyncio.Task] = set()
+
+    def _get_redis(self) -> "Redis | None":
+        """Lazy-init Redis client."""
+        if self._redis is not None:
+            return self._redis
+        if not self._redis_url:
+            return None
+        try:
+            from redis.asyncio import Redis
+
+            self._redis = Redis.from_url(self._redis_url, decode_responses=True)
+            return self._redis
+        except ImportError:
+            logger.debug("Redis not installed, using in-process user cache")
+            return None
+
+    @staticmethod
+    def _id_key(user_id: UUID) -> str:
+        return f"{_KEY_PREFIX}id:{user_id}"
+
+    @staticmethod
+    def _external_key(external_id: str, messenger_type: MessengerType) -> str:
+        return f"{_KEY_PREFIX}ext:{messenger_type.value}:{external_id}"
+
+    def _record(self, result: str) -> None:
+        if self._metrics is not None:
+            self._metrics.record_user_cache_lookup(result)
+
+    async def get_by_id(self, user_id: UUID) -> User | None:
+        """Return a cached user by id, or None on a miss."""
+        user, result = await self._lookup(user_id)
+        self._record(result)
+        return user
+
+    async def get_by_external(
+        self, external_id: str, messenger_type: MessengerType
+    ) -> User | None:
+        """Return a cached user by external id, or None on a miss."""
+        user_id = (
+            self._by_external.get((external_id, messenger_type.value))
+            if self._local_enabled()
+            else None
+        )
+        redis = self._get_redis()
+        if user_id is None and redis is not None:
+            try:
+                raw = await redis.get(
+                    self._external_key(external_id, messenger_type)
+                )
+            except Exception as exc:
+                logger.debug("User cache read failed", exc_info=exc)
+                raw = None
+            if raw:
+                user_id = UUID(raw)
+        if user_id is None:
+            self._record("miss")
+            return None
+        user, result = await self._lookup(user_id)
+        self._record(result)
+        return user
+
+    async def _lookup(self, user_id: UUID) -> tuple[User | None, str]:
+        if self._local_enabled():
+            user = self._by_id.get(user_id)
+            if user is not None:
+                return user, "local_hit"
+        redis = self._get_redis()
+        if redis is None:
+            return None, "miss"
+        try:
+            raw = await redis.get(self._id_key(user_id))
+        except Exception as exc:
+            logger.debug("User cache read failed", exc_info=exc)
+            return None, "miss"
+        if not raw:
+            return None, "miss"
+        user = _user_from_json(raw)
+        self._store_local(user)
+        return user, "redis_hit"
+
+    def _local_enabled(self) -> bool:
+        """In-process tier is safe only if peers' invalidations reach it."""
+        return self._listener is not None or self._get_redis() is None
+
+    def _store_local(self, user: User) -> None:
+        if not self._local_enabled():
+            return
+        self._by_id.set(user.user_id, user)
+        self._by_external.set(
+            (user.external_id, user.messenger_type.value), user.user_id
+        )
+
+    async def put(self, user: User) -> None:
+        """Store a user in both tiers."""
+        self._store_local(user)
+        redis = self._get_redis()
+        if redis is None:
+            return
+        try:
+            async with redis.pipeline(transaction=False) as pipe:
+                pipe.set(
+                    self._id_key(user.user_id),
+                    _user_to_json(user),
+                    ex=self._redis_ttl,
+                )
+                pipe.set(
+                    self._external_key(user.external_id, user.messenger_type),
+                    str(user.user_id),
+                    ex=self._redis_ttl,
+                )
+                await pipe.execute()
+        except Exception as exc:
+            logger.debug("User cache write failed", exc_info=exc)
+
+    def drop_local(self, user_ids: Iterable[UUID]) -> None:
+        """Drop in-process entries only (e.g. on a peer's invalidation)."""
+        for user_id in user_ids:
+            self._by_id.pop(user_id)
+
+    async def invalidate(self, user_ids: Sequence[UUID]) -> None:
+        """Drop users from both tiers and notify other replicas."""
+        if not user_ids:
+            return
+        self.drop_local(user_ids)
+        redis = self._get_redis()
+        if redis is None:
+            return
+        try:
+            await redis.delete(*(self._id_key(u) for u in user_ids))
+            await redis.publish(
+                _INVALIDATION_CHANNEL, ",".join(str(u) for u in user_ids)
+            )
+        except Exception as exc:
+            logger.warning(
+                "User cache invalidation failed",
+                extra={"error": str(exc)},
+            )
+
+    def invalidate_soon(self, user_ids: Sequence[UUID]) -> None:
+        """Schedule ``invalidate`` from sync code (e.g. session events).
+
+        The task is kept until it finishes; ``close()`` waits for it.
+        """
+        task = asyncio.get_running_loop().create_task(self.invalidate(user_ids))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    def start(self) -> None:
+        """Start the invalidation subscriber (needs a running event loop).
+
+        Until it runs, the in-process tier is bypassed whenever Redis is
+        configured; lookups then go to Redis.
+        """
+        if self._listener is None and self._get_redis() is not None:
+            self._listener = asyncio.get_running_loop().create_task(
+                self._listen()
+            )
+
+    async def _listen(self) -> None:
+        """Drop local entries announced by other replicas; reconnect."""
+        redis = self._get_redis()
+        assert redis is not None
+        while True:
+            try:
+                async with redis.pubsub() as pubsub:
+                    await pubsub.subscribe(_INVALIDATION_CHANNEL)
+                    async for message in pubsub.listen():
+                        if message.get("type") != "message":
+                            continue
+                        self.drop_local(
+                            UUID(part)
+                            for part in str(message["data"]).split(",")
+                            if part
+                        )
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.warning(
+                    "User cache subscriber failed, reconnecting",
+                    extra={"error": str(exc)},
+                )
+                await asyncio.sleep(1.0)
+
+    async def close(self) -> None:
+        """Finish pending invalidations, stop the subscriber, close Redis."""
+        if self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
+        if self._listener is not None:
+            self._listener.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._listener
+            self._listener = None
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
+
+
+def _session_info(session: object | None) -> dict | None:
+    info = getattr(session, "info", None)
+    return info if isinstance(info, dict) else None
+
+
+@dataclass(slots=True)
+class CachedUserRepository(UserRepository):
+    """User repository decorator adding a read-through ``UserCache``.
+
+    Sessions that have written users bypass the cache for the rest of their
+    transaction, so uncommitted rows are never cached. Written users are
+    invalidated before the write and again after the commit. Reads on a
+    replica session use the cache but never fill it.
+    """
+
+    inner: UserRepository
+    cache: UserCache
+
+    def _is_dirty(self, session: object | None) -> bool:
+        info = _session_info(session)
+        return bool(info and info.get(_DIRTY_KEY))
+
+    def _may_populate(self, session: object | None) -> bool:
+        return not self._is_dirty(session) and not is_replica_session(session)
+
+    async def _written(
+        self, user_ids: Sequence[UUID], session: object | None
+    ) -> None:
+        await self.cache.invalidate(user_ids)
+        info = _session_info(session)
+        if info is None:
+            return
+        info.setdefault(_DIRTY_KEY, set()).update(user_ids)
+        sync_session = getattr(session, "sync_session", None)
+        if sync_session is None or info.get(_HOOKED_KEY):
+            return
+        info[_HOOKED_KEY] = True
+        cache = self.cache
+
+        def _after_commit(_session: Any) -> None:
+            dirty = info.pop(_DIRTY_KEY, None)
+            if dirty:
+                cache.invalidate_soon(list(dirty))
+
+        def _after_rollback(_session: Any) -> None:
+            info.pop(_DIRTY_KEY, None)
+
+        event.listen(sync_session, "after_commit", _after_commit)
+        event.listen(sync_session, "after_rollback", _after_rollback)
+
+    async def get_by_id(
+        self, user_id: UUID, session: object | None = None
+    ) -> Optional[User]:
+        """Fetch a user by ID, from cache when possible."""
+        dirty = self._is_dirty(session)
+        if not dirty:
+            cached = await self.cache.get_by_id(user_id)
+            if cached is not None:
+                return cached
+        user = await self.inner.get_by_id(user_id, session=session)
+        if user is not None and self._may_populate(session):
+            await self.cache.put(user)
+        return user
+
+    async def get_by_external(
+        self,
+        external_id: str,
+        messenger_type: MessengerType,
+        session: object | None = None,
+    ) -> Optional[User]:
+        """Fetch a user by external ID, from cache when possible."""
+        dirty = self._is_dirty(session)
+        if not dirty:
+            cached = await self.cache.get_by_external(
+                external_id, messenger_type
+            )
+            if cached is not None:
+                return cached
+        user = await self.inner.get_by_external(
+            external_id, messenger_type, session=session
+        )
+        if user is not None and self._may_populate(session):
+            await self.cache.put(user)
+        return user
+
+    async def save(self, user: User, session: object | None = None) -> None:
+        """Persist a user and invalidate its cache entries."""
+        await self._written([user.user_id], session)
+        await self.inner.save(user, session=session)
+
+    async def save_many(
+        self, users: Sequence[User], session: object | None = None
+    ) -> None:
+        """Persist many users and invalidate their cache entries."""
+        await self._written([u.user_id for u in users], session)
+        await self.inner.save_many(users, session=session)
+
+    async def list_by_ids(
+        self, user_ids: Sequence[UUID], session: object | None = None
+    ) -> list[User]:
+        """Fetch many users with one query (not cached)."""
+        return await self.inner.list_by_ids(user_ids, session=session)
+
+    async def list_pending_role_reminders(
+        self,
+        reminder_cutoff: datetime,
+        session: object | None = None,
+        *,
+        limit: int | None = None,
+        after_user_id: UUID | None = None,
+    ) -> Iterable[User]:
+        """List users due for a role reminder (not cached)."""
+        return await self.inner.list_pending_role_reminders(
+            reminder_cutoff,
+            session=session,
+            limit=limit,
+            after_user_id=after_user_id,
+        )
+
+    async def update_last_role_reminder_at_many(
+        self,
+        user_ids: Sequence[UUID],
+        reminded_at: datetime,
+        session: object | None = None,
+    ) -> None:
+        """Bulk-update reminder time and invalidate the users."""
+        await self._written(list(user_ids), session)
+        await self.inner.update_last_role_reminder_at_many(
+            user_ids, reminded_at, session=session
+        )
+
+    async def iter_all(self) -> Iterable[User]:
+        """Iterate all users (not cached)."""
+        return await self.inner.iter_all()
+
+    async def list_admins(
+        self,
+        messenger_type: MessengerType | None = None,
+        session: object | None = None,
+    ) -> Iterable[User]:
+        """List admin users (not cached)."""
+        return await self.inner.list_admins(
+            messenger_type=messenger_type, session=session
+        )
@@ -2,19 +2,23 @@
 
 import hashlib
 import hmac
-import json
 import logging
+import sys
 from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from typing import Any
 from uuid import UUID
 
 from fastapi import FastAPI, Header, HTTPException, Request, Response
 from fastapi.responses import PlainTextResponse
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 
+from ugc_bot import json_codec
 from ugc_bot.application.services.instagram_verification_service import (
     InstagramVerificationService,
 )
 from ugc_bot.config import AppConfig, load_config
+from ugc_bot.config_reload import ConfigState
 from ugc_bot.container import Container
 from ugc_bot.logging_setup import configure_logging
 from ugc_bot.startup_logging import log_startup_info
@@ -22,6 +26,57 @@ from ugc_bot.startup_logging import log_startup_info
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True, slots=True)
+class _WebhookSettings:
+    """Config plus the values the endpoints check, derived once."""
+
+    config: AppConfig
+    verify_token: str
+    app_secret: bytes | None
+
+
+def _webhook_settings(config: AppConfig) -> _WebhookSettings:
+    secret = config.instagram.instagram_app_secret
+    return _WebhookSettings(
+        config=config,
+        verify_token=config.instagram.instagram_webhook_verify_token,
+        app_secret=secret.encode("utf-8") if secret else None,
+    )
+
+
+def _settings(request: Request) -> _WebhookSettings:
+    config_state: ConfigState[_WebhookSettings] = request.app.state.config_state
+    return config_state.get()
+
+
+@dataclass(frozen=True, slots=True)
+class _WebhookServices:
+    """Container and service handle_webhook uses, built once per process."""
+
+    container: Container
+    verification_service: InstagramVerificationService
+
+
+def _build_services(config: AppConfig) -> _WebhookServices:
+    container = Container(config)
+    return _WebhookServices(
+        container=container,
+        verification_service=container.build_instagram_verification_service(),
+    )
+
+
+def _services(request: Request) -> _WebhookServices:
+    services: _WebhookServices | None = request.app.state.services
+    if services is None:
+        # Served without the lifespan; built on first use instead.
+        services = _build_services(_settings(request).config)
+        request.app.state.services = services
+    return services
+
+
+_config_state = ConfigState(_webhook_settings, lambda: load_config())
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifespan event handler for FastAPI application.
@@ -29,27 +84,45 @@ async def lifespan(app: FastAPI):
     Logs version and sanitized config on server startup.
     This runs when the app is served by Uvicorn (including docker-compose),
     where `main()` is typically not executed.
+
+    The container (DB engine and pool), verification service and Graph
+    API client are built here once and the engine is disposed on
+    shutdown. A SIGHUP reload does not rebuild them.
     """
     # Startup
-    config = load_config()
+    app.state.config_state = _config_state
+    config = _config_state.reload().config
     log_startup_info(
         logger=logger, service_name="instagram-webhook", config=config
     )
+    services = _build_services(config)
+    app.state.services = services
+    _config_state.install_reload_signal()
     yield
-    # Shutdown (if needed in the future)
+    _config_state.remove_reload_signal()
+    app.state.services = None
+    await services.container.close()
+    if "ugc_bot.bot.http_session" in sys.modules:
+        # Only present once a notification was sent; aiogram is heavy.
+        from ugc_bot.bot.http_session import close_shared_bot_session
+
+        await close_shared_bot_session()
 
 
 app = FastAPI(title="Instagram Webhook", lifespan=lifespan)
+# Loaded in the lifespan (or on first request); SIGHUP reloads it.
+app.state.config_state = _config_state
+app.state.services = None
 
 
-def _verify_signature(payload: bytes, signature: str, app_secret: str) -> bool:
+def _verify_signature(
+    payload: bytes, signature: str, app_secret: bytes
+) -> bool:
     """Verify webhook signature using SHA256."""
     if not signature.startswith("sha256="):
         return False
     expected_signature = signature[7:]  # Remove "sha256=" prefix
-    computed = hmac.new(
-        app_secret.encode("utf-8"), payload, hashlib.sha256
-    ).hexdigest()
+    computed = hmac.new(app_secret, payload, hashlib.sha256).hexdigest()
     return hmac.compare_digest(computed, expected_signature)
 
 
@@ -60,10 +133,16 @@ async def health() -> dict[str, str]:
     return {"status": "ok"}
 
 
+@app.get("/metrics")
+async def metrics() -> Response:
+    """Prometheus metrics (DB pool, Bot API connections)."""
+    return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
+
 @app.get("/webhook/instagram")
 async def verify_webhook(request: Request) -> Response:
     """Handle webhook verification request from Meta."""
-    config = load_config()
+    settings = _settings(request)
 
     # FastAPI: query params with dots; use request.query_params
     hub_mode = request.query_params.get("hub.mode")
@@ -74,7 +153,7 @@ async def verify_webhook(request: Request) -> Response:
         logger.warning("Invalid hub.mode in verification request")
         raise HTTPException(status_code=400, detail="Invalid mode")
 
-    if hub_verify_token != config.instagram.instagram_webhook_verify_token:
+    if hub_verify_token != settings.verify_token:
         logger.warning("Invalid verify token in verification request")
         raise HTTPException(status_code=403, detail="Invalid verify token")
 
@@ -92,13 +171,14 @@ async def handle_webhook(
     x_hub_signature_256: str | None = Header(None, alias="X-Hub-Signature-256"),
 ) -> dict[str, str]:
     """Handle webhook event notifications from Instagram."""
-    config = load_config()
+    settings = _settings(request)
+    config = settings.config
 
     # Read raw payload for signature verification
     payload_bytes = await request.body()
 
     # Verify signature if app secret is configured
-    if config.instagram.instagram_app_secret:
+    if settings.app_secret is not None:
         if not x_hub_signature_256:
             logger.warning("Missing X-Hub-Signature-256 header")
             raise HTTPException(
@@ -108,15 +188,15 @@ async def handle_webhook(
         if not _verify_signature(
             payload_bytes,
             x_hub_signature_256,
-            config.instagram.instagram_app_secret,
+            settings.app_secret,
         ):
             logger.warning("Invalid webhook signature")
             raise HTTPException(status_code=403, detail="Invalid signature")
 
     # Parse JSON payload
     try:
-        payload = json.loads(payload_bytes.decode("utf-8"))
-    except json.JSONDecodeError as exc:
+        payload = json_codec.loads(payload_bytes)
+    except ValueError as exc:
         logger.warning("Invalid JSON payload", exc_info=exc)
         raise HTTPException(status_code=400, detail="Invalid JSON") from exc
 
@@ -124,8 +204,7 @@ async def handle_webhook(
 
     # Process webhook events
     try:
-        container = Container(config)
-        verification_service = container.build_instagram_verification_service()
+        verification_service = _services(request).verification_service
         await _process_webhook_events(payload, verification_service, config)
     except Exception as exc:
         logger.exception("Error processing webhook events", exc_info=exc)
@@ -144,7 +223,8 @@ async def _notify_user_verification_success(
     try:
         from aiogram import Bot
 
-        from ugc_bot.bot.handlers.keyboards import blogger_menu_keyboard
+        from ugc_bot.bot.http_session import shared_bot_session
+        from ugc_bot.bot.keyboards import blogger_menu_keyboard
 
         (
             user,
@@ -166,18 +246,18 @@ async def _notify_user_verification_success(
 
         confirmed = blogger_profile.confirmed if blogger_profile else False
 
-        bot = Bot(token=config.bot.bot_token)
-        try:
-            await bot.send_message(
-                chat_id=int(user.external_id),
-                text=(
-                    "Instagram подтверждён ✅. "
-                    "Бренды могут отправлять предложения."
-                ),
-                reply_markup=blogger_menu_keyboard(confirmed=confirmed),
-            )
-        finally:
-            await bot.session.close()
+        # Shares the process-wide connection pool; closed on shutdown.
+        bot = Bot(
+            token=config.bot.bot_token, session=shared_bot_session(config.bot)
+        )
+        await bot.send_message(
+            chat_id=int(user.external_id),
+            text=(
+                "Instagram подтверждён ✅. "
+                "Бренды могут отправлять предложения."
+            ),
+            reply_markup=blogger_menu_keyboard(confirmed=confirmed),
+        )
     except Exception as exc:
         logger.exception(
             "Error sending verification notification to user",
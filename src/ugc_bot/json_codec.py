@@ -0,0 +1,86 @@
+"""JSON encoding for webhook payloads, FSM storage, Kafka and logs.
+
+Uses orjson when installed (``pip install ugc-bot[orjson]``), otherwise
+the stdlib. Both backends write compact UTF-8 JSON, UUIDs as strings,
+dates and times in ISO 8601, enums as their values and dataclasses as
+objects of their fields, and accept int, float, bool and None dict keys.
+Other types are passed to ``default``; without one they raise TypeError.
+"""
+
+import dataclasses
+import json
+from collections.abc import Callable
+from datetime import date, datetime, time
+from enum import Enum
+from typing import Any
+from uuid import UUID
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised without orjson
+    orjson = None  # type: ignore[assignment]
+
+BACKEND = "orjson" if orjson is not None else "json"
+
+Default = Callable[[Any], Any]
+
+
+def _stdlib_default(default: Default | None) -> Default:
+    """Encode what orjson serializes natively, then defer to ``default``."""
+
+    def _encode(value: Any) -> Any:
+        if isinstance(value, UUID):
+            return str(value)
+        if isinstance(value, (datetime, date, time)):
+            return value.isoformat()
+        if isinstance(value, Enum):
+            return value.value
+        if dataclasses.is_dataclass(value) and not isinstance(value, type):
+            return {
+                field.name: getattr(value, field.name)
+                for field in dataclasses.fields(value)
+            }
+        if default is not None:
+            return default(value)
+        raise TypeError(
+            f"Object of type {type(value).__name__} is not JSON serializable"
+        )
+
+    return _encode
+
+
+def dumps_bytes(obj: Any, *, default: Default | None = None) -> bytes:
+    """Encode ``obj`` as UTF-8 JSON bytes."""
+
+    if orjson is not None:
+        return orjson.dumps(
+            obj, default=default, option=orjson.OPT_NON_STR_KEYS
+        )
+    return _stdlib_dumps(obj, default).encode("utf-8")
+
+
+def dumps(obj: Any, *, default: Default | None = None) -> str:
+    """Encode ``obj`` as a JSON string."""
+
+    if orjson is not None:
+        return orjson.dumps(
+            obj, default=default, option=orjson.OPT_NON_STR_KEYS
+        ).decode("utf-8")
+    return _stdlib_dumps(obj, default)
+
+
+def _stdlib_dumps(obj: Any, default: Default | None) -> str:
+    return json.dumps(
+        obj,
+        default=_stdlib_default(default),
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+
+
+def loads(data: str | bytes) -> Any:
+    """Decode JSON text or UTF-8 bytes."""
+
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -1,7 +1,6 @@
 """Kafka consumer for order activation events."""
 
 import asyncio
-import json
 import logging
 from typing import Any
 from uuid import UUID
@@ -13,13 +12,16 @@ from aiokafka import (  # type: ignore[import-untyped]
     AIOKafkaProducer,
 )
 
+from ugc_bot import json_codec
 from ugc_bot.application.services.offer_dispatch_service import (
     OfferDispatchService,
 )
+from ugc_bot.bot.http_session import shared_bot_session
 from ugc_bot.config import AppConfig, load_config
 from ugc_bot.container import Container
 from ugc_bot.domain.entities import Order, User
 from ugc_bot.logging_setup import configure_logging
+from ugc_bot.metrics.exporter import start_metrics_server
 from ugc_bot.startup_logging import log_startup_info
 
 logger = logging.getLogger(__name__)
@@ -183,13 +185,13 @@ def _create_kafka_clients(
     """Create Kafka DLQ producer and activation consumer."""
     dlq_producer = AIOKafkaProducer(
         bootstrap_servers=config.kafka.kafka_bootstrap_servers,
-        value_serializer=lambda value: json.dumps(value).encode("utf-8"),
+        value_serializer=json_codec.dumps_bytes,
     )
     consumer = AIOKafkaConsumer(
         config.kafka.kafka_topic,
         bootstrap_servers=config.kafka.kafka_bootstrap_servers,
         group_id=config.kafka.kafka_group_id,
-        value_deserializer=lambda value: json.loads(value.decode("utf-8")),
+        value_deserializer=json_codec.loads,
         auto_offset_reset="earliest",
         enable_auto_commit=True,
     )
@@ -257,6 +259,7 @@ async def run_consumer() -> None:
         logger.error("DATABASE_URL is required for Kafka consumer")
         return
 
+    start_metrics_server(config.metrics)
     container = Container(config)
     offer_dispatch_service = container.build_offer_dispatch_service()
 
@@ -265,7 +268,9 @@ async def run_consumer() -> None:
         "Kafka consumer started", extra={"topic": config.kafka.kafka_topic}
     )
 
-    bot = Bot(token=config.bot.bot_token)
+    bot = Bot(
+        token=config.bot.bot_token, session=shared_bot_session(config.bot)
+    )
     await _consume_forever(
         consumer=consumer,
         dlq_producer=dlq_producer,
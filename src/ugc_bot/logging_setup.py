@@ -1,10 +1,11 @@
 """Logging configuration helpers."""
 
-import json
 import logging
 import os
 from typing import Any
 
+from ugc_bot import json_codec
+
 
 class EnvLevelFilter(logging.Filter):
     """Filter log records below LOG_LEVEL env threshold.
@@ -91,7 +92,7 @@ class JSONFormatter(logging.Formatter):
                 }:
                     log_data[key] = value
 
-        return json.dumps(log_data, ensure_ascii=False, default=str)
+        return json_codec.dumps(log_data, default=str)
 
 
 def configure_logging(log_level: str, json_format: bool | None = None) -> None:
@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Optional
 
-from prometheus_client import Counter, Histogram
+from prometheus_client import Counter, Gauge, Histogram
 
 logger = logging.getLogger(__name__)
 
@@ -79,6 +79,72 @@ _REQUEST_LATENCY = Histogram(
     buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
 )
 
+_USER_CACHE_LOOKUPS = Counter(
+    "ugc_user_cache_lookups_total",
+    "User cache lookups by result (local_hit, redis_hit, miss)",
+    ["result"],
+)
+_DB_STATEMENTS = Histogram(
+    "ugc_db_statements_per_operation",
+    "SQL statements issued per logical operation",
+    ["operation"],
+    buckets=(1, 2, 5, 10, 20, 50, 100, 250),
+)
+_DB_TIME = Histogram(
+    "ugc_db_time_per_operation_seconds",
+    "Time spent executing SQL per logical operation",
+    ["operation"],
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+)
+_UPDATE_QUEUE_DEPTH = Gauge(
+    "ugc_webhook_queue_depth",
+    "Webhook updates waiting for a worker",
+)
+_UPDATE_QUEUE_WAIT = Histogram(
+    "ugc_webhook_queue_wait_seconds",
+    "Time a webhook update waited in the queue",
+    buckets=(0.001, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 15.0, 60.0),
+)
+_UPDATE_QUEUE_REJECTED = Counter(
+    "ugc_webhook_queue_rejected_total",
+    "Webhook updates refused because the queue was full",
+)
+_DUPLICATE_UPDATES = Counter(
+    "ugc_webhook_duplicate_updates_total",
+    "Webhook updates dropped because another delivery was handled",
+)
+_DB_POOL_CHECKED_OUT = Gauge(
+    "ugc_db_pool_checked_out",
+    "Connections currently checked out of the pool",
+    ["pool"],
+)
+_DB_POOL_OVERFLOW = Gauge(
+    "ugc_db_pool_overflow",
+    "Overflow connections open beyond pool_size",
+    ["pool"],
+)
+_DB_POOL_CHECKOUT_WAIT = Histogram(
+    "ugc_db_pool_checkout_wait_seconds",
+    "Time spent waiting for a pooled connection",
+    ["pool"],
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0),
+)
+_BOT_API_CONNECTIONS = Counter(
+    "ugc_bot_api_connections_total",
+    "Bot API requests by connection: new or reused from the pool",
+    ["kind"],
+)
+_BOT_API_CONNECT_SECONDS = Histogram(
+    "ugc_bot_api_connect_seconds",
+    "Time to open a new Bot API connection (TCP and TLS)",
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+_DB_POOL_INVALIDATIONS = Counter(
+    "ugc_db_pool_invalidations_total",
+    "Pooled connections invalidated (hard) or marked stale (soft)",
+    ["pool", "kind"],
+)
+
 
 @dataclass(slots=True)
 class MetricsCollector:
@@ -351,3 +417,60 @@ class MetricsCollector:
                 "timestamp": datetime.now(timezone.utc).isoformat(),
             },
         )
+
+    def record_user_cache_lookup(self, result: str) -> None:
+        """Record a user cache lookup (counter only; too hot to log)."""
+        _USER_CACHE_LOOKUPS.labels(result=result).inc()
+
+    def record_db_operation(
+        self, operation: str, statements: int, duration_seconds: float
+    ) -> None:
+        """Record SQL statements and DB time of one operation (no log)."""
+        _DB_STATEMENTS.labels(operation=operation).observe(statements)
+        _DB_TIME.labels(operation=operation).observe(duration_seconds)
+
+    def record_update_queue_depth(self, depth: int) -> None:
+        """Record webhook updates waiting in the queue (no log)."""
+        _UPDATE_QUEUE_DEPTH.set(depth)
+
+    def record_update_queue_wait(self, seconds: float) -> None:
+        """Record how long an update waited for a worker (no log)."""
+        _UPDATE_QUEUE_WAIT.observe(seconds)
+
+    def record_update_queue_rejected(self) -> None:
+        """Record an update refused because the queue was full."""
+        _UPDATE_QUEUE_REJECTED.inc()
+        logger.warning("Webhook update queue full")
+
+    def record_duplicate_update(self) -> None:
+        """Record a redelivered update that was dropped (no log)."""
+        _DUPLICATE_UPDATES.inc()
+
+    def record_db_pool_state(
+        self, pool: str, checked_out: int, overflow: int
+    ) -> None:
+        """Record connections in use and overflow of a pool (no log)."""
+        _DB_POOL_CHECKED_OUT.labels(pool=pool).set(checked_out)
+        _DB_POOL_OVERFLOW.labels(pool=pool).set(overflow)
+
+    def record_db_pool_checkout_wait(self, pool: str, seconds: float) -> None:
+        """Record how long a checkout waited for a connection (no log)."""
+        _DB_POOL_CHECKOUT_WAIT.labels(pool=pool).observe(seconds)
+
+    def record_db_pool_invalidation(self, pool: str, soft: bool) -> None:
+        """Record an invalidated pooled connection."""
+        kind = "soft" if soft else "hard"
+        _DB_POOL_INVALIDATIONS.labels(pool=pool, kind=kind).inc()
+        logger.warning(
+            "Pooled connection invalidated",
+            extra={"pool": pool, "kind": kind},
+        )
+
+    def record_bot_api_connection_created(self, seconds: float) -> None:
+        """Record a new Bot API connection and its setup time (no log)."""
+        _BOT_API_CONNECTIONS.labels(kind="new").inc()
+        _BOT_API_CONNECT_SECONDS.observe(seconds)
+
+    def record_bot_api_connection_reused(self) -> None:
+        """Record a Bot API request served by a pooled connection (no log)."""
+        _BOT_API_CONNECTIONS.labels(kind="reused").inc()
@@ -0,0 +1,42 @@
+"""Expose metrics from processes without an HTTP app.
+
+Long-running workers serve the default registry on ``METRICS_PORT``
+with prometheus_client's own HTTP server. One-shot jobs exit before
+Prometheus could scrape them, so they push to a Pushgateway instead.
+"""
+
+import logging
+
+from prometheus_client import REGISTRY, push_to_gateway, start_http_server
+
+from ugc_bot.config import MetricsConfig
+
+logger = logging.getLogger(__name__)
+
+
+def start_metrics_server(config: MetricsConfig) -> bool:
+    """Serve /metrics on ``metrics_port``; return False when disabled."""
+
+    if not config.metrics_port:
+        return False
+    start_http_server(config.metrics_port)
+    logger.info("Metrics server started", extra={"port": config.metrics_port})
+    return True
+
+
+def push_metrics(config: MetricsConfig, job: str) -> bool:
+    """Push the default registry as ``job``; False when disabled or failed."""
+
+    if not config.metrics_pushgateway_url:
+        return False
+    try:
+        push_to_gateway(
+            config.metrics_pushgateway_url, job=job, registry=REGISTRY
+        )
+    except OSError as exc:
+        logger.warning(
+            "Metrics push failed",
+            extra={"job": job, "error": str(exc)},
+        )
+        return False
+    return True
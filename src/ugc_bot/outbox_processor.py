@@ -10,7 +10,10 @@ from ugc_bot.application.ports import OrderActivationPublisher
 from ugc_bot.application.services.outbox_publisher import OutboxPublisher
 from ugc_bot.config import load_config
 from ugc_bot.container import Container
+from ugc_bot.infrastructure.db.statement_stats import track_statements
 from ugc_bot.logging_setup import configure_logging
+from ugc_bot.metrics.collector import MetricsCollector
+from ugc_bot.metrics.exporter import start_metrics_server
 from ugc_bot.startup_logging import log_startup_info
 
 logger = logging.getLogger(__name__)
@@ -25,11 +28,13 @@ class OutboxProcessor:
         kafka_publisher: OrderActivationPublisher,
         poll_interval: float = 5.0,
         max_retries: int = 3,
+        metrics_collector: Optional[MetricsCollector] = None,
     ):
         self.outbox_publisher = outbox_publisher
         self.kafka_publisher = kafka_publisher
         self.poll_interval = poll_interval
         self.max_retries = max_retries
+        self.metrics_collector = metrics_collector
         self._running = False
         self._task: Optional[asyncio.Task] = None
 
@@ -71,14 +76,18 @@ class OutboxProcessor:
         """Process a batch of pending events."""
 
         start_time = datetime.now(timezone.utc)
-        await self.outbox_publisher.process_pending_events(
-            self.kafka_publisher, self.max_retries
-        )
+        with track_statements("outbox_batch", self.metrics_collector) as stats:
+            await self.outbox_publisher.process_pending_events(
+                self.kafka_publisher, self.max_retries
+            )
         processing_time = (
             datetime.now(timezone.utc) - start_time
         ).total_seconds()
 
-        logger.debug(f"Processed pending events in {processing_time:.2f}s")
+        logger.debug(
+            f"Processed pending events in {processing_time:.2f}s "
+            f"({stats.statements} SQL statements)"
+        )
 
     async def process_once(self) -> None:
         """Process pending events once (for testing/manual runs)."""
@@ -111,12 +120,15 @@ async def run_processor() -> None:
         logger.error("Kafka is disabled, cannot run outbox processor")
         return
 
+    start_metrics_server(config.metrics)
+
     # Create and start processor
     processor = OutboxProcessor(
         outbox_publisher=outbox_publisher,
         kafka_publisher=kafka_publisher,
         poll_interval=5.0,
         max_retries=3,
+        metrics_collector=container.build_metrics_collector(),
     )
 
     try:
@@ -3,25 +3,43 @@
 import asyncio
 import logging
 from datetime import datetime, timezone
+from uuid import UUID
 from zoneinfo import ZoneInfo
 
 from aiogram import Bot
 
 from ugc_bot.application.services.user_role_service import UserRoleService
-from ugc_bot.bot.handlers.start import START_TEXT, _role_keyboard
-from ugc_bot.bot.handlers.utils import send_with_retry
+from ugc_bot.bot.http_session import (
+    close_shared_bot_session,
+    shared_bot_session,
+)
+from ugc_bot.bot.keyboards import START_TEXT, role_keyboard
+from ugc_bot.bot.sending import SendRateLimiter, send_with_retry
 from ugc_bot.config import load_config
+from ugc_bot.container.infrastructure_factory import (
+    build_metrics_collector,
+    build_slow_query_recorder,
+    create_replica_session_factory_from_config,
+    create_transaction_manager,
+    db_engine_options,
+)
+from ugc_bot.domain.entities import User
 from ugc_bot.infrastructure.db.repositories import SqlAlchemyUserRepository
 from ugc_bot.infrastructure.db.session import (
-    SessionTransactionManager,
     create_session_factory,
 )
+from ugc_bot.infrastructure.db.statement_stats import track_statements
 from ugc_bot.logging_setup import configure_logging
+from ugc_bot.metrics.collector import MetricsCollector
+from ugc_bot.metrics.exporter import push_metrics
 from ugc_bot.startup_logging import log_startup_info
 
 logger = logging.getLogger(__name__)
 _send_retries = 3
 _send_retry_delay_seconds = 0.5
+_default_batch_size = 500
+_default_concurrency = 10
+_default_send_rate_per_second = 25.0
 
 
 def _reminder_cutoff(config) -> datetime:
@@ -38,39 +56,75 @@ def _reminder_cutoff(config) -> datetime:
     return today_at_time.astimezone(timezone.utc)
 
 
+async def _send_reminder(
+    bot: Bot, user: User, limiter: SendRateLimiter | None
+) -> UUID | None:
+    """Send one reminder; return user id on success, None on failure."""
+
+    try:
+        chat_id = int(user.external_id)
+        sent = await send_with_retry(
+            bot,
+            chat_id=chat_id,
+            text=START_TEXT,
+            reply_markup=role_keyboard(),
+            retries=_send_retries,
+            delay_seconds=_send_retry_delay_seconds,
+            logger=logger,
+            extra={"user_id": str(user.user_id)},
+            limiter=limiter,
+        )
+    except Exception as exc:
+        logger.warning(
+            "Role reminder send failed",
+            extra={
+                "user_id": str(user.user_id),
+                "external_id": user.external_id,
+                "error": str(exc),
+            },
+        )
+        return None
+    return user.user_id if sent else None
+
+
 async def run_once(
     bot: Bot,
     user_role_service: UserRoleService,
     reminder_cutoff: datetime,
+    *,
+    batch_size: int = _default_batch_size,
+    limiter: SendRateLimiter | None = None,
+    metrics_collector: MetricsCollector | None = None,
 ) -> None:
-    """Send one reminder to each user due for a role-choice reminder."""
+    """Send one reminder to each user due for a role-choice reminder.
 
-    users = await user_role_service.list_pending_role_reminders(reminder_cutoff)
-    for user in users:
-        if user.messenger_type.value != "telegram":  # pragma: no cover
-            continue
-        try:
-            chat_id = int(user.external_id)
-            await send_with_retry(
-                bot,
-                chat_id=chat_id,
-                text=START_TEXT,
-                reply_markup=_role_keyboard(),
-                retries=_send_retries,
-                delay_seconds=_send_retry_delay_seconds,
-                logger=logger,
-                extra={"user_id": str(user.user_id)},
-            )
-            await user_role_service.update_last_role_reminder_at(user.user_id)
-        except Exception as exc:
-            logger.warning(
-                "Role reminder send failed",
-                extra={
-                    "user_id": str(user.user_id),
-                    "external_id": user.external_id,
-                    "error": str(exc),
-                },
+    Users are streamed in pages of batch_size. Sends within a page run
+    concurrently under the limiter, then last_role_reminder_at is written
+    for the whole page with one bulk UPDATE.
+    """
+
+    if limiter is None:
+        limiter = SendRateLimiter(
+            rate_per_second=_default_send_rate_per_second,
+            max_concurrency=_default_concurrency,
+        )
+    sent_total = 0
+    with track_statements("role_reminder_cycle", metrics_collector):
+        async for users in user_role_service.iter_pending_role_reminders(
+            reminder_cutoff, batch_size
+        ):
+            telegram_users = [
+                user
+                for user in users
+                if user.messenger_type.value == "telegram"
+            ]
+            results = await asyncio.gather(
+                *(_send_reminder(bot, user, limiter) for user in telegram_users)
             )
+            sent_ids = [user_id for user_id in results if user_id is not None]
+            await user_role_service.update_last_role_reminder_at_many(sent_ids)
+            sent_total += len(sent_ids)
+    logger.info("Role reminders sent", extra={"count": sent_total})
 
 
 def main() -> None:  # pragma: no cover
@@ -89,21 +143,45 @@ def main() -> None:  # pragma: no cover
     if not config.db.database_url:
         logger.error("DATABASE_URL is required for role reminder")
         return
+    slow_query_recorder = build_slow_query_recorder(config)
     session_factory = create_session_factory(
         config.db.database_url,
-        pool_size=config.db.pool_size,
-        max_overflow=config.db.max_overflow,
-        pool_timeout=config.db.pool_timeout,
+        **db_engine_options(config, slow_query_recorder),
+    )
+    transaction_manager = create_transaction_manager(
+        session_factory,
+        create_replica_session_factory_from_config(config, slow_query_recorder),
+        config,
     )
-    transaction_manager = SessionTransactionManager(session_factory)
     user_repo = SqlAlchemyUserRepository(session_factory=session_factory)
     user_role_service = UserRoleService(
         user_repo=user_repo,
         transaction_manager=transaction_manager,
     )
     reminder_cutoff = _reminder_cutoff(config)
-    bot = Bot(token=config.bot.bot_token)
-    asyncio.run(run_once(bot, user_role_service, reminder_cutoff))
+    bot = Bot(
+        token=config.bot.bot_token, session=shared_bot_session(config.bot)
+    )
+    limiter = SendRateLimiter(
+        rate_per_second=config.bot.bot_send_rate_per_second,
+        max_concurrency=config.role_reminder.role_reminder_concurrency,
+    )
+
+    async def _run() -> None:
+        try:
+            await run_once(
+                bot,
+                user_role_service,
+                reminder_cutoff,
+                batch_size=config.role_reminder.role_reminder_batch_size,
+                limiter=limiter,
+                metrics_collector=build_metrics_collector(),
+            )
+        finally:
+            await close_shared_bot_session()
+
+    asyncio.run(_run())
+    push_metrics(config.metrics, job="role_reminder")
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -7,25 +7,64 @@ can receive updates via webhook (no polling conflict).
 import asyncio
 import logging
 from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any
 
-from aiogram import Bot, Dispatcher
+from aiogram import Bot
 from aiogram.types import Update
 from fastapi import FastAPI, Header, HTTPException, Request
 from fastapi.responses import Response
 from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 
-from ugc_bot.app import build_dispatcher, create_storage
-from ugc_bot.config import load_config
+from ugc_bot import json_codec
+from ugc_bot.app import build_dispatcher, create_storage, include_routers
+from ugc_bot.bot.http_session import shared_bot_session
+from ugc_bot.bot.update_queue import UpdateQueue, UpdateQueueFull, WebhookReply
+from ugc_bot.bot.webhook_reply import DeferCallbackAnswer
+from ugc_bot.config import AppConfig, load_config
+from ugc_bot.config_reload import ConfigState
+from ugc_bot.container.infrastructure_factory import (
+    build_metrics_collector,
+    build_update_deduplicator,
+)
+from ugc_bot.infrastructure.user_cache import UserCache
 from ugc_bot.logging_setup import configure_logging
 from ugc_bot.startup_logging import log_startup_info
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True, slots=True)
+class _WebhookSettings:
+    """Config plus the values handle_webhook needs, derived once."""
+
+    config: AppConfig
+    secret: str | None
+    # Seconds to wait for an inline reply; None answers at once.
+    inline_reply_timeout: float | None
+
+
+def _webhook_settings(config: AppConfig) -> _WebhookSettings:
+    return _WebhookSettings(
+        config=config,
+        secret=config.webhook.webhook_secret.strip() or None,
+        inline_reply_timeout=(
+            config.webhook.webhook_inline_reply_timeout_seconds
+            if config.webhook.webhook_inline_reply
+            else None
+        ),
+    )
+
+
+_config_state = ConfigState(_webhook_settings, lambda: load_config())
+
+
 @asynccontextmanager
 async def _lifespan(app: FastAPI):
     """Initialize bot, dispatcher, storage and register webhook on startup."""
-    config = load_config()
+    app.state.config_state = _config_state
+    settings = _config_state.reload()
+    config = settings.config
     configure_logging(
         config.log.log_level,
         json_format=config.log.log_format.lower() == "json",
@@ -40,27 +79,70 @@ async def _lifespan(app: FastAPI):
         )
 
     storage = await create_storage(config)
-    dispatcher = build_dispatcher(config, storage=storage)
-    bot = Bot(token=config.bot.bot_token)
+    # Handlers load in the background; the queue holds updates meanwhile.
+    dispatcher = build_dispatcher(
+        config, include_routers=False, storage=storage
+    )
+    routers_loaded = asyncio.create_task(include_routers(dispatcher))
+    user_cache = dispatcher.get("user_cache")
+    if isinstance(user_cache, UserCache):
+        user_cache.start()
+    bot = Bot(
+        token=config.bot.bot_token, session=shared_bot_session(config.bot)
+    )
+    # Installed unconditionally so WEBHOOK_INLINE_REPLY can be flipped by
+    # a reload; it only defers calls while a reply is being awaited.
+    bot.session.middleware(DeferCallbackAnswer())
 
     webhook_url = f"{base_url}/webhook/telegram"
-    secret = config.webhook.webhook_secret.strip() or None
-    await bot.set_webhook(webhook_url, secret_token=secret)
+    await bot.set_webhook(webhook_url, secret_token=settings.secret)
     logger.info("Webhook registered", extra={"url": webhook_url})
 
+    deduplicator = build_update_deduplicator(config)
+    update_queue = UpdateQueue(
+        dispatcher,
+        bot,
+        workers=config.webhook.webhook_workers,
+        max_size=config.webhook.webhook_queue_size,
+        metrics_collector=build_metrics_collector(),
+        deduplicator=deduplicator,
+    )
+    update_queue.start(ready=routers_loaded)
+
+    registered_secret = settings.secret
+
+    async def _register_secret(reloaded: _WebhookSettings) -> None:
+        # Telegram keeps sending the old secret until told otherwise.
+        nonlocal registered_secret
+        if reloaded.secret != registered_secret:
+            await bot.set_webhook(webhook_url, secret_token=reloaded.secret)
+            registered_secret = reloaded.secret
+
+    _config_state.install_reload_signal(_register_secret)
+
     app.state.dispatcher = dispatcher
     app.state.bot = bot
     app.state.storage = storage
+    app.state.update_queue = update_queue
 
     yield
 
+    _config_state.remove_reload_signal()
+    await update_queue.drain(config.webhook.webhook_drain_timeout_seconds)
+    routers_loaded.cancel()
+    await asyncio.gather(routers_loaded, return_exceptions=True)
     await bot.delete_webhook()
+    await deduplicator.close()
+    if isinstance(user_cache, UserCache):
+        await user_cache.close()
     if hasattr(storage, "close"):
         await storage.close()
     await bot.session.close()
 
 
 app = FastAPI(title="Telegram Webhook", lifespan=_lifespan)
+# Loaded in the lifespan; SIGHUP reloads it (the webhook secret follows).
+app.state.config_state = _config_state
 
 
 @app.get("/health")
@@ -82,20 +164,26 @@ async def handle_webhook(
     x_telegram_bot_api_secret_token: str | None = Header(
         None, alias="X-Telegram-Bot-Api-Secret-Token"
     ),
-) -> dict[str, str]:
-    """Receive updates from Telegram. Process in background, return 200."""
-    config = load_config()
-    secret = config.webhook.webhook_secret.strip()
+) -> dict[str, Any]:
+    """Receive updates from Telegram and queue them for the workers.
+
+    Answers 503 when the queue is full; Telegram retries the update.
+    With WEBHOOK_INLINE_REPLY the handler's single Bot API call is
+    returned as the response when it finishes within the timeout.
+    """
+    config_state: ConfigState[_WebhookSettings] = request.app.state.config_state
+    settings = config_state.get()
+    secret = settings.secret
     if secret and x_telegram_bot_api_secret_token != secret:
         logger.warning("Invalid or missing webhook secret token")
         raise HTTPException(status_code=403, detail="Invalid secret token")
 
-    dispatcher: Dispatcher = request.app.state.dispatcher
     bot: Bot = request.app.state.bot
+    update_queue: UpdateQueue = request.app.state.update_queue
 
     try:
-        data = await request.json()
-    except Exception as exc:
+        data = json_codec.loads(await request.body())
+    except ValueError as exc:
         logger.warning("Invalid JSON in webhook request", exc_info=exc)
         raise HTTPException(status_code=400, detail="Invalid JSON") from exc
 
@@ -105,5 +193,26 @@ async def handle_webhook(
         logger.warning("Invalid Update payload", exc_info=exc)
         raise HTTPException(status_code=400, detail="Invalid update") from exc
 
-    asyncio.create_task(dispatcher.feed_update(bot, update))
+    reply: WebhookReply | None = None
+    if settings.inline_reply_timeout is not None:
+        reply = asyncio.get_running_loop().create_future()
+    try:
+        update_queue.submit(update, reply)
+    except UpdateQueueFull as exc:
+        raise HTTPException(
+            status_code=503,
+            detail="Update queue full",
+            headers={"Retry-After": "1"},
+        ) from exc
+    if reply is not None:
+        try:
+            # On timeout the future is cancelled and the worker sends
+            # the calls itself.
+            payload = await asyncio.wait_for(
+                reply, settings.inline_reply_timeout
+            )
+        except asyncio.TimeoutError:
+            payload = None
+        if payload is not None:
+            return payload
     return {"status": "ok"}
@@ -16,6 +16,7 @@ from .fakes import (
     FakeSession,
     FakeUser,
 )
+from .queries import assert_max_queries
 from .repositories import (
     create_in_memory_repositories,
     create_repository_fixtures,
@@ -40,6 +41,7 @@ __all__ = [
     "create_test_blogger_profile",
     "create_test_advertiser_profile",
     "create_test_interaction",
+    "assert_max_queries",
     "create_in_memory_repositories",
     "create_repository_fixtures",
     "build_profile_service",
@@ -0,0 +1,24 @@
+"""SQL statement budget assertions for N+1 regression tests."""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from ugc_bot.infrastructure.db.statement_stats import (
+    StatementStats,
+    track_statements,
+)
+
+
+@contextmanager
+def assert_max_queries(limit: int) -> Iterator[StatementStats]:
+    """Fail when the block issues more than ``limit`` SQL statements.
+
+    Counts statements on engines built by ``create_session_factory`` or
+    ``create_db_engine``, including those run by tasks the block spawns.
+    """
+
+    with track_statements("test") as stats:
+        yield stats
+    assert (
+        stats.statements <= limit
+    ), f"Expected at most {limit} SQL statements, got {stats.statements}"
@@ -39,12 +39,15 @@ def create_in_memory_repositories() -> InMemoryRepositories:
     Returns:
         Container with all repositories
     """
+    order_repo = InMemoryOrderRepository()
     return InMemoryRepositories(
         user_repo=InMemoryUserRepository(),
         blogger_repo=InMemoryBloggerProfileRepository(),
         advertiser_repo=InMemoryAdvertiserProfileRepository(),
-        order_repo=InMemoryOrderRepository(),
-        order_response_repo=InMemoryOrderResponseRepository(),
+        order_repo=order_repo,
+        order_response_repo=InMemoryOrderResponseRepository(
+            order_repo=order_repo
+        ),
         interaction_repo=InMemoryInteractionRepository(),
         payment_repo=InMemoryPaymentRepository(),
         pricing_repo=InMemoryContactPricingRepository(),
@@ -77,9 +80,11 @@ def order_repo() -> InMemoryOrderRepository:
 
 
 @pytest.fixture
-def order_response_repo() -> InMemoryOrderResponseRepository:
-    """Fixture for order response repository."""
-    return InMemoryOrderResponseRepository()
+def order_response_repo(
+    order_repo: InMemoryOrderRepository,
+) -> InMemoryOrderResponseRepository:
+    """Fixture for order response repository joined to ``order_repo``."""
+    return InMemoryOrderResponseRepository(order_repo=order_repo)
 
 
 @pytest.fixture
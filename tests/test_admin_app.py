@@ -1,5 +1,6 @@
 """Tests for admin app setup."""
 
+import json
 from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import UUID
@@ -13,6 +14,7 @@ from ugc_bot.admin.app import (
     EnumAwareAdmin,
     InteractionAdmin,
     OrderAdmin,
+    SlowQueryAdmin,
     UserAdmin,
     _get_order_moderation_deps,
     _get_services,
@@ -35,6 +37,7 @@ from ugc_bot.infrastructure.db.models import (
     OrderModel,
     UserModel,
 )
+from ugc_bot.infrastructure.user_cache import UserCache
 
 
 def _make_session_maker_mock(mock_session: MagicMock) -> MagicMock:
@@ -240,6 +243,24 @@ async def test_user_admin_update_model_status_change() -> None:
     assert mock_session.get.call_count == 2
 
 
+@pytest.mark.asyncio
+async def test_user_admin_delete_model_invalidates_user_cache() -> None:
+    """Deleting a user drops it from the bot's user cache."""
+
+    user_id = UUID("00000000-0000-0000-0000-000000000002")
+    user_cache = MagicMock(spec=UserCache)
+    admin = UserAdmin()
+    admin._container = MagicMock(user_cache=user_cache)  # type: ignore[attr-defined]
+
+    with patch.object(
+        UserAdmin.__bases__[0], "delete_model", new_callable=AsyncMock
+    ) as delete_model:
+        await admin.delete_model(MagicMock(), str(user_id))
+
+    delete_model.assert_awaited_once()
+    user_cache.invalidate.assert_awaited_once_with([user_id])
+
+
 @pytest.mark.asyncio
 async def test_user_admin_update_model_exception_in_logging_suppressed() -> (
     None
@@ -1176,3 +1197,66 @@ def test_enum_aware_admin_edit_form_data_handles_attribute_error() -> None:
     result = admin._edit_form_data(model, model_view)
 
     assert isinstance(result, dict)
+
+
+def test_admin_slow_queries_endpoint_requires_login(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """The slow query view is served only to a logged-in admin."""
+
+    monkeypatch.setenv("BOT_TOKEN", "token")
+    monkeypatch.setenv("ADMIN_USERNAME", "admin")
+    monkeypatch.setenv("ADMIN_PASSWORD", "password")
+    monkeypatch.setenv("ADMIN_SECRET", "secret")
+    monkeypatch.setenv("DATABASE_URL", "sqlite:///:memory:")
+    monkeypatch.setenv("USE_REDIS_STORAGE", "false")
+    monkeypatch.setenv("DB_SLOW_QUERY_THRESHOLD_MS", "0")
+
+    client = TestClient(create_admin_app())
+    anonymous = client.get("/admin/slow-queries", follow_redirects=False)
+    assert anonymous.status_code in (302, 303)
+
+    client.post(
+        "/admin/login", data={"username": "admin", "password": "password"}
+    )
+    response = client.get("/admin/slow-queries?limit=5")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["enabled"] is True
+    assert body["threshold_ms"] == 0
+    assert len(body["instances"]) == 1
+
+
+def test_admin_slow_queries_not_mounted_without_threshold(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Without DB_SLOW_QUERY_THRESHOLD_MS there is no slow query view."""
+
+    monkeypatch.setenv("BOT_TOKEN", "token")
+    monkeypatch.setenv("ADMIN_USERNAME", "admin")
+    monkeypatch.setenv("ADMIN_PASSWORD", "password")
+    monkeypatch.setenv("ADMIN_SECRET", "secret")
+    monkeypatch.setenv("DATABASE_URL", "sqlite:///:memory:")
+    monkeypatch.setenv("USE_REDIS_STORAGE", "false")
+    monkeypatch.delenv("DB_SLOW_QUERY_THRESHOLD_MS", raising=False)
+
+    client = TestClient(create_admin_app())
+    client.post(
+        "/admin/login", data={"username": "admin", "password": "password"}
+    )
+
+    assert client.get("/admin/slow-queries").status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_slow_query_view_without_recorder_reports_disabled() -> None:
+    """The view answers "disabled" when its container has no recorder."""
+
+    view = SlowQueryAdmin()
+    view._admin_ref = None  # no auth backend: skip the login check
+    view._container = MagicMock(slow_query_recorder=None)  # type: ignore[attr-defined]
+
+    response = await view.slow_queries(MagicMock())
+
+    assert json.loads(response.body) == {"enabled": False, "instances": {}}
@@ -54,7 +54,7 @@ def fake_tm():
         yield object()
 
     class FakeTM:
-        def transaction(self):
+        def transaction(self, readonly: bool = False):
             return _tx()
 
     return FakeTM()
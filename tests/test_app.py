@@ -1,16 +1,23 @@
 """Tests for application setup."""
 
+import subprocess
+import sys
 from datetime import datetime, timezone
 from uuid import UUID
 
 import pytest
-from aiogram import Router
+from aiogram import Dispatcher, Router
 
 from ugc_bot.app import (
+    ROUTER_MODULES,
     _json_dumps,
     build_dispatcher,
     create_storage,
+    include_routers,
+    load_routers,
 )
+from ugc_bot.bot.middleware.error_handler import ErrorHandlerMiddleware
+from ugc_bot.bot.middleware.unit_of_work import UnitOfWorkMiddleware
 from ugc_bot.config import AppConfig
 
 
@@ -50,6 +57,10 @@ def test_build_dispatcher_sets_services() -> None:
     assert dispatcher["offer_dispatch_service"] is not None
     assert dispatcher["offer_response_service"] is not None
     assert dispatcher["payment_service"] is not None
+    outer = [type(m) for m in dispatcher.update.outer_middleware]
+    assert outer.index(UnitOfWorkMiddleware) < outer.index(
+        ErrorHandlerMiddleware
+    )
 
 
 def test_build_dispatcher_includes_routers(
@@ -57,13 +68,8 @@ def test_build_dispatcher_includes_routers(
 ) -> None:
     """Include routers when enabled."""
 
-    monkeypatch.setattr("ugc_bot.app.start_router", Router())
-    monkeypatch.setattr("ugc_bot.app.blogger_router", Router())
-    monkeypatch.setattr("ugc_bot.app.advertiser_router", Router())
-    monkeypatch.setattr("ugc_bot.app.instagram_router", Router())
-    monkeypatch.setattr("ugc_bot.app.offer_response_router", Router())
-    monkeypatch.setattr("ugc_bot.app.order_router", Router())
-    monkeypatch.setattr("ugc_bot.app.payments_router", Router())
+    routers = [Router() for _ in ROUTER_MODULES]
+    monkeypatch.setattr("ugc_bot.app.load_routers", lambda: routers)
 
     dispatcher = build_dispatcher(
         AppConfig.model_validate(
@@ -77,7 +83,64 @@ def test_build_dispatcher_includes_routers(
         storage=None,
     )
 
-    assert dispatcher is not None
+    assert dispatcher.sub_routers == routers
+
+
+@pytest.mark.asyncio
+async def test_include_routers_attaches_loaded_routers(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """The background loader includes every router in the dispatcher."""
+
+    routers = [Router() for _ in ROUTER_MODULES]
+    monkeypatch.setattr("ugc_bot.app.load_routers", lambda: routers)
+    dispatcher = Dispatcher()
+
+    await include_routers(dispatcher)
+
+    assert dispatcher.sub_routers == routers
+
+
+def test_load_routers_returns_each_handler_router() -> None:
+    """Every listed handler module provides a router, in order."""
+
+    routers = load_routers()
+
+    assert len(routers) == len(ROUTER_MODULES)
+    assert all(isinstance(router, Router) for router in routers)
+
+
+@pytest.mark.timeout(120)
+def test_entry_points_do_not_import_handler_modules() -> None:
+    """Importing entry points leaves handler routers to build_dispatcher."""
+
+    entry_points = [
+        "ugc_bot.app",
+        "ugc_bot.telegram_webhook_app",
+        "ugc_bot.instagram_webhook_app",
+        "ugc_bot.outbox_processor",
+        "ugc_bot.kafka_consumer",
+        "ugc_bot.feedback_scheduler",
+        "ugc_bot.role_reminder_scheduler",
+    ]
+    code = (
+        "import importlib, sys\n"
+        f"for name in {entry_points!r}:\n"
+        "    importlib.import_module(name)\n"
+        "print(','.join(m for m in sys.modules "
+        "if m.startswith('ugc_bot.bot.handlers.')))"
+    )
+
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    imported = set(filter(None, result.stdout.strip().split(",")))
+    handlers = {f"ugc_bot.bot.handlers.{name}" for name in ROUTER_MODULES}
+    assert not imported & handlers
 
 
 def test_json_dumps_serializes_uuid_and_datetime() -> None:
@@ -18,6 +18,7 @@ def test_app_config_accepts_nested_dict() -> None:
     nested = {
         "bot": {"BOT_TOKEN": "token"},
         "log": {"LOG_LEVEL": "INFO", "LOG_FORMAT": "text"},
+        "metrics": {"METRICS_PORT": "0"},
         "db": {"DATABASE_URL": "postgresql://localhost/db"},
         "admin": {
             "ADMIN_USERNAME": "a",
@@ -83,3 +84,24 @@ def test_bot_config_empty_token_raises() -> None:
 
     with pytest.raises(ValueError, match="BOT_TOKEN is required"):
         BotConfig.model_validate({"BOT_TOKEN": "   "})
+
+
+def test_db_config_driver_settings() -> None:
+    """DB_DRIVER is normalized and limited to supported async drivers."""
+    config = AppConfig.model_validate(
+        {
+            "BOT_TOKEN": "t",
+            "DATABASE_URL": "postgresql://db",
+            "DB_DRIVER": " AsyncPG ",
+            "DB_STATEMENT_CACHE_SIZE": 250,
+            "DB_PGBOUNCER": True,
+        }
+    )
+    assert config.db.db_driver == "asyncpg"
+    assert config.db.statement_cache_size == 250
+    assert config.db.pgbouncer is True
+
+    with pytest.raises(ValueError, match="DB_DRIVER must be"):
+        AppConfig.model_validate(
+            {"BOT_TOKEN": "t", "DATABASE_URL": "db", "DB_DRIVER": "pg8000"}
+        )
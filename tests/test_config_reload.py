@@ -0,0 +1,133 @@
+"""Tests for config loaded once and reloaded on SIGHUP."""
+
+import asyncio
+import os
+import signal
+
+import pytest
+from pydantic import ValidationError
+
+from ugc_bot.config import AppConfig
+from ugc_bot.config_reload import ConfigState
+
+
+def _config(secret: str) -> AppConfig:
+    return AppConfig.model_validate(
+        {
+            "BOT_TOKEN": "test_token",
+            "DATABASE_URL": "sqlite:///:memory:",
+            "WEBHOOK_SECRET": secret,
+        }
+    )
+
+
+class Loader:
+    """Config loader double returning queued configs or errors."""
+
+    def __init__(self, *results: AppConfig | Exception) -> None:
+        self.results = list(results)
+        self.calls = 0
+
+    def __call__(self) -> AppConfig:
+        self.calls += 1
+        result = self.results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+def _invalid() -> ValidationError:
+    try:
+        AppConfig.model_validate({"DB_POOL_SIZE": "many"})
+    except ValidationError as exc:
+        return exc
+    raise AssertionError("config unexpectedly valid")
+
+
+def _secret(config: AppConfig) -> str:
+    return config.webhook.webhook_secret
+
+
+def test_get_loads_once() -> None:
+    """Settings are derived on first use and then reused."""
+
+    loader = Loader(_config("one"))
+    state = ConfigState(_secret, loader)
+
+    assert state.get() == "one"
+    assert state.get() == "one"
+    assert loader.calls == 1
+
+
+def test_clear_loads_again() -> None:
+    """After clear() the next get() reads the config anew."""
+
+    loader = Loader(_config("one"), _config("two"))
+    state = ConfigState(_secret, loader)
+    state.get()
+
+    state.clear()
+
+    assert state.get() == "two"
+    assert loader.calls == 2
+
+
+def test_reload_replaces_and_keeps_current_when_invalid() -> None:
+    """A valid reload swaps settings; an invalid one is ignored."""
+
+    state = ConfigState(
+        _secret, Loader(_config("one"), _config("two"), _invalid())
+    )
+    state.get()
+
+    assert state.reload() == "two"
+    assert state.reload() == "two"
+    assert state.get() == "two"
+
+
+def test_reload_raises_without_previous_config() -> None:
+    """The first load surfaces config errors."""
+
+    state = ConfigState(_secret, Loader(_invalid()))
+
+    with pytest.raises(ValidationError):
+        state.reload()
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGHUP"), reason="needs SIGHUP")
+@pytest.mark.asyncio
+async def test_sighup_reloads_and_runs_callback() -> None:
+    """SIGHUP reloads the config and hands it to the callback."""
+
+    state = ConfigState(_secret, Loader(_config("one"), _config("two")))
+    state.get()
+    reloaded: list[str] = []
+
+    async def _on_reload(secret: str) -> None:
+        reloaded.append(secret)
+
+    assert state.install_reload_signal(_on_reload)
+    try:
+        os.kill(os.getpid(), signal.SIGHUP)
+        for _ in range(100):
+            if reloaded:
+                break
+            await asyncio.sleep(0.01)
+    finally:
+        state.remove_reload_signal()
+
+    assert reloaded == ["two"]
+    assert state.get() == "two"
+
+
+def test_reload_signal_unsupported(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Without SIGHUP or a running loop the handler is not installed."""
+
+    state = ConfigState(_secret, Loader(_config("one")))
+
+    assert not state.install_reload_signal()
+    state.remove_reload_signal()
+
+    monkeypatch.delattr(signal, "SIGHUP", raising=False)
+    assert not state.install_reload_signal()
+    state.remove_reload_signal()
@@ -1,6 +1,7 @@
 """Tests for dependency container error paths."""
 
 import pytest
+from sqlalchemy import text
 
 from ugc_bot.config import AppConfig
 from ugc_bot.container import Container
@@ -134,6 +135,8 @@ def test_container_build_instagram_api_client_with_token() -> None:
     container = Container(config)
     client = container.build_instagram_api_client()
     assert client is not None
+    assert container.build_instagram_api_client() is client
+    assert client._usernames._ttl == 3600.0
 
 
 def test_container_build_instagram_api_client_without_token() -> None:
@@ -186,3 +189,125 @@ def test_container_build_bot_services_requires_database_url() -> None:
         ValueError, match="DATABASE_URL is required for bot services\\."
     ):
         container.build_bot_services()
+
+
+def test_container_wires_read_replica_when_configured() -> None:
+    """DATABASE_REPLICA_URL gives the transaction manager a replica."""
+
+    config = AppConfig.model_validate(
+        {
+            "BOT_TOKEN": "test_token",
+            "DATABASE_URL": "sqlite:///:memory:",
+            "DATABASE_REPLICA_URL": "sqlite:///:memory:",
+            "DB_REPLICA_MAX_LAG_SECONDS": 2.5,
+        }
+    )
+    container = Container(config)
+    manager = container.transaction_manager
+
+    assert manager is not None
+    assert manager._replica_session_factory is not None
+    assert manager._replica_max_lag_seconds == 2.5
+
+    plain = Container(_config("sqlite:///:memory:")).transaction_manager
+    assert plain is not None
+    assert plain._replica_session_factory is None
+
+
+@pytest.mark.asyncio
+async def test_container_close_disposes_engines(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    """close() releases pooled connections of primary and replica."""
+
+    config = AppConfig.model_validate(
+        {
+            "BOT_TOKEN": "test_token",
+            "DATABASE_URL": f"sqlite:///{tmp_path / 'primary.db'}",
+            "DATABASE_REPLICA_URL": f"sqlite:///{tmp_path / 'replica.db'}",
+        }
+    )
+    container = Container(config)
+    engines = [
+        container.session_factory.kw["bind"],
+        container._replica_session_factory.kw["bind"],
+    ]
+    for engine in engines:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+        assert engine.sync_engine.pool.checkedin() == 1
+
+    await container.close()
+
+    assert [e.sync_engine.pool.checkedin() for e in engines] == [0, 0]
+
+
+@pytest.mark.asyncio
+async def test_container_close_closes_instagram_api_client() -> None:
+    """close() closes the cached Instagram Graph API client."""
+
+    config = AppConfig.model_validate(
+        {
+            "BOT_TOKEN": "test_token",
+            "DATABASE_URL": "sqlite:///:memory:",
+            "INSTAGRAM_ACCESS_TOKEN": "test_token",
+        }
+    )
+    container = Container(config)
+    client = container.build_instagram_api_client()
+    assert client is not None
+    http_client = client._get_client()
+
+    await container.close()
+
+    assert http_client.is_closed
+
+
+@pytest.mark.asyncio
+async def test_container_shares_one_slow_query_recorder(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    """One recorder instruments every engine and is closed with them."""
+
+    config = AppConfig.model_validate(
+        {
+            "BOT_TOKEN": "test_token",
+            "DATABASE_URL": f"sqlite:///{tmp_path / 'primary.db'}",
+            "DATABASE_REPLICA_URL": f"sqlite:///{tmp_path / 'replica.db'}",
+            "DB_SLOW_QUERY_THRESHOLD_MS": "0",
+        }
+    )
+    container = Container(config)
+    recorder = container.slow_query_recorder
+    assert recorder is not None
+    assert Container(config).slow_query_recorder is not recorder
+
+    for factory in (
+        container.session_factory,
+        container._replica_session_factory,
+    ):
+        async with factory.kw["bind"].connect() as conn:
+            await conn.execute(text("SELECT 1"))
+    with container.get_admin_engine().connect() as conn:
+        conn.execute(text("SELECT 1"))
+
+    assert recorder.top()[0].count == 3
+    await container.close()
+
+
+def test_container_without_slow_query_threshold_has_no_recorder() -> None:
+    """Slow query recording stays off unless a threshold is set."""
+
+    assert Container(_config("sqlite:///:memory:")).slow_query_recorder is None
+
+
+def test_container_user_cache_can_be_disabled() -> None:
+    """USER_CACHE_ENABLED=false leaves the container without a user cache."""
+
+    config = AppConfig.model_validate(
+        {
+            "BOT_TOKEN": "test_token",
+            "DATABASE_URL": "sqlite:///:memory:",
+            "KAFKA_ENABLED": False,
+            "USER_CACHE_ENABLED": False,
+        }
+    )
+
+    assert Container(config).user_cache is None
+    assert Container(_config("sqlite:///:memory:")).user_cache is not None
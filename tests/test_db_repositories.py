@@ -100,6 +100,13 @@ class FakeResult:
     def scalars(self):  # type: ignore[no-untyped-def]
         return FakeScalarResult(self._value)
 
+    def one_or_none(self):  # type: ignore[no-untyped-def]
+        """Row for column selects; models stand in for rows."""
+        return self._value
+
+    def all(self):  # type: ignore[no-untyped-def]
+        return FakeScalarResult(self._value).all()
+
 
 class FakeSession:
     """Fake session supporting async context manager."""
@@ -803,6 +810,65 @@ async def test_user_repository_list_pending_role_reminders() -> None:
     assert users[0].username == "alice"
 
 
+@pytest.mark.asyncio
+async def test_user_repository_list_pending_role_reminders_page() -> None:
+    """List one keyset page of users pending role reminder."""
+
+    user_model = UserModel(
+        user_id=UUID("00000000-0000-0000-0000-000000000162"),
+        external_id="162",
+        messenger_type=MessengerType.TELEGRAM,
+        username="bob",
+        status=UserStatus.ACTIVE,
+        issue_count=0,
+        created_at=datetime.now(timezone.utc),
+    )
+    repo = SqlAlchemyUserRepository(
+        session_factory=_session_factory([user_model])
+    )
+    users = list(
+        await repo.list_pending_role_reminders(
+            datetime.now(timezone.utc),
+            session=_repo_session(repo),
+            limit=10,
+            after_user_id=UUID("00000000-0000-0000-0000-000000000001"),
+        )
+    )
+    assert [user.username for user in users] == ["bob"]
+
+
+@pytest.mark.asyncio
+async def test_user_repository_update_last_role_reminder_at_many() -> None:
+    """Bulk update issues one UPDATE and skips empty input."""
+
+    class RecordingSession(FakeSession):
+        def __init__(self) -> None:
+            super().__init__(None)
+            self.statements: list[object] = []
+
+        async def execute(self, stmt, *_args, **_kwargs):  # type: ignore[no-untyped-def]
+            self.statements.append(stmt)
+            return FakeResult(None)
+
+    session = RecordingSession()
+    repo = SqlAlchemyUserRepository(session_factory=_session_factory(None))
+    now = datetime.now(timezone.utc)
+
+    await repo.update_last_role_reminder_at_many([], now, session=session)
+    assert session.statements == []
+
+    await repo.update_last_role_reminder_at_many(
+        [
+            UUID("00000000-0000-0000-0000-000000000163"),
+            UUID("00000000-0000-0000-0000-000000000164"),
+        ],
+        now,
+        session=session,
+    )
+    assert len(session.statements) == 1
+    assert "UPDATE users" in str(session.statements[0])
+
+
 @pytest.mark.asyncio
 async def test_user_repository_list_admins() -> None:
     """List admin users."""
@@ -1319,6 +1385,111 @@ async def test_interaction_repository_update_next_check_at() -> None:
     await repo.update_next_check_at(interaction_id, next_check, session=session)
 
 
+@pytest.mark.asyncio
+async def test_interaction_repository_update_fields() -> None:
+    """update_fields writes only given columns and returns the row."""
+
+    interaction_id = UUID("00000000-0000-0000-0000-000000000212")
+    next_check = datetime.now(timezone.utc) + timedelta(hours=1)
+    model = InteractionModel(
+        interaction_id=interaction_id,
+        order_id=UUID("00000000-0000-0000-0000-000000000213"),
+        blogger_id=UUID("00000000-0000-0000-0000-000000000214"),
+        advertiser_id=UUID("00000000-0000-0000-0000-000000000215"),
+        status=InteractionStatus.PENDING,
+        from_advertiser=None,
+        from_blogger=None,
+        postpone_count=0,
+        next_check_at=next_check,
+        created_at=datetime.now(timezone.utc),
+        updated_at=datetime.now(timezone.utc),
+    )
+
+    class RecordingSession(FakeSession):
+        def __init__(self) -> None:
+            super().__init__(model)
+            self.statements: list[object] = []
+
+        async def execute(self, stmt, *_args, **_kwargs):  # type: ignore[no-untyped-def]
+            self.statements.append(stmt)
+            return FakeResult(model)
+
+    session = RecordingSession()
+    repo = SqlAlchemyInteractionRepository(
+        session_factory=_session_factory(None)
+    )
+    updated = await repo.update_fields(
+        interaction_id, session=session, next_check_at=next_check
+    )
+
+    assert updated is not None
+    assert updated.next_check_at == next_check
+    assert len(session.statements) == 1
+    sql = str(session.statements[0])
+    assert sql.startswith("UPDATE interactions SET next_check_at=")
+    assert "status" not in sql.split("WHERE")[0]
+    assert "RETURNING" in sql
+
+
+@pytest.mark.asyncio
+async def test_order_repository_update_fields_missing() -> None:
+    """update_fields returns None when the order does not exist."""
+
+    repo = SqlAlchemyOrderRepository(session_factory=_session_factory(None))
+    updated = await repo.update_fields(
+        UUID("00000000-0000-0000-0000-000000000216"),
+        session=_repo_session(repo),
+        status=OrderStatus.ACTIVE,
+    )
+    assert updated is None
+
+
+@pytest.mark.asyncio
+async def test_blogger_profile_repository_update_fields() -> None:
+    """update_fields updates the profile; no changes is a plain read."""
+
+    model = BloggerProfileModel(
+        user_id=UUID("00000000-0000-0000-0000-000000000217"),
+        instagram_url="https://instagram.com/test_update",
+        confirmed=True,
+        city="Moscow",
+        topics={"selected": ["fitness"]},
+        audience_gender=AudienceGender.ALL,
+        audience_age_min=18,
+        audience_age_max=35,
+        audience_geo="Moscow",
+        price=1000.0,
+        barter=False,
+        work_format=WorkFormat.UGC_ONLY,
+        updated_at=datetime.now(timezone.utc),
+    )
+
+    class RecordingSession(FakeSession):
+        def __init__(self) -> None:
+            super().__init__(model)
+            self.statements: list[object] = []
+
+        async def execute(self, stmt, *_args, **_kwargs):  # type: ignore[no-untyped-def]
+            self.statements.append(stmt)
+            return FakeResult(model)
+
+    session = RecordingSession()
+    repo = SqlAlchemyBloggerProfileRepository(
+        session_factory=_session_factory(None)
+    )
+    updated = await repo.update_fields(
+        model.user_id, session=session, confirmed=True
+    )
+    unchanged = await repo.update_fields(model.user_id, session=session)
+
+    assert updated is not None and updated.confirmed is True
+    assert unchanged == updated
+    assert str(session.statements[0]).startswith(
+        "UPDATE blogger_profiles SET confirmed="
+    )
+    assert str(session.statements[1]).startswith("SELECT")
+
+
 @pytest.mark.asyncio
 async def test_complaint_repository_list_by_reporter() -> None:
     """list_by_reporter returns complaints by reporter."""
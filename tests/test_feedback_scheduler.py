@@ -1,6 +1,7 @@
 """Tests for feedback scheduler."""
 
 import logging
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta, timezone
 from unittest.mock import Mock
 from uuid import UUID
@@ -31,6 +32,7 @@ from ugc_bot.domain.enums import (
 )
 from ugc_bot.feedback_scheduler import (
     _feedback_keyboard,
+    _iter_due_interactions,
     main,
     run_loop,
     run_once,
@@ -64,6 +66,27 @@ def test_feedback_keyboard() -> None:
     assert markup_blog.inline_keyboard[0][0].text == "✅ Всё прошло нормально"
 
 
+@pytest.mark.asyncio
+async def test_due_scan_reads_primary() -> None:
+    """The scan drives sends and updates, so it never uses the replica."""
+
+    readonly_flags: list[bool] = []
+
+    class _RecordingTM:
+        @asynccontextmanager
+        async def transaction(self, readonly: bool = False):
+            readonly_flags.append(readonly)
+            yield object()
+
+    await _iter_due_interactions(
+        InMemoryInteractionRepository(),
+        datetime.now(timezone.utc),
+        _RecordingTM(),
+    )
+
+    assert readonly_flags == [False]
+
+
 @pytest.mark.asyncio
 async def test_run_once_sends_feedback_requests(fake_tm) -> None:
     """Send feedback to advertiser and blogger."""
@@ -5,18 +5,17 @@ from uuid import uuid4
 
 import pytest
 
-from ugc_bot.bot.handlers.keyboards import (
-    RESUME_DRAFT_BUTTON_TEXT,
-    START_OVER_BUTTON_TEXT,
-    draft_choice_keyboard,
-)
 from ugc_bot.bot.handlers.utils import (
     RateLimiter,
     get_user_and_ensure_allowed,
     get_user_and_ensure_allowed_callback,
     handle_draft_choice,
     parse_user_id_from_state,
-    send_with_retry,
+)
+from ugc_bot.bot.keyboards import (
+    RESUME_DRAFT_BUTTON_TEXT,
+    START_OVER_BUTTON_TEXT,
+    draft_choice_keyboard,
 )
 from ugc_bot.domain.entities import User
 from ugc_bot.domain.enums import MessengerType, UserStatus
@@ -31,49 +30,6 @@ def test_rate_limiter_allows_within_limit() -> None:
     assert limiter.allow("key") is False
 
 
-@pytest.mark.asyncio
-async def test_send_with_retry_success() -> None:
-    """Return True on successful send."""
-
-    class DummyBot:
-        def __init__(self) -> None:
-            self.calls = 0
-
-        async def send_message(self, chat_id: int, text: str, **kwargs) -> None:  # type: ignore[no-untyped-def]
-            self.calls += 1
-
-    bot = DummyBot()
-    ok = await send_with_retry(
-        bot,
-        chat_id=1,
-        text="hi",
-        retries=2,
-        delay_seconds=0.0,
-        logger=__import__("logging").getLogger("test"),
-    )
-    assert ok is True
-    assert bot.calls == 1
-
-
-@pytest.mark.asyncio
-async def test_send_with_retry_failure() -> None:
-    """Return False after retries exhausted."""
-
-    class DummyBot:
-        async def send_message(self, chat_id: int, text: str, **kwargs) -> None:  # type: ignore[no-untyped-def]
-            raise RuntimeError("fail")
-
-    ok = await send_with_retry(
-        DummyBot(),
-        chat_id=1,
-        text="hi",
-        retries=2,
-        delay_seconds=0.0,
-        logger=__import__("logging").getLogger("test"),
-    )
-    assert ok is False
-
-
 def test_parse_user_id_from_state_missing() -> None:
     """Return None when key is missing."""
     assert parse_user_id_from_state({}, key="user_id") is None
@@ -29,7 +29,7 @@ from ugc_bot.bot.handlers.advertiser_registration import (
     handle_phone,
     handle_site_link,
 )
-from ugc_bot.bot.handlers.keyboards import (
+from ugc_bot.bot.keyboards import (
     CONFIRM_AGREEMENT_BUTTON_TEXT,
     DRAFT_QUESTION_TEXT,
     RESUME_DRAFT_BUTTON_TEXT,
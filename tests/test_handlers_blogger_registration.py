@@ -40,7 +40,7 @@ from ugc_bot.bot.handlers.blogger_registration import (
     handle_work_format,
     start_registration_button,
 )
-from ugc_bot.bot.handlers.keyboards import (
+from ugc_bot.bot.keyboards import (
     CONFIRM_AGREEMENT_BUTTON_TEXT,
     CONFIRM_INSTAGRAM_BUTTON_TEXT,
     CREATE_PROFILE_BUTTON_TEXT,
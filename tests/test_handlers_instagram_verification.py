@@ -186,7 +186,7 @@ async def test_start_verification_via_button(
     from datetime import datetime, timezone
     from uuid import UUID
 
-    from ugc_bot.bot.handlers.keyboards import CONFIRM_INSTAGRAM_BUTTON_TEXT
+    from ugc_bot.bot.keyboards import CONFIRM_INSTAGRAM_BUTTON_TEXT
     from ugc_bot.domain.entities import BloggerProfile
     from ugc_bot.domain.enums import AudienceGender, WorkFormat
 
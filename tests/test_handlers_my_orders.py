@@ -1,6 +1,6 @@
 """Tests for my orders handler."""
 
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from uuid import UUID, uuid4
 
 import pytest
@@ -17,15 +17,17 @@ from ugc_bot.application.services.offer_response_service import (
     OfferResponseService,
 )
 from ugc_bot.application.services.user_role_service import UserRoleService
-from ugc_bot.bot.handlers.keyboards import MY_ORDERS_BUTTON_TEXT
 from ugc_bot.bot.handlers.my_orders import (
+    _cursor,
     _format_date,
     _format_order_type,
     _format_price,
     _format_price_and_barter,
+    _parse_page_data,
     paginate_orders,
     show_my_orders,
 )
+from ugc_bot.bot.keyboards import MY_ORDERS_BUTTON_TEXT
 from ugc_bot.domain.entities import Order, OrderResponse
 from ugc_bot.domain.enums import MessengerType, OrderStatus, OrderType
 
@@ -960,6 +962,7 @@ async def test_my_orders_pagination(
         username="adv",
     )
     await create_test_advertiser_profile(advertiser_repo, user.user_id)
+    base = datetime(2026, 1, 1, tzinfo=timezone.utc)
     for idx in range(6):
         await create_test_order(
             order_repo,
@@ -968,27 +971,112 @@ async def test_my_orders_pagination(
             price=1000.0 + idx,
             bloggers_needed=3,
             status=OrderStatus.NEW,
+            created_at=base + timedelta(minutes=idx),
+        )
+
+    async def press(data: str) -> tuple[str, dict[str, str]]:
+        message = FakeMessage(text=MY_ORDERS_BUTTON_TEXT, user=FakeUser(1))
+        callback = FakeCallback(data=data, user=FakeUser(1), message=message)
+        await paginate_orders(
+            callback,
+            user_service,
+            profile_service,
+            order_service,
+            offer_response_service,
+        )
+        text, keyboard = message.answers[-1]
+        buttons = {
+            button.text: button.callback_data
+            for row in keyboard.inline_keyboard
+            for button in row
+        }
+        return text, buttons
+
+    text, buttons = await press("my_orders:1")
+    assert "страница 1/2" in text
+    assert "№ 6" in text and "№ 2" in text
+
+    text, buttons = await press(buttons["Вперед ➡️"])
+    assert "страница 2/2" in text
+    assert "№ 1" in text and "№ 2" not in text
+    assert "Вперед ➡️" not in buttons
+
+    text, _ = await press(buttons["⬅️ Назад"])
+    assert "страница 1/2" in text
+    assert "№ 6" in text and "№ 2" in text
+
+    # Buttons sent before keyset cursors existed reopen the first page.
+    text, _ = await press("my_orders:2")
+    assert "страница 1/2" in text
+    text, _ = await press("my_orders:2:b1767225600000000")
+    assert "страница 1/2" in text
+
+
+@pytest.mark.asyncio
+async def test_my_orders_pagination_with_equal_timestamps(
+    fake_tm: object,
+    user_repo,
+    advertiser_repo,
+    order_repo,
+    blogger_repo,
+    order_response_repo,
+) -> None:
+    """Orders created at the same instant are paged by id, none is lost."""
+
+    user_service = UserRoleService(user_repo=user_repo)
+    profile_service = build_profile_service(
+        user_repo, blogger_repo, advertiser_repo
+    )
+    order_service = build_order_service(
+        user_repo, advertiser_repo, order_repo, fake_tm
+    )
+    offer_response_service = OfferResponseService(
+        order_repo=order_repo,
+        response_repo=order_response_repo,
+        transaction_manager=fake_tm,
+    )
+
+    user = await create_test_user(
+        user_repo,
+        user_id=UUID("00000000-0000-0000-0000-000000000920"),
+        external_id="1",
+        username="adv",
+    )
+    await create_test_advertiser_profile(advertiser_repo, user.user_id)
+    created_at = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    for idx in range(6):
+        await create_test_order(
+            order_repo,
+            user.user_id,
+            order_id=UUID(f"00000000-0000-0000-0000-00000000092{idx}"),
+            price=1000.0 + idx,
+            bloggers_needed=3,
+            status=OrderStatus.NEW,
+            created_at=created_at,
         )
 
     message = FakeMessage(text=MY_ORDERS_BUTTON_TEXT, user=FakeUser(1))
-    callback = FakeCallback(
-        data="my_orders:2", user=FakeUser(1), message=message
+    await paginate_orders(
+        FakeCallback(data="my_orders:1", user=FakeUser(1), message=message),
+        user_service,
+        profile_service,
+        order_service,
+        offer_response_service,
     )
+    forward = message.answers[-1][1].inline_keyboard[0][0].callback_data
+    assert len(forward.encode()) <= 64
     await paginate_orders(
-        callback,
+        FakeCallback(data=forward, user=FakeUser(1), message=message),
         user_service,
         profile_service,
         order_service,
         offer_response_service,
     )
 
-    assert message.answers
-    answer_text = (
-        message.answers[-1]
-        if isinstance(message.answers[-1], str)
-        else message.answers[-1][0]
-    )
-    assert "страница 2/2" in answer_text
+    text = message.answers[-1][0]
+    assert "страница 2/2" in text
+    assert "№ 1\n" in text and "Стоимость 1 UGC: 1 000 ₽" in text
+    assert "№ 2\n" not in text
 
 
 @pytest.mark.asyncio
@@ -1152,6 +1240,160 @@ async def test_paginate_orders_blogger(
     assert "Ссылка на проект:" in answer_text
 
 
+def test_cursor_round_trip() -> None:
+    """A cursor parses back to its position; naive times count as UTC."""
+
+    row_id = uuid4()
+    moment = datetime(2026, 1, 2, 3, 4, 5, 678901)
+
+    before = _cursor("b", (moment, row_id))
+    after = _cursor("a", (moment.replace(tzinfo=timezone.utc), row_id))
+
+    aware = moment.replace(tzinfo=timezone.utc)
+    assert _parse_page_data(f"3:{before}") == (3, (aware, row_id), None)
+    assert _parse_page_data(f"2:{after}") == (2, None, (aware, row_id))
+    assert _parse_page_data(f"2:x{before[1:]}") == (1, None, None)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("prefix", ["my_orders", "my_orders_blogger"])
+async def test_paginate_orders_stale_cursor_opens_first_page(
+    prefix: str,
+    fake_tm: object,
+    user_repo,
+    advertiser_repo,
+    order_repo,
+    blogger_repo,
+    order_response_repo,
+) -> None:
+    """A cursor past every row (e.g. rows deleted) falls back to page 1."""
+
+    user_service = UserRoleService(user_repo=user_repo)
+    profile_service = build_profile_service(
+        user_repo, blogger_repo, advertiser_repo
+    )
+    order_service = build_order_service(
+        user_repo, advertiser_repo, order_repo, fake_tm
+    )
+    offer_response_service = OfferResponseService(
+        order_repo=order_repo,
+        response_repo=order_response_repo,
+        transaction_manager=fake_tm,
+    )
+    user = await create_test_user(
+        user_repo, user_id=uuid4(), external_id="1", username="both"
+    )
+    await create_test_advertiser_profile(advertiser_repo, user.user_id)
+    await create_test_blogger_profile(blogger_repo, user.user_id)
+    order = await create_test_order(
+        order_repo,
+        user.user_id,
+        order_id=uuid4(),
+        price=500.0,
+        bloggers_needed=1,
+        status=OrderStatus.ACTIVE,
+    )
+    await order_response_repo.save(
+        OrderResponse(
+            response_id=uuid4(),
+            order_id=order.order_id,
+            blogger_id=user.user_id,
+            responded_at=datetime.now(timezone.utc),
+        )
+    )
+    stale = _cursor("b", (datetime(2000, 1, 1, tzinfo=timezone.utc), uuid4()))
+
+    message = FakeMessage(text=MY_ORDERS_BUTTON_TEXT, user=FakeUser(1))
+    await paginate_orders(
+        FakeCallback(
+            data=f"{prefix}:4:{stale}", user=FakeUser(1), message=message
+        ),
+        user_service,
+        profile_service,
+        order_service,
+        offer_response_service,
+    )
+
+    text = message.answers[-1][0]
+    assert "Стоимость 1 UGC: 500 ₽" in text
+    assert "страница 4" not in text
+
+
+@pytest.mark.asyncio
+async def test_paginate_orders_blogger_pages_forward(
+    fake_tm: object,
+    user_repo,
+    advertiser_repo,
+    order_repo,
+    blogger_repo,
+    order_response_repo,
+) -> None:
+    """A blogger with more responses than a page gets a forward button."""
+
+    user_service = UserRoleService(user_repo=user_repo)
+    profile_service = build_profile_service(
+        user_repo, blogger_repo, advertiser_repo
+    )
+    order_service = build_order_service(
+        user_repo, advertiser_repo, order_repo, fake_tm
+    )
+    offer_response_service = OfferResponseService(
+        order_repo=order_repo,
+        response_repo=order_response_repo,
+        transaction_manager=fake_tm,
+    )
+    adv_user = await create_test_user(
+        user_repo, user_id=uuid4(), external_id="10", username="adv"
+    )
+    await create_test_advertiser_profile(advertiser_repo, adv_user.user_id)
+    blogger_user = await create_test_user(
+        user_repo, user_id=uuid4(), external_id="11", username="blogger"
+    )
+    await create_test_blogger_profile(blogger_repo, blogger_user.user_id)
+    responded_at = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    for idx in range(6):
+        order = await create_test_order(
+            order_repo,
+            adv_user.user_id,
+            order_id=uuid4(),
+            price=1000.0 + idx,
+            bloggers_needed=2,
+            status=OrderStatus.ACTIVE,
+        )
+        await order_response_repo.save(
+            OrderResponse(
+                response_id=uuid4(),
+                order_id=order.order_id,
+                blogger_id=blogger_user.user_id,
+                responded_at=responded_at + timedelta(minutes=idx),
+            )
+        )
+
+    message = FakeMessage(text=MY_ORDERS_BUTTON_TEXT, user=FakeUser(11))
+    await paginate_orders(
+        FakeCallback(
+            data="my_orders_blogger:1", user=FakeUser(11), message=message
+        ),
+        user_service,
+        profile_service,
+        order_service,
+        offer_response_service,
+    )
+    forward = message.answers[-1][1].inline_keyboard[-1][-1].callback_data
+    assert forward.startswith("my_orders_blogger:2:")
+    await paginate_orders(
+        FakeCallback(data=forward, user=FakeUser(11), message=message),
+        user_service,
+        profile_service,
+        order_service,
+        offer_response_service,
+    )
+
+    text = message.answers[-1][0]
+    assert "страница 2/2" in text
+    assert "Стоимость 1 UGC: 1 000 ₽" in text
+
+
 def test_format_price() -> None:
     """_format_price uses space as thousands separator and ruble sign."""
     assert _format_price(500) == "500 ₽"
@@ -1306,21 +1548,11 @@ async def test_my_orders_shows_active_status_and_matched_count(
         bloggers_needed=10,
         status=OrderStatus.ACTIVE,
     )
-    await order_response_repo.save(
-        OrderResponse(
-            response_id=uuid4(),
-            order_id=order.order_id,
-            blogger_id=blogger1.user_id,
-            responded_at=datetime.now(timezone.utc),
-        )
+    await offer_response_service.respond_and_finalize(
+        order.order_id, blogger1.user_id
     )
-    await order_response_repo.save(
-        OrderResponse(
-            response_id=uuid4(),
-            order_id=order.order_id,
-            blogger_id=blogger2.user_id,
-            responded_at=datetime.now(timezone.utc),
-        )
+    await offer_response_service.respond_and_finalize(
+        order.order_id, blogger2.user_id
     )
 
     message = FakeMessage(
@@ -1385,8 +1617,7 @@ async def test_my_orders_shows_completed_status_and_completion_date(
         order_id=uuid4(),
         price=2000.0,
         bloggers_needed=3,
-        status=OrderStatus.CLOSED,
-        completed_at=completion_dt,
+        status=OrderStatus.ACTIVE,
     )
     for i in range(3):
         blogger = await create_test_user(
@@ -1395,14 +1626,10 @@ async def test_my_orders_shows_completed_status_and_completion_date(
             external_id=f"b{i}",
             username=f"blogger{i}",
         )
-        await order_response_repo.save(
-            OrderResponse(
-                response_id=uuid4(),
-                order_id=order.order_id,
-                blogger_id=blogger.user_id,
-                responded_at=datetime.now(timezone.utc),
-            )
+        await offer_response_service.respond_and_finalize(
+            order.order_id, blogger.user_id
         )
+    await order_repo.update_fields(order.order_id, completed_at=completion_dt)
 
     message = FakeMessage(text=MY_ORDERS_BUTTON_TEXT, user=FakeUser("adv_done"))
     await show_my_orders(
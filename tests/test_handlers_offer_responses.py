@@ -546,6 +546,7 @@ async def test_offer_response_handler_limit_reached(fake_tm: object) -> None:
         status=OrderStatus.ACTIVE,
         created_at=datetime.now(timezone.utc),
         completed_at=None,
+        responses_count=1,
     )
     await order_repo.save(order)
     await response_repo.save(
@@ -876,13 +877,13 @@ async def test_offer_response_handler_exception(fake_tm: object) -> None:
     )
     await order_repo.save(order)
 
-    # Mock response_repo.save to raise exception
-    original_save = response_repo.save
+    # Mock response_repo.add_if_absent to raise exception
+    original_add = response_repo.add_if_absent
 
-    async def failing_save(response, session=None):
+    async def failing_add(response, session=None):
         raise Exception("Test exception")
 
-    response_repo.save = failing_save  # type: ignore[assignment]
+    response_repo.add_if_absent = failing_add  # type: ignore[assignment]
 
     message = FakeMessage()
     callback = FakeCallback(
@@ -903,7 +904,7 @@ async def test_offer_response_handler_exception(fake_tm: object) -> None:
     assert any("ошибка" in ans.lower() for ans in callback.answers)
 
     # Restore original method
-    response_repo.save = original_save
+    response_repo.add_if_absent = original_add
 
 
 @pytest.mark.asyncio
@@ -22,10 +22,6 @@ from tests.helpers.services import (
 )
 from ugc_bot.application.services.order_service import MAX_ORDER_PRICE
 from ugc_bot.application.services.user_role_service import UserRoleService
-from ugc_bot.bot.handlers.keyboards import (
-    RESUME_DRAFT_BUTTON_TEXT,
-    START_OVER_BUTTON_TEXT,
-)
 from ugc_bot.bot.handlers.order_creation import (
     CONTENT_USAGE_BOTH,
     COOP_BARTER,
@@ -51,6 +47,10 @@ from ugc_bot.bot.handlers.order_creation import (
     order_draft_choice,
     start_order_creation,
 )
+from ugc_bot.bot.keyboards import (
+    RESUME_DRAFT_BUTTON_TEXT,
+    START_OVER_BUTTON_TEXT,
+)
 from ugc_bot.config import AppConfig
 from ugc_bot.domain.entities import FsmDraft
 from ugc_bot.domain.enums import MessengerType, OrderStatus, UserStatus
@@ -13,12 +13,6 @@ from tests.helpers.fakes import (
     FakeUser,
 )
 from ugc_bot.application.services.order_service import MAX_ORDER_PRICE
-from ugc_bot.bot.handlers.keyboards import (
-    CONFIRM_INSTAGRAM_BUTTON_TEXT,
-    MY_PROFILE_BUTTON_TEXT,
-    WORK_FORMAT_ADS_BUTTON_TEXT,
-    WORK_FORMAT_UGC_ONLY_BUTTON_TEXT,
-)
 from ugc_bot.bot.handlers.profile import (
     EditProfileStates,
     edit_profile_choose_field,
@@ -27,6 +21,12 @@ from ugc_bot.bot.handlers.profile import (
     edit_profile_start,
     show_profile,
 )
+from ugc_bot.bot.keyboards import (
+    CONFIRM_INSTAGRAM_BUTTON_TEXT,
+    MY_PROFILE_BUTTON_TEXT,
+    WORK_FORMAT_ADS_BUTTON_TEXT,
+    WORK_FORMAT_UGC_ONLY_BUTTON_TEXT,
+)
 from ugc_bot.domain.entities import AdvertiserProfile, BloggerProfile, User
 from ugc_bot.domain.enums import AudienceGender, MessengerType, WorkFormat
 
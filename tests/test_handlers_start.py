@@ -18,19 +18,19 @@ from ugc_bot.bot.handlers.blogger_registration import (
     CREATOR_INTRO_NOT_REGISTERED,
     choose_creator_role,
 )
-from ugc_bot.bot.handlers.keyboards import (
-    advertiser_menu_keyboard,
-    creator_filled_profile_keyboard,
-    creator_start_keyboard,
-)
 from ugc_bot.bot.handlers.start import (
-    CHANGE_ROLE_BUTTON_TEXT,
-    START_TEXT,
-    _role_keyboard,
     change_role_button,
     start_command,
     support_button,
 )
+from ugc_bot.bot.keyboards import (
+    CHANGE_ROLE_BUTTON_TEXT,
+    START_TEXT,
+    advertiser_menu_keyboard,
+    creator_filled_profile_keyboard,
+    creator_start_keyboard,
+    role_keyboard,
+)
 from ugc_bot.domain.enums import MessengerType
 
 
@@ -47,7 +47,7 @@ async def test_start_command_sends_role_keyboard(user_repo) -> None:
     assert "Бизнесу — подбор креаторов" in message.answers[0][0]
     keyboard = message.answers[0][1]
     assert keyboard is not None
-    assert keyboard.keyboard == _role_keyboard().keyboard
+    assert keyboard.keyboard == role_keyboard().keyboard
 
 
 @pytest.mark.asyncio
@@ -73,7 +73,7 @@ async def test_change_role_button_shows_start_screen() -> None:
     assert message.answers
     assert START_TEXT in message.answers[0][0]
     assert message.answers[0][1] is not None
-    assert message.answers[0][1].keyboard == _role_keyboard().keyboard
+    assert message.answers[0][1].keyboard == role_keyboard().keyboard
 
 
 @pytest.mark.asyncio
@@ -0,0 +1,90 @@
+"""Tests for the shared Bot API HTTP session."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from ugc_bot.bot import http_session
+from ugc_bot.bot.http_session import PooledAiohttpSession, shared_bot_session
+from ugc_bot.config import BotConfig
+
+
+def _bot_config(pool_limit: int, timeout: float) -> BotConfig:
+    return BotConfig.model_validate(
+        {
+            "BOT_TOKEN": "token",
+            "BOT_HTTP_POOL_LIMIT": pool_limit,
+            "BOT_HTTP_TIMEOUT_SECONDS": timeout,
+        }
+    )
+
+
+@pytest.mark.asyncio
+async def test_shared_session_is_created_once_per_config(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Callers share a session; a different pool setting gets its own."""
+
+    monkeypatch.setattr(http_session, "_shared_sessions", {})
+
+    session = shared_bot_session(_bot_config(20, 5))
+    other = shared_bot_session(_bot_config(50, 5))
+
+    assert shared_bot_session(_bot_config(20, 5)) is session
+    assert other is not session
+    assert session.timeout == 5
+    client = await session.create_session()
+    other_client = await other.create_session()
+    assert client.connector is not None
+    assert client.connector.limit == 20
+    assert other_client.connector is not None
+    assert other_client.connector.limit == 50
+
+    await http_session.close_shared_bot_session()
+
+    assert client.closed
+    assert other_client.closed
+
+
+@pytest.mark.asyncio
+async def test_trace_config_is_added_once_per_client_session() -> None:
+    """Reusing or reopening the client session keeps a single trace config."""
+
+    session = PooledAiohttpSession()
+    client = await session.create_session()
+
+    assert await session.create_session() is client
+    assert client.trace_configs.count(session._trace_config) == 1
+
+    await session.close()
+    reopened = await session.create_session()
+
+    assert reopened is not client
+    assert reopened.trace_configs.count(session._trace_config) == 1
+    await session.close()
+
+
+@pytest.mark.asyncio
+async def test_connections_are_reused_and_counted() -> None:
+    """The second request reuses the kept-alive connection."""
+
+    async def ok(request: web.Request) -> web.Response:
+        return web.Response(text="ok")
+
+    app = web.Application()
+    app.router.add_get("/", ok)
+    metrics = MagicMock()
+    session = PooledAiohttpSession(metrics_collector=metrics)
+    async with TestServer(app) as server:
+        client = await session.create_session()
+        for _ in range(2):
+            async with client.get(server.make_url("/")) as response:
+                assert await response.text() == "ok"
+        await session.close()
+
+    metrics.record_bot_api_connection_created.assert_called_once()
+    (seconds,) = metrics.record_bot_api_connection_created.call_args.args
+    assert seconds >= 0
+    metrics.record_bot_api_connection_reused.assert_called_once()
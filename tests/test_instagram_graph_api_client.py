@@ -1,10 +1,13 @@
 """Tests for Instagram Graph API client."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from urllib.parse import parse_qs
 
 import httpx
 import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
 
+from ugc_bot import json_codec
 from ugc_bot.infrastructure.instagram.graph_api_client import (
     HttpInstagramGraphApiClient,
 )
@@ -12,103 +15,365 @@ from ugc_bot.infrastructure.memory_repositories import (
     InMemoryInstagramGraphApiClient,
 )
 
+_USERNAMES = {"123456": "test_user", "789012": "another_user"}
+
+
+class _GraphApiStub:
+    """Answers GET /v24.0/{id} and batch POST / like the Graph API.
+
+    Batch items for ids in ``failing_ids`` answer 500; those in
+    ``skipped_ids`` are null, as for items the batch did not run.
+    """
+
+    def __init__(
+        self,
+        status_code: int = 200,
+        error: object = None,
+        failing_ids: frozenset[str] = frozenset(),
+        skipped_ids: frozenset[str] = frozenset(),
+    ) -> None:
+        self.status_code = status_code
+        self.error = error or {"message": "failed"}
+        self.failing_ids = failing_ids
+        self.skipped_ids = skipped_ids
+        self.requests: list[httpx.Request] = []
+
+    def transport(self) -> httpx.MockTransport:
+        return httpx.MockTransport(self)
+
+    def batch_ids(self, request: httpx.Request) -> list[str]:
+        form = parse_qs(request.content.decode())
+        return [
+            item["relative_url"].split("/")[1].split("?")[0]
+            for item in json_codec.loads(form["batch"][0])
+        ]
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if request.method == "POST":
+            answers: list[dict[str, object] | None] = []
+            for user_id in self.batch_ids(request):
+                if user_id in self.skipped_ids:
+                    answers.append(None)
+                    continue
+                code, body = self._answer(user_id)
+                if user_id in self.failing_ids:
+                    code, body = 500, '{"error": {"code": 2}}'
+                answers.append({"code": code, "body": body})
+            return httpx.Response(200, json=answers)
+        user_id = request.url.path.rsplit("/", 1)[-1]
+        code, body = self._answer(user_id)
+        return httpx.Response(code, text=body)
+
+    def _answer(self, user_id: str) -> tuple[int, str]:
+        if self.status_code != 200:
+            return self.status_code, json_codec.dumps({"error": self.error})
+        if user_id == "nousername":
+            return 200, json_codec.dumps({"id": user_id})
+        if user_id not in _USERNAMES:
+            return 404, '{"error": {"code": 100}}'
+        return 200, json_codec.dumps(
+            {"id": user_id, "username": _USERNAMES[user_id]}
+        )
+
+
+def _client(stub: _GraphApiStub, **kwargs) -> HttpInstagramGraphApiClient:
+    return HttpInstagramGraphApiClient(
+        access_token="test_token", transport=stub.transport(), **kwargs
+    )
+
 
 @pytest.mark.asyncio
 async def test_get_username_by_id_success() -> None:
     """Test successful username retrieval."""
-    client = HttpInstagramGraphApiClient(access_token="test_token")
+    stub = _GraphApiStub()
+    client = _client(stub)
+
+    username = await client.get_username_by_id("123456")
+
+    assert username == "test_user"
+    request = stub.requests[0]
+    assert request.url.path == "/v24.0/123456"
+    assert request.url.params["fields"] == "username"
+    assert request.url.params["access_token"] == "test_token"
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_get_username_by_id_is_cached() -> None:
+    """A resolved username is served from the cache on the next call."""
+    stub = _GraphApiStub()
+    client = _client(stub)
+
+    assert await client.get_username_by_id("123456") == "test_user"
+    assert await client.get_username_by_id("123456") == "test_user"
 
-    mock_response = MagicMock()
-    mock_response.json.return_value = {"username": "test_user"}
-    mock_response.raise_for_status.return_value = None
+    assert len(stub.requests) == 1
+    await client.close()
 
-    with patch("httpx.AsyncClient") as mock_client_class:
-        mock_client = AsyncMock()
-        mock_client.__aenter__.return_value = mock_client
-        mock_client.__aexit__.return_value = None
-        mock_client.get.return_value = mock_response
-        mock_client_class.return_value = mock_client
 
-        username = await client.get_username_by_id("123456")
+@pytest.mark.asyncio
+async def test_get_username_by_id_cache_expires() -> None:
+    """Cached usernames are fetched again after the TTL."""
+    stub = _GraphApiStub()
+    client = _client(stub, cache_ttl_seconds=0)
+
+    await client.get_username_by_id("123456")
+    await client.get_username_by_id("123456")
 
-        assert username == "test_user"
-        mock_client.get.assert_called_once()
-        call_args = mock_client.get.call_args
-        assert "123456" in call_args[0][0]
-        assert call_args[1]["params"]["fields"] == "username"
-        assert call_args[1]["params"]["access_token"] == "test_token"
+    assert len(stub.requests) == 2
+    await client.close()
 
 
 @pytest.mark.asyncio
 async def test_get_username_by_id_no_token() -> None:
     """Test username retrieval without access token."""
-    client = HttpInstagramGraphApiClient(access_token="")
+    stub = _GraphApiStub()
+    client = HttpInstagramGraphApiClient(
+        access_token="", transport=stub.transport()
+    )
 
     username = await client.get_username_by_id("123456")
 
     assert username is None
+    assert stub.requests == []
 
 
 @pytest.mark.asyncio
-async def test_get_username_by_id_http_error() -> None:
-    """Test username retrieval with HTTP error."""
-    client = HttpInstagramGraphApiClient(access_token="test_token")
+async def test_get_username_by_id_unknown_id_is_negative_cached() -> None:
+    """An id the API does not know is not requested again within the TTL."""
+    stub = _GraphApiStub()
+    client = _client(stub)
+
+    assert await client.get_username_by_id("unknown") is None
+    assert await client.get_username_by_id("unknown") is None
 
-    mock_response = MagicMock()
-    mock_response.status_code = 404
-    mock_response.text = "Not Found"
-    mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
-        "Not Found", request=MagicMock(), response=mock_response
+    assert len(stub.requests) == 1
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_get_username_by_id_nonexistent_object_is_negative_cached() -> (
+    None
+):
+    """A 400 with code 100 and subcode 33 marks the id as unknown."""
+    stub = _GraphApiStub(
+        status_code=400, error={"code": 100, "error_subcode": 33}
     )
+    client = _client(stub)
+
+    assert await client.get_username_by_id("123456") is None
+    stub.status_code = 200
+    assert await client.get_username_by_id("123456") is None
 
-    with patch("httpx.AsyncClient") as mock_client_class:
-        mock_client = AsyncMock()
-        mock_client.__aenter__.return_value = mock_client
-        mock_client.__aexit__.return_value = None
-        mock_client.get.return_value = mock_response
-        mock_client_class.return_value = mock_client
+    assert len(stub.requests) == 1
+    await client.close()
 
-        username = await client.get_username_by_id("123456")
 
-        assert username is None
+@pytest.mark.asyncio
+async def test_get_username_by_id_no_username_in_response() -> None:
+    """Test username retrieval when response doesn't contain username."""
+    stub = _GraphApiStub()
+    client = _client(stub)
+
+    username = await client.get_username_by_id("nousername")
+
+    assert username is None
+    await client.close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("status_code", "error"),
+    [
+        (400, {"code": 190, "message": "Invalid OAuth access token"}),
+        (400, {"code": 100, "error_subcode": 2018001}),
+        (400, "not an object"),
+        (401, None),
+        (429, None),
+        (500, None),
+    ],
+)
+async def test_get_username_by_id_http_error_not_cached(
+    status_code: int, error: object
+) -> None:
+    """Auth, permission, rate-limit and server errors are retried."""
+    stub = _GraphApiStub(status_code=status_code, error=error)
+    client = _client(stub)
+
+    assert await client.get_username_by_id("123456") is None
+    stub.status_code = 200
+    assert await client.get_username_by_id("123456") == "test_user"
+
+    assert len(stub.requests) == 2
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_get_username_by_id_non_json_error_not_cached() -> None:
+    """An error body that is not JSON is treated as unavailable."""
+    client = HttpInstagramGraphApiClient(
+        access_token="test_token",
+        transport=httpx.MockTransport(
+            lambda request: httpx.Response(400, text="<html>Bad Request")
+        ),
+    )
+
+    assert await client.get_username_by_id("123456") is None
+    assert client._cached("123456") == (False, None)
+    await client.close()
 
 
 @pytest.mark.asyncio
 async def test_get_username_by_id_request_error() -> None:
     """Test username retrieval with request error."""
-    client = HttpInstagramGraphApiClient(access_token="test_token")
 
-    with patch("httpx.AsyncClient") as mock_client_class:
-        mock_client = AsyncMock()
-        mock_client.__aenter__.return_value = mock_client
-        mock_client.__aexit__.return_value = None
-        mock_client.get.side_effect = httpx.RequestError("Connection error")
-        mock_client_class.return_value = mock_client
+    def _fail(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("Connection error", request=request)
+
+    client = HttpInstagramGraphApiClient(
+        access_token="test_token", transport=httpx.MockTransport(_fail)
+    )
 
-        username = await client.get_username_by_id("123456")
+    username = await client.get_username_by_id("123456")
 
-        assert username is None
+    assert username is None
+    await client.close()
 
 
 @pytest.mark.asyncio
-async def test_get_username_by_id_no_username_in_response() -> None:
-    """Test username retrieval when response doesn't contain username."""
-    client = HttpInstagramGraphApiClient(access_token="test_token")
+async def test_get_usernames_by_ids_batches_only_uncached_ids() -> None:
+    """Cached and negative-cached ids are answered without the API."""
+    stub = _GraphApiStub()
+    client = _client(stub)
+    assert await client.get_username_by_id("123456") == "test_user"
+    assert await client.get_username_by_id("gone") is None
+
+    result = await client.get_usernames_by_ids(
+        ["123456", "789012", "gone", "unknown", "789012"]
+    )
+
+    assert result == {
+        "123456": "test_user",
+        "789012": "another_user",
+        "gone": None,
+        "unknown": None,
+    }
+    assert len(stub.requests) == 3
+    batch_request = stub.requests[2]
+    assert batch_request.method == "POST"
+    form = parse_qs(batch_request.content.decode())
+    assert form["access_token"] == ["test_token"]
+    assert stub.batch_ids(batch_request) == ["789012", "unknown"]
+
+    assert await client.get_username_by_id("789012") == "another_user"
+    assert await client.get_username_by_id("unknown") is None
+    assert len(stub.requests) == 3
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_get_usernames_by_ids_partial_errors_are_not_cached() -> None:
+    """Failed or skipped batch items map to None and are retried later."""
+    stub = _GraphApiStub(
+        failing_ids=frozenset({"789012"}), skipped_ids=frozenset({"123456"})
+    )
+    client = _client(stub)
+
+    result = await client.get_usernames_by_ids(["123456", "789012", "gone"])
+
+    assert result == {"123456": None, "789012": None, "gone": None}
+    assert client._cached("123456") == (False, None)
+    assert client._cached("789012") == (False, None)
+    assert client._cached("gone") == (True, None)
+
+    stub.failing_ids = stub.skipped_ids = frozenset()
+    assert await client.get_usernames_by_ids(["123456", "789012", "gone"]) == {
+        "123456": "test_user",
+        "789012": "another_user",
+        "gone": None,
+    }
+    assert stub.batch_ids(stub.requests[1]) == ["123456", "789012"]
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_get_usernames_by_ids_splits_large_batches() -> None:
+    """More than 50 ids are sent in several batch requests."""
+    stub = _GraphApiStub()
+    client = _client(stub)
+
+    result = await client.get_usernames_by_ids([str(i) for i in range(120)])
 
-    mock_response = MagicMock()
-    mock_response.json.return_value = {"id": "123456"}
-    mock_response.raise_for_status.return_value = None
+    assert len(result) == 120
+    assert [len(stub.batch_ids(r)) for r in stub.requests] == [50, 50, 20]
+    await client.close()
 
-    with patch("httpx.AsyncClient") as mock_client_class:
-        mock_client = AsyncMock()
-        mock_client.__aenter__.return_value = mock_client
-        mock_client.__aexit__.return_value = None
-        mock_client.get.return_value = mock_response
-        mock_client_class.return_value = mock_client
 
-        username = await client.get_username_by_id("123456")
+@pytest.mark.asyncio
+async def test_get_usernames_by_ids_failed_batch_not_cached() -> None:
+    """A failed batch request maps its ids to None without caching."""
+    client = HttpInstagramGraphApiClient(
+        access_token="test_token",
+        transport=httpx.MockTransport(
+            lambda request: httpx.Response(500, text="unavailable")
+        ),
+    )
+
+    assert await client.get_usernames_by_ids(["123456"]) == {"123456": None}
+    assert client._cached("123456") == (False, None)
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_get_usernames_by_ids_no_token() -> None:
+    """Without a token every id maps to None."""
+    client = HttpInstagramGraphApiClient(access_token="")
+
+    assert await client.get_usernames_by_ids(["1", "2"]) == {
+        "1": None,
+        "2": None,
+    }
+
 
-        assert username is None
+@pytest.mark.asyncio
+async def test_client_reuses_connection() -> None:
+    """Lookups share one kept-alive connection instead of one per call."""
+    peers: set[object] = set()
+
+    async def user(request: web.Request) -> web.Response:
+        peers.add(request.transport.get_extra_info("peername"))
+        return web.json_response({"username": request.match_info["user_id"]})
+
+    web_app = web.Application()
+    web_app.router.add_get("/v24.0/{user_id}", user)
+    server = TestServer(web_app)
+    await server.start_server()
+    client = HttpInstagramGraphApiClient(
+        access_token="test_token", base_url=str(server.make_url(""))
+    )
+    try:
+        for user_id in ("a", "b", "c"):
+            assert await client.get_username_by_id(user_id) == user_id
+    finally:
+        await client.close()
+        await server.close()
+
+    assert len(peers) == 1
+
+
+@pytest.mark.asyncio
+async def test_close_allows_reuse() -> None:
+    """After close() the next request opens a new HTTP client."""
+    stub = _GraphApiStub()
+    client = _client(stub)
+    await client.get_username_by_id("123456")
+
+    await client.close()
+    await client.close()
+
+    assert await client.get_username_by_id("789012") == "another_user"
+    await client.close()
 
 
 @pytest.mark.asyncio
@@ -126,3 +391,8 @@ async def test_in_memory_client() -> None:
 
     username3 = await client.get_username_by_id("unknown")
     assert username3 is None
+
+    assert await client.get_usernames_by_ids(["123456", "unknown"]) == {
+        "123456": "test_user",
+        "unknown": None,
+    }
@@ -136,6 +136,42 @@ async def test_verify_code_success() -> None:
     assert updated.confirmed is True
 
 
+@pytest.mark.asyncio
+async def test_verify_code_keeps_other_profile_fields() -> None:
+    """Confirmation only touches confirmed/updated_at."""
+
+    user_repo = InMemoryUserRepository()
+    profile_repo = InMemoryBloggerProfileRepository()
+    verification_repo = InMemoryInstagramVerificationRepository()
+    user_id = await _seed_user(user_repo)
+    await _seed_profile(profile_repo, user_id)
+    profile = await profile_repo.get_by_user_id(user_id)
+    assert profile is not None
+    await profile_repo.update_fields(user_id, wanted_to_change_terms_count=2)
+    await verification_repo.save(
+        InstagramVerificationCode(
+            code_id=UUID("00000000-0000-0000-0000-000000000139"),
+            user_id=user_id,
+            code="ABC124",
+            expires_at=datetime.now(timezone.utc) + timedelta(minutes=5),
+            used=False,
+            created_at=datetime.now(timezone.utc),
+        )
+    )
+    service = InstagramVerificationService(
+        user_repo=user_repo,
+        blogger_repo=profile_repo,
+        verification_repo=verification_repo,
+    )
+
+    assert await service.verify_code(user_id, "ABC124") is True
+    updated = await profile_repo.get_by_user_id(user_id)
+    assert updated is not None
+    assert updated.confirmed is True
+    assert updated.wanted_to_change_terms_count == 2
+    assert updated.topics == profile.topics
+
+
 @pytest.mark.asyncio
 async def test_verify_code_invalid() -> None:
     """Return false for invalid code."""
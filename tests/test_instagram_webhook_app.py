@@ -3,7 +3,8 @@
 import hashlib
 import hmac
 import json
-from unittest.mock import MagicMock, patch
+from collections.abc import Iterator
+from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
 import pytest
@@ -13,6 +14,7 @@ from fastapi.testclient import TestClient
 from ugc_bot.application.services.instagram_verification_service import (
     InstagramVerificationService,
 )
+from ugc_bot.bot.http_session import shared_bot_session
 from ugc_bot.config import AppConfig
 from ugc_bot.domain.entities import BloggerProfile, User
 from ugc_bot.domain.enums import (
@@ -49,9 +51,13 @@ def test_config() -> AppConfig:
 
 
 @pytest.fixture
-def client() -> TestClient:
-    """Create test client."""
-    return TestClient(app)
+def client() -> Iterator[TestClient]:
+    """Create test client; config is loaded on the first request."""
+    app.state.config_state.clear()
+    app.state.services = None
+    yield TestClient(app)
+    app.state.config_state.clear()
+    app.state.services = None
 
 
 def _create_signature(payload: bytes, secret: str) -> str:
@@ -70,10 +76,19 @@ def test_webhook_health(client: TestClient) -> None:
     assert response.json() == {"status": "ok"}
 
 
+def test_webhook_metrics(client: TestClient) -> None:
+    """Metrics endpoint serves the default registry to Prometheus."""
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert "python_info" in response.text
+
+
 def test_verify_signature_rejects_non_prefixed() -> None:
     """Reject signatures without sha256 prefix."""
 
-    assert _verify_signature(b"payload", "invalid", "secret") is False
+    assert _verify_signature(b"payload", "invalid", b"secret") is False
 
 
 @pytest.mark.asyncio
@@ -121,18 +136,16 @@ async def test_notify_user_verification_missing_telegram_user(
 async def test_notify_user_verification_success(test_config: AppConfig) -> None:
     """Send notification when user and telegram record exist."""
 
-    class DummySession:
-        async def close(self) -> None:
-            return None
+    sent: list[tuple[int, str]] = []
+    sessions: list[object] = []
 
     class DummyBot:
-        def __init__(self, token: str) -> None:
+        def __init__(self, token: str, session: object = None) -> None:
             self.token = token
-            self.session = DummySession()
-            self.sent = []
+            sessions.append(session)
 
         async def send_message(self, chat_id: int, text: str, **kwargs) -> None:  # type: ignore[no-untyped-def]
-            self.sent.append((chat_id, text, kwargs))
+            sent.append((chat_id, text))
 
     user_repo = InMemoryUserRepository()
     blogger_repo = InMemoryBloggerProfileRepository()
@@ -174,6 +187,13 @@ async def test_notify_user_verification_success(test_config: AppConfig) -> None:
         await _notify_user_verification_success(
             user.user_id, service, test_config
         )
+        await _notify_user_verification_success(
+            user.user_id, service, test_config
+        )
+
+    assert [chat_id for chat_id, _ in sent] == [12345, 12345]
+    # Both notifications share the process-wide Bot API session.
+    assert sessions[0] is sessions[1] is shared_bot_session(test_config.bot)
 
 
 @patch("ugc_bot.instagram_webhook_app.load_config")
@@ -196,6 +216,26 @@ def test_webhook_verification_success(
     assert response.text == "1234567890"
 
 
+@patch("ugc_bot.instagram_webhook_app.load_config")
+def test_webhook_loads_config_once(
+    mock_load_config: MagicMock,
+    client: TestClient,
+    test_config: AppConfig,
+) -> None:
+    """Config is loaded on the first request and reused afterwards."""
+    mock_load_config.return_value = test_config
+    params = {
+        "hub.mode": "subscribe",
+        "hub.challenge": "1",
+        "hub.verify_token": "test_verify_token",
+    }
+    for _ in range(3):
+        assert (
+            client.get("/webhook/instagram", params=params).status_code == 200
+        )
+    mock_load_config.assert_called_once()
+
+
 @patch("ugc_bot.instagram_webhook_app.load_config")
 def test_webhook_verification_invalid_mode(
     mock_load_config: MagicMock,
@@ -566,15 +606,21 @@ async def test_webhook_startup_event(
     mock_load_config: MagicMock,
     test_config: AppConfig,
 ) -> None:
-    """Startup event loads config and logs."""
+    """Startup loads config and builds services; shutdown disposes them."""
     mock_load_config.return_value = test_config
+    container = mock_container_cls.return_value
+    container.close = AsyncMock()
     from ugc_bot.instagram_webhook_app import lifespan
 
     app = FastAPI()
     async with lifespan(app):
-        pass
+        assert app.state.services.container is container
+        container.close.assert_not_awaited()
 
     mock_load_config.assert_called()
+    mock_container_cls.assert_called_once_with(test_config)
+    container.close.assert_awaited_once()
+    assert app.state.services is None
 
 
 @patch("ugc_bot.instagram_webhook_app.load_config")
@@ -855,3 +901,37 @@ async def test_webhook_verification_exception_logged(
     )
     assert response.status_code == 200
     mock_notify.assert_not_called()
+
+
+@patch("ugc_bot.instagram_webhook_app.load_config")
+@patch("ugc_bot.instagram_webhook_app.Container")
+def test_webhook_builds_container_once(
+    mock_container_cls: MagicMock,
+    mock_load_config: MagicMock,
+    client: TestClient,
+    test_config: AppConfig,
+) -> None:
+    """Webhook posts reuse one container and verification service."""
+    mock_load_config.return_value = test_config
+    payload_bytes = json.dumps(
+        {
+            "object": "instagram",
+            "entry": [{"id": "page1", "time": 123, "messaging": []}],
+        }
+    ).encode("utf-8")
+    signature = _create_signature(
+        payload_bytes, test_config.instagram.instagram_app_secret
+    )
+    for _ in range(3):
+        response = client.post(
+            "/webhook/instagram",
+            content=payload_bytes,
+            headers={"X-Hub-Signature-256": signature},
+        )
+        assert response.status_code == 200
+
+    mock_container_cls.assert_called_once_with(test_config)
+    mock_build = (
+        mock_container_cls.return_value.build_instagram_verification_service
+    )
+    mock_build.assert_called_once_with()
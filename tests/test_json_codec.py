@@ -0,0 +1,102 @@
+"""Tests for the JSON codec with and without orjson."""
+
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import date, datetime, time, timezone
+from enum import Enum
+from uuid import UUID
+
+import pytest
+
+from ugc_bot import json_codec
+from ugc_bot.domain.enums import OrderStatus
+
+
+class _Color(Enum):
+    RED = "red"
+    BLUE = 2
+
+
+@dataclass(slots=True)
+class _Slot:
+    at: time
+    color: _Color
+
+
+@dataclass
+class _Payload:
+    id: UUID
+    slot: _Slot
+    colors: list[_Color]
+    status: OrderStatus
+
+
+@pytest.fixture(params=["orjson", "json"])
+def backend(request: pytest.FixtureRequest) -> Iterator[str]:
+    """Run each test with orjson and with the stdlib fallback."""
+    if request.param == "orjson" and json_codec.orjson is None:
+        pytest.skip("orjson not installed")
+    with pytest.MonkeyPatch.context() as mp:
+        if request.param == "json":
+            mp.setattr(json_codec, "orjson", None)
+        yield request.param
+
+
+def test_dumps_encodes_uuid_datetime_and_keys(backend: str) -> None:
+    """Both backends write the same compact JSON."""
+    data = {
+        "id": UUID("00000000-0000-0000-0000-000000000001"),
+        "at": datetime(2025, 1, 15, 12, 0, tzinfo=timezone.utc),
+        "day": date(2025, 1, 15),
+        1: "Привет",
+    }
+
+    assert json_codec.dumps(data) == (
+        '{"id":"00000000-0000-0000-0000-000000000001",'
+        '"at":"2025-01-15T12:00:00+00:00","day":"2025-01-15","1":"Привет"}'
+    )
+    assert json_codec.dumps_bytes(data) == json_codec.dumps(data).encode()
+
+
+def test_default_and_type_error(backend: str) -> None:
+    """Unknown types go through default, or raise TypeError."""
+    assert json_codec.dumps({"x": object()}, default=lambda _: "obj") == (
+        '{"x":"obj"}'
+    )
+    with pytest.raises(TypeError):
+        json_codec.dumps({"x": object()})
+
+
+def test_loads_text_and_bytes(backend: str) -> None:
+    """Text and UTF-8 bytes decode alike; invalid input is a ValueError."""
+    assert json_codec.loads('{"a": [1, 2]}') == {"a": [1, 2]}
+    assert json_codec.loads('{"a":"é"}'.encode()) == {"a": "é"}
+    with pytest.raises(ValueError):
+        json_codec.loads(b"not json")
+
+
+def test_backends_agree_on_dataclasses_and_enums() -> None:
+    """orjson and the stdlib fallback encode the same payload identically."""
+    if json_codec.orjson is None:
+        pytest.skip("orjson not installed")
+    payload = {
+        "order": _Payload(
+            id=UUID("00000000-0000-0000-0000-000000000001"),
+            slot=_Slot(at=time(12, 30, 1, 500), color=_Color.BLUE),
+            colors=[_Color.RED],
+            status=OrderStatus.ACTIVE,
+        ),
+        "at": datetime(2025, 1, 15, 12, 0, 0, 4),
+        2: None,
+    }
+
+    encoded = json_codec.dumps(payload)
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(json_codec, "orjson", None)
+        fallback = json_codec.dumps(payload)
+
+    assert fallback == encoded
+    assert json_codec.loads(encoded)["order"]["slot"] == {
+        "at": "12:30:01.000500",
+        "color": 2,
+    }
@@ -538,7 +538,7 @@ async def test_run_consumer_processes_activation_message(
             session_closed["value"] = True
 
     class FakeBot:
-        def __init__(self, token: str) -> None:
+        def __init__(self, token: str, session: object = None) -> None:
             self.session = FakeSession()
 
     fake_consumer = FakeConsumer()
@@ -1,6 +1,6 @@
 """Tests for keyboard helpers."""
 
-from ugc_bot.bot.handlers.keyboards import (
+from ugc_bot.bot.keyboards import (
     ADVERTISER_START_BUTTON_TEXT,
     CONFIRM_INSTAGRAM_BUTTON_TEXT,
     CREATE_ORDER_BUTTON_TEXT,
@@ -95,7 +95,7 @@ def test_advertiser_start_keyboard() -> None:
 
 def test_advertiser_menu_keyboard() -> None:
     """Advertiser menu: Create order, My orders, My profile, Edit, Support."""
-    from ugc_bot.bot.handlers.keyboards import EDIT_PROFILE_BUTTON_TEXT
+    from ugc_bot.bot.keyboards import EDIT_PROFILE_BUTTON_TEXT
 
     keyboard = advertiser_menu_keyboard()
 
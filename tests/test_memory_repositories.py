@@ -5,9 +5,11 @@ from uuid import UUID, uuid4
 
 import pytest
 
+from tests.helpers.factories import create_test_blogger_profile
 from ugc_bot.domain.entities import Order, OrderResponse
 from ugc_bot.domain.enums import OrderStatus, OrderType
 from ugc_bot.infrastructure.memory_repositories import (
+    InMemoryBloggerProfileRepository,
     InMemoryOrderRepository,
     InMemoryOrderResponseRepository,
 )
@@ -105,7 +107,7 @@ async def test_order_response_repo_list_by_blogger() -> None:
 
 @pytest.mark.asyncio
 async def test_order_response_repo_count_by_order() -> None:
-    """count_by_order returns count of responses for order."""
+    """count_by_order and count_by_orders count responses per order."""
 
     repo = InMemoryOrderResponseRepository()
     order_id = UUID("00000000-0000-0000-0000-000000000040")
@@ -127,3 +129,53 @@ async def test_order_response_repo_count_by_order() -> None:
     )
     count = await repo.count_by_order(order_id)
     assert count == 2
+    other_id = UUID("00000000-0000-0000-0000-000000000043")
+    counts = await repo.count_by_orders([order_id, other_id])
+    assert counts == {order_id: 2, other_id: 0}
+
+
+@pytest.mark.asyncio
+async def test_order_repo_update_fields() -> None:
+    """update_fields changes only the given fields."""
+
+    repo = InMemoryOrderRepository()
+    order = Order(
+        order_id=uuid4(),
+        advertiser_id=uuid4(),
+        order_type=OrderType.UGC_ONLY,
+        product_link="https://x.com",
+        offer_text="Offer",
+        barter_description=None,
+        price=1000.0,
+        bloggers_needed=3,
+        status=OrderStatus.NEW,
+        created_at=datetime.now(timezone.utc),
+        completed_at=None,
+    )
+    await repo.save(order)
+
+    updated = await repo.update_fields(
+        order.order_id, status=OrderStatus.ACTIVE
+    )
+
+    assert updated is not None
+    assert updated.status == OrderStatus.ACTIVE
+    assert updated.offer_text == order.offer_text
+    assert await repo.get_by_id(order.order_id) == updated
+    assert await repo.update_fields(uuid4(), status=OrderStatus.ACTIVE) is None
+
+
+@pytest.mark.asyncio
+async def test_blogger_profile_repo_update_fields() -> None:
+    """update_fields changes the given fields; unknown users give None."""
+
+    repo = InMemoryBloggerProfileRepository()
+    profile = await create_test_blogger_profile(repo, uuid4(), price=500.0)
+
+    updated = await repo.update_fields(profile.user_id, confirmed=True)
+
+    assert updated is not None
+    assert updated.confirmed is True
+    assert updated.price == 500.0
+    assert await repo.get_by_user_id(profile.user_id) == updated
+    assert await repo.update_fields(uuid4(), confirmed=True) is None
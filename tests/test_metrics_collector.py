@@ -340,3 +340,101 @@ class TestMetricsCollector:
         call_args = mock_logger.info.call_args
         extra = call_args[1]["extra"]
         assert extra["success"] is False
+
+    def test_record_db_operation(self, metrics_collector, mock_logger):
+        """Test DB statement histograms are observed without logging."""
+        from prometheus_client import REGISTRY
+
+        labels = {"operation": "outbox_batch"}
+        before = REGISTRY.get_sample_value(
+            "ugc_db_statements_per_operation_sum", labels
+        )
+
+        metrics_collector.record_db_operation("outbox_batch", 7, 0.02)
+
+        after = REGISTRY.get_sample_value(
+            "ugc_db_statements_per_operation_sum", labels
+        )
+        assert after == (before or 0) + 7
+        assert REGISTRY.get_sample_value(
+            "ugc_db_time_per_operation_seconds_count", labels
+        )
+        mock_logger.info.assert_not_called()
+
+    def test_record_db_pool_metrics(self, metrics_collector, mock_logger):
+        """Pool gauges, checkout wait and invalidations are exported."""
+        from prometheus_client import REGISTRY
+
+        pool = {"pool": "replica"}
+        metrics_collector.record_db_pool_state("replica", 4, 1)
+        metrics_collector.record_db_pool_checkout_wait("replica", 0.2)
+        before = REGISTRY.get_sample_value(
+            "ugc_db_pool_invalidations_total", {**pool, "kind": "hard"}
+        )
+        metrics_collector.record_db_pool_invalidation("replica", soft=False)
+
+        assert REGISTRY.get_sample_value("ugc_db_pool_checked_out", pool) == 4
+        assert REGISTRY.get_sample_value("ugc_db_pool_overflow", pool) == 1
+        assert REGISTRY.get_sample_value(
+            "ugc_db_pool_checkout_wait_seconds_count", pool
+        )
+        assert (
+            REGISTRY.get_sample_value(
+                "ugc_db_pool_invalidations_total", {**pool, "kind": "hard"}
+            )
+            == (before or 0) + 1
+        )
+        mock_logger.warning.assert_called_once()
+
+    def test_record_update_queue_rejected(self, metrics_collector, mock_logger):
+        """A refused webhook update is counted and logged."""
+        from prometheus_client import REGISTRY
+
+        name = "ugc_webhook_queue_rejected_total"
+        before = REGISTRY.get_sample_value(name)
+
+        metrics_collector.record_update_queue_rejected()
+
+        assert REGISTRY.get_sample_value(name) == (before or 0) + 1
+        mock_logger.warning.assert_called_once()
+
+    def test_record_duplicate_update(self, metrics_collector, mock_logger):
+        """A dropped redelivery is counted without logging."""
+        from prometheus_client import REGISTRY
+
+        name = "ugc_webhook_duplicate_updates_total"
+        before = REGISTRY.get_sample_value(name)
+
+        metrics_collector.record_duplicate_update()
+
+        assert REGISTRY.get_sample_value(name) == (before or 0) + 1
+        mock_logger.warning.assert_not_called()
+
+    def test_record_bot_api_connections(self, metrics_collector, mock_logger):
+        """New and reused Bot API connections are counted apart."""
+        from prometheus_client import REGISTRY
+
+        name = "ugc_bot_api_connections_total"
+        new_before = REGISTRY.get_sample_value(name, {"kind": "new"})
+        reused_before = REGISTRY.get_sample_value(name, {"kind": "reused"})
+        seconds_before = REGISTRY.get_sample_value(
+            "ugc_bot_api_connect_seconds_count"
+        )
+
+        metrics_collector.record_bot_api_connection_created(0.03)
+        metrics_collector.record_bot_api_connection_reused()
+        metrics_collector.record_bot_api_connection_reused()
+
+        assert (
+            REGISTRY.get_sample_value(name, {"kind": "new"})
+            == (new_before or 0) + 1
+        )
+        assert (
+            REGISTRY.get_sample_value(name, {"kind": "reused"})
+            == (reused_before or 0) + 2
+        )
+        assert (
+            REGISTRY.get_sample_value("ugc_bot_api_connect_seconds_count")
+            == (seconds_before or 0) + 1
+        )
+        mock_logger.info.assert_not_called()
@@ -0,0 +1,69 @@
+"""Tests for worker metrics exposure."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from ugc_bot.config import MetricsConfig
+from ugc_bot.metrics import exporter
+from ugc_bot.metrics.exporter import push_metrics, start_metrics_server
+
+
+def _config(**values: object) -> MetricsConfig:
+    return MetricsConfig.model_validate(values)
+
+
+def test_start_metrics_server_disabled(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Port 0 leaves the worker without a metrics server."""
+    server = Mock()
+    monkeypatch.setattr(exporter, "start_http_server", server)
+
+    assert start_metrics_server(_config()) is False
+    server.assert_not_called()
+
+
+def test_start_metrics_server_listens_on_port(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A configured port starts prometheus_client's HTTP server."""
+    server = Mock()
+    monkeypatch.setattr(exporter, "start_http_server", server)
+
+    assert start_metrics_server(_config(METRICS_PORT="9108")) is True
+    server.assert_called_once_with(9108)
+
+
+def test_push_metrics_disabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Without a Pushgateway URL nothing is pushed."""
+    push = Mock()
+    monkeypatch.setattr(exporter, "push_to_gateway", push)
+
+    assert push_metrics(_config(), job="role_reminder") is False
+    push.assert_not_called()
+
+
+def test_push_metrics_sends_registry(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The default registry is pushed under the job name."""
+    push = Mock()
+    monkeypatch.setattr(exporter, "push_to_gateway", push)
+    config = _config(METRICS_PUSHGATEWAY_URL="pushgateway:9091")
+
+    assert push_metrics(config, job="role_reminder") is True
+    push.assert_called_once_with(
+        "pushgateway:9091", job="role_reminder", registry=exporter.REGISTRY
+    )
+
+
+def test_push_metrics_failure_is_logged(
+    monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    """An unreachable Pushgateway does not fail the job."""
+    monkeypatch.setattr(
+        exporter, "push_to_gateway", Mock(side_effect=OSError("refused"))
+    )
+    config = _config(METRICS_PUSHGATEWAY_URL="pushgateway:9091")
+
+    assert push_metrics(config, job="role_reminder") is False
+    assert "Metrics push failed" in caplog.text
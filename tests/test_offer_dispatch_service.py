@@ -1,10 +1,13 @@
 """Tests for offer dispatch service."""
 
 from datetime import datetime, timezone
-from uuid import UUID
+from unittest.mock import patch
+from uuid import UUID, uuid4
 
 import pytest
 
+from tests.helpers.factories import create_test_blogger_profile
+from tests.helpers.queries import assert_max_queries
 from ugc_bot.application.errors import OrderCreationError
 from ugc_bot.application.services.offer_dispatch_service import (
     OfferDispatchService,
@@ -18,6 +21,23 @@ from ugc_bot.domain.enums import (
     UserStatus,
     WorkFormat,
 )
+from ugc_bot.infrastructure.db.base import Base
+from ugc_bot.infrastructure.db.models import (
+    BloggerProfileModel,
+    OfferDispatchModel,
+    OrderModel,
+    UserModel,
+)
+from ugc_bot.infrastructure.db.repositories import (
+    SqlAlchemyBloggerProfileRepository,
+    SqlAlchemyOfferDispatchRepository,
+    SqlAlchemyOrderRepository,
+    SqlAlchemyUserRepository,
+)
+from ugc_bot.infrastructure.db.session import (
+    SessionTransactionManager,
+    create_session_factory,
+)
 from ugc_bot.infrastructure.memory_repositories import (
     InMemoryBloggerProfileRepository,
     InMemoryOfferDispatchRepository,
@@ -497,6 +517,44 @@ async def test_dispatch_excludes_order_author() -> None:
     assert result[0].user_id != advertiser_id
 
 
+@pytest.mark.asyncio
+async def test_dispatch_without_candidates_skips_user_lookup() -> None:
+    """When every confirmed blogger is excluded, no users are loaded."""
+
+    user_repo = InMemoryUserRepository()
+    blogger_repo = InMemoryBloggerProfileRepository()
+    order_repo = InMemoryOrderRepository()
+    service = OfferDispatchService(
+        user_repo=user_repo,
+        blogger_repo=blogger_repo,
+        order_repo=order_repo,
+        offer_dispatch_repo=InMemoryOfferDispatchRepository(),
+    )
+    advertiser_id = UUID("00000000-0000-0000-0000-000000000660")
+    order = Order(
+        order_id=UUID("00000000-0000-0000-0000-000000000661"),
+        advertiser_id=advertiser_id,
+        order_type=OrderType.UGC_ONLY,
+        product_link="https://example.com",
+        offer_text="Offer",
+        barter_description=None,
+        price=1000.0,
+        bloggers_needed=1,
+        status=OrderStatus.ACTIVE,
+        created_at=datetime.now(timezone.utc),
+        completed_at=None,
+    )
+    await order_repo.save(order)
+    await create_test_blogger_profile(
+        blogger_repo, advertiser_id, confirmed=True
+    )
+
+    with patch.object(user_repo, "list_by_ids") as list_by_ids:
+        assert await service.dispatch(order.order_id) == []
+
+    list_by_ids.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_dispatch_excludes_bloggers_who_already_received_offer() -> None:
     """Do not return bloggers who already received an offer for this order."""
@@ -596,3 +654,91 @@ async def test_record_offer_sent() -> None:
 
     sent = await offer_dispatch_repo.list_blogger_ids_sent_for_order(order_id)
     assert sent == [blogger_id]
+
+
+@pytest.mark.asyncio
+async def test_dispatch_query_count_does_not_grow_with_bloggers() -> None:
+    """Dispatch loads candidate users in one query, not one per blogger."""
+
+    factory = create_session_factory("sqlite:///:memory:")
+    engine = factory.kw["bind"]
+    tables = [
+        UserModel.__table__,
+        BloggerProfileModel.__table__,
+        OrderModel.__table__,
+        OfferDispatchModel.__table__,
+    ]
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all, tables=tables)
+    user_repo = SqlAlchemyUserRepository(session_factory=factory)
+    blogger_repo = SqlAlchemyBloggerProfileRepository(session_factory=factory)
+    order_repo = SqlAlchemyOrderRepository(session_factory=factory)
+    service = OfferDispatchService(
+        user_repo=user_repo,
+        blogger_repo=blogger_repo,
+        order_repo=order_repo,
+        offer_dispatch_repo=SqlAlchemyOfferDispatchRepository(
+            session_factory=factory
+        ),
+        transaction_manager=SessionTransactionManager(factory),
+    )
+    now = datetime.now(timezone.utc)
+    order = Order(
+        order_id=uuid4(),
+        advertiser_id=uuid4(),
+        order_type=OrderType.UGC_ONLY,
+        product_link="https://example.com",
+        offer_text="Offer",
+        barter_description=None,
+        price=1000.0,
+        bloggers_needed=3,
+        status=OrderStatus.ACTIVE,
+        created_at=now,
+        completed_at=None,
+    )
+    bloggers = [
+        User(
+            user_id=uuid4(),
+            external_id=str(index),
+            messenger_type=MessengerType.TELEGRAM,
+            username=f"blogger{index}",
+            status=UserStatus.BLOCKED if index == 0 else UserStatus.ACTIVE,
+            issue_count=0,
+            created_at=now,
+        )
+        for index in range(20)
+    ]
+    async with factory() as session:
+        await order_repo.save(order, session=session)
+        await user_repo.save_many(bloggers, session=session)
+        await blogger_repo.save_many(
+            [
+                BloggerProfile(
+                    user_id=blogger.user_id,
+                    instagram_url=f"https://instagram.com/{blogger.username}",
+                    confirmed=True,
+                    city="Moscow",
+                    topics={"selected": ["tech"]},
+                    audience_gender=AudienceGender.ALL,
+                    audience_age_min=18,
+                    audience_age_max=35,
+                    audience_geo="Moscow",
+                    price=1000.0,
+                    barter=False,
+                    work_format=WorkFormat.UGC_ONLY,
+                    updated_at=now,
+                )
+                for blogger in bloggers
+            ],
+            session=session,
+        )
+        await session.commit()
+
+    try:
+        with assert_max_queries(4):
+            result = await service.dispatch(order.order_id)
+    finally:
+        await engine.dispose()
+
+    assert len(result) == 19
+    assert bloggers[0].user_id not in {user.user_id for user in result}
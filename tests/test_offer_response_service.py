@@ -2,16 +2,27 @@
 
 from datetime import datetime, timezone
 from unittest.mock import Mock
-from uuid import UUID
+from uuid import UUID, uuid4
 
 import pytest
 
+from tests.helpers.queries import assert_max_queries
 from ugc_bot.application.errors import OrderCreationError
 from ugc_bot.application.services.offer_response_service import (
     OfferResponseService,
 )
-from ugc_bot.domain.entities import Order
+from ugc_bot.domain.entities import Order, OrderResponse
 from ugc_bot.domain.enums import OrderStatus, OrderType
+from ugc_bot.infrastructure.db.base import Base
+from ugc_bot.infrastructure.db.models import OrderModel, OrderResponseModel
+from ugc_bot.infrastructure.db.repositories import (
+    SqlAlchemyOrderRepository,
+    SqlAlchemyOrderResponseRepository,
+)
+from ugc_bot.infrastructure.db.session import (
+    SessionTransactionManager,
+    create_session_factory,
+)
 from ugc_bot.infrastructure.memory_repositories import (
     InMemoryOrderRepository,
     InMemoryOrderResponseRepository,
@@ -414,3 +425,197 @@ async def test_offer_response_tx_duplicate_response_is_rejected(
         await service.respond_and_finalize(
             order_id=order_id, blogger_id=blogger_id
         )
+
+
+@pytest.mark.asyncio
+async def test_offer_response_sqlite_counter_closes_order() -> None:
+    """Each accept is two statements; the counter caps and closes the order."""
+
+    factory = create_session_factory("sqlite:///:memory:")
+    engine = factory.kw["bind"]
+    tables = [OrderModel.__table__, OrderResponseModel.__table__]
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all, tables=tables)
+    order_repo = SqlAlchemyOrderRepository(session_factory=factory)
+    response_repo = SqlAlchemyOrderResponseRepository(session_factory=factory)
+    service = OfferResponseService(
+        order_repo=order_repo,
+        response_repo=response_repo,
+        transaction_manager=SessionTransactionManager(factory),
+    )
+    order = Order(
+        order_id=uuid4(),
+        advertiser_id=uuid4(),
+        order_type=OrderType.UGC_ONLY,
+        product_link="https://example.com",
+        offer_text="Offer",
+        barter_description=None,
+        price=1000.0,
+        bloggers_needed=2,
+        status=OrderStatus.ACTIVE,
+        created_at=datetime.now(timezone.utc),
+        completed_at=None,
+    )
+    first, second = uuid4(), uuid4()
+    try:
+        async with factory() as session:
+            await order_repo.save(order, session=session)
+            await session.commit()
+
+        with assert_max_queries(2):
+            result = await service.respond_and_finalize(order.order_id, first)
+        assert result.response_count == 1
+        assert not result.order_closed
+
+        with pytest.raises(OrderCreationError, match="already responded"):
+            await service.respond_and_finalize(order.order_id, first)
+
+        # Saving the order must not reset the counter.
+        async with factory() as session:
+            await order_repo.save(order, session=session)
+            await session.commit()
+
+        result = await service.respond_and_finalize(order.order_id, second)
+        assert result.response_count == 2
+        assert result.order_closed
+        assert result.completed_at is not None
+
+        with pytest.raises(OrderCreationError, match="not active"):
+            await service.respond_and_finalize(order.order_id, uuid4())
+
+        async with factory() as session:
+            stored = await order_repo.get_by_id(order.order_id, session=session)
+            count = await response_repo.count_by_order(
+                order.order_id, session=session
+            )
+    finally:
+        await engine.dispose()
+
+    assert stored is not None
+    assert stored.status == OrderStatus.CLOSED
+    assert stored.responses_count == 2
+    assert count == 2
+
+
+@pytest.mark.asyncio
+async def test_increment_responses_count_rejects_full_order() -> None:
+    """The conditional UPDATE matches nothing once the order is full."""
+
+    factory = create_session_factory("sqlite:///:memory:")
+    engine = factory.kw["bind"]
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            Base.metadata.create_all, tables=[OrderModel.__table__]
+        )
+    repo = SqlAlchemyOrderRepository(session_factory=factory)
+    order = Order(
+        order_id=uuid4(),
+        advertiser_id=uuid4(),
+        order_type=OrderType.UGC_ONLY,
+        product_link="https://example.com",
+        offer_text="Offer",
+        barter_description=None,
+        price=1000.0,
+        bloggers_needed=1,
+        status=OrderStatus.ACTIVE,
+        created_at=datetime.now(timezone.utc),
+        completed_at=None,
+        responses_count=1,
+    )
+    try:
+        async with factory() as session:
+            await session.merge(
+                OrderModel(
+                    order_id=order.order_id,
+                    advertiser_id=order.advertiser_id,
+                    product_link=order.product_link,
+                    offer_text=order.offer_text,
+                    price=order.price,
+                    bloggers_needed=order.bloggers_needed,
+                    status=order.status,
+                    created_at=order.created_at,
+                    responses_count=order.responses_count,
+                )
+            )
+            await session.commit()
+        async with factory() as session:
+            updated = await repo.increment_responses_count(
+                order.order_id, datetime.now(timezone.utc), session=session
+            )
+    finally:
+        await engine.dispose()
+
+    assert updated is None
+
+
+@pytest.mark.asyncio
+async def test_list_by_blogger_pages(fake_tm: object) -> None:
+    """Responses are listed whole and in keyset pages with their orders."""
+
+    order_repo = InMemoryOrderRepository()
+    response_repo = InMemoryOrderResponseRepository(order_repo=order_repo)
+    service = OfferResponseService(
+        order_repo=order_repo,
+        response_repo=response_repo,
+        transaction_manager=fake_tm,
+    )
+    blogger_id = uuid4()
+    for _ in range(3):
+        order = Order(
+            order_id=uuid4(),
+            advertiser_id=uuid4(),
+            order_type=OrderType.UGC_ONLY,
+            product_link="https://example.com",
+            offer_text="Offer",
+            barter_description=None,
+            price=1000.0,
+            bloggers_needed=3,
+            status=OrderStatus.ACTIVE,
+            created_at=datetime.now(timezone.utc),
+            completed_at=None,
+        )
+        await order_repo.save(order)
+        await service.respond(order.order_id, blogger_id)
+
+    responses = await service.list_by_blogger(blogger_id)
+    first = await service.list_page_by_blogger(blogger_id, 2)
+    last = first.items[-1][1]
+    second = await service.list_page_by_blogger(
+        blogger_id, 2, before=(last.responded_at, last.response_id)
+    )
+
+    assert len(responses) == 3
+    assert first.total == 3 and len(first.items) == 2
+    assert len(second.items) == 1
+    assert {r.response_id for _, r in first.items + second.items} == {
+        r.response_id for r in responses
+    }
+
+
+@pytest.mark.asyncio
+async def test_count_by_orders_and_has_responded(fake_tm: object) -> None:
+    """Grouped counts and the existence check go through the repository."""
+
+    response_repo = InMemoryOrderResponseRepository()
+    service = OfferResponseService(
+        order_repo=InMemoryOrderRepository(),
+        response_repo=response_repo,
+        transaction_manager=fake_tm,
+    )
+    order_id, other_order_id, blogger_id = uuid4(), uuid4(), uuid4()
+    await response_repo.save(
+        OrderResponse(
+            response_id=uuid4(),
+            order_id=order_id,
+            blogger_id=blogger_id,
+            responded_at=datetime.now(timezone.utc),
+        )
+    )
+
+    assert await service.count_by_orders([order_id, other_order_id]) == {
+        order_id: 1,
+        other_order_id: 0,
+    }
+    assert await service.count_by_order(order_id) == 1
+    assert await service.has_responded(order_id, blogger_id) is True
+    assert await service.has_responded(other_order_id, blogger_id) is False
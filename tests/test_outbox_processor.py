@@ -168,9 +168,17 @@ class TestOutboxProcessor:
 class TestRunProcessor:
     """Test run_processor function."""
 
+    @pytest.fixture(autouse=True)
+    def _no_metrics_server(self, monkeypatch: pytest.MonkeyPatch) -> Mock:
+        server = Mock(return_value=False)
+        monkeypatch.setattr(
+            "ugc_bot.outbox_processor.start_metrics_server", server
+        )
+        return server
+
     @pytest.mark.asyncio
     async def test_run_processor_success(
-        self, monkeypatch: pytest.MonkeyPatch
+        self, monkeypatch: pytest.MonkeyPatch, _no_metrics_server: Mock
     ) -> None:
         """run_processor successfully starts and runs processor."""
 
@@ -251,6 +259,7 @@ class TestRunProcessor:
 
         # Verify processor was created and started
         assert processor_created
+        _no_metrics_server.assert_called_once_with(mock_config.metrics)
         mock_processor.start.assert_called_once()
         mock_processor.stop.assert_called_once()
 
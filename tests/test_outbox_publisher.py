@@ -137,8 +137,7 @@ class TestOutboxPublisher:
         outbox_repo.get_pending_events.return_value = [event]
 
         order_repo = Mock()
-        order_repo.get_by_id = AsyncMock(return_value=order)
-        order_repo.save = AsyncMock()
+        order_repo.update_fields = AsyncMock(return_value=order)
         publisher = OutboxPublisher(
             outbox_repo=outbox_repo, order_repo=order_repo
         )
@@ -149,6 +148,11 @@ class TestOutboxPublisher:
             event.event_id, session=None
         )
 
+        # Verify only the status column was updated
+        order_repo.update_fields.assert_called_once_with(
+            order.order_id, session=None, status=OrderStatus.ACTIVE
+        )
+
         # Verify event was published to Kafka
         kafka_publisher.publish.assert_called_once()
 
@@ -207,8 +211,7 @@ class TestOutboxPublisher:
         outbox_repo.get_pending_events.return_value = [event]
 
         order_repo = Mock()
-        order_repo.get_by_id = AsyncMock(return_value=order)
-        order_repo.save = AsyncMock()
+        order_repo.update_fields = AsyncMock(return_value=order)
         publisher = OutboxPublisher(
             outbox_repo=outbox_repo, order_repo=order_repo
         )
@@ -336,8 +339,7 @@ class TestOutboxPublisher:
         )
 
         order_repo = Mock()
-        order_repo.get_by_id = AsyncMock(return_value=order)
-        order_repo.save = AsyncMock()
+        order_repo.update_fields = AsyncMock(return_value=order)
         publisher = OutboxPublisher(
             outbox_repo=outbox_repo, order_repo=order_repo
         )
@@ -432,7 +434,7 @@ class TestOutboxPublisher:
         order_repo = Mock()
 
         # Mock order repository to return None
-        order_repo.get_by_id = AsyncMock(return_value=None)
+        order_repo.update_fields = AsyncMock(return_value=None)
 
         # Mock pending event
         event = OutboxEvent(
@@ -498,8 +500,7 @@ class TestOutboxPublisher:
             created_at=datetime.now(timezone.utc),
             completed_at=None,
         )
-        order_repo.get_by_id = AsyncMock(return_value=test_order)
-        order_repo.save = AsyncMock()
+        order_repo.update_fields = AsyncMock(return_value=test_order)
 
         # Make Kafka publish raise an exception
         kafka_publisher.publish = AsyncMock(
@@ -536,8 +537,8 @@ class TestOutboxPublisher:
         )
         await publisher.process_pending_events(kafka_publisher, max_retries=3)
 
-        # Verify order was saved (activation happened before Kafka failure)
-        order_repo.save.assert_called_once()
+        # Verify order was activated before the Kafka failure
+        order_repo.update_fields.assert_called_once()
 
         # Verify event was marked as failed
         outbox_repo.mark_as_failed.assert_called_once()
@@ -0,0 +1,179 @@
+"""Tests for connection pool metrics and background validation."""
+
+import asyncio
+import sqlite3
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from ugc_bot.infrastructure.db.pool_monitor import (
+    MonitoredAsyncAdaptedQueuePool,
+    MonitoredQueuePool,
+    PoolValidator,
+    get_pool_validator,
+    instrument_pool,
+)
+from ugc_bot.infrastructure.db.session import dispose_engine
+
+
+class RecordingMetrics:
+    """Metrics collector double capturing pool calls."""
+
+    def __init__(self) -> None:
+        self.states: list[tuple[str, int, int]] = []
+        self.waits: list[tuple[str, float]] = []
+        self.invalidations: list[tuple[str, bool]] = []
+
+    def record_db_pool_state(
+        self, pool: str, checked_out: int, overflow: int
+    ) -> None:
+        self.states.append((pool, checked_out, overflow))
+
+    def record_db_pool_checkout_wait(self, pool: str, seconds: float) -> None:
+        self.waits.append((pool, seconds))
+
+    def record_db_pool_invalidation(self, pool: str, soft: bool) -> None:
+        self.invalidations.append((pool, soft))
+
+
+def test_instrument_pool_records_state_waits_and_invalidations(
+    tmp_path: Path,
+) -> None:
+    """Checkouts, checkins and invalidations reach the collector."""
+
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=MonitoredQueuePool,
+        pool_size=1,
+        max_overflow=1,
+    )
+    metrics = RecordingMetrics()
+    instrument_pool(engine, "primary", metrics)  # type: ignore[arg-type]
+    try:
+        with engine.connect() as first, engine.connect() as second:
+            assert metrics.states[-1] == ("primary", 2, 1)
+            first.invalidate()
+            second.connection.invalidate(soft=True)
+        assert metrics.states[-1] == ("primary", 0, 0)
+        assert metrics.invalidations == [("primary", False), ("primary", True)]
+        assert len(metrics.waits) == 2
+        assert all(pool == "primary" for pool, _ in metrics.waits)
+
+        engine.dispose()
+        with engine.connect():
+            pass
+        assert len(metrics.waits) == 3
+    finally:
+        engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_pool_validator_pings_idle_connections(tmp_path: Path) -> None:
+    """validate_once checks out and pings every idle connection."""
+
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+        poolclass=MonitoredAsyncAdaptedQueuePool,
+        pool_size=2,
+    )
+    validator = PoolValidator(engine, interval_seconds=3600)
+    try:
+        assert await validator.validate_once() == 0
+        async with engine.connect() as first, engine.connect() as second:
+            await first.execute(text("SELECT 1"))
+            await second.execute(text("SELECT 1"))
+
+        assert await validator.validate_once() == 2
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_pool_validator_starts_on_first_checkout(tmp_path: Path) -> None:
+    """attach() starts the loop lazily and stop() cancels it."""
+
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+        poolclass=MonitoredAsyncAdaptedQueuePool,
+        pool_pre_ping=False,
+    )
+    validator = PoolValidator(engine, interval_seconds=0.01)
+    validator.attach()
+    validator.attach()
+    try:
+        assert validator._task is None
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+        task = validator._task
+        assert task is not None
+        await asyncio.sleep(0.05)
+        assert not task.done()
+
+        await validator.stop()
+        assert task.cancelled()
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_dispose_engine_stops_attached_validator(tmp_path: Path) -> None:
+    """The attached validator is kept and stopped when the engine goes."""
+
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+        poolclass=MonitoredAsyncAdaptedQueuePool,
+        pool_pre_ping=False,
+    )
+    assert get_pool_validator(engine) is None
+    validator = PoolValidator(engine, interval_seconds=3600)
+    validator.attach()
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+    task = validator._task
+    assert get_pool_validator(engine) is validator
+
+    await dispose_engine(engine)
+
+    assert task is not None and task.cancelled()
+    assert validator._task is None
+    await validator.stop()
+
+
+def test_pool_validator_needs_running_loop(tmp_path: Path) -> None:
+    """Checkouts outside an event loop do not start the loop."""
+
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'p.db'}")
+    validator = PoolValidator(engine, interval_seconds=3600)
+
+    validator._on_checkout()
+
+    assert validator._task is None
+
+
+@pytest.mark.asyncio
+async def test_pool_validator_stops_at_failed_ping(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    """A failed ping is logged and ends the pass."""
+
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+        poolclass=MonitoredAsyncAdaptedQueuePool,
+        pool_size=2,
+    )
+    validator = PoolValidator(engine, interval_seconds=3600)
+    try:
+        async with engine.connect() as first, engine.connect() as second:
+            await first.execute(text("SELECT 1"))
+            await second.execute(text("SELECT 1"))
+
+        @event.listens_for(engine.sync_engine, "before_cursor_execute")
+        def _fail(*_args: object) -> None:
+            raise sqlite3.OperationalError("server closed the connection")
+
+        assert await validator.validate_once() == 0
+        assert "Pooled connection failed validation" in caplog.text
+    finally:
+        await engine.dispose()
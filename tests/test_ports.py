@@ -0,0 +1,43 @@
+"""Tests for default implementations on repository ports."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, call
+
+import pytest
+
+from ugc_bot.application.ports import (
+    AdvertiserProfileRepository,
+    BloggerProfileRepository,
+    ComplaintRepository,
+    InteractionRepository,
+    OrderRepository,
+    OrderResponseRepository,
+    PaymentRepository,
+)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "port",
+    [
+        AdvertiserProfileRepository,
+        BloggerProfileRepository,
+        ComplaintRepository,
+        InteractionRepository,
+        OrderRepository,
+        OrderResponseRepository,
+        PaymentRepository,
+    ],
+)
+async def test_save_many_defaults_to_save_per_item(port: type) -> None:
+    """Without a bulk override every entity goes through save()."""
+
+    repo = SimpleNamespace(save=AsyncMock())
+    session = object()
+
+    await port.save_many(repo, ["first", "second"], session=session)
+
+    assert repo.save.await_args_list == [
+        call("first", session=session),
+        call("second", session=session),
+    ]
@@ -0,0 +1,436 @@
+"""Query-plan regression suite: repository reads must use indexes.
+
+Migrates a scratch schema to head, seeds one row per table through the
+repositories, records every SELECT the read methods issue and runs it
+through ``EXPLAIN`` with sequential scans disabled. A ``Seq Scan`` left in
+the plan means no index can serve the predicate.
+"""
+
+import os
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from uuid import uuid4
+
+import psycopg
+import pytest
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+
+from ugc_bot.domain.entities import (
+    AdvertiserProfile,
+    BloggerProfile,
+    Complaint,
+    InstagramVerificationCode,
+    Interaction,
+    Order,
+    OrderResponse,
+    OutboxEvent,
+    Payment,
+    User,
+)
+from ugc_bot.domain.enums import (
+    AudienceGender,
+    ComplaintStatus,
+    InteractionStatus,
+    MessengerType,
+    OrderStatus,
+    OrderType,
+    OutboxEventStatus,
+    PaymentStatus,
+    UserStatus,
+    WorkFormat,
+)
+from ugc_bot.infrastructure.db.repositories import (
+    SqlAlchemyAdvertiserProfileRepository,
+    SqlAlchemyBloggerProfileRepository,
+    SqlAlchemyComplaintRepository,
+    SqlAlchemyContactPricingRepository,
+    SqlAlchemyFsmDraftRepository,
+    SqlAlchemyInstagramVerificationRepository,
+    SqlAlchemyInteractionRepository,
+    SqlAlchemyNpsRepository,
+    SqlAlchemyOfferDispatchRepository,
+    SqlAlchemyOrderRepository,
+    SqlAlchemyOrderResponseRepository,
+    SqlAlchemyOutboxRepository,
+    SqlAlchemyPaymentRepository,
+    SqlAlchemyUserRepository,
+)
+from ugc_bot.infrastructure.db.session import create_session_factory
+
+_SCHEMA = "query_plan_test"
+
+
+def _seq_scans(plan: dict) -> list[str]:
+    """Return relations read with a sequential scan anywhere in the plan."""
+
+    found = []
+    if plan.get("Node Type") == "Seq Scan":
+        found.append(plan.get("Relation Name", "?"))
+    for child in plan.get("Plans", []):
+        found.extend(_seq_scans(child))
+    return found
+
+
+def _postgres_url() -> str:
+    database_url = os.getenv("DATABASE_URL", "")
+    if "postgresql" not in database_url:
+        pytest.skip("DATABASE_URL with PostgreSQL is required for plan tests.")
+    return database_url
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+async def _seed(factory) -> dict:  # type: ignore[no-untyped-def]
+    """Insert one related row per table and return the keys used."""
+
+    advertiser = User(
+        user_id=uuid4(),
+        external_id="1001",
+        messenger_type=MessengerType.TELEGRAM,
+        username="advertiser",
+        status=UserStatus.ACTIVE,
+        issue_count=0,
+        created_at=_now(),
+        admin=True,
+    )
+    blogger = User(
+        user_id=uuid4(),
+        external_id="1002",
+        messenger_type=MessengerType.TELEGRAM,
+        username="blogger",
+        status=UserStatus.ACTIVE,
+        issue_count=0,
+        created_at=_now(),
+    )
+    order = Order(
+        order_id=uuid4(),
+        advertiser_id=advertiser.user_id,
+        order_type=OrderType.UGC_ONLY,
+        product_link="https://example.com",
+        offer_text="Offer",
+        barter_description=None,
+        price=1000.0,
+        bloggers_needed=3,
+        status=OrderStatus.ACTIVE,
+        created_at=_now(),
+        completed_at=_now(),
+    )
+    async with factory() as session:
+        await SqlAlchemyUserRepository(factory).save_many(
+            [advertiser, blogger], session=session
+        )
+        await SqlAlchemyBloggerProfileRepository(factory).save(
+            BloggerProfile(
+                user_id=blogger.user_id,
+                instagram_url="https://instagram.com/blogger",
+                confirmed=True,
+                city="Moscow",
+                topics={"selected": ["beauty"]},
+                audience_gender=AudienceGender.ALL,
+                audience_age_min=18,
+                audience_age_max=35,
+                audience_geo="Moscow",
+                price=1000.0,
+                barter=False,
+                work_format=WorkFormat.UGC_ONLY,
+                updated_at=_now(),
+            ),
+            session=session,
+        )
+        await SqlAlchemyAdvertiserProfileRepository(factory).save(
+            AdvertiserProfile(
+                user_id=advertiser.user_id, phone="+7000", brand="Brand"
+            ),
+            session=session,
+        )
+        await SqlAlchemyOrderRepository(factory).save(order, session=session)
+        await SqlAlchemyOrderResponseRepository(factory).save(
+            OrderResponse(
+                response_id=uuid4(),
+                order_id=order.order_id,
+                blogger_id=blogger.user_id,
+                responded_at=_now(),
+            ),
+            session=session,
+        )
+        await SqlAlchemyInteractionRepository(factory).save(
+            Interaction(
+                interaction_id=uuid4(),
+                order_id=order.order_id,
+                blogger_id=blogger.user_id,
+                advertiser_id=advertiser.user_id,
+                status=InteractionStatus.PENDING,
+                from_advertiser=None,
+                from_blogger=None,
+                postpone_count=0,
+                next_check_at=_now(),
+                created_at=_now(),
+                updated_at=_now(),
+            ),
+            session=session,
+        )
+        await SqlAlchemyComplaintRepository(factory).save(
+            Complaint(
+                complaint_id=uuid4(),
+                reporter_id=blogger.user_id,
+                reported_id=advertiser.user_id,
+                order_id=order.order_id,
+                reason="reason",
+                status=ComplaintStatus.PENDING,
+                created_at=_now(),
+                reviewed_at=None,
+            ),
+            session=session,
+        )
+        await SqlAlchemyPaymentRepository(factory).save(
+            Payment(
+                payment_id=uuid4(),
+                order_id=order.order_id,
+                provider="yookassa",
+                status=PaymentStatus.PAID,
+                amount=1000.0,
+                currency="RUB",
+                external_id="charge-1",
+                created_at=_now(),
+                paid_at=_now(),
+            ),
+            session=session,
+        )
+        await SqlAlchemyInstagramVerificationRepository(factory).save(
+            InstagramVerificationCode(
+                code_id=uuid4(),
+                user_id=blogger.user_id,
+                code="ABC123",
+                expires_at=_now() + timedelta(minutes=15),
+                used=False,
+                created_at=_now(),
+            ),
+            session=session,
+        )
+        await SqlAlchemyOutboxRepository(factory).save(
+            OutboxEvent(
+                event_id=uuid4(),
+                event_type="order.activated",
+                aggregate_id=str(order.order_id),
+                aggregate_type="order",
+                payload={},
+                status=OutboxEventStatus.PENDING,
+                created_at=_now(),
+                processed_at=None,
+                retry_count=0,
+                last_error=None,
+            ),
+            session=session,
+        )
+        await session.commit()
+    return {
+        "advertiser": advertiser,
+        "blogger": blogger,
+        "order": order,
+    }
+
+
+def _read_calls(factory, seeded: dict) -> dict[str, Callable]:  # type: ignore[no-untyped-def]
+    """Map a label to a coroutine function(session) for every read."""
+
+    users = SqlAlchemyUserRepository(factory)
+    bloggers = SqlAlchemyBloggerProfileRepository(factory)
+    advertisers = SqlAlchemyAdvertiserProfileRepository(factory)
+    orders = SqlAlchemyOrderRepository(factory)
+    responses = SqlAlchemyOrderResponseRepository(factory)
+    interactions = SqlAlchemyInteractionRepository(factory)
+    complaints = SqlAlchemyComplaintRepository(factory)
+    payments = SqlAlchemyPaymentRepository(factory)
+    codes = SqlAlchemyInstagramVerificationRepository(factory)
+    outbox = SqlAlchemyOutboxRepository(factory)
+    dispatches = SqlAlchemyOfferDispatchRepository(factory)
+    nps = SqlAlchemyNpsRepository(factory)
+    drafts = SqlAlchemyFsmDraftRepository(factory)
+    pricing = SqlAlchemyContactPricingRepository(factory)
+    blogger_id = seeded["blogger"].user_id
+    advertiser_id = seeded["advertiser"].user_id
+    order_id = seeded["order"].order_id
+    now = _now()
+    tg = MessengerType.TELEGRAM
+
+    calls: dict[str, Callable[[object], Awaitable[object]]] = {
+        "users.get_by_id": lambda s: users.get_by_id(blogger_id, s),
+        "users.get_by_external": lambda s: users.get_by_external("1002", tg, s),
+        "users.list_pending_role_reminders": lambda s: (
+            users.list_pending_role_reminders(
+                now, s, limit=100, after_user_id=blogger_id
+            )
+        ),
+        "users.list_admins": lambda s: users.list_admins(tg, s),
+        "bloggers.get_by_user_id": lambda s: bloggers.get_by_user_id(
+            blogger_id, s
+        ),
+        "bloggers.get_by_instagram_url": lambda s: (
+            bloggers.get_by_instagram_url("https://instagram.com/x", s)
+        ),
+        "bloggers.list_confirmed_user_ids": lambda s: (
+            bloggers.list_confirmed_user_ids(s)
+        ),
+        "advertisers.get_by_user_id": lambda s: advertisers.get_by_user_id(
+            advertiser_id, s
+        ),
+        "orders.get_by_id": lambda s: orders.get_by_id(order_id, s),
+        "orders.list_active": lambda s: orders.list_active(s),
+        "orders.list_by_advertiser": lambda s: orders.list_by_advertiser(
+            advertiser_id, s
+        ),
+        "orders.list_completed_before": lambda s: (
+            orders.list_completed_before(now, s)
+        ),
+        "orders.count_by_advertiser": lambda s: orders.count_by_advertiser(
+            advertiser_id, s
+        ),
+        "orders.list_page_by_advertiser": lambda s: (
+            orders.list_page_by_advertiser(
+                advertiser_id, 5, before=now, session=s
+            )
+        ),
+        "responses.list_by_order": lambda s: responses.list_by_order(
+            order_id, s
+        ),
+        "responses.list_by_blogger": lambda s: responses.list_by_blogger(
+            blogger_id, s
+        ),
+        "responses.list_page_by_blogger": lambda s: (
+            responses.list_page_by_blogger(blogger_id, 5, after=now, session=s)
+        ),
+        "responses.exists": lambda s: responses.exists(order_id, blogger_id, s),
+        "responses.count_by_order": lambda s: responses.count_by_order(
+            order_id, s
+        ),
+        "responses.count_by_orders": lambda s: responses.count_by_orders(
+            [order_id], s
+        ),
+        "interactions.get_by_participants": lambda s: (
+            interactions.get_by_participants(
+                order_id, blogger_id, advertiser_id, s
+            )
+        ),
+        "interactions.list_by_order": lambda s: interactions.list_by_order(
+            order_id, s
+        ),
+        "interactions.count_advertiser_feedback_by_orders": lambda s: (
+            interactions.count_advertiser_feedback_by_orders([order_id], s)
+        ),
+        "interactions.list_due_for_feedback": lambda s: (
+            interactions.list_due_for_feedback(now, s)
+        ),
+        "interactions.list_by_status": lambda s: (
+            interactions.list_by_status(InteractionStatus.ISSUE, s)
+        ),
+        "complaints.list_by_order": lambda s: complaints.list_by_order(
+            order_id, s
+        ),
+        "complaints.list_by_reporter": lambda s: (
+            complaints.list_by_reporter(blogger_id, s)
+        ),
+        "complaints.exists": lambda s: complaints.exists(
+            order_id, blogger_id, s
+        ),
+        "complaints.list_by_status": lambda s: complaints.list_by_status(
+            ComplaintStatus.PENDING, s
+        ),
+        "payments.get_by_order": lambda s: payments.get_by_order(order_id, s),
+        "payments.get_by_external_id": lambda s: (
+            payments.get_by_external_id("charge-1", s)
+        ),
+        "codes.get_valid_code": lambda s: codes.get_valid_code(
+            blogger_id, "ABC123", s
+        ),
+        "codes.get_valid_code_by_code": lambda s: (
+            codes.get_valid_code_by_code("ABC123", s)
+        ),
+        "outbox.get_pending_events": lambda s: outbox.get_pending_events(10, s),
+        "dispatches.list_blogger_ids_sent_for_order": lambda s: (
+            dispatches.list_blogger_ids_sent_for_order(order_id, s)
+        ),
+        "nps.exists_for_user": lambda s: nps.exists_for_user(blogger_id, s),
+        "drafts.get": lambda s: drafts.get(blogger_id, "blogger", s),
+        "pricing.get_by_bloggers_count": lambda s: (
+            pricing.get_by_bloggers_count(3, s)
+        ),
+    }
+    return calls
+
+
+@pytest.mark.integration
+@pytest.mark.timeout(120)
+@pytest.mark.asyncio
+async def test_repository_reads_never_seq_scan() -> None:
+    """Every repository SELECT is served by an index on the migrated schema."""
+
+    database_url = _postgres_url()
+    url = make_url(database_url)
+    conninfo = url.set(drivername="postgresql").render_as_string(
+        hide_password=False
+    )
+    schema_url = url.set(
+        query={**url.query, "options": f"-csearch_path={_SCHEMA}"}
+    ).render_as_string(hide_password=False)
+
+    try:
+        with psycopg.connect(conninfo, autocommit=True) as connection:
+            connection.execute(f'DROP SCHEMA IF EXISTS "{_SCHEMA}" CASCADE')
+            connection.execute(f'CREATE SCHEMA "{_SCHEMA}"')
+    except psycopg.OperationalError:
+        pytest.skip("PostgreSQL is not available for plan tests.")
+
+    previous_url = os.environ.get("DATABASE_URL")
+    factory = create_session_factory(schema_url)
+    engine = factory.kw["bind"]
+    try:
+        os.environ["DATABASE_URL"] = schema_url
+        root = Path(__file__).resolve().parents[1]
+        command.upgrade(Config(str(root / "alembic.ini")), "head")
+
+        seeded = await _seed(factory)
+        captured: list[tuple[str, str, object]] = []
+        current = [""]
+
+        def _record(conn, cursor, statement, params, *_args):  # type: ignore[no-untyped-def]
+            if statement.lstrip().upper().startswith("SELECT"):
+                captured.append((current[0], statement, params))
+
+        event.listen(engine.sync_engine, "before_cursor_execute", _record)
+        try:
+            async with factory() as session:
+                for label, call in _read_calls(factory, seeded).items():
+                    current[0] = label
+                    await call(session)
+                await session.rollback()
+        finally:
+            event.remove(engine.sync_engine, "before_cursor_execute", _record)
+
+        offenders: dict[str, list[str]] = {}
+        async with engine.connect() as conn:
+            await conn.exec_driver_sql("SET enable_seqscan = off")
+            for name, statement, params in captured:
+                result = await conn.exec_driver_sql(
+                    f"EXPLAIN (FORMAT JSON) {statement}", params
+                )
+                plan = result.scalar_one()[0]["Plan"]
+                scans = _seq_scans(plan)
+                if scans:
+                    offenders[name] = scans
+    finally:
+        if previous_url is None:
+            os.environ.pop("DATABASE_URL", None)
+        else:
+            os.environ["DATABASE_URL"] = previous_url
+        await engine.dispose()
+        with psycopg.connect(conninfo, autocommit=True) as connection:
+            connection.execute(f'DROP SCHEMA IF EXISTS "{_SCHEMA}" CASCADE')
+
+    assert captured
+    assert offenders == {}
@@ -0,0 +1,425 @@
+"""Tests for the Core row read path in SQLAlchemy repositories."""
+
+from collections.abc import AsyncIterator
+from datetime import datetime, timedelta, timezone
+from uuid import UUID, uuid4
+
+import pytest
+import pytest_asyncio
+
+from tests.helpers.queries import assert_max_queries
+from ugc_bot.domain.entities import (
+    Complaint,
+    Interaction,
+    Order,
+    OrderResponse,
+    User,
+)
+from ugc_bot.domain.enums import (
+    ComplaintStatus,
+    InteractionStatus,
+    MessengerType,
+    OrderStatus,
+    OrderType,
+    UserStatus,
+)
+from ugc_bot.infrastructure.db.base import Base
+from ugc_bot.infrastructure.db.models import (
+    ComplaintModel,
+    InteractionModel,
+    NpsResponseModel,
+    OrderModel,
+    OrderResponseModel,
+    UserModel,
+)
+from ugc_bot.infrastructure.db.repositories import (
+    SqlAlchemyComplaintRepository,
+    SqlAlchemyInteractionRepository,
+    SqlAlchemyNpsRepository,
+    SqlAlchemyOrderRepository,
+    SqlAlchemyOrderResponseRepository,
+    SqlAlchemyUserRepository,
+)
+from ugc_bot.infrastructure.db.session import create_session_factory
+
+
+def _order_cursor(order: Order) -> tuple[datetime, UUID]:
+    return order.created_at, order.order_id
+
+
+def _response_cursor(response: OrderResponse) -> tuple[datetime, UUID]:
+    return response.responded_at, response.response_id
+
+
+@pytest_asyncio.fixture
+async def session_factory() -> AsyncIterator[object]:
+    """SQLite session factory with the tables these reads touch."""
+
+    factory = create_session_factory("sqlite:///:memory:")
+    engine = factory.kw["bind"]
+    tables = [
+        UserModel.__table__,
+        InteractionModel.__table__,
+        OrderModel.__table__,
+        OrderResponseModel.__table__,
+        ComplaintModel.__table__,
+        NpsResponseModel.__table__,
+    ]
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all, tables=tables)
+    try:
+        yield factory
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_point_lookup_maps_row_without_orm_instance(
+    session_factory,
+) -> None:
+    """get_by_external returns the entity without filling the identity map."""
+
+    repo = SqlAlchemyUserRepository(session_factory=session_factory)
+    user = User(
+        user_id=uuid4(),
+        external_id="42",
+        messenger_type=MessengerType.TELEGRAM,
+        username="alice",
+        status=UserStatus.ACTIVE,
+        issue_count=1,
+        created_at=datetime(2025, 1, 1, tzinfo=timezone.utc),
+        telegram="@alice",
+    )
+    async with session_factory() as session:
+        await repo.save(user, session=session)
+        await session.commit()
+
+    async with session_factory() as session:
+        loaded = await repo.get_by_external(
+            "42", MessengerType.TELEGRAM, session=session
+        )
+        assert len(session.identity_map) == 0
+
+    assert loaded is not None
+    assert loaded.messenger_type is MessengerType.TELEGRAM
+    assert loaded.status is UserStatus.ACTIVE
+    assert loaded.user_id == user.user_id
+    assert loaded.telegram == "@alice"
+    assert not hasattr(loaded, "__dict__")
+
+
+@pytest.mark.asyncio
+async def test_list_by_ids_reads_users_in_one_query(session_factory) -> None:
+    """list_by_ids loads every requested user with one IN query."""
+
+    repo = SqlAlchemyUserRepository(session_factory=session_factory)
+    users = [
+        User(
+            user_id=uuid4(),
+            external_id=str(idx),
+            messenger_type=MessengerType.TELEGRAM,
+            username=f"user{idx}",
+            status=UserStatus.ACTIVE,
+            issue_count=0,
+            created_at=datetime(2025, 1, 1, tzinfo=timezone.utc),
+        )
+        for idx in range(3)
+    ]
+    async with session_factory() as session:
+        await repo.save_many(users, session=session)
+        await session.commit()
+
+    async with session_factory() as session:
+        with assert_max_queries(1):
+            listed = await repo.list_by_ids(
+                [users[0].user_id, users[2].user_id, uuid4()], session=session
+            )
+        assert await repo.list_by_ids([], session=session) == []
+
+    assert {user.user_id for user in listed} == {
+        users[0].user_id,
+        users[2].user_id,
+    }
+
+
+@pytest.mark.asyncio
+async def test_list_due_for_feedback_maps_rows(session_factory) -> None:
+    """List queries map every row to an Interaction entity."""
+
+    repo = SqlAlchemyInteractionRepository(session_factory=session_factory)
+    now = datetime.now(timezone.utc)
+    due = [
+        Interaction(
+            interaction_id=uuid4(),
+            order_id=uuid4(),
+            blogger_id=uuid4(),
+            advertiser_id=uuid4(),
+            status=InteractionStatus.PENDING,
+            from_advertiser=None,
+            from_blogger=None,
+            postpone_count=0,
+            next_check_at=now - timedelta(minutes=index),
+            created_at=now,
+            updated_at=now,
+        )
+        for index in range(3)
+    ]
+    async with session_factory() as session:
+        await repo.save_many(due, session=session)
+        await session.commit()
+
+    async with session_factory() as session:
+        listed = list(await repo.list_due_for_feedback(now, session=session))
+        assert len(session.identity_map) == 0
+
+    assert {item.interaction_id for item in listed} == {
+        item.interaction_id for item in due
+    }
+    assert all(item.status is InteractionStatus.PENDING for item in listed)
+
+
+@pytest.mark.asyncio
+async def test_keyset_pages_of_orders_and_responses(session_factory) -> None:
+    """Each page is one statement and carries the total list size."""
+
+    orders_repo = SqlAlchemyOrderRepository(session_factory=session_factory)
+    responses_repo = SqlAlchemyOrderResponseRepository(
+        session_factory=session_factory
+    )
+    advertiser_id, blogger_id = uuid4(), uuid4()
+    base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    orders = [
+        Order(
+            order_id=uuid4(),
+            advertiser_id=advertiser_id,
+            order_type=OrderType.UGC_ONLY,
+            product_link="https://example.com",
+            offer_text="Offer",
+            barter_description=None,
+            price=1000.0,
+            bloggers_needed=3,
+            status=OrderStatus.ACTIVE,
+            created_at=base + timedelta(minutes=index),
+            completed_at=None,
+        )
+        for index in range(5)
+    ]
+    responses = [
+        OrderResponse(
+            response_id=uuid4(),
+            order_id=order.order_id,
+            blogger_id=blogger_id,
+            responded_at=base + timedelta(hours=1, minutes=-index),
+        )
+        for index, order in enumerate(orders)
+    ]
+    async with session_factory() as session:
+        await orders_repo.save_many(orders, session=session)
+        await responses_repo.save_many(responses, session=session)
+        await session.commit()
+
+    async with session_factory() as session:
+        with assert_max_queries(1):
+            first = await orders_repo.list_page_by_advertiser(
+                advertiser_id, 2, session=session
+            )
+        second = await orders_repo.list_page_by_advertiser(
+            advertiser_id,
+            2,
+            before=_order_cursor(first.items[-1]),
+            session=session,
+        )
+        back = await orders_repo.list_page_by_advertiser(
+            advertiser_id,
+            2,
+            after=_order_cursor(second.items[0]),
+            session=session,
+        )
+        with assert_max_queries(1):
+            joined = await responses_repo.list_page_by_blogger(
+                blogger_id,
+                2,
+                after=_response_cursor(responses[2]),
+                session=session,
+            )
+        empty = await responses_repo.list_page_by_blogger(
+            blogger_id,
+            2,
+            before=_response_cursor(responses[-1]),
+            session=session,
+        )
+
+    assert [o.order_id for o in first.items] == [
+        orders[4].order_id,
+        orders[3].order_id,
+    ]
+    assert first.total == 5
+    assert [o.order_id for o in second.items] == [
+        orders[2].order_id,
+        orders[1].order_id,
+    ]
+    assert back.items == first.items
+    assert [(o.order_id, r.response_id) for o, r in joined.items] == [
+        (orders[0].order_id, responses[0].response_id),
+        (orders[1].order_id, responses[1].response_id),
+    ]
+    assert joined.total == 5
+    assert empty.items == [] and empty.total == 0
+
+
+@pytest.mark.asyncio
+async def test_keyset_pages_break_timestamp_ties_by_id(session_factory) -> None:
+    """Rows sharing a timestamp are neither skipped nor repeated."""
+
+    orders_repo = SqlAlchemyOrderRepository(session_factory=session_factory)
+    advertiser_id = uuid4()
+    created_at = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    orders = [
+        Order(
+            order_id=order_id,
+            advertiser_id=advertiser_id,
+            order_type=OrderType.UGC_ONLY,
+            product_link="https://example.com",
+            offer_text="Offer",
+            barter_description=None,
+            price=1000.0,
+            bloggers_needed=3,
+            status=OrderStatus.ACTIVE,
+            created_at=created_at,
+            completed_at=None,
+        )
+        for order_id in sorted(uuid4() for _ in range(5))
+    ]
+    async with session_factory() as session:
+        await orders_repo.save_many(orders, session=session)
+        await session.commit()
+
+    seen: list[UUID] = []
+    before = None
+    async with session_factory() as session:
+        while True:
+            page = await orders_repo.list_page_by_advertiser(
+                advertiser_id, 2, before=before, session=session
+            )
+            if not page.items:
+                break
+            seen.extend(order.order_id for order in page.items)
+            before = _order_cursor(page.items[-1])
+        back = await orders_repo.list_page_by_advertiser(
+            advertiser_id,
+            2,
+            after=_order_cursor(orders[2]),
+            session=session,
+        )
+
+    assert seen == [order.order_id for order in reversed(orders)]
+    assert [o.order_id for o in back.items] == [
+        orders[4].order_id,
+        orders[3].order_id,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_grouped_counts_and_exists_checks(session_factory) -> None:
+    """Counts come back per requested order; existence checks use EXISTS."""
+
+    responses = SqlAlchemyOrderResponseRepository(
+        session_factory=session_factory
+    )
+    interactions = SqlAlchemyInteractionRepository(
+        session_factory=session_factory
+    )
+    complaints = SqlAlchemyComplaintRepository(session_factory=session_factory)
+    nps = SqlAlchemyNpsRepository(session_factory=session_factory)
+    now = datetime.now(timezone.utc)
+    busy, quiet, unknown = uuid4(), uuid4(), uuid4()
+    bloggers = [uuid4(), uuid4(), uuid4()]
+    advertiser_id, reporter_id = uuid4(), uuid4()
+    async with session_factory() as session:
+        await responses.save_many(
+            [
+                OrderResponse(
+                    response_id=uuid4(),
+                    order_id=order_id,
+                    blogger_id=blogger_id,
+                    responded_at=now,
+                )
+                for order_id, blogger_id in [
+                    (busy, bloggers[0]),
+                    (busy, bloggers[1]),
+                    (quiet, bloggers[2]),
+                ]
+            ],
+            session=session,
+        )
+        await interactions.save_many(
+            [
+                Interaction(
+                    interaction_id=uuid4(),
+                    order_id=busy,
+                    blogger_id=blogger_id,
+                    advertiser_id=advertiser_id,
+                    status=InteractionStatus.PENDING,
+                    from_advertiser=feedback,
+                    from_blogger=None,
+                    postpone_count=0,
+                    next_check_at=now,
+                    created_at=now,
+                    updated_at=now,
+                )
+                for blogger_id, feedback in [
+                    (bloggers[0], "✅ Сделка состоялась"),
+                    (bloggers[1], None),
+                ]
+            ],
+            session=session,
+        )
+        await complaints.save(
+            Complaint(
+                complaint_id=uuid4(),
+                reporter_id=reporter_id,
+                reported_id=advertiser_id,
+                order_id=busy,
+                reason="Мошенничество",
+                status=ComplaintStatus.PENDING,
+                created_at=now,
+                reviewed_at=None,
+            ),
+            session=session,
+        )
+        session.add(
+            NpsResponseModel(
+                id=uuid4(), user_id=reporter_id, score=9, created_at=now
+            )
+        )
+        await session.commit()
+
+    async with session_factory() as session:
+        with assert_max_queries(2):
+            response_counts = await responses.count_by_orders(
+                [busy, quiet, unknown], session=session
+            )
+            feedback_counts = (
+                await interactions.count_advertiser_feedback_by_orders(
+                    [busy, unknown], session=session
+                )
+            )
+        assert await responses.count_by_orders([], session=session) == {}
+        assert (
+            await interactions.count_advertiser_feedback_by_orders(
+                [], session=session
+            )
+            == {}
+        )
+        checks = [
+            await responses.exists(busy, bloggers[0], session=session),
+            await responses.exists(quiet, bloggers[0], session=session),
+            await complaints.exists(busy, reporter_id, session=session),
+            await complaints.exists(quiet, reporter_id, session=session),
+            await nps.exists_for_user(reporter_id, session=session),
+            await nps.exists_for_user(advertiser_id, session=session),
+        ]
+
+    assert response_counts == {busy: 2, quiet: 1, unknown: 0}
+    assert feedback_counts == {busy: 1, unknown: 0}
+    assert checks == [True, False, True, False, True, False]
@@ -0,0 +1,471 @@
+"""Tests for upsert and partial-update writes in SQLAlchemy repositories."""
+
+from collections.abc import AsyncIterator
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from uuid import UUID, uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event, inspect
+from sqlalchemy.dialects import postgresql
+
+from ugc_bot.domain.entities import (
+    AdvertiserProfile,
+    Complaint,
+    Order,
+    OrderResponse,
+    Payment,
+    User,
+)
+from ugc_bot.domain.enums import (
+    ComplaintStatus,
+    MessengerType,
+    OrderStatus,
+    OrderType,
+    PaymentStatus,
+    UserStatus,
+)
+from ugc_bot.infrastructure.db import repositories
+from ugc_bot.infrastructure.db.base import Base
+from ugc_bot.infrastructure.db.models import (
+    OrderModel,
+    UserModel,
+)
+from ugc_bot.infrastructure.db.repositories import (
+    SqlAlchemyAdvertiserProfileRepository,
+    SqlAlchemyComplaintRepository,
+    SqlAlchemyOfferDispatchRepository,
+    SqlAlchemyOrderRepository,
+    SqlAlchemyOrderResponseRepository,
+    SqlAlchemyPaymentRepository,
+    SqlAlchemyUserRepository,
+    _to_order_model,
+    _to_user_model,
+)
+from ugc_bot.infrastructure.db.session import create_session_factory
+
+
+@pytest_asyncio.fixture
+async def session_factory() -> AsyncIterator[object]:
+    """SQLite session factory with the users and orders tables."""
+
+    factory = create_session_factory("sqlite:///:memory:")
+    engine = factory.kw["bind"]
+    tables = [UserModel.__table__, OrderModel.__table__]
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all, tables=tables)
+    try:
+        yield factory
+    finally:
+        await engine.dispose()
+
+
+class _StatementCounter:
+    """Count statements sent to the database."""
+
+    def __init__(self, factory) -> None:  # type: ignore[no-untyped-def]
+        self.statements: list[str] = []
+        self._engine = factory.kw["bind"].sync_engine
+        event.listen(self._engine, "before_cursor_execute", self._record)
+
+    def _record(self, conn, cursor, statement, *args):  # type: ignore[no-untyped-def]
+        self.statements.append(statement)
+
+    def close(self) -> None:
+        event.remove(self._engine, "before_cursor_execute", self._record)
+
+
+def _user(**overrides: object) -> User:
+    values: dict = {
+        "user_id": uuid4(),
+        "external_id": str(uuid4().int)[:9],
+        "messenger_type": MessengerType.TELEGRAM,
+        "username": "alice",
+        "status": UserStatus.ACTIVE,
+        "issue_count": 0,
+        "created_at": datetime.now(timezone.utc),
+    }
+    values.update(overrides)
+    return User(**values)
+
+
+def _order(advertiser_id: UUID) -> Order:
+    return Order(
+        order_id=uuid4(),
+        advertiser_id=advertiser_id,
+        order_type=OrderType.UGC_ONLY,
+        product_link="https://example.com",
+        offer_text="Offer",
+        barter_description=None,
+        price=1000.0,
+        bloggers_needed=3,
+        status=OrderStatus.NEW,
+        created_at=datetime.now(timezone.utc),
+        completed_at=None,
+    )
+
+
+@pytest.mark.asyncio
+async def test_user_save_inserts_then_updates(session_factory) -> None:
+    """save inserts a new row and updates it on conflict."""
+
+    repo = SqlAlchemyUserRepository(session_factory=session_factory)
+    user = _user()
+
+    async with session_factory() as session:
+        await repo.save(user, session=session)
+        await session.commit()
+
+    renamed = _user(
+        user_id=user.user_id,
+        external_id=user.external_id,
+        username="bob",
+        created_at=user.created_at,
+    )
+    async with session_factory() as session:
+        await repo.save(renamed, session=session)
+        await session.commit()
+
+    async with session_factory() as session:
+        stored = await repo.get_by_id(user.user_id, session=session)
+    assert stored is not None
+    assert stored.username == "bob"
+
+
+@pytest.mark.asyncio
+async def test_save_refreshes_instance_loaded_in_same_session(
+    session_factory,
+) -> None:
+    """A read after save in the same session sees the new values."""
+
+    repo = SqlAlchemyUserRepository(session_factory=session_factory)
+    user = _user()
+    async with session_factory() as session:
+        await repo.save(user, session=session)
+        await session.commit()
+
+    async with session_factory() as session:
+        loaded = await repo.get_by_id(user.user_id, session=session)
+        assert loaded is not None
+        await repo.save(
+            _user(
+                user_id=user.user_id,
+                external_id=user.external_id,
+                username="carol",
+                created_at=user.created_at,
+            ),
+            session=session,
+        )
+        reloaded = await repo.get_by_id(user.user_id, session=session)
+    assert reloaded is not None
+    assert reloaded.username == "carol"
+
+
+@pytest.mark.asyncio
+async def test_save_expires_orm_instance_in_same_session(
+    session_factory,
+) -> None:
+    """An ORM instance of the saved row is expired, not left stale."""
+
+    repo = SqlAlchemyUserRepository(session_factory=session_factory)
+    user = _user()
+    async with session_factory() as session:
+        await repo.save(user, session=session)
+        await session.commit()
+
+    async with session_factory() as session:
+        model = await session.get(UserModel, user.user_id)
+        assert model is not None
+        await repo.save(
+            _user(
+                user_id=user.user_id,
+                external_id=user.external_id,
+                username="dave",
+                created_at=user.created_at,
+            ),
+            session=session,
+        )
+        assert inspect(model).expired
+        await session.refresh(model)
+        assert model.username == "dave"
+
+
+@pytest.mark.asyncio
+async def test_save_many_writes_one_statement(session_factory) -> None:
+    """save_many persists all rows with a single INSERT."""
+
+    user_repo = SqlAlchemyUserRepository(session_factory=session_factory)
+    order_repo = SqlAlchemyOrderRepository(session_factory=session_factory)
+    advertiser = _user()
+    orders = [_order(advertiser.user_id) for _ in range(3)]
+
+    counter = _StatementCounter(session_factory)
+    try:
+        async with session_factory() as session:
+            await user_repo.save(advertiser, session=session)
+            await order_repo.save_many(orders, session=session)
+            await session.commit()
+    finally:
+        counter.close()
+
+    inserts = [s for s in counter.statements if s.startswith("INSERT")]
+    assert len(inserts) == 2
+    async with session_factory() as session:
+        listed = list(
+            await order_repo.list_by_advertiser(
+                advertiser.user_id, session=session
+            )
+        )
+    assert len(listed) == 3
+
+
+@pytest.mark.asyncio
+async def test_upsert_halves_statements_versus_merge(session_factory) -> None:
+    """Registration + order creation issue half the statements of merge."""
+
+    user_repo = SqlAlchemyUserRepository(session_factory=session_factory)
+    order_repo = SqlAlchemyOrderRepository(session_factory=session_factory)
+
+    def _dml(statements: list[str]) -> list[str]:
+        return [
+            s
+            for s in statements
+            if s.split(" ", 1)[0] in {"SELECT", "INSERT", "UPDATE"}
+        ]
+
+    merge_user = _user()
+    counter = _StatementCounter(session_factory)
+    try:
+        async with session_factory() as session:
+            await session.merge(_to_user_model(merge_user))
+            await session.merge(_to_order_model(_order(merge_user.user_id)))
+            await session.commit()
+    finally:
+        counter.close()
+    merge_count = len(_dml(counter.statements))
+
+    upsert_user = _user()
+    counter = _StatementCounter(session_factory)
+    try:
+        async with session_factory() as session:
+            await user_repo.save(upsert_user, session=session)
+            await order_repo.save(_order(upsert_user.user_id), session=session)
+            await session.commit()
+    finally:
+        counter.close()
+    upsert_count = len(_dml(counter.statements))
+
+    assert upsert_count == 2
+    assert upsert_count * 2 <= merge_count
+
+
+@pytest.mark.asyncio
+async def test_order_update_fields_single_statement(session_factory) -> None:
+    """update_fields is one UPDATE ... RETURNING touching given columns."""
+
+    user_repo = SqlAlchemyUserRepository(session_factory=session_factory)
+    order_repo = SqlAlchemyOrderRepository(session_factory=session_factory)
+    advertiser = _user()
+    order = _order(advertiser.user_id)
+    async with session_factory() as session:
+        await user_repo.save(advertiser, session=session)
+        await order_repo.save(order, session=session)
+        await session.commit()
+
+    counter = _StatementCounter(session_factory)
+    try:
+        async with session_factory() as session:
+            loaded = await order_repo.get_by_id(order.order_id, session=session)
+            counter.statements.clear()
+            updated = await order_repo.update_fields(
+                order.order_id, session=session, status=OrderStatus.ACTIVE
+            )
+            reloaded = await order_repo.get_by_id(
+                order.order_id, session=session
+            )
+            await session.commit()
+    finally:
+        counter.close()
+
+    assert loaded is not None and loaded.status == OrderStatus.NEW
+    assert updated is not None
+    assert updated.status == OrderStatus.ACTIVE
+    assert updated.offer_text == order.offer_text
+    assert reloaded is not None and reloaded.status == OrderStatus.ACTIVE
+    writes = [s for s in counter.statements if s.startswith("UPDATE")]
+    assert len(writes) == 1
+    assert writes[0].startswith("UPDATE orders SET status=")
+    assert "RETURNING" in writes[0]
+
+
+class _PostgresRecordingSession:
+    """Session stub reporting a Postgres dialect and recording statements."""
+
+    bind = SimpleNamespace(dialect=SimpleNamespace(name="postgresql"))
+
+    def __init__(self) -> None:
+        self.statements: list = []
+
+    async def execute(self, stmt, *_args, **_kwargs):  # type: ignore[no-untyped-def]
+        self.statements.append(stmt)
+
+    def _sql(self, index: int = 0) -> str:
+        return str(self.statements[index].compile(dialect=postgresql.dialect()))
+
+
+@pytest.mark.asyncio
+async def test_upsert_compiles_on_conflict_for_postgres() -> None:
+    """On Postgres the save is a single INSERT ... ON CONFLICT DO UPDATE."""
+
+    session = _PostgresRecordingSession()
+    repo = SqlAlchemyUserRepository(session_factory=None)  # type: ignore[arg-type]
+    await repo.save(_user(), session=session)
+
+    assert len(session.statements) == 1
+    sql = session._sql()
+    assert "ON CONFLICT (user_id) DO UPDATE" in sql
+    assert "username = excluded.username" in sql
+
+
+@pytest.mark.asyncio
+async def test_offer_dispatch_record_sent_does_nothing_on_conflict() -> None:
+    """Recording an existing dispatch is a no-op insert on Postgres."""
+
+    session = _PostgresRecordingSession()
+    repo = SqlAlchemyOfferDispatchRepository(session_factory=None)  # type: ignore[arg-type]
+    await repo.record_sent(uuid4(), uuid4(), session=session)
+
+    assert len(session.statements) == 1
+    assert "ON CONFLICT (order_id, blogger_id) DO NOTHING" in session._sql()
+
+
+@pytest.mark.asyncio
+async def test_save_many_without_rows_issues_no_statement() -> None:
+    """save_many([]) returns without touching the database."""
+
+    session = _PostgresRecordingSession()
+    repo = SqlAlchemyUserRepository(session_factory=None)  # type: ignore[arg-type]
+    await repo.save_many([], session=session)
+
+    assert session.statements == []
+
+
+@pytest.mark.asyncio
+async def test_save_many_upserts_payments_profiles_and_complaints() -> None:
+    """Each repository's save_many is one multi-row upsert on Postgres."""
+
+    now = datetime.now(timezone.utc)
+    user_ids = [uuid4(), uuid4()]
+    profiles = SqlAlchemyAdvertiserProfileRepository(session_factory=None)  # type: ignore[arg-type]
+    payments = SqlAlchemyPaymentRepository(session_factory=None)  # type: ignore[arg-type]
+    complaints = SqlAlchemyComplaintRepository(session_factory=None)  # type: ignore[arg-type]
+    session = _PostgresRecordingSession()
+    await profiles.save_many(
+        [
+            AdvertiserProfile(user_id=user_id, phone="+7900", brand="Brand")
+            for user_id in user_ids
+        ],
+        session=session,
+    )
+    await payments.save_many(
+        [
+            Payment(
+                payment_id=uuid4(),
+                order_id=uuid4(),
+                provider="yookassa",
+                status=PaymentStatus.PAID,
+                amount=1000.0,
+                currency="RUB",
+                external_id=str(uuid4()),
+                created_at=now,
+                paid_at=now,
+            )
+            for _ in range(2)
+        ],
+        session=session,
+    )
+    await complaints.save_many(
+        [
+            Complaint(
+                complaint_id=uuid4(),
+                reporter_id=user_ids[0],
+                reported_id=user_ids[1],
+                order_id=uuid4(),
+                reason="spam",
+                status=ComplaintStatus.PENDING,
+                created_at=now,
+                reviewed_at=None,
+            )
+            for _ in range(2)
+        ],
+        session=session,
+    )
+
+    assert len(session.statements) == 3
+    assert "ON CONFLICT (user_id) DO UPDATE" in session._sql(0)
+    assert "ON CONFLICT (payment_id) DO UPDATE" in session._sql(1)
+    assert "ON CONFLICT (complaint_id) DO UPDATE" in session._sql(2)
+
+
+class _NoUpsertSession:
+    """Session stub without a bound dialect; EXISTS answers ``found``."""
+
+    def __init__(self, found: bool) -> None:
+        self.found = found
+        self.added: list = []
+
+    async def execute(self, stmt, *_args, **_kwargs):  # type: ignore[no-untyped-def]
+        return SimpleNamespace(scalar_one=lambda: self.found)
+
+    def add(self, model) -> None:  # type: ignore[no-untyped-def]
+        self.added.append(model)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("found", [False, True])
+async def test_add_if_absent_falls_back_without_upsert_dialect(
+    found: bool,
+) -> None:
+    """Without native upserts the response is added after an EXISTS check."""
+
+    session = _NoUpsertSession(found)
+    repo = SqlAlchemyOrderResponseRepository(session_factory=None)  # type: ignore[arg-type]
+    response = OrderResponse(
+        response_id=uuid4(),
+        order_id=uuid4(),
+        blogger_id=uuid4(),
+        responded_at=datetime.now(timezone.utc),
+    )
+
+    added = await repo.add_if_absent(response, session=session)
+
+    assert added is not found
+    assert [m.response_id for m in session.added] == (
+        [] if found else [response.response_id]
+    )
+
+
+@pytest.mark.asyncio
+async def test_column_reads_see_merge_fallback_in_same_unit(
+    session_factory, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Rows left pending by the merge fallback are flushed before a read."""
+
+    monkeypatch.setattr(repositories, "_UPSERT_INSERTS", {})
+    repo = SqlAlchemyUserRepository(session_factory=session_factory)
+    orders = SqlAlchemyOrderRepository(session_factory=session_factory)
+    user = _user()
+    order = _order(user.user_id)
+
+    async with session_factory() as session:
+        await repo.save(user, session=session)
+        await orders.save(order, session=session)
+
+        stored = await repo.get_by_id(user.user_id, session=session)
+        stored_order = await orders.get_by_id(order.order_id, session=session)
+
+    assert stored is not None
+    assert stored.user_id == user.user_id
+    assert stored_order is not None
+    assert stored_order.responses_count == 0
@@ -8,6 +8,7 @@ from zoneinfo import ZoneInfo
 import pytest
 
 from ugc_bot.application.services.user_role_service import UserRoleService
+from ugc_bot.bot.sending import SendRateLimiter
 from ugc_bot.domain.entities import User
 from ugc_bot.domain.enums import MessengerType, UserStatus
 from ugc_bot.infrastructure.memory_repositories import InMemoryUserRepository
@@ -132,6 +133,44 @@ def test_main_exits_when_no_database_url() -> None:
             mock_load.assert_called_once()
 
 
+def test_main_closes_shared_bot_session_when_run_fails() -> None:
+    """main() closes the shared Bot API session even if the run raises."""
+
+    config = MagicMock()
+    config.role_reminder.role_reminder_enabled = True
+    config.db.database_url = "postgresql+psycopg://u:p@localhost/db"
+    module = "ugc_bot.role_reminder_scheduler"
+    with (
+        patch(f"{module}.load_config", return_value=config),
+        patch(f"{module}.configure_logging"),
+        patch(f"{module}.log_startup_info"),
+        patch(f"{module}.build_slow_query_recorder"),
+        patch(f"{module}.db_engine_options", return_value={}),
+        patch(f"{module}.create_session_factory"),
+        patch(f"{module}.create_replica_session_factory_from_config"),
+        patch(f"{module}.create_transaction_manager"),
+        patch(f"{module}._reminder_cutoff"),
+        patch(f"{module}.shared_bot_session"),
+        patch(f"{module}.Bot"),
+        patch(f"{module}.SendRateLimiter"),
+        patch(f"{module}.build_metrics_collector"),
+        patch(
+            f"{module}.run_once",
+            new_callable=AsyncMock,
+            side_effect=RuntimeError("db down"),
+        ),
+        patch(
+            f"{module}.close_shared_bot_session", new_callable=AsyncMock
+        ) as close_session,
+    ):
+        from ugc_bot.role_reminder_scheduler import main
+
+        with pytest.raises(RuntimeError):
+            main()
+
+    close_session.assert_awaited_once()
+
+
 @pytest.mark.asyncio
 async def test_run_once_handles_send_failure(fake_tm) -> None:
     """run_once logs warning and does not update when send_with_retry raises."""
@@ -164,3 +203,90 @@ async def test_run_once_handles_send_failure(fake_tm) -> None:
     updated = await service.get_user_by_id(user.user_id)
     assert updated is not None
     assert updated.last_role_reminder_at is None
+
+
+@pytest.mark.asyncio
+async def test_run_once_does_not_mark_unsent_reminders(fake_tm) -> None:
+    """A reminder send_with_retry gave up on is not marked as sent."""
+
+    repo = InMemoryUserRepository()
+    user = User(
+        user_id=uuid4(),
+        external_id="123",
+        messenger_type=MessengerType.TELEGRAM,
+        username="u",
+        status=UserStatus.ACTIVE,
+        issue_count=0,
+        created_at=datetime.now(timezone.utc),
+        role_chosen_at=None,
+        last_role_reminder_at=None,
+    )
+    await repo.save(user)
+    service = UserRoleService(user_repo=repo, transaction_manager=fake_tm)
+
+    with patch(
+        "ugc_bot.role_reminder_scheduler.send_with_retry",
+        new_callable=AsyncMock,
+        return_value=False,
+    ):
+        await run_once(MagicMock(), service, datetime.now(timezone.utc))
+
+    updated = await service.get_user_by_id(user.user_id)
+    assert updated is not None
+    assert updated.last_role_reminder_at is None
+
+
+@pytest.mark.asyncio
+async def test_run_once_pages_and_bulk_updates(fake_tm) -> None:
+    """run_once streams users in pages and writes one bulk update per page."""
+
+    repo = InMemoryUserRepository()
+    users = []
+    for idx in range(5):
+        user = User(
+            user_id=uuid4(),
+            external_id=str(1000 + idx),
+            messenger_type=MessengerType.TELEGRAM,
+            username=f"u{idx}",
+            status=UserStatus.ACTIVE,
+            issue_count=0,
+            created_at=datetime.now(timezone.utc),
+        )
+        await repo.save(user)
+        users.append(user)
+
+    service = UserRoleService(user_repo=repo, transaction_manager=fake_tm)
+    limiter = SendRateLimiter(rate_per_second=0, max_concurrency=3)
+
+    with (
+        patch(
+            "ugc_bot.role_reminder_scheduler.send_with_retry",
+            new_callable=AsyncMock,
+        ) as mock_send,
+        patch.object(
+            repo,
+            "update_last_role_reminder_at_many",
+            wraps=repo.update_last_role_reminder_at_many,
+        ) as bulk_update,
+    ):
+        await run_once(
+            MagicMock(),
+            service,
+            datetime.now(timezone.utc),
+            batch_size=2,
+            limiter=limiter,
+        )
+
+    assert mock_send.await_count == 5
+    assert all(
+        call.kwargs["limiter"] is limiter for call in mock_send.call_args_list
+    )
+    assert [len(call.args[0]) for call in bulk_update.call_args_list] == [
+        2,
+        2,
+        1,
+    ]
+    for user in users:
+        updated = await repo.get_by_id(user.user_id)
+        assert updated is not None
+        assert updated.last_role_reminder_at is not None
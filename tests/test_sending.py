@@ -0,0 +1,99 @@
+"""Tests for outbound Bot API helpers."""
+
+import asyncio
+import logging
+
+import pytest
+
+from ugc_bot.bot.sending import SendRateLimiter, send_with_retry
+
+
+@pytest.mark.asyncio
+async def test_send_with_retry_success() -> None:
+    """Return True on successful send."""
+
+    class DummyBot:
+        def __init__(self) -> None:
+            self.calls = 0
+
+        async def send_message(self, chat_id: int, text: str, **kwargs) -> None:  # type: ignore[no-untyped-def]
+            self.calls += 1
+
+    bot = DummyBot()
+    ok = await send_with_retry(
+        bot,
+        chat_id=1,
+        text="hi",
+        retries=2,
+        delay_seconds=0.0,
+        logger=logging.getLogger("test"),
+    )
+    assert ok is True
+    assert bot.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_send_with_retry_failure() -> None:
+    """Return False after retries exhausted."""
+
+    class DummyBot:
+        async def send_message(self, chat_id: int, text: str, **kwargs) -> None:  # type: ignore[no-untyped-def]
+            raise RuntimeError("fail")
+
+    ok = await send_with_retry(
+        DummyBot(),
+        chat_id=1,
+        text="hi",
+        retries=2,
+        delay_seconds=0.0,
+        logger=logging.getLogger("test"),
+    )
+    assert ok is False
+
+
+@pytest.mark.asyncio
+async def test_send_rate_limiter_caps_concurrency() -> None:
+    """SendRateLimiter never lets more than max_concurrency calls run."""
+
+    limiter = SendRateLimiter(rate_per_second=0, max_concurrency=2)
+    in_flight = 0
+    peak = 0
+
+    class DummyBot:
+        async def send_message(self, chat_id: int, text: str, **kwargs) -> None:  # type: ignore[no-untyped-def]
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+
+    bot = DummyBot()
+    results = await asyncio.gather(
+        *(
+            send_with_retry(
+                bot,
+                chat_id=i,
+                text="hi",
+                retries=1,
+                delay_seconds=0.0,
+                logger=logging.getLogger("test"),
+                limiter=limiter,
+            )
+            for i in range(6)
+        )
+    )
+    assert all(results)
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_send_rate_limiter_spaces_calls() -> None:
+    """SendRateLimiter spaces slots by 1 / rate_per_second."""
+
+    limiter = SendRateLimiter(rate_per_second=100.0, max_concurrency=5)
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    for _ in range(3):
+        async with limiter.slot():
+            pass
+    assert loop.time() - started >= 0.015
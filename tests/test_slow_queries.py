@@ -0,0 +1,310 @@
+"""Tests for the slow query recorder and statement fingerprinting."""
+
+import json
+import logging
+import sys
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from ugc_bot.infrastructure.db.session import create_session_factory
+from ugc_bot.infrastructure.db.slow_queries import (
+    SlowQueryRecorder,
+    fingerprint_statement,
+)
+
+
+class FakeRedis:
+    """Minimal async Redis double for get/set/scan_iter."""
+
+    def __init__(self) -> None:
+        self.store: dict[str, str] = {}
+
+    async def set(self, key: str, value: str, ex: int | None = None) -> None:
+        self.store[key] = value
+
+    async def get(self, key: str) -> str | None:
+        return self.store.get(key)
+
+    async def scan_iter(self, match: str):  # type: ignore[no-untyped-def]
+        prefix = match.rstrip("*")
+        for key in list(self.store):
+            if key.startswith(prefix):
+                yield key
+
+    async def aclose(self) -> None:
+        pass
+
+
+class FailingRedis:
+    """Redis double whose every call fails."""
+
+    async def set(self, key: str, value: str, ex: int | None = None) -> None:
+        raise ConnectionError("redis down")
+
+    async def scan_iter(self, match: str):  # type: ignore[no-untyped-def]
+        raise ConnectionError("redis down")
+        yield  # pragma: no cover
+
+    async def aclose(self) -> None:
+        pass
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.parametrize(
+    ("statement", "expected"),
+    [
+        (
+            "SELECT * FROM users WHERE user_id = %(user_id_1)s LIMIT 10",
+            "SELECT * FROM users WHERE user_id = ? LIMIT ?",
+        ),
+        (
+            "SELECT * FROM users WHERE external_id = $1 AND id = $2::UUID",
+            "SELECT * FROM users WHERE external_id = ? AND id = ?::UUID",
+        ),
+        (
+            "SELECT *\n  FROM orders -- hot path\n WHERE status = 'active'",
+            "SELECT * FROM orders WHERE status = ?",
+        ),
+        (
+            "SELECT * FROM users WHERE user_id IN (?, ?, ?) AND name = :name",
+            "SELECT * FROM users WHERE user_id IN (?, ...) AND name = ?",
+        ),
+        (
+            "INSERT INTO t (a, b) VALUES (%s, %s), (%s, %s), (%s, %s)",
+            "INSERT INTO t (a, b) VALUES (?, ?), ...",
+        ),
+        (
+            "SELECT users_1.id FROM users AS users_1 /* c */ WHERE x = 1.5",
+            "SELECT users_1.id FROM users AS users_1 WHERE x = ?",
+        ),
+    ],
+)
+def test_fingerprint_statement(statement: str, expected: str) -> None:
+    """Literals and parameters are stripped; lists and rows are folded."""
+
+    assert fingerprint_statement(statement) == expected
+
+
+def test_record_aggregates_by_fingerprint() -> None:
+    """Fast statements are ignored; slow ones aggregate with percentiles."""
+
+    recorder = SlowQueryRecorder(0.1, log_interval_seconds=3600)
+    recorder.record("SELECT 1", 0.05)
+    for index in range(1, 101):
+        recorder.record(
+            f"SELECT * FROM orders WHERE order_id = {index}", index / 100
+        )
+    recorder.record("SELECT * FROM users WHERE user_id = $1", 5.0)
+
+    top = recorder.top()
+    assert [stat.fingerprint for stat in top] == [
+        "SELECT * FROM orders WHERE order_id = ?",
+        "SELECT * FROM users WHERE user_id = ?",
+    ]
+    orders = top[0]
+    assert orders.count == 91
+    assert orders.total_seconds == pytest.approx(sum(range(10, 101)) / 100)
+    assert orders.p50_seconds == pytest.approx(0.55)
+    assert orders.p99_seconds == pytest.approx(0.99)
+    assert recorder.top(1) == [orders]
+
+
+def test_fingerprint_limit_and_reset() -> None:
+    """New fingerprints beyond the limit are dropped until reset."""
+
+    recorder = SlowQueryRecorder(0.0, max_fingerprints=2)
+    for table in ("a", "b", "c"):
+        recorder.record(f"SELECT * FROM {table}", 0.2)
+
+    assert len(recorder.top()) == 2
+    recorder.reset()
+    assert recorder.top() == []
+
+
+def test_report_logs_top_on_interval(caplog: pytest.LogCaptureFixture) -> None:
+    """Top fingerprints are logged once per interval."""
+
+    clock = FakeClock()
+    recorder = SlowQueryRecorder(0.0, log_interval_seconds=60, clock=clock)
+    caplog.set_level(logging.WARNING)
+
+    recorder.record("SELECT * FROM users", 0.3)
+    assert not caplog.records
+    clock.now = 61
+    recorder.record("SELECT * FROM users", 0.5)
+
+    records = [r for r in caplog.records if r.getMessage() == "Slow query"]
+    assert len(records) == 1
+    assert records[0].fingerprint == "SELECT * FROM users"  # type: ignore[attr-defined]
+    assert records[0].count == 2  # type: ignore[attr-defined]
+
+
+@pytest.mark.asyncio
+async def test_instrumented_engine_records_statements() -> None:
+    """Statements on an instrumented engine reach the recorder."""
+
+    recorder = SlowQueryRecorder(0.0, log_interval_seconds=3600)
+    factory = create_session_factory(
+        "sqlite:///:memory:", slow_query_recorder=recorder
+    )
+    engine = factory.kw["bind"]
+    recorder.instrument(engine)
+    try:
+        async with factory() as session:
+            for value in (1, 2):
+                await session.execute(text("SELECT :value"), {"value": value})
+    finally:
+        await engine.dispose()
+
+    assert [(s.fingerprint, s.count) for s in recorder.top()] == [
+        ("SELECT ?", 2)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_publish_and_collect_across_instances() -> None:
+    """Each process publishes its top list; collect merges them."""
+
+    redis = FakeRedis()
+    first = SlowQueryRecorder(0.0, redis_url="redis://test")
+    second = SlowQueryRecorder(0.0, redis_url="redis://test")
+    first._redis = redis  # type: ignore[assignment]
+    second._redis = redis  # type: ignore[assignment]
+    second.instance = "worker:2"
+    first.record("SELECT * FROM users", 0.2)
+    second.record("SELECT * FROM orders", 0.4)
+
+    await first.publish()
+    await second.publish()
+    collected = await first.collect()
+
+    assert set(collected) == {first.instance, "worker:2"}
+    assert collected["worker:2"][0]["fingerprint"] == "SELECT * FROM orders"
+    assert json.loads(redis.store["ugc:slow_queries:worker:2"])[0]["count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_collect_without_redis_returns_local_only() -> None:
+    """Without Redis only this process's fingerprints are returned."""
+
+    recorder = SlowQueryRecorder(0.0)
+    recorder.record("SELECT 1", 0.2)
+
+    collected = await recorder.collect(limit=5)
+
+    assert list(collected) == [recorder.instance]
+    assert collected[recorder.instance][0]["count"] == 1
+    await recorder.publish()
+
+
+@pytest.mark.asyncio
+async def test_redis_url_without_redis_package_stays_local(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A Redis URL without the redis package keeps fingerprints local."""
+
+    monkeypatch.setitem(sys.modules, "redis.asyncio", None)
+    recorder = SlowQueryRecorder(0.0, redis_url="redis://test")
+    recorder.record("SELECT 1", 0.2)
+
+    await recorder.publish()
+
+    assert list(await recorder.collect()) == [recorder.instance]
+    assert recorder._redis is None
+
+
+@pytest.mark.asyncio
+async def test_report_keeps_one_publish_task() -> None:
+    """report() keeps its publish task and close() waits for it."""
+
+    redis = FakeRedis()
+    recorder = SlowQueryRecorder(0.0, redis_url="redis://test")
+    recorder._redis = redis  # type: ignore[assignment]
+    recorder.record("SELECT 1", 0.2)
+
+    recorder.report()
+    task = recorder._publish_task
+    recorder.report()
+
+    assert task is not None
+    assert recorder._publish_task is task
+    await recorder.close()
+    assert task.done()
+    assert recorder._publish_task is None
+    assert f"ugc:slow_queries:{recorder.instance}" in redis.store
+
+
+def test_report_without_loop_skips_publish() -> None:
+    """Outside an event loop (admin thread pool) nothing is published."""
+
+    recorder = SlowQueryRecorder(0.0, redis_url="redis://test")
+    recorder.record("SELECT 1", 0.2)
+
+    recorder.report()
+
+    assert recorder._publish_task is None
+
+
+@pytest.mark.asyncio
+async def test_redis_failures_are_logged(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Publish and collect keep working locally when Redis fails."""
+
+    recorder = SlowQueryRecorder(0.0, redis_url="redis://test")
+    recorder._redis = FailingRedis()  # type: ignore[assignment]
+    recorder.record("SELECT 1", 0.2)
+
+    await recorder.publish()
+    collected = await recorder.collect()
+
+    assert list(collected) == [recorder.instance]
+    assert "Slow query publish failed" in caplog.text
+    assert "Slow query collection failed" in caplog.text
+    await recorder.close()
+
+
+@pytest.mark.asyncio
+async def test_redis_client_is_created_lazily() -> None:
+    """The Redis client is built from the URL on first use and closed."""
+
+    recorder = SlowQueryRecorder(0.0, redis_url="redis://localhost:1/0")
+
+    redis = recorder._get_redis()
+
+    assert redis is not None
+    assert recorder._get_redis() is redis
+    await recorder.close()
+    assert recorder._redis is None
+    assert SlowQueryRecorder(0.0)._get_redis() is None
+
+
+@pytest.mark.asyncio
+async def test_failed_statement_does_not_leak_start_time() -> None:
+    """A statement that errors pops its start time without recording."""
+
+    recorder = SlowQueryRecorder(0.0, log_interval_seconds=3600)
+    factory = create_session_factory(
+        "sqlite:///:memory:", slow_query_recorder=recorder
+    )
+    engine = factory.kw["bind"]
+    try:
+        async with engine.connect() as conn:
+            with pytest.raises(OperationalError):
+                await conn.execute(text("SELECT * FROM missing_table"))
+            assert conn.sync_connection.info["ugc_slow_query_started"] == []
+    finally:
+        await engine.dispose()
+
+    assert recorder.top() == []
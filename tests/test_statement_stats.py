@@ -0,0 +1,130 @@
+"""Tests for per-operation SQL statement counting."""
+
+import asyncio
+from collections.abc import AsyncIterator
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from tests.helpers.queries import assert_max_queries
+from ugc_bot.infrastructure.db.session import (
+    create_db_engine,
+    create_session_factory,
+)
+from ugc_bot.infrastructure.db.statement_stats import (
+    instrument_engine,
+    track_statements,
+)
+
+
+class RecordingMetrics:
+    """Metrics collector double capturing record_db_operation calls."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, int, float]] = []
+
+    def record_db_operation(
+        self, operation: str, statements: int, duration_seconds: float
+    ) -> None:
+        self.calls.append((operation, statements, duration_seconds))
+
+
+@pytest_asyncio.fixture
+async def session_factory() -> AsyncIterator[object]:
+    """In-memory SQLite session factory."""
+
+    factory = create_session_factory("sqlite:///:memory:")
+    try:
+        yield factory
+    finally:
+        await factory.kw["bind"].dispose()
+
+
+async def _select(factory, count: int) -> None:  # type: ignore[no-untyped-def]
+    async with factory() as session:
+        for _ in range(count):
+            await session.execute(text("SELECT 1"))
+
+
+@pytest.mark.asyncio
+async def test_track_statements_counts_and_records(session_factory) -> None:
+    """Statements and DB time are counted and sent to the collector."""
+
+    metrics = RecordingMetrics()
+    with track_statements("telegram_update", metrics) as stats:  # type: ignore[arg-type]
+        await _select(session_factory, 3)
+
+    assert stats.statements == 3
+    assert stats.duration_seconds > 0
+    assert metrics.calls == [
+        ("telegram_update", 3, pytest.approx(stats.duration_seconds))
+    ]
+
+
+@pytest.mark.asyncio
+async def test_statements_outside_scope_are_not_counted(
+    session_factory,
+) -> None:
+    """Only statements issued inside the block count."""
+
+    await _select(session_factory, 2)
+    with track_statements("op") as stats:
+        await _select(session_factory, 1)
+    await _select(session_factory, 2)
+
+    assert stats.statements == 1
+
+
+@pytest.mark.asyncio
+async def test_nested_scopes_and_spawned_tasks(session_factory) -> None:
+    """Inner scopes and child tasks also count towards the outer scope."""
+
+    with track_statements("outer") as outer:
+        await _select(session_factory, 1)
+        with track_statements("inner") as inner:
+            await asyncio.gather(
+                _select(session_factory, 2), _select(session_factory, 2)
+            )
+
+    assert inner.statements == 4
+    assert outer.statements == 5
+
+
+def test_sync_engine_is_instrumented_once() -> None:
+    """Sync engines count statements; instrumenting twice is a no-op."""
+
+    engine = create_db_engine("sqlite:///:memory:")
+    instrument_engine(engine)
+    with track_statements("admin") as stats, engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+    engine.dispose()
+
+    assert stats.statements == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_statement_is_not_counted(session_factory) -> None:
+    """A statement that raises leaves the counters consistent."""
+
+    with track_statements("op") as stats:
+        async with session_factory() as session:
+            with pytest.raises(OperationalError):
+                await session.execute(text("SELECT * FROM missing"))
+        await _select(session_factory, 1)
+
+    assert stats.statements == 1
+
+
+@pytest.mark.asyncio
+async def test_assert_max_queries_fails_over_budget(session_factory) -> None:
+    """assert_max_queries raises when the block exceeds its budget."""
+
+    with assert_max_queries(2):
+        await _select(session_factory, 2)
+    with (
+        pytest.raises(AssertionError, match="at most 2 SQL statements"),
+        assert_max_queries(2),
+    ):
+        await _select(session_factory, 3)
@@ -1,12 +1,24 @@
 """Tests for Telegram webhook application."""
 
+import asyncio
+import contextlib
+from collections.abc import Iterator
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
+from ugc_bot.bot.update_queue import UpdateQueueFull
 from ugc_bot.config import AppConfig
-from ugc_bot.telegram_webhook_app import app
+from ugc_bot.infrastructure.user_cache import UserCache
+from ugc_bot.telegram_webhook_app import (
+    _config_state,
+    _lifespan,
+    _webhook_settings,
+    app,
+)
 
 
 def _test_config() -> AppConfig:
@@ -37,6 +49,10 @@ def client() -> TestClient:
             new_callable=AsyncMock,
         ) as mock_storage,
         patch("ugc_bot.telegram_webhook_app.build_dispatcher") as mock_build,
+        patch(
+            "ugc_bot.telegram_webhook_app.include_routers",
+            new_callable=AsyncMock,
+        ),
         patch("ugc_bot.telegram_webhook_app.Bot") as MockBot,
     ):
         mock_storage.return_value = MemoryStorage()
@@ -94,6 +110,18 @@ def test_webhook_post_update_returns_200(client: TestClient) -> None:
     assert response.json() == {"status": "ok"}
 
 
+def test_webhook_returns_503_when_queue_full(client: TestClient) -> None:
+    """A full update queue answers 503 so Telegram retries later."""
+    client.app.state.update_queue.submit = MagicMock(  # type: ignore[attr-defined]
+        side_effect=UpdateQueueFull("full")
+    )
+    response = client.post(
+        "/webhook/telegram", json={"update_id": 1, "message": None}
+    )
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
+
+
 def test_webhook_rejects_invalid_json(client: TestClient) -> None:
     """POST with invalid JSON returns 400 or 422."""
     response = client.post(
@@ -124,6 +152,10 @@ def test_webhook_rejects_invalid_secret() -> None:
             new_callable=AsyncMock,
         ),
         patch("ugc_bot.telegram_webhook_app.build_dispatcher") as mock_build,
+        patch(
+            "ugc_bot.telegram_webhook_app.include_routers",
+            new_callable=AsyncMock,
+        ),
         patch("ugc_bot.telegram_webhook_app.Bot") as MockBot,
     ):
         fake_dp = MagicMock()
@@ -170,3 +202,204 @@ def test_webhook_rejects_invalid_secret() -> None:
                 headers={"X-Telegram-Bot-Api-Secret-Token": "my_secret"},
             )
             assert response.status_code == 200
+
+
+def test_webhook_returns_inline_reply() -> None:
+    """With WEBHOOK_INLINE_REPLY the worker's payload is the response."""
+    config = AppConfig.model_validate(
+        {
+            "BOT_TOKEN": "test_token",
+            "DATABASE_URL": "sqlite:///:memory:",
+            "WEBHOOK_BASE_URL": "https://test.example.com",
+            "WEBHOOK_INLINE_REPLY": "true",
+        }
+    )
+    reply_payload = {"method": "answerCallbackQuery", "callback_query_id": "cb"}
+
+    def _submit(update: object, reply: asyncio.Future | None = None) -> None:
+        assert reply is not None
+        reply.set_result(reply_payload)
+
+    with (
+        patch(
+            "ugc_bot.telegram_webhook_app.load_config",
+            return_value=config,
+        ),
+        patch(
+            "ugc_bot.telegram_webhook_app.create_storage",
+            new_callable=AsyncMock,
+        ),
+        patch("ugc_bot.telegram_webhook_app.build_dispatcher"),
+        patch(
+            "ugc_bot.telegram_webhook_app.include_routers",
+            new_callable=AsyncMock,
+        ),
+        patch("ugc_bot.telegram_webhook_app.Bot") as MockBot,
+    ):
+        fake_bot = MagicMock()
+        fake_bot.set_webhook = AsyncMock(return_value=True)
+        fake_bot.delete_webhook = AsyncMock(return_value=True)
+        fake_bot.session = MagicMock()
+        fake_bot.session.close = AsyncMock()
+        MockBot.return_value = fake_bot
+
+        with TestClient(app) as c:
+            c.app.state.update_queue.submit = _submit  # type: ignore[attr-defined]
+            response = c.post("/webhook/telegram", json={"update_id": 1})
+
+        fake_bot.session.middleware.assert_called_once()
+    assert response.status_code == 200
+    assert response.json() == reply_payload
+
+
+def test_webhook_inline_reply_timeout_answers_ok() -> None:
+    """Without a reply in time the endpoint answers with a plain ok."""
+    config = AppConfig.model_validate(
+        {
+            "BOT_TOKEN": "test_token",
+            "DATABASE_URL": "sqlite:///:memory:",
+            "WEBHOOK_BASE_URL": "https://test.example.com",
+            "WEBHOOK_INLINE_REPLY": "true",
+            "WEBHOOK_INLINE_REPLY_TIMEOUT_SECONDS": "0.01",
+        }
+    )
+    replies: list[asyncio.Future] = []
+
+    def _submit(update: object, reply: asyncio.Future | None = None) -> None:
+        assert reply is not None
+        replies.append(reply)
+
+    with (
+        patch(
+            "ugc_bot.telegram_webhook_app.load_config",
+            return_value=config,
+        ),
+        patch(
+            "ugc_bot.telegram_webhook_app.create_storage",
+            new_callable=AsyncMock,
+        ),
+        patch("ugc_bot.telegram_webhook_app.build_dispatcher"),
+        patch(
+            "ugc_bot.telegram_webhook_app.include_routers",
+            new_callable=AsyncMock,
+        ),
+        patch("ugc_bot.telegram_webhook_app.Bot") as MockBot,
+    ):
+        fake_bot = MagicMock()
+        fake_bot.set_webhook = AsyncMock(return_value=True)
+        fake_bot.delete_webhook = AsyncMock(return_value=True)
+        fake_bot.session = MagicMock()
+        fake_bot.session.close = AsyncMock()
+        MockBot.return_value = fake_bot
+
+        with TestClient(app) as c:
+            c.app.state.update_queue.submit = _submit  # type: ignore[attr-defined]
+            response = c.post("/webhook/telegram", json={"update_id": 1})
+
+    assert response.status_code == 200
+    assert response.json() == {"status": "ok"}
+    assert replies[0].cancelled()
+
+
+@contextlib.contextmanager
+def _lifespan_deps(config: AppConfig) -> Iterator[SimpleNamespace]:
+    """Patch what ``_lifespan`` builds; yield the fakes it receives."""
+    from aiogram import Dispatcher
+    from aiogram.fsm.storage.memory import MemoryStorage
+
+    dispatcher = Dispatcher(storage=MemoryStorage())
+    user_cache = MagicMock(spec=UserCache)
+    dispatcher["user_cache"] = user_cache
+    deduplicator = MagicMock()
+    deduplicator.close = AsyncMock()
+    fake_bot = MagicMock()
+    fake_bot.set_webhook = AsyncMock(return_value=True)
+    fake_bot.delete_webhook = AsyncMock(return_value=True)
+    fake_bot.session.close = AsyncMock()
+    with (
+        patch("ugc_bot.telegram_webhook_app.load_config", return_value=config),
+        patch(
+            "ugc_bot.telegram_webhook_app.create_storage",
+            new_callable=AsyncMock,
+            return_value=MemoryStorage(),
+        ),
+        patch(
+            "ugc_bot.telegram_webhook_app.build_dispatcher",
+            return_value=dispatcher,
+        ),
+        patch(
+            "ugc_bot.telegram_webhook_app.include_routers",
+            new_callable=AsyncMock,
+        ) as include_routers,
+        patch(
+            "ugc_bot.telegram_webhook_app.build_update_deduplicator",
+            return_value=deduplicator,
+        ),
+        patch("ugc_bot.telegram_webhook_app.Bot", return_value=fake_bot),
+    ):
+        yield SimpleNamespace(
+            bot=fake_bot,
+            dispatcher=dispatcher,
+            user_cache=user_cache,
+            deduplicator=deduplicator,
+            include_routers=include_routers,
+        )
+
+
+@pytest.mark.asyncio
+async def test_lifespan_starts_and_closes_user_cache() -> None:
+    """The dispatcher's user cache is started on startup, closed on shutdown."""
+    with _lifespan_deps(_test_config()) as deps:
+        async with _lifespan(FastAPI()):
+            deps.user_cache.start.assert_called_once_with()
+            deps.user_cache.close.assert_not_awaited()
+
+    deps.user_cache.close.assert_awaited_once_with()
+    deps.bot.delete_webhook.assert_awaited_once_with()
+
+
+@pytest.mark.asyncio
+async def test_lifespan_closes_deduplicator() -> None:
+    """The update deduplicator is closed once the queue is drained."""
+    with _lifespan_deps(_test_config()) as deps:
+        async with _lifespan(FastAPI()):
+            deps.deduplicator.close.assert_not_awaited()
+
+    deps.deduplicator.close.assert_awaited_once_with()
+
+
+@pytest.mark.asyncio
+async def test_reload_registers_changed_secret() -> None:
+    """A reload with a new secret registers the webhook again, once."""
+    rotated = _webhook_settings(
+        _test_config().model_copy(
+            update={
+                "webhook": _test_config().webhook.model_copy(
+                    update={"webhook_secret": "rotated"}
+                )
+            }
+        )
+    )
+    with (
+        _lifespan_deps(_test_config()) as deps,
+        patch.object(_config_state, "install_reload_signal") as install,
+    ):
+        async with _lifespan(FastAPI()):
+            on_reload = install.call_args.args[0]
+            await on_reload(rotated)
+            await on_reload(rotated)
+
+    assert deps.bot.set_webhook.await_count == 2
+    deps.bot.set_webhook.assert_awaited_with(
+        "https://test.example.com/webhook/telegram", secret_token="rotated"
+    )
+
+
+@pytest.mark.asyncio
+async def test_lifespan_loads_routers_in_background() -> None:
+    """The dispatcher is built without routers; they load after startup."""
+    with _lifespan_deps(_test_config()) as deps:
+        async with _lifespan(FastAPI()) as _:
+            pass
+
+    deps.include_routers.assert_awaited_once_with(deps.dispatcher)
@@ -0,0 +1,51 @@
+"""Tests for the in-process TTL cache."""
+
+import subprocess
+import sys
+
+from ugc_bot.infrastructure.ttl_cache import TTLCache
+
+
+def test_ttl_cache_expires_and_evicts_lru() -> None:
+    """Entries expire after the TTL; the least recently used is evicted."""
+
+    now = [0.0]
+    cache: TTLCache[str, int] = TTLCache(2, 10.0, clock=lambda: now[0])
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    now[0] = 11.0
+    assert cache.get("a") is None
+    assert len(cache) == 1
+    cache.pop("c")
+    cache.pop("missing")
+    assert len(cache) == 0
+
+
+def test_cache_users_do_not_import_the_database_layer() -> None:
+    """Update dedup and the Graph API client stay free of SQLAlchemy."""
+
+    modules = [
+        "ugc_bot.infrastructure.update_dedup",
+        "ugc_bot.infrastructure.instagram.graph_api_client",
+    ]
+    code = (
+        "import importlib, sys\n"
+        f"for name in {modules!r}:\n"
+        "    importlib.import_module(name)\n"
+        "print(','.join(m for m in sys.modules "
+        "if m.split('.')[0] == 'sqlalchemy' "
+        "or m.startswith('ugc_bot.infrastructure.db')))"
+    )
+
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert result.stdout.strip() == ""
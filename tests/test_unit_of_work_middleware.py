@@ -0,0 +1,208 @@
+"""Tests for request-scoped unit of work middleware."""
+
+import pytest
+
+from tests.helpers.fakes import FakeMessage, FakeUser
+from ugc_bot.bot.middleware.unit_of_work import UnitOfWorkMiddleware
+from ugc_bot.infrastructure.db.session import (
+    SessionTransactionManager,
+    with_optional_tx,
+)
+
+
+class _FakeConnection:
+    def __init__(self) -> None:
+        self.closed = False
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class _FakeEngine:
+    """Engine stub counting pool checkouts."""
+
+    def __init__(self) -> None:
+        self.connections: list[_FakeConnection] = []
+
+    async def connect(self) -> _FakeConnection:
+        connection = _FakeConnection()
+        self.connections.append(connection)
+        return connection
+
+
+class _CountingSessionFactory:
+    """Session factory stub counting created sessions."""
+
+    def __init__(self) -> None:
+        self.engine = _FakeEngine()
+        self.kw = {"bind": self.engine}
+        self.sessions: list[_FakeSession] = []
+
+    def __call__(self, bind: object = None) -> "_FakeSession":
+        session = _FakeSession(bind)
+        self.sessions.append(session)
+        return session
+
+
+class _FakeNested:
+    async def __aenter__(self) -> None:
+        return None
+
+    async def __aexit__(self, *_exc: object) -> bool:
+        return False
+
+
+class _FakeSession:
+    def __init__(self, bind: object = None) -> None:
+        self.bind = bind
+        self.info: dict[str, object] = {}
+        self.committed = False
+        self.commits = 0
+        self.rolled_back = False
+        self.closed = False
+        self.savepoints = 0
+
+    def begin_nested(self) -> _FakeNested:
+        self.savepoints += 1
+        return _FakeNested()
+
+    async def commit(self) -> None:
+        self.committed = True
+        self.commits += 1
+
+    async def rollback(self) -> None:
+        self.rolled_back = True
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+@pytest.mark.asyncio
+async def test_middleware_uses_one_session_per_update() -> None:
+    """All service transactions in one update share a session."""
+
+    factory = _CountingSessionFactory()
+    manager = SessionTransactionManager(factory)  # type: ignore[arg-type]
+    middleware = UnitOfWorkMiddleware(manager)
+    used: list[object] = []
+
+    async def _service_call(session: object | None) -> None:
+        used.append(session)
+
+    async def handler(event, data):  # type: ignore[no-untyped-def]
+        for _ in range(5):
+            await with_optional_tx(manager, _service_call)
+        return "ok"
+
+    result = await middleware(handler, FakeMessage(user=FakeUser(1)), {})
+
+    assert result == "ok"
+    assert len(factory.sessions) == 1
+    assert len(factory.engine.connections) == 1
+    session = factory.sessions[0]
+    assert session.bind is factory.engine.connections[0]
+    assert used == [session] * 5
+    # Each service call commits on its own; the scope adds a final commit.
+    assert session.savepoints == 0
+    assert session.commits == 6
+    assert session.closed
+    assert factory.engine.connections[0].closed
+
+
+@pytest.mark.asyncio
+async def test_middleware_rolls_back_when_handler_fails() -> None:
+    """An unhandled error rolls back what the update left pending."""
+
+    factory = _CountingSessionFactory()
+    manager = SessionTransactionManager(factory)  # type: ignore[arg-type]
+    middleware = UnitOfWorkMiddleware(manager)
+
+    async def _service_call(session: object | None) -> None:
+        return None
+
+    async def handler(event, data):  # type: ignore[no-untyped-def]
+        await with_optional_tx(manager, _service_call)
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        await middleware(handler, FakeMessage(user=FakeUser(1)), {})
+
+    session = factory.sessions[0]
+    assert session.commits == 1
+    assert session.rolled_back
+    assert session.closed
+    assert factory.engine.connections[0].closed
+
+
+@pytest.mark.asyncio
+async def test_middleware_without_db_access_checks_out_nothing() -> None:
+    """An update that never touches the database opens no connection."""
+
+    factory = _CountingSessionFactory()
+    middleware = UnitOfWorkMiddleware(
+        SessionTransactionManager(factory)  # type: ignore[arg-type]
+    )
+
+    async def handler(event, data):  # type: ignore[no-untyped-def]
+        return "ok"
+
+    assert await middleware(handler, FakeMessage(user=FakeUser(1)), {}) == "ok"
+    assert factory.sessions == []
+    assert factory.engine.connections == []
+
+
+@pytest.mark.asyncio
+async def test_middleware_without_transaction_manager() -> None:
+    """Without a transaction manager the handler runs unchanged."""
+
+    middleware = UnitOfWorkMiddleware(None)
+
+    async def handler(event, data):  # type: ignore[no-untyped-def]
+        return data["value"]
+
+    assert await middleware(handler, object(), {"value": 1}) == 1
+
+
+@pytest.mark.asyncio
+async def test_middleware_records_statements_per_update() -> None:
+    """The update is tracked as one telegram_update DB operation."""
+
+    recorded: list[tuple[str, int]] = []
+
+    class _Metrics:
+        def record_db_operation(
+            self, operation: str, statements: int, duration_seconds: float
+        ) -> None:
+            recorded.append((operation, statements))
+
+    middleware = UnitOfWorkMiddleware(
+        SessionTransactionManager(_CountingSessionFactory()),  # type: ignore[arg-type]
+        metrics_collector=_Metrics(),  # type: ignore[arg-type]
+    )
+
+    async def handler(event, data):  # type: ignore[no-untyped-def]
+        return "ok"
+
+    assert await middleware(handler, FakeMessage(user=FakeUser(1)), {}) == "ok"
+    assert recorded == [("telegram_update", 0)]
+
+
+@pytest.mark.asyncio
+async def test_middleware_commits_before_outbound_calls() -> None:
+    """A service call is committed before the handler goes on."""
+
+    factory = _CountingSessionFactory()
+    manager = SessionTransactionManager(factory)  # type: ignore[arg-type]
+    middleware = UnitOfWorkMiddleware(manager)
+    committed_before_send: list[bool] = []
+
+    async def _service_call(session: object | None) -> None:
+        return None
+
+    async def handler(event, data):  # type: ignore[no-untyped-def]
+        await with_optional_tx(manager, _service_call)
+        committed_before_send.append(factory.sessions[0].committed)
+
+    await middleware(handler, FakeMessage(user=FakeUser(1)), {})
+
+    assert committed_before_send == [True]
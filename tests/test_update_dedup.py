@@ -0,0 +1,96 @@
+"""Tests for webhook update deduplication."""
+
+import sys
+from unittest.mock import MagicMock
+
+import pytest
+
+from ugc_bot.infrastructure.update_dedup import UpdateDeduplicator
+
+
+class FakeRedis:
+    """Shared Redis double supporting SET NX EX."""
+
+    def __init__(self, fail: bool = False) -> None:
+        self.store: dict[str, tuple[str, int | None]] = {}
+        self.fail = fail
+
+    async def set(
+        self, key: str, value: str, nx: bool = False, ex: int | None = None
+    ) -> bool | None:
+        if self.fail:
+            raise ConnectionError("redis down")
+        if nx and key in self.store:
+            return None
+        self.store[key] = (value, ex)
+        return True
+
+    async def aclose(self) -> None:
+        return None
+
+
+@pytest.mark.asyncio
+async def test_claim_in_process_once() -> None:
+    """Without Redis the second claim of an update id fails."""
+
+    metrics = MagicMock()
+    dedup = UpdateDeduplicator(None, metrics_collector=metrics)
+
+    assert await dedup.claim(1) is True
+    assert await dedup.claim(1) is False
+    assert await dedup.claim(2) is True
+    metrics.record_duplicate_update.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_claim_shared_across_replicas_via_redis() -> None:
+    """Only one replica claims an update id stored in Redis."""
+
+    redis = FakeRedis()
+    first = UpdateDeduplicator("redis://test", ttl_seconds=60)
+    second = UpdateDeduplicator("redis://test", ttl_seconds=60)
+    first._redis = redis  # type: ignore[assignment]
+    second._redis = redis  # type: ignore[assignment]
+
+    assert await first.claim(7) is True
+    assert await second.claim(7) is False
+    assert redis.store["ugc:update:7"] == ("1", 60)
+    await first.close()
+
+
+@pytest.mark.asyncio
+async def test_claim_falls_back_when_redis_fails() -> None:
+    """A Redis error falls back to in-process claims."""
+
+    dedup = UpdateDeduplicator("redis://test")
+    dedup._redis = FakeRedis(fail=True)  # type: ignore[assignment]
+
+    assert await dedup.claim(3) is True
+    assert await dedup.claim(3) is False
+
+
+@pytest.mark.asyncio
+async def test_claim_without_redis_package(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A Redis URL without the redis package deduplicates in-process."""
+
+    monkeypatch.setitem(sys.modules, "redis.asyncio", None)
+    dedup = UpdateDeduplicator("redis://test")
+
+    assert await dedup.claim(4) is True
+    assert await dedup.claim(4) is False
+    assert dedup._redis is None
+
+
+@pytest.mark.asyncio
+async def test_redis_client_is_created_lazily() -> None:
+    """The Redis client is built on first use, reused and closed."""
+
+    dedup = UpdateDeduplicator("redis://localhost:6379/0")
+
+    redis = dedup._get_redis()
+    assert redis is not None
+    assert dedup._get_redis() is redis
+    await dedup.close()
+    assert dedup._redis is None
@@ -0,0 +1,579 @@
+"""Tests for the bounded webhook update queue."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+import pytest_asyncio
+from aiogram import Bot
+from aiogram.methods import AnswerCallbackQuery, SendMessage
+from aiogram.types import Update
+
+from ugc_bot.bot.update_queue import (
+    UpdateQueue,
+    UpdateQueueFull,
+    WebhookReply,
+    update_lane_key,
+)
+from ugc_bot.bot.webhook_reply import DeferCallbackAnswer
+from ugc_bot.infrastructure.update_dedup import UpdateDeduplicator
+
+
+class RecordingDispatcher:
+    """Dispatcher double tracking concurrent feed_update calls."""
+
+    def __init__(
+        self, delay: float = 0.0, fail_ids: frozenset[int] = frozenset()
+    ) -> None:
+        self.delay = delay
+        self.fail_ids = fail_ids
+        self.handled: list[int] = []
+        self.running = 0
+        self.max_running = 0
+
+    async def feed_update(self, bot: object, update: Update) -> None:
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(self.delay)
+            if update.update_id in self.fail_ids:
+                raise RuntimeError("handler failed")
+            self.handled.append(update.update_id)
+        finally:
+            self.running -= 1
+
+
+def _update(update_id: int) -> Update:
+    return Update(update_id=update_id)
+
+
+def _message(update_id: int, user_id: int) -> Update:
+    return Update.model_validate(
+        {
+            "update_id": update_id,
+            "message": {
+                "message_id": update_id,
+                "date": 1609459200,
+                "chat": {"id": user_id, "type": "private"},
+                "from": {"id": user_id, "is_bot": False, "first_name": "x"},
+                "text": "hi",
+            },
+        }
+    )
+
+
+class OrderedDispatcher:
+    """Dispatcher double recording start/end of each user's updates."""
+
+    def __init__(self) -> None:
+        self.events: list[tuple[str, int, int]] = []
+        self.running_users: set[int] = set()
+        self.overlapping_users = False
+
+    async def feed_update(self, bot: object, update: Update) -> None:
+        user_id = update_lane_key(update)
+        self.overlapping_users |= bool(self.running_users - {user_id})
+        self.running_users.add(user_id)
+        self.events.append(("start", user_id, update.update_id))
+        await asyncio.sleep(0.01)
+        self.events.append(("end", user_id, update.update_id))
+        self.running_users.discard(user_id)
+
+
+def test_update_lane_key_prefers_user_then_chat() -> None:
+    """Messages and callbacks map to the sender; bare updates to their id."""
+
+    callback = Update.model_validate(
+        {
+            "update_id": 5,
+            "callback_query": {
+                "id": "cb",
+                "chat_instance": "ci",
+                "from": {"id": 42, "is_bot": False, "first_name": "x"},
+                "data": "tap",
+            },
+        }
+    )
+
+    channel_post = Update.model_validate(
+        {
+            "update_id": 6,
+            "channel_post": {
+                "message_id": 1,
+                "date": 1609459200,
+                "chat": {"id": -100, "type": "channel"},
+                "text": "post",
+            },
+        }
+    )
+    poll_answer = Update.model_validate(
+        {
+            "update_id": 8,
+            "poll_answer": {
+                "poll_id": "p",
+                "option_ids": [0],
+                "option_persistent_ids": ["a"],
+            },
+        }
+    )
+
+    assert update_lane_key(_message(1, 7)) == 7
+    assert update_lane_key(callback) == 42
+    assert update_lane_key(channel_post) == -100
+    assert update_lane_key(poll_answer) == 8
+    assert update_lane_key(_update(9)) == 9
+
+
+@pytest.mark.asyncio
+async def test_same_user_serial_other_users_parallel() -> None:
+    """One user's updates never overlap; different users run together."""
+
+    dispatcher = OrderedDispatcher()
+    queue = UpdateQueue(
+        dispatcher,  # type: ignore[arg-type]
+        MagicMock(),
+        workers=4,
+    )
+    queue.start()
+    for update_id, user_id in enumerate([1, 1, 2, 1, 2]):
+        queue.submit(_message(update_id, user_id))
+
+    await queue.drain(timeout=5)
+
+    for user_id in (1, 2):
+        events = [e for e in dispatcher.events if e[1] == user_id]
+        starts_and_ends = [kind for kind, _, _ in events]
+        assert starts_and_ends == ["start", "end"] * (len(events) // 2)
+        handled = [update_id for kind, _, update_id in events if kind == "end"]
+        assert handled == sorted(handled)
+    assert dispatcher.overlapping_users
+
+
+@pytest.mark.asyncio
+async def test_workers_bound_concurrency_and_drain() -> None:
+    """At most ``workers`` updates run at once; drain finishes the rest."""
+
+    dispatcher = RecordingDispatcher(delay=0.01)
+    metrics = MagicMock()
+    queue = UpdateQueue(
+        dispatcher,  # type: ignore[arg-type]
+        MagicMock(),
+        workers=2,
+        max_size=10,
+        metrics_collector=metrics,
+    )
+    queue.start()
+    for update_id in range(6):
+        queue.submit(_update(update_id))
+
+    await queue.drain(timeout=5)
+
+    assert sorted(dispatcher.handled) == list(range(6))
+    assert dispatcher.max_running == 2
+    assert metrics.record_update_queue_wait.call_count == 6
+    metrics.record_update_queue_depth.assert_called()
+    with pytest.raises(UpdateQueueFull):
+        queue.submit(_update(7))
+
+
+@pytest.mark.asyncio
+async def test_submit_raises_when_full() -> None:
+    """A full queue refuses updates and counts the rejection."""
+
+    metrics = MagicMock()
+    queue = UpdateQueue(
+        RecordingDispatcher(delay=1),  # type: ignore[arg-type]
+        MagicMock(),
+        workers=1,
+        max_size=1,
+        metrics_collector=metrics,
+    )
+    queue.start()
+    queue.submit(_update(1))
+    await asyncio.sleep(0)
+    queue.submit(_update(2))
+
+    with pytest.raises(UpdateQueueFull):
+        queue.submit(_update(3))
+    metrics.record_update_queue_rejected.assert_called_once()
+
+    await queue.drain(timeout=0.01)
+
+
+@pytest.mark.asyncio
+async def test_start_twice_keeps_workers() -> None:
+    """A second start() does not spawn another set of workers."""
+
+    queue = UpdateQueue(
+        RecordingDispatcher(),  # type: ignore[arg-type]
+        MagicMock(),
+        workers=2,
+    )
+    queue.start()
+    tasks = list(queue._tasks)
+
+    queue.start()
+
+    assert queue._tasks == tasks
+    await queue.drain(timeout=5)
+
+
+@pytest.mark.asyncio
+async def test_updates_wait_for_ready() -> None:
+    """Updates queued before ``ready`` completes are handled after it."""
+
+    dispatcher = RecordingDispatcher()
+    queue = UpdateQueue(
+        dispatcher,  # type: ignore[arg-type]
+        MagicMock(),
+        workers=2,
+    )
+    ready: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+    queue.start(ready=ready)
+    queue.submit(_update(1))
+    await asyncio.sleep(0.01)
+    assert dispatcher.handled == []
+
+    ready.set_result(None)
+    await queue.drain(timeout=5)
+
+    assert dispatcher.handled == [1]
+
+
+@pytest.mark.asyncio
+async def test_failed_ready_stops_accepting() -> None:
+    """If ``ready`` fails the queue refuses updates instead of hanging."""
+
+    dispatcher = RecordingDispatcher()
+    queue = UpdateQueue(
+        dispatcher,  # type: ignore[arg-type]
+        MagicMock(),
+        workers=2,
+    )
+    ready: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+    queue.start(ready=ready)
+
+    ready.set_exception(RuntimeError("routers failed"))
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+    with pytest.raises(UpdateQueueFull):
+        queue.submit(_update(1))
+    assert dispatcher.handled == []
+    await queue.drain(timeout=0.01)
+
+
+@pytest.mark.asyncio
+async def test_failing_update_does_not_stop_worker() -> None:
+    """A handler error is logged and the worker takes the next update."""
+
+    dispatcher = RecordingDispatcher(fail_ids=frozenset({1}))
+    queue = UpdateQueue(
+        dispatcher,  # type: ignore[arg-type]
+        MagicMock(),
+        workers=1,
+    )
+    queue.start()
+    queue.submit(_update(1))
+    queue.submit(_update(2))
+
+    await queue.drain(timeout=5)
+
+    assert dispatcher.handled == [2]
+
+
+@pytest.mark.asyncio
+async def test_duplicate_update_is_handled_once() -> None:
+    """A redelivered update id is skipped by the worker."""
+
+    dispatcher = RecordingDispatcher()
+    queue = UpdateQueue(
+        dispatcher,  # type: ignore[arg-type]
+        MagicMock(),
+        workers=2,
+        deduplicator=UpdateDeduplicator(None),
+    )
+    queue.start()
+    for update_id in (1, 1, 2):
+        queue.submit(_update(update_id))
+
+    await queue.drain(timeout=5)
+
+    assert sorted(dispatcher.handled) == [1, 2]
+
+
+class PerUserDelayDispatcher:
+    """Dispatcher double with a per-user handling delay."""
+
+    def __init__(self, delays: dict[int, float]) -> None:
+        self.delays = delays
+        self.handled: list[int] = []
+
+    async def feed_update(self, bot: object, update: Update) -> None:
+        await asyncio.sleep(self.delays.get(update_lane_key(update), 0.0))
+        self.handled.append(update.update_id)
+
+
+@pytest.mark.asyncio
+async def test_slow_user_does_not_block_other_users() -> None:
+    """Idle workers take other users' updates while one user is slow."""
+
+    dispatcher = PerUserDelayDispatcher({1: 0.05})
+    queue = UpdateQueue(
+        dispatcher,  # type: ignore[arg-type]
+        MagicMock(),
+        workers=2,
+    )
+    queue.start()
+    # Users 1 and 3 would share a lane if updates were sharded by id.
+    for update_id, user_id in [(1, 1), (2, 1), (3, 3), (4, 3), (5, 3)]:
+        queue.submit(_message(update_id, user_id))
+
+    await queue.drain(timeout=5)
+
+    assert dispatcher.handled[:3] == [3, 4, 5]
+    assert dispatcher.handled[3:] == [1, 2]
+    assert queue._chains == {}
+
+
+@pytest.mark.asyncio
+async def test_max_size_is_shared_by_all_users() -> None:
+    """One user may use the whole queue; the bound is global."""
+
+    queue = UpdateQueue(
+        RecordingDispatcher(delay=1),  # type: ignore[arg-type]
+        MagicMock(),
+        workers=4,
+        max_size=4,
+    )
+    queue.start()
+    for update_id in range(4):
+        queue.submit(_message(update_id, 1))
+
+    assert queue.depth() == 4
+    with pytest.raises(UpdateQueueFull):
+        queue.submit(_message(5, 2))
+
+    await queue.drain(timeout=0.01)
+
+
+@pytest.mark.asyncio
+async def test_drain_timeout_releases_waiting_replies() -> None:
+    """Updates dropped by drain resolve their reply future with None."""
+
+    queue = UpdateQueue(
+        RecordingDispatcher(delay=1),  # type: ignore[arg-type]
+        MagicMock(),
+        workers=1,
+    )
+    queue.start()
+    loop = asyncio.get_running_loop()
+    replies: list[WebhookReply] = [loop.create_future() for _ in range(2)]
+    for update_id, reply in enumerate(replies):
+        queue.submit(_message(update_id, 1), reply)
+    await asyncio.sleep(0)
+
+    await queue.drain(timeout=0.01)
+
+    assert [reply.result() for reply in replies] == [None, None]
+    assert queue.depth() == 0
+    assert queue._chains == {}
+
+
+class ReplyingDispatcher:
+    """Dispatcher double calling the bot and returning a method."""
+
+    def __init__(
+        self,
+        calls: list[Any],
+        result: Any = None,
+        delay: float = 0.0,
+        delay_after: float = 0.0,
+        error: Exception | None = None,
+    ) -> None:
+        self.calls = calls
+        self.result = result
+        self.delay = delay
+        self.delay_after = delay_after
+        self.error = error
+        self.sent: list[Any] = []
+
+    async def feed_update(self, bot: Bot, update: Update) -> Any:
+        await asyncio.sleep(self.delay)
+        for call in self.calls:
+            await bot(call)
+        await asyncio.sleep(self.delay_after)
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+    async def silent_call_request(self, bot: Bot, method: Any) -> None:
+        self.sent.append(method)
+
+
+@pytest_asyncio.fixture
+async def deferring_bot() -> AsyncIterator[Bot]:
+    bot = Bot(token="42:TEST")
+    bot.session.middleware(DeferCallbackAnswer())
+    bot.session.make_request = AsyncMock(return_value=True)  # type: ignore[method-assign]
+    yield bot
+    await bot.session.close()
+
+
+async def _run_with_reply(
+    dispatcher: ReplyingDispatcher, bot: Bot, wait: float = 1.0
+) -> dict[str, Any] | None:
+    queue = UpdateQueue(dispatcher, bot, workers=1)  # type: ignore[arg-type]
+    queue.start()
+    reply: WebhookReply = asyncio.get_running_loop().create_future()
+    queue.submit(_update(1), reply)
+    try:
+        return await asyncio.wait_for(reply, wait)
+    except asyncio.TimeoutError:
+        return None
+    finally:
+        await queue.drain(timeout=5)
+
+
+@pytest.mark.asyncio
+async def test_single_callback_answer_is_returned_inline(
+    deferring_bot: Bot,
+) -> None:
+    """A lone callback answer becomes the webhook response payload."""
+
+    dispatcher = ReplyingDispatcher(
+        [AnswerCallbackQuery(callback_query_id="cb")]
+    )
+
+    payload = await _run_with_reply(dispatcher, deferring_bot)
+
+    assert payload == {
+        "method": "answerCallbackQuery",
+        "callback_query_id": "cb",
+    }
+    assert dispatcher.sent == []
+    deferring_bot.session.make_request.assert_not_awaited()  # type: ignore[attr-defined]
+
+
+@pytest.mark.asyncio
+async def test_returned_method_is_returned_inline(deferring_bot: Bot) -> None:
+    """A method returned by the handler is the inline reply."""
+
+    method = SendMessage(chat_id=1, text="hi")
+    dispatcher = ReplyingDispatcher([], result=method)
+
+    payload = await _run_with_reply(dispatcher, deferring_bot)
+
+    assert payload == {"method": "sendMessage", "chat_id": 1, "text": "hi"}
+    assert dispatcher.sent == []
+
+
+@pytest.mark.asyncio
+async def test_two_methods_are_sent_by_worker(deferring_bot: Bot) -> None:
+    """With more than one call nothing is inlined; all are sent."""
+
+    answer = AnswerCallbackQuery(callback_query_id="cb")
+    method = SendMessage(chat_id=1, text="hi")
+    dispatcher = ReplyingDispatcher([answer], result=method)
+
+    payload = await _run_with_reply(dispatcher, deferring_bot)
+
+    assert payload is None
+    assert dispatcher.sent == [answer, method]
+
+
+@pytest.mark.asyncio
+async def test_answer_after_timeout_is_not_deferred(deferring_bot: Bot) -> None:
+    """Once the endpoint stopped waiting, answers go out directly."""
+
+    answer = AnswerCallbackQuery(callback_query_id="cb")
+    dispatcher = ReplyingDispatcher([answer], delay=0.05)
+
+    payload = await _run_with_reply(dispatcher, deferring_bot, wait=0.01)
+
+    assert payload is None
+    assert dispatcher.sent == []
+    deferring_bot.session.make_request.assert_awaited_once()  # type: ignore[attr-defined]
+
+
+@pytest.mark.asyncio
+async def test_held_answer_sent_when_reply_times_out(
+    deferring_bot: Bot,
+) -> None:
+    """A held answer goes out on timeout, not when the handler ends."""
+
+    answer = AnswerCallbackQuery(callback_query_id="cb")
+    dispatcher = ReplyingDispatcher([answer], delay_after=1)
+    queue = UpdateQueue(dispatcher, deferring_bot, workers=1)  # type: ignore[arg-type]
+    queue.start()
+    reply: WebhookReply = asyncio.get_running_loop().create_future()
+    queue.submit(_update(1), reply)
+
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(reply, 0.01)
+    await asyncio.sleep(0.01)
+
+    assert dispatcher.sent == [answer]
+    await queue.drain(timeout=0)
+
+
+@pytest.mark.asyncio
+async def test_held_answer_sent_before_next_call(deferring_bot: Bot) -> None:
+    """An answer followed by another call keeps the handler's order."""
+
+    answer = AnswerCallbackQuery(callback_query_id="cb")
+    edit = SendMessage(chat_id=1, text="next")
+    dispatcher = ReplyingDispatcher([answer, edit])
+
+    payload = await _run_with_reply(dispatcher, deferring_bot)
+
+    assert payload is None
+    assert dispatcher.sent == [answer]
+    deferring_bot.session.make_request.assert_awaited_once()  # type: ignore[attr-defined]
+
+
+@pytest.mark.asyncio
+async def test_returned_method_after_other_calls_is_sent(
+    deferring_bot: Bot,
+) -> None:
+    """A returned method is not inlined once the handler sent calls."""
+
+    method = SendMessage(chat_id=1, text="hi")
+    dispatcher = ReplyingDispatcher(
+        [SendMessage(chat_id=1, text="first")], result=method
+    )
+
+    payload = await _run_with_reply(dispatcher, deferring_bot)
+
+    assert payload is None
+    assert dispatcher.sent == [method]
+
+
+@pytest.mark.asyncio
+async def test_failed_handler_sends_held_answer(deferring_bot: Bot) -> None:
+    """A handler error still delivers the answer it made."""
+
+    answer = AnswerCallbackQuery(callback_query_id="cb")
+    dispatcher = ReplyingDispatcher([answer], error=RuntimeError("boom"))
+
+    payload = await _run_with_reply(dispatcher, deferring_bot)
+
+    assert payload is None
+    assert dispatcher.sent == [answer]
+
+
+@pytest.mark.asyncio
+async def test_returned_method_sent_without_reply(deferring_bot: Bot) -> None:
+    """Without a reply future a returned method is executed."""
+
+    method = SendMessage(chat_id=1, text="hi")
+    dispatcher = ReplyingDispatcher([], result=method)
+    queue = UpdateQueue(dispatcher, deferring_bot, workers=1)  # type: ignore[arg-type]
+    queue.start()
+    queue.submit(_update(1))
+
+    await queue.drain(timeout=5)
+
+    assert dispatcher.sent == [method]
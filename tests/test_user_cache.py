@@ -0,0 +1,450 @@
+"""Tests for the two-tier user cache."""
+
+import asyncio
+import sys
+from contextlib import asynccontextmanager
+from dataclasses import replace
+from datetime import datetime, timezone
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy import text
+
+from ugc_bot.domain.entities import User
+from ugc_bot.domain.enums import MessengerType, UserStatus
+from ugc_bot.infrastructure.db.session import (
+    _REPLICA_KEY,
+    create_session_factory,
+)
+from ugc_bot.infrastructure.memory_repositories import InMemoryUserRepository
+from ugc_bot.infrastructure.user_cache import (
+    CachedUserRepository,
+    UserCache,
+    _user_from_json,
+    _user_to_json,
+)
+
+
+class FakeRedis:
+    """Minimal async Redis double: strings, pipelines and pub/sub."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, str] = {}
+        self.published: list[tuple[str, str]] = []
+        self._subscribers: list[asyncio.Queue] = []
+
+    async def get(self, key: str) -> str | None:
+        return self.data.get(key)
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self.data.pop(key, None)
+
+    async def publish(self, channel: str, message: str) -> None:
+        self.published.append((channel, message))
+        for queue in self._subscribers:
+            queue.put_nowait({"type": "message", "data": message})
+
+    @asynccontextmanager
+    async def pipeline(self, transaction: bool = True):  # type: ignore[no-untyped-def]
+        redis = self
+
+        class _Pipe:
+            def __init__(self) -> None:
+                self.ops: list[tuple[str, str]] = []
+
+            def set(self, key: str, value: str, ex: int | None = None):  # type: ignore[no-untyped-def]
+                self.ops.append((key, value))
+
+            async def execute(self) -> None:
+                redis.data.update(self.ops)
+
+        yield _Pipe()
+
+    @asynccontextmanager
+    async def pubsub(self):  # type: ignore[no-untyped-def]
+        queue: asyncio.Queue = asyncio.Queue()
+        subscribers = self._subscribers
+
+        class _PubSub:
+            async def subscribe(self, _channel: str) -> None:
+                subscribers.append(queue)
+
+            async def listen(self):  # type: ignore[no-untyped-def]
+                while True:
+                    yield await queue.get()
+
+        try:
+            yield _PubSub()
+        finally:
+            if queue in subscribers:
+                subscribers.remove(queue)
+
+    async def aclose(self) -> None:
+        return None
+
+
+class CountingUserRepository(InMemoryUserRepository):
+    """In-memory user repo counting lookups that reach storage."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.lookups = 0
+
+    async def get_by_id(self, user_id, session=None):  # type: ignore[no-untyped-def]
+        self.lookups += 1
+        return await super().get_by_id(user_id, session=session)
+
+    async def get_by_external(  # type: ignore[no-untyped-def]
+        self, external_id, messenger_type, session=None
+    ):
+        self.lookups += 1
+        return await super().get_by_external(
+            external_id, messenger_type, session=session
+        )
+
+
+class RecordingMetrics:
+    def __init__(self) -> None:
+        self.results: list[str] = []
+
+    def record_user_cache_lookup(self, result: str) -> None:
+        self.results.append(result)
+
+
+def _user(username: str = "alice", user_id: UUID | None = None) -> User:
+    return User(
+        user_id=user_id or UUID("00000000-0000-0000-0000-000000000901"),
+        external_id="901",
+        messenger_type=MessengerType.TELEGRAM,
+        username=username,
+        status=UserStatus.ACTIVE,
+        issue_count=0,
+        created_at=datetime(2025, 1, 1, tzinfo=timezone.utc),
+    )
+
+
+def _redis_cache(redis: FakeRedis, **kwargs: object) -> UserCache:
+    cache = UserCache("redis://test", **kwargs)  # type: ignore[arg-type]
+    cache._redis = redis  # type: ignore[assignment]
+    return cache
+
+
+def test_user_json_round_trip() -> None:
+    """Users survive serialization for the Redis tier."""
+
+    user = User(
+        user_id=uuid4(),
+        external_id="1",
+        messenger_type=MessengerType.MAX,
+        username="bob",
+        status=UserStatus.BLOCKED,
+        issue_count=2,
+        created_at=datetime(2025, 1, 1, tzinfo=timezone.utc),
+        role_chosen_at=datetime(2025, 1, 2, tzinfo=timezone.utc),
+        last_role_reminder_at=None,
+        telegram="@bob",
+        admin=True,
+    )
+    assert _user_from_json(_user_to_json(user)) == user
+
+
+@pytest.mark.asyncio
+async def test_cached_repo_serves_repeat_lookups_from_memory() -> None:
+    """Repeat lookups by external id and user id skip the repository."""
+
+    inner = CountingUserRepository()
+    user = _user()
+    await inner.save(user)
+    metrics = RecordingMetrics()
+    repo = CachedUserRepository(
+        inner=inner,
+        cache=UserCache(None, metrics_collector=metrics),  # type: ignore[arg-type]
+    )
+
+    first = await repo.get_by_external("901", MessengerType.TELEGRAM)
+    second = await repo.get_by_external("901", MessengerType.TELEGRAM)
+    by_id = await repo.get_by_id(user.user_id)
+
+    assert first == second == by_id == user
+    assert inner.lookups == 1
+    assert metrics.results == ["miss", "local_hit", "local_hit"]
+
+
+@pytest.mark.asyncio
+async def test_cached_repo_save_invalidates() -> None:
+    """Saving a user drops the cached copy."""
+
+    inner = CountingUserRepository()
+    repo = CachedUserRepository(inner=inner, cache=UserCache(None))
+    await repo.save(_user("alice"))
+    assert (await repo.get_by_id(_user().user_id)) == _user("alice")
+
+    await repo.save(_user("bob"))
+    cached = await repo.get_by_external("901", MessengerType.TELEGRAM)
+
+    assert cached is not None
+    assert cached.username == "bob"
+
+
+@pytest.mark.asyncio
+async def test_cached_repo_bulk_update_invalidates() -> None:
+    """Bulk reminder updates drop the cached users."""
+
+    inner = CountingUserRepository()
+    repo = CachedUserRepository(inner=inner, cache=UserCache(None))
+    user = _user()
+    await repo.save(user)
+    await repo.get_by_id(user.user_id)
+    reminded_at = datetime(2025, 2, 1, tzinfo=timezone.utc)
+
+    await repo.update_last_role_reminder_at_many([user.user_id], reminded_at)
+    cached = await repo.get_by_id(user.user_id)
+
+    assert cached is not None
+    assert cached.last_role_reminder_at == reminded_at
+
+
+@pytest.mark.asyncio
+async def test_cached_repo_bypasses_cache_after_write_in_session() -> None:
+    """Reads in a session that wrote users are not cached."""
+
+    class Session:
+        def __init__(self) -> None:
+            self.info: dict = {}
+
+    inner = CountingUserRepository()
+    repo = CachedUserRepository(inner=inner, cache=UserCache(None))
+    session = Session()
+    await repo.save(_user(), session=session)
+
+    await repo.get_by_id(_user().user_id, session=session)
+    await repo.get_by_id(_user().user_id, session=session)
+    assert inner.lookups == 2
+
+    await repo.get_by_id(_user().user_id)
+    await repo.get_by_id(_user().user_id)
+    assert inner.lookups == 3
+
+
+@pytest.mark.asyncio
+async def test_redis_tier_without_listener_skips_local_tier() -> None:
+    """With Redis but no subscriber, lookups come from Redis only."""
+
+    redis = FakeRedis()
+    metrics = RecordingMetrics()
+    cache = _redis_cache(redis, metrics_collector=metrics)
+    user = _user()
+
+    await cache.put(user)
+    assert await cache.get_by_external("901", MessengerType.TELEGRAM) == user
+    assert await cache.get_by_id(user.user_id) == user
+    assert metrics.results == ["redis_hit", "redis_hit"]
+
+    await cache.invalidate([user.user_id])
+    assert await cache.get_by_id(user.user_id) is None
+    assert redis.published == [("ugc:user_cache:invalidate", str(user.user_id))]
+
+
+@pytest.mark.asyncio
+async def test_invalidation_reaches_other_replicas() -> None:
+    """A peer's invalidation drops the local copy via pub/sub."""
+
+    redis = FakeRedis()
+    replica_a = _redis_cache(redis)
+    replica_b = _redis_cache(redis)
+    replica_a.start()
+    replica_b.start()
+    await asyncio.sleep(0)
+    user = _user()
+    try:
+        await replica_a.put(user)
+        assert replica_a._by_id.get(user.user_id) == user
+
+        await replica_b.invalidate([user.user_id])
+        await asyncio.sleep(0)
+
+        assert replica_a._by_id.get(user.user_id) is None
+    finally:
+        await replica_a.close()
+        await replica_b.close()
+
+
+class FailingRedis(FakeRedis):
+    """Redis double whose reads and writes fail."""
+
+    async def get(self, key: str) -> str | None:
+        raise ConnectionError("redis down")
+
+    async def delete(self, *keys: str) -> None:
+        raise ConnectionError("redis down")
+
+    @asynccontextmanager
+    async def pipeline(self, transaction: bool = True):  # type: ignore[no-untyped-def]
+        raise ConnectionError("redis down")
+        yield
+
+
+@pytest.mark.asyncio
+async def test_cached_repo_does_not_populate_from_replica_reads() -> None:
+    """A replica read may use the cache but never writes to it."""
+
+    class ReplicaSession:
+        def __init__(self) -> None:
+            self.info: dict = {_REPLICA_KEY: True}
+
+    inner = CountingUserRepository()
+    await inner.save(_user())
+    repo = CachedUserRepository(inner=inner, cache=UserCache(None))
+
+    await repo.get_by_id(_user().user_id, session=ReplicaSession())
+    await repo.get_by_external(
+        "901", MessengerType.TELEGRAM, session=ReplicaSession()
+    )
+    assert repo.cache._by_id.get(_user().user_id) is None
+    assert inner.lookups == 2
+
+    await repo.get_by_id(_user().user_id)
+    assert (
+        await repo.get_by_id(_user().user_id, session=ReplicaSession())
+        == _user()
+    )
+    assert inner.lookups == 3
+
+
+@pytest.mark.asyncio
+async def test_cached_repo_invalidates_again_after_commit() -> None:
+    """Users written in a session are invalidated once it commits."""
+
+    factory = create_session_factory("sqlite:///:memory:")
+    redis = FakeRedis()
+    cache = _redis_cache(redis)
+    repo = CachedUserRepository(inner=InMemoryUserRepository(), cache=cache)
+    user = _user()
+    try:
+        async with factory() as session:
+            await repo.save(user, session=session)
+            await repo.save(user, session=session)
+            assert len(redis.published) == 2
+            await session.commit()
+            assert cache._pending
+            await cache.close()
+        assert not cache._pending
+        assert len(redis.published) == 3
+
+        cache._redis = redis  # type: ignore[assignment]
+        async with factory() as session:
+            await repo.save(user, session=session)
+            await session.execute(text("SELECT 1"))
+            await session.rollback()
+            await session.commit()
+        assert not cache._pending
+        assert len(redis.published) == 4
+    finally:
+        await factory.kw["bind"].dispose()
+
+
+@pytest.mark.asyncio
+async def test_redis_errors_are_misses() -> None:
+    """Failing Redis reads count as misses; failing writes are ignored."""
+
+    metrics = RecordingMetrics()
+    cache = _redis_cache(FailingRedis(), metrics_collector=metrics)
+    user = _user()
+
+    await cache.put(user)
+    assert await cache.get_by_id(user.user_id) is None
+    assert await cache.get_by_external("901", MessengerType.TELEGRAM) is None
+    assert metrics.results == ["miss", "miss"]
+    await cache.invalidate([])
+    await cache.invalidate([user.user_id])
+
+
+def test_user_cache_without_redis_package(monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    """A Redis URL without the redis package falls back to memory."""
+
+    monkeypatch.setitem(sys.modules, "redis.asyncio", None)
+    cache = UserCache("redis://test")
+
+    assert cache._get_redis() is None
+    assert cache._local_enabled()
+
+
+@pytest.mark.asyncio
+async def test_user_cache_creates_redis_client_lazily() -> None:
+    """The Redis client is created on first use and reused."""
+
+    cache = UserCache("redis://localhost:6379/0")
+
+    redis = cache._get_redis()
+    assert redis is not None
+    assert cache._get_redis() is redis
+    await cache.close()
+
+
+@pytest.mark.asyncio
+async def test_subscriber_reconnects_and_ignores_other_messages(
+    monkeypatch,
+) -> None:  # type: ignore[no-untyped-def]
+    """The subscriber survives a failure and skips non-message events."""
+
+    redis = FakeRedis()
+    original_pubsub = redis.pubsub
+    attempts = 0
+
+    @asynccontextmanager
+    async def flaky_pubsub():  # type: ignore[no-untyped-def]
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            raise ConnectionError("subscribe failed")
+        async with original_pubsub() as pubsub:
+            yield pubsub
+
+    real_sleep = asyncio.sleep
+
+    async def fast_sleep(_delay: float) -> None:
+        await real_sleep(0)
+
+    redis.pubsub = flaky_pubsub  # type: ignore[method-assign]
+    monkeypatch.setattr(asyncio, "sleep", fast_sleep)
+    cache = _redis_cache(redis)
+    cache.start()
+    user = _user()
+    try:
+        while not redis._subscribers:
+            await real_sleep(0)
+        cache._store_local(user)
+        redis._subscribers[0].put_nowait({"type": "subscribe", "data": 1})
+        await redis.publish("ugc:user_cache:invalidate", f"{user.user_id},")
+        for _ in range(3):
+            await real_sleep(0)
+        assert cache._by_id.get(user.user_id) is None
+        assert attempts == 2
+    finally:
+        await cache.close()
+
+
+@pytest.mark.asyncio
+async def test_cached_repo_passes_through_uncached_queries() -> None:
+    """List and bulk methods go straight to the inner repository."""
+
+    inner = InMemoryUserRepository()
+    repo = CachedUserRepository(inner=inner, cache=UserCache(None))
+    alice = _user()
+    bob = replace(
+        _user("bob", UUID("00000000-0000-0000-0000-000000000902")),
+        external_id="902",
+    )
+
+    await repo.save_many([alice, bob])
+
+    assert {u.user_id for u in await repo.list_by_ids([alice.user_id])} == {
+        alice.user_id
+    }
+    assert len(list(await repo.iter_all())) == 2
+    assert list(await repo.list_admins()) == []
+    pending = await repo.list_pending_role_reminders(
+        datetime.now(timezone.utc), limit=10
+    )
+    assert {u.user_id for u in pending} == {alice.user_id, bob.user_id}
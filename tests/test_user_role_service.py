@@ -1,5 +1,6 @@
 """Tests for the user role service."""
 
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 from uuid import UUID, uuid4
 
@@ -221,6 +222,110 @@ async def test_list_pending_role_reminders_returns_users_without_role_chosen(
     assert "p2" not in external_ids
 
 
+@pytest.mark.asyncio
+async def test_iter_pending_role_reminders_yields_pages(
+    fake_tm: object,
+) -> None:
+    """iter_pending_role_reminders pages through all pending users."""
+
+    repo = InMemoryUserRepository()
+    service = UserRoleService(user_repo=repo, transaction_manager=fake_tm)
+    for idx in range(5):
+        await service.set_user(
+            external_id=f"page-{idx}",
+            messenger_type=MessengerType.TELEGRAM,
+            username=f"u{idx}",
+        )
+    cutoff = datetime.now(timezone.utc)
+
+    pages = [
+        page async for page in service.iter_pending_role_reminders(cutoff, 2)
+    ]
+
+    assert [len(page) for page in pages] == [2, 2, 1]
+    user_ids = [user.user_id for page in pages for user in page]
+    assert user_ids == sorted(user_ids)
+    assert len(set(user_ids)) == 5
+
+
+@pytest.mark.asyncio
+async def test_pending_role_reminder_scans_read_primary() -> None:
+    """Reminder scans drive sends and updates, so they skip the replica."""
+
+    readonly_flags: list[bool] = []
+
+    class _RecordingTM:
+        @asynccontextmanager
+        async def transaction(self, readonly: bool = False):
+            readonly_flags.append(readonly)
+            yield object()
+
+    repo = InMemoryUserRepository()
+    service = UserRoleService(
+        user_repo=repo, transaction_manager=_RecordingTM()
+    )
+    cutoff = datetime.now(timezone.utc)
+
+    await service.list_pending_role_reminders(cutoff)
+    pages = [
+        page async for page in service.iter_pending_role_reminders(cutoff, 2)
+    ]
+
+    assert pages == []
+    assert readonly_flags == [False, False]
+
+
+@pytest.mark.asyncio
+async def test_iter_pending_role_reminders_stops_on_empty_page(
+    fake_tm: object,
+) -> None:
+    """A full last page is followed by one empty read and no empty yield."""
+
+    repo = InMemoryUserRepository()
+    service = UserRoleService(user_repo=repo, transaction_manager=fake_tm)
+    for idx in range(4):
+        await service.set_user(
+            external_id=f"full-{idx}",
+            messenger_type=MessengerType.TELEGRAM,
+            username=f"u{idx}",
+        )
+    cutoff = datetime.now(timezone.utc)
+
+    pages = [
+        page async for page in service.iter_pending_role_reminders(cutoff, 2)
+    ]
+
+    assert [len(page) for page in pages] == [2, 2]
+
+
+@pytest.mark.asyncio
+async def test_update_last_role_reminder_at_many(fake_tm: object) -> None:
+    """update_last_role_reminder_at_many marks every given user."""
+
+    repo = InMemoryUserRepository()
+    service = UserRoleService(user_repo=repo, transaction_manager=fake_tm)
+    first = await service.set_user(
+        external_id="bulk-1",
+        messenger_type=MessengerType.TELEGRAM,
+        username="u1",
+    )
+    second = await service.set_user(
+        external_id="bulk-2",
+        messenger_type=MessengerType.TELEGRAM,
+        username="u2",
+    )
+
+    await service.update_last_role_reminder_at_many(
+        [first.user_id, second.user_id]
+    )
+    await service.update_last_role_reminder_at_many([])
+
+    for user_id in (first.user_id, second.user_id):
+        updated = await service.get_user_by_id(user_id)
+        assert updated is not None
+        assert updated.last_role_reminder_at is not None
+
+
 @pytest.mark.asyncio
 async def test_user_repo_iter_all() -> None:
     """InMemoryUserRepository.iter_all returns all users."""
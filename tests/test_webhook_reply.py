@@ -0,0 +1,129 @@
+"""Tests for returning Bot API calls in the webhook response."""
+
+from collections.abc import AsyncIterator
+from unittest.mock import AsyncMock
+
+import pytest
+import pytest_asyncio
+from aiogram import Bot
+from aiogram.methods import AnswerCallbackQuery, SendMessage, SendPhoto
+from aiogram.types import (
+    BufferedInputFile,
+    InlineKeyboardButton,
+    InlineKeyboardMarkup,
+)
+
+from ugc_bot.bot.webhook_reply import (
+    DeferCallbackAnswer,
+    ReplyCapture,
+    capture_replies,
+    webhook_reply_payload,
+)
+
+
+@pytest_asyncio.fixture
+async def bot() -> AsyncIterator[Bot]:
+    bot = Bot(token="42:TEST")
+    yield bot
+    await bot.session.close()
+
+
+def test_payload_includes_method_and_nested_values(bot: Bot) -> None:
+    """Markup is serialized as a nested object and None fields dropped."""
+
+    method = SendMessage(
+        chat_id=1,
+        text="hi",
+        reply_markup=InlineKeyboardMarkup(
+            inline_keyboard=[
+                [InlineKeyboardButton(text="a", callback_data="b")]
+            ]
+        ),
+    )
+
+    assert webhook_reply_payload(bot, method) == {
+        "method": "sendMessage",
+        "chat_id": 1,
+        "text": "hi",
+        "reply_markup": {
+            "inline_keyboard": [[{"text": "a", "callback_data": "b"}]]
+        },
+    }
+
+
+def test_payload_is_none_for_uploads(bot: Bot) -> None:
+    """File uploads cannot be sent in the webhook response."""
+
+    method = SendPhoto(chat_id=1, photo=BufferedInputFile(b"x", "a.png"))
+
+    assert webhook_reply_payload(bot, method) is None
+
+
+@pytest.mark.asyncio
+async def test_callback_answer_deferred_only_while_capturing(bot: Bot) -> None:
+    """A lone first answer is held; uncaptured answers are sent."""
+
+    make_request = AsyncMock(return_value="sent")
+    middleware = DeferCallbackAnswer()
+    answer = AnswerCallbackQuery(callback_query_id="cb")
+
+    assert await middleware(make_request, bot, answer) == "sent"
+
+    capture = ReplyCapture(AsyncMock())
+    with capture_replies(capture):
+        deferred = await middleware(make_request, bot, answer)
+
+    assert deferred.result is True
+    assert make_request.await_count == 1
+    assert capture.take() is answer
+    assert capture.take() is None
+
+
+@pytest.mark.asyncio
+async def test_next_call_sends_held_answer_first(bot: Bot) -> None:
+    """Another call sends the held answer before it goes out."""
+
+    order: list[str] = []
+
+    async def make_request(_bot: Bot, method: object) -> str:
+        order.append(type(method).__name__)
+        return "sent"
+
+    async def send(method: object) -> None:
+        await middleware(make_request, bot, method)  # type: ignore[arg-type]
+
+    middleware = DeferCallbackAnswer()
+    capture = ReplyCapture(send)
+    with capture_replies(capture):
+        await middleware(
+            make_request, bot, AnswerCallbackQuery(callback_query_id="cb")
+        )
+        await middleware(make_request, bot, SendMessage(chat_id=1, text="hi"))
+        await middleware(
+            make_request, bot, AnswerCallbackQuery(callback_query_id="cb")
+        )
+
+    assert order == [
+        "AnswerCallbackQuery",
+        "SendMessage",
+        "AnswerCallbackQuery",
+    ]
+    assert not capture.open
+    assert capture.take() is None
+
+
+@pytest.mark.asyncio
+async def test_close_sends_held_answer_in_background() -> None:
+    """close() sends the held answer without waiting for the handler."""
+
+    send = AsyncMock()
+    answer = AnswerCallbackQuery(callback_query_id="cb")
+    capture = ReplyCapture(send)
+    assert capture.defer(answer)
+
+    capture.close()
+    capture.close()
+    await capture.flush()
+
+    send.assert_awaited_once_with(answer)
+    assert not capture.defer(answer)